@@ -0,0 +1,245 @@
+"""
+Hedging Adapter - Hedged requests and failover between two LLM providers.
+
+For latency-critical calls (routing, short agent replies) the primary
+provider gets a head start equal to its recent p95 latency (time to first
+token for streams). If it has not answered by then, the same request is sent
+to the secondary provider; whichever answers first wins and the other call is
+cancelled. If the primary fails outright, the request fails over to the
+secondary immediately.
+
+Hedges cost an extra request, so the share of requests allowed to hedge is
+capped (LLM_HEDGE_MAX_RATE).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LLM_HEDGING = os.getenv("LLM_HEDGING", "true").lower() == "true"
+LLM_HEDGE_MAX_RATE = float(os.getenv("LLM_HEDGE_MAX_RATE", "0.1"))
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "2.0"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.2"))
+
+_EMPTY_STREAM = object()
+
+
+class LatencyTracker:
+    """Sliding window of recent latencies with a percentile estimate."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, latency: float) -> None:
+        self.samples.append(latency)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HedgedChatModel:
+    """
+    Two chat models behind a single ``ainvoke``/``astream`` interface.
+
+    Other attributes resolve against the primary model.
+    """
+
+    def __init__(
+        self,
+        primary,
+        secondary,
+        primary_name: str = "primary",
+        secondary_name: str = "secondary",
+        max_hedge_rate: float = LLM_HEDGE_MAX_RATE,
+        default_delay: float = LLM_HEDGE_DEFAULT_DELAY,
+        min_delay: float = LLM_HEDGE_MIN_DELAY,
+        latency: Optional[LatencyTracker] = None,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.primary_name = primary_name
+        self.secondary_name = secondary_name
+        self.max_hedge_rate = max_hedge_rate
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.latency = latency or LatencyTracker()
+        self.stats = {
+            "requests": 0,
+            "hedges_issued": 0,
+            "hedges_won": 0,
+            "hedges_suppressed": 0,
+            "failovers": 0,
+        }
+
+    def hedge_delay(self) -> float:
+        """Head start for the primary: its recent p95, or a default until warmed up."""
+        p95 = self.latency.percentile(95)
+        return max(self.min_delay, p95 if p95 is not None else self.default_delay)
+
+    def _may_hedge(self) -> bool:
+        allowed = self.stats["hedges_issued"] < self.max_hedge_rate * self.stats["requests"]
+        if not allowed:
+            self.stats["hedges_suppressed"] += 1
+        return allowed
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task) -> None:
+        if not task.done():
+            task.cancel()
+        try:
+            await task
+        except BaseException:
+            pass
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        self.stats["requests"] += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self.primary.ainvoke(input, config, **kwargs))
+
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay())
+        if done:
+            try:
+                result = primary.result()
+                self.latency.record(time.monotonic() - started)
+                return result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["failovers"] += 1
+                logger.warning(
+                    f"⚠️ {self.primary_name} failed ({e}), failing over to {self.secondary_name}"
+                )
+                return await self.secondary.ainvoke(input, config, **kwargs)
+
+        if not self._may_hedge():
+            try:
+                result = await primary
+            finally:
+                # Slow samples must reach the tracker or p95 never adapts upward
+                self.latency.record(time.monotonic() - started)
+            return result
+
+        self.stats["hedges_issued"] += 1
+        secondary = asyncio.ensure_future(self.secondary.ainvoke(input, config, **kwargs))
+        pending = {primary, secondary}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            self.stats["hedges_won"] += 1
+                        else:
+                            self.latency.record(time.monotonic() - started)
+                        return task.result()
+            # Both failed: surface the primary's error
+            return primary.result()
+        finally:
+            for task in (primary, secondary):
+                await self._cancel(task)
+
+    async def astream(self, input, config=None, **kwargs) -> AsyncIterator[Any]:
+        self.stats["requests"] += 1
+        started = time.monotonic()
+        streams = {"primary": self.primary.astream(input, config, **kwargs).__aiter__()}
+        firsts: Dict[asyncio.Task, str] = {
+            asyncio.ensure_future(streams["primary"].__anext__()): "primary"
+        }
+
+        winner: Optional[Tuple[str, Any]] = None
+        failed_primary: Optional[BaseException] = None
+        try:
+            done, _ = await asyncio.wait(set(firsts), timeout=self.hedge_delay())
+            if not done and self._may_hedge():
+                self.stats["hedges_issued"] += 1
+                streams["secondary"] = self.secondary.astream(input, config, **kwargs).__aiter__()
+                firsts[asyncio.ensure_future(streams["secondary"].__anext__())] = "secondary"
+
+            pending = set(firsts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = firsts[task]
+                    error = task.exception()
+                    if error is None or isinstance(error, StopAsyncIteration):
+                        winner = (name, _EMPTY_STREAM if error else task.result())
+                        break
+                    if name == "primary" and "secondary" not in streams:
+                        # Primary failed before its first token: fail over
+                        failed_primary = error
+                        self.stats["failovers"] += 1
+                        streams["secondary"] = self.secondary.astream(
+                            input, config, **kwargs
+                        ).__aiter__()
+                        task2 = asyncio.ensure_future(streams["secondary"].__anext__())
+                        firsts[task2] = "secondary"
+                        pending.add(task2)
+                    elif name == "primary":
+                        failed_primary = error
+        finally:
+            for task, name in firsts.items():
+                if winner is None or name != winner[0]:
+                    await self._cancel(task)
+            for name, stream in streams.items():
+                if (winner is None or name != winner[0]) and hasattr(stream, "aclose"):
+                    try:
+                        await stream.aclose()
+                    except BaseException:
+                        pass
+
+        if winner is None:
+            raise failed_primary or RuntimeError("Both providers failed to stream")
+
+        name, first_chunk = winner
+        if name == "primary":
+            self.latency.record(time.monotonic() - started)
+        elif "primary" in streams and failed_primary is None:
+            self.stats["hedges_won"] += 1
+
+        if first_chunk is _EMPTY_STREAM:
+            return
+        yield first_chunk
+        async for chunk in streams[name]:
+            yield chunk
+
+    def get_stats(self) -> Dict[str, Any]:
+        issued = self.stats["hedges_issued"]
+        return {
+            **self.stats,
+            "primary": self.primary_name,
+            "secondary": self.secondary_name,
+            "hedge_rate": issued / self.stats["requests"] if self.stats["requests"] else 0.0,
+            "hedge_win_rate": self.stats["hedges_won"] / issued if issued else 0.0,
+            "hedge_delay_ms": self.hedge_delay() * 1000,
+        }
+
+    def __getattr__(self, name):
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+
+_hedged_models = []
+
+
+def register_hedged_model(model: HedgedChatModel) -> HedgedChatModel:
+    _hedged_models.append(model)
+    return model
+
+
+def get_hedging_stats() -> Dict[str, Any]:
+    return {
+        "enabled": LLM_HEDGING,
+        "max_hedge_rate": LLM_HEDGE_MAX_RATE,
+        "models": [m.get_stats() for m in _hedged_models],
+    }
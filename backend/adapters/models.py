@@ -4,6 +4,7 @@ Supports both OpenAI and DeepSeek with flexible provider switching.
 
 OpenAI: Premium models, higher cost
 DeepSeek: Cost-effective alternative (~90% cheaper)
+Stub: Deterministic offline models for tests and load testing (LLM_PROVIDER=stub)
 """
 
 import logging
@@ -22,10 +23,71 @@ except ImportError:
     ChatOpenAI = None
     OPENAI_AVAILABLE = False
 
-from backend.config.settings import get_settings
+from backend.adapters.hedging import LLM_HEDGING, HedgedChatModel, register_hedged_model
+from backend.adapters.resilience import guard_chat_model
+from backend.adapters.singleflight import coalesce_chat_model
+from backend.adapters.stub import (
+    OPENAI_EMBEDDING_DIMENSIONS,
+    StubChatModel,
+    StubEmbeddings,
+)
+from backend.adapters.usage import usage_callback
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+
+def use_stub_provider() -> bool:
+    """True when LLM_PROVIDER=stub selects the offline stub models."""
+    return os.getenv("LLM_PROVIDER", "").lower() == "stub"
+
+
+def get_stub_model(
+    model_name: str = "stub-chat",
+    temperature: float = 0.2,
+    max_tokens: Optional[int] = None,
+    **kwargs,
+) -> StubChatModel:
+    """Create a deterministic offline chat model."""
+    kwargs.setdefault("callbacks", [usage_callback])
+    return StubChatModel(
+        model_name=model_name, temperature=temperature, max_tokens=max_tokens, **kwargs
+    )
+
+
+def get_chat_model(model_name: Optional[str] = None, **kwargs):
+    """
+    Create a chat model for the configured provider.
+
+    For modules that construct their own model instead of using the shared
+    primary model; returns a stub model when LLM_PROVIDER=stub.
+    """
+    model_name = model_name or os.getenv("MODEL_NAME", "gpt-3.5-turbo")
+    if use_stub_provider():
+        return get_stub_model(model_name, **kwargs)
+    kwargs.setdefault("callbacks", [usage_callback])
+    kwargs.setdefault("stream_usage", True)
+    return ChatOpenAI(model_name=model_name, **kwargs)
+
+
+def embedding_model_name() -> str:
+    """Name of the model behind get_embeddings_model()."""
+    if use_stub_provider():
+        return "stub-embedding"
+    return os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+
+
+def get_embeddings_model(dimensions: int = OPENAI_EMBEDDING_DIMENSIONS, **kwargs):
+    """
+    Create an OpenAI embeddings client (EMBEDDING_MODEL), or hash-based stub
+    embeddings of the same dimension when LLM_PROVIDER=stub.
+    """
+    if use_stub_provider():
+        return StubEmbeddings(dimensions=dimensions, model=embedding_model_name())
+
+    from langchain_openai import OpenAIEmbeddings
+
+    kwargs.setdefault("model", embedding_model_name())
+    return OpenAIEmbeddings(**kwargs)
 
 
 def get_openai_model(
@@ -44,6 +106,10 @@ def get_openai_model(
         logger.error("OpenAI API key not found")
         return None
 
+    # Every call is counted; streams report usage in their final chunk
+    kwargs.setdefault("callbacks", [usage_callback])
+    kwargs.setdefault("stream_usage", True)
+
     try:
         return ChatOpenAI(
             model=model_name,
@@ -80,6 +146,9 @@ def get_deepseek_model(
         logger.error("DeepSeek API key not found")
         return None
 
+    kwargs.setdefault("callbacks", [usage_callback])
+    kwargs.setdefault("stream_usage", True)
+
     try:
         model = ChatOpenAI(
             model=model_name,
@@ -109,6 +178,10 @@ def get_primary_model() -> Optional[ChatOpenAI]:
     provider = os.getenv("MODEL_PROVIDER", "openai").lower()
     model_name = os.getenv("MODEL_NAME", "gpt-3.5-turbo")
 
+    if use_stub_provider():
+        logger.info(f"🧪 Using offline stub model for {model_name}")
+        return get_stub_model(model_name)
+
     logger.info(f"🔧 Creating primary model: provider={provider}, model={model_name}")
 
     if provider == "deepseek":
@@ -152,11 +225,58 @@ def get_primary_model() -> Optional[ChatOpenAI]:
         return None
 
 
+def get_secondary_model() -> Optional[ChatOpenAI]:
+    """
+    Get the other provider's model, used for hedging and failover.
+
+    Returns None unless both providers have API keys configured.
+    """
+    provider = os.getenv("MODEL_PROVIDER", "openai").lower()
+    if use_stub_provider():
+        return get_stub_model(os.getenv("SECONDARY_MODEL_NAME", "stub-secondary"))
+    if not (os.getenv("OPENAI_API_KEY") and os.getenv("DEEPSEEK_API_KEY")):
+        return None
+
+    if provider == "deepseek":
+        return get_openai_model(os.getenv("SECONDARY_MODEL_NAME", "gpt-3.5-turbo"))
+    return get_deepseek_model(os.getenv("SECONDARY_MODEL_NAME", "deepseek-chat"))
+
+
+def get_hedged_model():
+    """
+    Get a model that hedges slow primary calls to the secondary provider.
+
+    Falls back to the plain primary model when hedging is disabled or only
+    one provider is configured.
+    """
+    primary = guard_chat_model(get_primary_model())
+    if not LLM_HEDGING or primary is None:
+        return primary
+
+    secondary = guard_chat_model(get_secondary_model())
+    if secondary is None:
+        return primary
+
+    provider = "stub" if use_stub_provider() else os.getenv("MODEL_PROVIDER", "openai").lower()
+    secondary_name = {"stub": "stub-secondary", "deepseek": "openai"}.get(provider, "deepseek")
+    logger.info(f"🔀 Hedging enabled: {provider} primary with failover to secondary")
+    return register_hedged_model(
+        HedgedChatModel(
+            primary,
+            secondary,
+            primary_name=provider,
+            secondary_name=secondary_name,
+        )
+    )
+
+
 def get_evaluation_model() -> Optional[ChatOpenAI]:
     """Get model for evaluation tasks."""
     eval_model = os.getenv("EVALUATION_MODEL", "gpt-3.5-turbo")
     provider = os.getenv("MODEL_PROVIDER", "openai").lower()
 
+    if use_stub_provider():
+        return get_stub_model(eval_model)
     if provider == "deepseek":
         return get_deepseek_model(eval_model)
     else:
@@ -171,6 +291,7 @@ def get_available_models() -> Dict[str, Any]:
         "evaluation_model": os.getenv("EVALUATION_MODEL", "gpt-3.5-turbo"),
         "openai_available": bool(os.getenv("OPENAI_API_KEY")),
         "deepseek_available": bool(os.getenv("DEEPSEEK_API_KEY")),
+        "stub_provider": use_stub_provider(),
         "langchain_openai_installed": OPENAI_AVAILABLE,
     }
 
@@ -178,7 +299,7 @@ def get_available_models() -> Dict[str, Any]:
 # Backward compatibility functions
 def create_chat_model(**kwargs) -> Optional[ChatOpenAI]:
     """Create chat model with current configuration."""
-    return get_primary_model()
+    return coalesce_chat_model(guard_chat_model(get_primary_model()))
 
 
 def create_evaluation_model(**kwargs) -> Optional[ChatOpenAI]:
@@ -186,9 +307,18 @@ def create_evaluation_model(**kwargs) -> Optional[ChatOpenAI]:
     return get_evaluation_model()
 
 
-def create_langchain_llm(**kwargs) -> Optional[ChatOpenAI]:
-    """Create LangChain LLM instance (backward compatibility)."""
-    return get_primary_model()
+def create_langchain_llm(latency_critical: bool = False, **kwargs) -> Optional[ChatOpenAI]:
+    """
+    Create LangChain LLM instance (backward compatibility).
+
+    Identical concurrent ``ainvoke`` calls are coalesced into one request,
+    and every call goes through the provider's concurrency limiter and
+    circuit breaker. ``latency_critical`` models additionally hedge slow
+    calls to the secondary provider.
+    """
+    if latency_critical:
+        return coalesce_chat_model(get_hedged_model())
+    return coalesce_chat_model(guard_chat_model(get_primary_model()))
 
 
 def get_model_config() -> Dict[str, Any]:
@@ -213,6 +343,12 @@ __all__ = [
     "get_evaluation_model",
     "get_openai_model",
     "get_deepseek_model",
+    "get_stub_model",
+    "get_chat_model",
+    "get_embeddings_model",
+    "use_stub_provider",
+    "get_secondary_model",
+    "get_hedged_model",
     "get_available_models",
     "create_chat_model",
     "create_evaluation_model",
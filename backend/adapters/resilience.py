@@ -0,0 +1,409 @@
+"""
+Resilience Adapter - Per-provider concurrency limiting and circuit breaking.
+
+Each LLM provider (DeepSeek, OpenAI) gets a ProviderGuard made of:
+- AdaptiveConcurrencyLimiter: AIMD limit on in-flight requests. The limit
+  grows by one per window of healthy calls and shrinks multiplicatively when
+  latency climbs well above the observed baseline or calls fail.
+- A bounded wait queue with deadline-aware shedding: requests that cannot
+  start before their deadline are rejected immediately instead of piling up
+  on the event loop.
+- CircuitBreaker: opens when the error rate over a rolling window crosses a
+  threshold, fails fast while open, and lets a single probe through after a
+  cool-down.
+
+Requests have no deadline unless the caller passes one or
+LLM_REQUEST_TIMEOUT is set; without one they queue until a slot frees up.
+
+Callers catch ProviderUnavailableError and use their fallback path (for
+example keyword routing instead of LLM routing).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LLM_RESILIENCE = os.getenv("LLM_RESILIENCE", "true").lower() == "true"
+LLM_INITIAL_CONCURRENCY = int(os.getenv("LLM_INITIAL_CONCURRENCY", "8"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+LLM_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "200"))
+# Optional hard deadline per request in seconds; unset means none, so long
+# generations are never cut off unless a deployment asks for it
+LLM_REQUEST_TIMEOUT = (
+    float(os.environ["LLM_REQUEST_TIMEOUT"]) if os.getenv("LLM_REQUEST_TIMEOUT") else None
+)
+LLM_BREAKER_ERROR_RATE = float(os.getenv("LLM_BREAKER_ERROR_RATE", "0.5"))
+LLM_BREAKER_MIN_REQUESTS = int(os.getenv("LLM_BREAKER_MIN_REQUESTS", "10"))
+LLM_BREAKER_OPEN_SECONDS = float(os.getenv("LLM_BREAKER_OPEN_SECONDS", "15"))
+
+
+class ProviderUnavailableError(Exception):
+    """Raised instead of calling a provider that cannot take the request."""
+
+
+class CircuitOpenError(ProviderUnavailableError):
+    """The provider's circuit breaker is open."""
+
+
+class LoadShedError(ProviderUnavailableError):
+    """The request could not start before its deadline or the queue is full."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit with a deadline-aware wait queue."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = LLM_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+        max_limit: int = LLM_MAX_CONCURRENCY,
+        max_queue: int = LLM_MAX_QUEUE,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+    ):
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self.avg_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[Tuple[asyncio.Future, float]] = deque()
+        self.stats = {"admitted": 0, "queued": 0, "shed": 0, "decreases": 0}
+
+    def _estimated_wait(self) -> float:
+        """Rough time until a newly queued request would start."""
+        if not self.avg_latency:
+            return 0.0
+        ahead = len(self._waiters) + 1
+        return self.avg_latency * ahead / max(self.limit, 1.0)
+
+    async def acquire(self, deadline: Optional[float] = None) -> None:
+        """Wait for a slot, or raise LoadShedError if it cannot start in time."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            return
+
+        now = time.monotonic()
+        if len(self._waiters) >= self.max_queue:
+            self.stats["shed"] += 1
+            raise LoadShedError(f"{self.name} queue full ({self.max_queue})")
+        if deadline is not None and now + self._estimated_wait() >= deadline:
+            self.stats["shed"] += 1
+            raise LoadShedError(f"{self.name} cannot start before deadline")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((waiter, deadline or float("inf")))
+        self.stats["queued"] += 1
+        try:
+            timeout = None if deadline is None else max(0.0, deadline - now)
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            self.stats["shed"] += 1
+            self._drop_waiter(waiter)
+            raise LoadShedError(f"{self.name} deadline expired while queued")
+        except asyncio.CancelledError:
+            self._drop_waiter(waiter)
+            raise
+
+    def _drop_waiter(self, waiter: asyncio.Future) -> None:
+        if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+            # A slot was handed over just as we gave up; pass it on
+            self.release()
+            return
+        waiter.cancel()
+        self._waiters = deque(w for w in self._waiters if w[0] is not waiter)
+
+    def release(self) -> None:
+        """Free a slot and hand it to the oldest waiter still within its deadline."""
+        self.in_flight -= 1
+        now = time.monotonic()
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter, deadline = self._waiters.popleft()
+            if waiter.done():
+                continue
+            if deadline <= now:
+                self.stats["shed"] += 1
+                waiter.set_exception(LoadShedError(f"{self.name} deadline expired while queued"))
+                continue
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            waiter.set_result(None)
+
+    def on_result(self, latency: float, ok: bool) -> None:
+        """Adjust the limit from one completed request."""
+        self.avg_latency = (
+            latency if self.avg_latency is None else 0.8 * self.avg_latency + 0.2 * latency
+        )
+        if ok:
+            # Slowly decaying minimum tracks the provider's unloaded latency
+            if self.baseline_latency is None or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency = 0.99 * self.baseline_latency + 0.01 * latency
+
+        overloaded = not ok or (
+            self.baseline_latency is not None
+            and latency > self.baseline_latency * self.latency_tolerance
+        )
+        if overloaded:
+            # Back off at most once per round trip so a burst of failures
+            # from the same slowdown does not collapse the limit to the floor
+            now = time.monotonic()
+            if now - self._last_decrease >= (self.avg_latency or 0.0):
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self._last_decrease = now
+                self.stats["decreases"] += 1
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "avg_latency_ms": (self.avg_latency or 0.0) * 1000,
+            "baseline_latency_ms": (self.baseline_latency or 0.0) * 1000,
+        }
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker over a rolling time window."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        error_rate: float = LLM_BREAKER_ERROR_RATE,
+        min_requests: int = LLM_BREAKER_MIN_REQUESTS,
+        window_seconds: float = 30.0,
+        open_seconds: float = LLM_BREAKER_OPEN_SECONDS,
+    ):
+        self.name = name
+        self.error_rate = error_rate
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._probe_in_flight = False
+        self.stats = {"opened": 0, "rejected": 0}
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless the call may proceed."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.open_seconds:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError(f"{self.name} circuit open")
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError(f"{self.name} circuit half-open, probe running")
+            self._probe_in_flight = True
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot that never reached the provider."""
+        self._probe_in_flight = False
+
+    def record(self, ok: bool) -> None:
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            if ok:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+                logger.info(f"🔌 {self.name} circuit closed after successful probe")
+            else:
+                self._open(now)
+            return
+
+        self._outcomes.append((now, ok))
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+        total = len(self._outcomes)
+        failures = sum(1 for _, success in self._outcomes if not success)
+        if total >= self.min_requests and failures / total >= self.error_rate:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self.opened_at = now
+        self.stats["opened"] += 1
+        logger.warning(f"🔌 {self.name} circuit opened for {self.open_seconds}s")
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = len(self._outcomes)
+        failures = sum(1 for _, success in self._outcomes if not success)
+        return {
+            **self.stats,
+            "state": self.state,
+            "window_requests": total,
+            "window_error_rate": failures / total if total else 0.0,
+        }
+
+
+class ProviderGuard:
+    """Limiter + breaker (+ optional timeout) around calls to one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[float] = LLM_REQUEST_TIMEOUT,
+    ):
+        self.name = name
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(name)
+        self.breaker = breaker or CircuitBreaker(name)
+        self.timeout = timeout
+
+    async def call(self, fn: Callable[[], Awaitable[Any]], deadline: Optional[float] = None) -> Any:
+        """Run ``fn`` if the provider can take it; raise ProviderUnavailableError otherwise."""
+        self.breaker.before_call()
+        if deadline is None:
+            deadline = self.default_deadline()
+        await self.admit(deadline)
+
+        started = time.monotonic()
+        ok = False
+        cancelled = False
+        try:
+            timeout = None if deadline is None else max(0.001, deadline - started)
+            result = await asyncio.wait_for(fn(), timeout)
+            ok = True
+            return result
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                self.abandon()
+            else:
+                self.record(time.monotonic() - started, ok)
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Feed a finished call to the limiter and breaker and free its slot."""
+        self.limiter.on_result(latency, ok)
+        self.breaker.record(ok)
+        self.limiter.release()
+
+    def abandon(self) -> None:
+        """
+        Free the slot of a call its caller cancelled, such as the losing side
+        of a hedge. That says nothing about the provider, so neither the
+        limit nor the breaker moves.
+        """
+        self.breaker.release_probe()
+        self.limiter.release()
+
+    def default_deadline(self) -> Optional[float]:
+        """Deadline of a request started now, if the guard has a timeout."""
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+    async def admit(self, deadline: Optional[float]) -> None:
+        """
+        Wait for a limiter slot. Neither shedding nor the caller cancelling
+        while queued counts as a provider failure; either frees the probe.
+        """
+        try:
+            await self.limiter.acquire(deadline)
+        except (LoadShedError, asyncio.CancelledError):
+            self.breaker.release_probe()
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"limiter": self.limiter.get_stats(), "breaker": self.breaker.get_stats()}
+
+
+class GuardedChatModel:
+    """Chat model wrapper that routes ``ainvoke`` and ``astream`` through a ProviderGuard."""
+
+    def __init__(self, model, guard: ProviderGuard):
+        self.model = model
+        self.guard = guard
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        return await self.guard.call(lambda: self.model.ainvoke(input, config, **kwargs))
+
+    async def astream(self, input, config=None, **kwargs):
+        guard = self.guard
+        guard.breaker.before_call()
+        await guard.admit(guard.default_deadline())
+        started = time.monotonic()
+        first_chunk_at = None
+        ok = False
+        cancelled = False
+        try:
+            async for chunk in self.model.astream(input, config, **kwargs):
+                if first_chunk_at is None:
+                    first_chunk_at = time.monotonic()
+                yield chunk
+            ok = True
+        except GeneratorExit:
+            # Consumer stopped reading; not a provider failure
+            ok = True
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                guard.abandon()
+            else:
+                # Time to first chunk is the latency signal for streams
+                guard.record((first_chunk_at or time.monotonic()) - started, ok)
+
+    def __getattr__(self, name):
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+
+_guards: Dict[str, ProviderGuard] = {}
+
+
+def provider_name(model) -> str:
+    """Provider a ChatOpenAI-compatible model talks to."""
+    if getattr(model, "_llm_type", None) == "stub-chat":
+        return "stub"
+    base_url = str(getattr(model, "openai_api_base", None) or "")
+    return "deepseek" if "deepseek" in base_url else "openai"
+
+
+def get_provider_guard(provider: str) -> ProviderGuard:
+    """Shared guard for a provider, created on first use."""
+    guard = _guards.get(provider)
+    if guard is None:
+        guard = _guards[provider] = ProviderGuard(provider)
+    return guard
+
+
+def guard_chat_model(model):
+    """Wrap a chat model with its provider's limiter and circuit breaker."""
+    if model is None or not LLM_RESILIENCE or isinstance(model, GuardedChatModel):
+        return model
+    return GuardedChatModel(model, get_provider_guard(provider_name(model)))
+
+
+def get_resilience_stats() -> Dict[str, Any]:
+    return {name: guard.get_stats() for name, guard in _guards.items()}
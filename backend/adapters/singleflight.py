@@ -0,0 +1,241 @@
+"""
+Singleflight Adapter - Coalesce identical in-flight LLM and embedding calls.
+
+When many users send the same prompt at once (popular FAQs, routing of
+identical openers), every request used to hit the provider independently.
+Requests are keyed on a normalized fingerprint of (model, messages,
+temperature); concurrent duplicates await the single upstream call already
+in flight instead of issuing their own.
+
+Coalescing always happens within a worker. With SINGLEFLIGHT_REDIS enabled,
+workers also coordinate through a Redis lock: the lock holder publishes its
+result under a short-lived key that other workers poll for.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from langchain_core.messages import (
+    convert_to_messages,
+    message_to_dict,
+    messages_from_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+LLM_SINGLEFLIGHT = os.getenv("LLM_SINGLEFLIGHT", "true").lower() == "true"
+SINGLEFLIGHT_REDIS = os.getenv("SINGLEFLIGHT_REDIS", "false").lower() == "true"
+SINGLEFLIGHT_LOCK_TTL = int(os.getenv("SINGLEFLIGHT_LOCK_TTL", "30"))
+SINGLEFLIGHT_RESULT_TTL = int(os.getenv("SINGLEFLIGHT_RESULT_TTL", "15"))
+
+
+def request_fingerprint(model: str, payload: Any, temperature: Any = None, **params) -> str:
+    """Stable hash of a provider request."""
+    normalized = json.dumps(
+        {"model": model, "payload": payload, "temperature": temperature, **params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _normalize_messages(messages) -> List[List[str]]:
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+    return [[m.type, str(m.content)] for m in convert_to_messages(messages)]
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    The first caller for a key runs the call as a task; later callers await
+    the same task (shielded, so one caller cancelling does not cancel the
+    call for the others). Results are never cached after the call finishes.
+    """
+
+    def __init__(
+        self,
+        redis=None,
+        namespace: str = "singleflight",
+        lock_ttl: int = SINGLEFLIGHT_LOCK_TTL,
+        result_ttl: int = SINGLEFLIGHT_RESULT_TTL,
+        poll_interval: float = 0.05,
+    ):
+        self.redis = redis
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"calls": 0, "upstream": 0, "coalesced": 0, "remote_coalesced": 0}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        encode: Optional[Callable[[Any], str]] = None,
+        decode: Optional[Callable[[str], Any]] = None,
+    ) -> Any:
+        """Run ``fn`` once for all concurrent callers with the same key."""
+        self.stats["calls"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(key, fn, encode, decode))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    async def _execute(self, key, fn, encode, decode) -> Any:
+        if self.redis is None or encode is None or decode is None:
+            self.stats["upstream"] += 1
+            return await fn()
+        return await self._execute_distributed(key, fn, encode, decode)
+
+    async def _execute_distributed(self, key, fn, encode, decode) -> Any:
+        lock_key = f"{self.namespace}:{key}:lock"
+        result_key = f"{self.namespace}:{key}:result"
+
+        try:
+            async with self.redis.get_connection() as client:
+                acquired = await client.set(lock_key, "1", nx=True, ex=self.lock_ttl)
+                if not acquired:
+                    deadline = time.monotonic() + self.lock_ttl
+                    while time.monotonic() < deadline:
+                        cached = await client.get(result_key)
+                        if cached is not None:
+                            self.stats["remote_coalesced"] += 1
+                            return decode(cached)
+                        if not await client.exists(lock_key):
+                            break
+                        await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            logger.warning(f"Singleflight Redis coordination failed: {e}")
+            acquired = False
+
+        self.stats["upstream"] += 1
+        result = await fn()
+
+        if acquired:
+            try:
+                async with self.redis.get_connection() as client:
+                    pipe = client.pipeline(transaction=True)
+                    pipe.set(result_key, encode(result), ex=self.result_ttl)
+                    pipe.delete(lock_key)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Singleflight result publish failed: {e}")
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+class CoalescingChatModel:
+    """
+    Chat model wrapper whose ``ainvoke`` goes through a SingleFlight.
+
+    Calls with extra runtime config or kwargs, and every other attribute
+    (``astream``, ``bind``, ``model_name``...), pass straight through to the
+    wrapped model.
+    """
+
+    def __init__(self, model, singleflight: SingleFlight):
+        self.model = model
+        self.singleflight = singleflight
+
+    def _fingerprint(self, messages) -> str:
+        return request_fingerprint(
+            getattr(self.model, "model_name", None) or type(self.model).__name__,
+            _normalize_messages(messages),
+            getattr(self.model, "temperature", None),
+            base_url=getattr(self.model, "openai_api_base", None),
+            max_tokens=getattr(self.model, "max_tokens", None),
+        )
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        if config or kwargs:
+            return await self.model.ainvoke(input, config, **kwargs)
+        return await self.singleflight.do(
+            f"chat:{self._fingerprint(input)}",
+            lambda: self.model.ainvoke(input),
+            encode=lambda message: json.dumps(message_to_dict(message)),
+            decode=lambda raw: messages_from_dict([json.loads(raw)])[0],
+        )
+
+    def __getattr__(self, name):
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+
+class CoalescingEmbeddings:
+    """Embeddings wrapper that coalesces identical async embedding calls."""
+
+    def __init__(self, embeddings, singleflight: SingleFlight):
+        self.embeddings = embeddings
+        self.singleflight = singleflight
+        self.model = getattr(embeddings, "model", None) or type(embeddings).__name__
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.singleflight.do(
+            f"embed:{request_fingerprint(self.model, text)}",
+            lambda: self.embeddings.aembed_query(text),
+            encode=json.dumps,
+            decode=json.loads,
+        )
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.singleflight.do(
+            f"embed_docs:{request_fingerprint(self.model, texts)}",
+            lambda: self.embeddings.aembed_documents(texts),
+            encode=json.dumps,
+            decode=json.loads,
+        )
+
+    def __getattr__(self, name):
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+
+def _default_redis():
+    if not SINGLEFLIGHT_REDIS:
+        return None
+    from backend.database.redis_client import redis_client
+
+    return redis_client
+
+
+llm_singleflight = SingleFlight(redis=_default_redis(), namespace="singleflight:llm")
+embedding_singleflight = SingleFlight(redis=_default_redis(), namespace="singleflight:embed")
+
+
+def coalesce_chat_model(model):
+    """Wrap a chat model so identical concurrent calls share one request."""
+    if model is None or not LLM_SINGLEFLIGHT or isinstance(model, CoalescingChatModel):
+        return model
+    return CoalescingChatModel(model, llm_singleflight)
+
+
+def coalesce_embeddings(embeddings):
+    """Wrap an embeddings client so identical concurrent calls share one request."""
+    if embeddings is None or not LLM_SINGLEFLIGHT:
+        return embeddings
+    return CoalescingEmbeddings(embeddings, embedding_singleflight)
+
+
+def get_singleflight_stats() -> Dict[str, Any]:
+    return {
+        "enabled": LLM_SINGLEFLIGHT,
+        "distributed": SINGLEFLIGHT_REDIS,
+        "llm": llm_singleflight.get_stats(),
+        "embeddings": embedding_singleflight.get_stats(),
+    }
@@ -0,0 +1,282 @@
+"""
+Stub Adapter - Deterministic offline chat and embedding providers.
+
+Selected with ``LLM_PROVIDER=stub``. Every model factory in
+``backend.adapters.models`` then returns ``StubChatModel`` and
+``StubEmbeddings`` instead of calling a provider, so the API, agent graph and
+resume pipeline run (and can be load-tested) with no network or API keys.
+
+Responses are a pure function of the prompt: the same input always yields
+the same text, tokens and vectors. Prompts asking for JSON get a JSON object
+with the fields named in the prompt's template, so routing and quality
+parsing follow their normal LLM paths.
+
+Timing is configurable to mimic a real provider:
+- STUB_LLM_LATENCY_MS: delay before the first token
+- STUB_LLM_TOKENS_PER_SEC: generation rate after the first token
+- STUB_LLM_CHUNK_TOKENS: tokens per streamed chunk
+- STUB_LLM_RESPONSE_TOKENS: length of free-text responses
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import numpy as np
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+STUB_LLM_LATENCY_MS = float(os.getenv("STUB_LLM_LATENCY_MS", "300"))
+STUB_LLM_TOKENS_PER_SEC = float(os.getenv("STUB_LLM_TOKENS_PER_SEC", "80"))
+STUB_LLM_CHUNK_TOKENS = int(os.getenv("STUB_LLM_CHUNK_TOKENS", "4"))
+STUB_LLM_RESPONSE_TOKENS = int(os.getenv("STUB_LLM_RESPONSE_TOKENS", "120"))
+STUB_EMBEDDING_LATENCY_MS = float(os.getenv("STUB_EMBEDDING_LATENCY_MS", "20"))
+
+# Embedding sizes of the models the stub stands in for
+OPENAI_EMBEDDING_DIMENSIONS = 1536
+SENTENCE_TRANSFORMER_DIMENSIONS = 384
+
+_SENTENCES = [
+    "Massachusetts is adding thousands of clean energy jobs every year.",
+    "MassCEC funds internships that place students with climate employers.",
+    "Solar installers often start through a registered apprenticeship.",
+    "Veterans can translate military logistics experience into project coordination roles.",
+    "Offshore wind projects near New Bedford are hiring technicians and welders.",
+    "Heat pump installation is one of the fastest growing trades in the state.",
+    "Community colleges offer short certificate programs in building energy efficiency.",
+    "Environmental justice communities receive priority for several training grants.",
+    "Your existing skills in customer service transfer well to energy advising.",
+    "A good next step is to update your resume with measurable results.",
+    "Many employers value OSHA 10 certification for field positions.",
+    "International credentials can be evaluated for equivalency before applying.",
+]
+
+_ROUTES = [
+    ("specialists_team", "pendo", "climate_careers"),
+    ("specialists_team", "lauren", "climate_policy"),
+    ("specialists_team", "alex", "renewable_energy"),
+    ("specialists_team", "jasmine", "green_technology"),
+    ("veterans_team", "marcus", "veteran_transition"),
+    ("veterans_team", "james", "military_skills"),
+    ("ej_team", "miguel", "environmental_justice"),
+    ("international_team", "liv", "international_credentials"),
+    ("support_team", "mai", "wellbeing"),
+]
+
+_JSON_TEMPLATE = re.compile(r'"(\w+)"\s*:')
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _json_reply(template: str, digest: bytes) -> str:
+    """Fill the fields named in a prompt's JSON template deterministically."""
+    team, agent, domain = _ROUTES[digest[0] % len(_ROUTES)]
+    confidence = round(0.6 + (digest[1] % 40) / 100, 2)
+    values: Dict[str, Any] = {
+        "team": team,
+        "agent": agent,
+        "primary_domain": domain,
+        "confidence": confidence,
+        "confidence_score": confidence,
+        "score": confidence,
+        "routing_reason": f"Query matches {domain.replace('_', ' ')} expertise",
+        "reason": "Response is relevant and specific",
+        "complexity": "medium",
+        "complexity_level": "medium",
+        "requires_coordination": False,
+        "requires_human_review": False,
+        "needs_review": False,
+        "crisis_indicators": False,
+        "suggested_collaborators": [],
+        "domain_analysis": {"primary_domain": domain, "secondary_domains": []},
+    }
+    fields = list(dict.fromkeys(_JSON_TEMPLATE.findall(template)))
+    return json.dumps({f: values.get(f, "") for f in fields if f != "secondary_domains"})
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that answers deterministically after a simulated delay."""
+
+    model_name: str = "stub-chat"
+    temperature: float = 0.0
+    max_tokens: Optional[int] = None
+    latency_ms: float = STUB_LLM_LATENCY_MS
+    tokens_per_second: float = STUB_LLM_TOKENS_PER_SEC
+    chunk_tokens: int = STUB_LLM_CHUNK_TOKENS
+    response_tokens: int = STUB_LLM_RESPONSE_TOKENS
+    stream_usage: bool = True
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "temperature": self.temperature}
+
+    def _get_invocation_params(self, stop=None, **kwargs) -> Dict[str, Any]:
+        return {**super()._get_invocation_params(stop=stop, **kwargs), "model": self.model_name}
+
+    def bind_tools(self, tools, **kwargs):
+        # Tools are accepted but never called, so agents answer directly
+        return self
+
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        prompt = "\n".join(str(m.content) for m in messages)
+        digest = _digest(f"{self.model_name}\n{prompt}")
+        json_prompt = next((str(m.content) for m in messages if "JSON" in str(m.content)), None)
+        if json_prompt is not None:
+            return _json_reply(json_prompt[json_prompt.find("JSON") :], digest)
+
+        limit = min(self.response_tokens, self.max_tokens or self.response_tokens)
+        words: List[str] = []
+        i = 0
+        while len(words) < limit:
+            sentence = _SENTENCES[(digest[i % len(digest)] + i) % len(_SENTENCES)]
+            words.extend(sentence.split())
+            i += 1
+        return " ".join(words[:limit])
+
+    def _usage(self, messages: List[BaseMessage], text: str) -> Dict[str, int]:
+        prompt_tokens = sum(len(str(m.content).split()) for m in messages)
+        completion_tokens = len(text.split())
+        return {
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _chunks(self, text: str) -> List[str]:
+        words = text.split(" ")
+        size = max(1, self.chunk_tokens)
+        return [
+            " ".join(words[i : i + size]) + (" " if i + size < len(words) else "")
+            for i in range(0, len(words), size)
+        ]
+
+    def _generation_seconds(self, tokens: int) -> float:
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return tokens / self.tokens_per_second
+
+    def _result(self, messages: List[BaseMessage], text: str) -> ChatResult:
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"model_name": self.model_name},
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = self._respond(messages)
+        time.sleep(self.latency_ms / 1000 + self._generation_seconds(len(text.split())))
+        return self._result(messages, text)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = self._respond(messages)
+        await asyncio.sleep(self.latency_ms / 1000 + self._generation_seconds(len(text.split())))
+        return self._result(messages, text)
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        time.sleep(self.latency_ms / 1000)
+        for piece in self._chunks(text):
+            time.sleep(self._generation_seconds(self.chunk_tokens))
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+        if self.stream_usage:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content="", usage_metadata=self._usage(messages, text))
+            )
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        await asyncio.sleep(self.latency_ms / 1000)
+        for piece in self._chunks(text):
+            await asyncio.sleep(self._generation_seconds(self.chunk_tokens))
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            if run_manager:
+                await run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
+        if self.stream_usage:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content="", usage_metadata=self._usage(messages, text))
+            )
+
+
+class StubEmbeddings(Embeddings):
+    """
+    Hash-based embeddings of a fixed dimension.
+
+    Vectors are unit-normalized and seeded from the text, so identical texts
+    embed identically. Also provides ``encode`` for code written against
+    sentence-transformers.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = OPENAI_EMBEDDING_DIMENSIONS,
+        model: str = "stub-embedding",
+        latency_ms: float = STUB_EMBEDDING_LATENCY_MS,
+    ):
+        self.dimensions = dimensions
+        self.model = model
+        self.latency_ms = latency_ms
+
+    def _vector(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(_digest(f"{self.model}\n{text}")[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+        return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(t).tolist() for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text).tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(self.latency_ms / 1000)
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        await asyncio.sleep(self.latency_ms / 1000)
+        return self.embed_query(text)
+
+    def encode(self, sentences, **kwargs) -> np.ndarray:
+        if isinstance(sentences, str):
+            return self._vector(sentences)
+        return np.stack([self._vector(s) for s in sentences])
@@ -0,0 +1,320 @@
+"""
+Usage Adapter - Token and cost accounting for every LLM call.
+
+A LangChain callback handler is attached to each chat model when it is
+created, so routing, agent, quality and summarization calls are all counted
+without changing call sites. Callers tag calls with the agent, graph node
+and conversation through ``usage_context``; the tags travel in a context
+variable and are read when the call starts.
+
+Usage comes from the provider (``usage_metadata``, including cached prompt
+tokens; streams report it when ``stream_usage`` is on). When a provider does
+not report usage, tokens are counted locally with the tokenizer.
+
+Totals are aggregated in memory, fed to OptimizationManager.track_ai_usage
+per call, and flushed periodically to Redis (per model/agent/node, per day)
+and to ``conversations.total_tokens_used``.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from backend.utils.optimization import optimization_manager
+from backend.utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+USAGE_FLUSH_INTERVAL = float(os.getenv("USAGE_FLUSH_INTERVAL", "30"))
+USAGE_REDIS_TTL = 60 * 60 * 24 * 35
+
+# USD per million tokens: (prompt, cached prompt, completion)
+MODEL_PRICING: Dict[str, Tuple[float, float, float]] = {
+    "deepseek-chat": (0.27, 0.07, 1.10),
+    "deepseek-reasoner": (0.55, 0.14, 2.19),
+    "gpt-3.5-turbo": (0.50, 0.50, 1.50),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4": (30.00, 30.00, 60.00),
+}
+
+USAGE_TAG_KEYS = ("agent", "node", "conversation_id")
+
+_usage_tags: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    "llm_usage_tags", default={}
+)
+
+
+@contextmanager
+def usage_context(**tags):
+    """
+    Tag LLM calls made inside the block (agent, node, conversation_id).
+
+    Streaming calls made from generators should pass the same keys as run
+    metadata instead (``config={"metadata": usage_metadata(...)}``).
+    """
+    token = _usage_tags.set({**_usage_tags.get(), **tags})
+    try:
+        yield
+    finally:
+        _usage_tags.reset(token)
+
+
+def usage_metadata(**tags) -> Dict[str, Any]:
+    """Run metadata carrying usage tags, for calls that take a config."""
+    return {**_usage_tags.get(), **tags}
+
+
+def estimate_cost(model: str, prompt: int, cached: int, completion: int) -> float:
+    """Cost in USD; unknown models use the closest known prefix or zero."""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        pricing = next(
+            (p for name, p in MODEL_PRICING.items() if model and model.startswith(name)),
+            (0.0, 0.0, 0.0),
+        )
+    prompt_price, cached_price, completion_price = pricing
+    return (
+        (prompt - cached) * prompt_price + cached * cached_price + completion * completion_price
+    ) / 1_000_000
+
+
+class UsageAccountant:
+    """In-memory aggregation of per-call usage with periodic flush."""
+
+    def __init__(self, flush_interval: float = USAGE_FLUSH_INTERVAL, redis=None):
+        self.flush_interval = flush_interval
+        self._redis = redis
+        self.totals: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+        self._pending: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+        self._pending_conversations: Dict[str, int] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self.stats = {"calls": 0, "estimated_calls": 0, "flushes": 0, "flush_errors": 0}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from backend.database.redis_client import redis_client
+
+            self._redis = redis_client
+        return self._redis
+
+    def record(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        tags: Optional[Dict[str, Any]] = None,
+        estimated: bool = False,
+    ) -> float:
+        """Record one call; returns its estimated cost."""
+        tags = tags or {}
+        cost = estimate_cost(model, prompt_tokens, cached_tokens, completion_tokens)
+        key = (model, tags.get("agent") or "-", tags.get("node") or "-")
+
+        for bucket in (self.totals, self._pending):
+            entry = bucket.setdefault(
+                key,
+                {"calls": 0, "prompt": 0, "cached": 0, "completion": 0, "cost": 0.0},
+            )
+            entry["calls"] += 1
+            entry["prompt"] += prompt_tokens
+            entry["cached"] += cached_tokens
+            entry["completion"] += completion_tokens
+            entry["cost"] += cost
+
+        conversation_id = tags.get("conversation_id")
+        if conversation_id:
+            self._pending_conversations[conversation_id] = (
+                self._pending_conversations.get(conversation_id, 0)
+                + prompt_tokens
+                + completion_tokens
+            )
+
+        self.stats["calls"] += 1
+        if estimated:
+            self.stats["estimated_calls"] += 1
+
+        optimization_manager.track_ai_usage(
+            model, prompt_tokens, completion_tokens, cost, cached_tokens=cached_tokens
+        )
+        self._ensure_flusher()
+        return cost
+
+    def _ensure_flusher(self) -> None:
+        if self.flush_interval <= 0 or (self._flusher and not self._flusher.done()):
+            return
+        try:
+            self._flusher = asyncio.get_running_loop().create_task(self._run_flusher())
+        except RuntimeError:
+            # No running loop (sync caller); the next async call starts it
+            pass
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending aggregates to Redis and conversation token totals."""
+        pending, self._pending = self._pending, {}
+        conversations, self._pending_conversations = self._pending_conversations, {}
+        if not pending and not conversations:
+            return
+
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        redis_key = f"ai_usage:{day}"
+        try:
+            async with self.redis.get_connection() as client:
+                pipe = client.pipeline(transaction=False)
+                for (model, agent, node), entry in pending.items():
+                    prefix = f"{model}|{agent}|{node}"
+                    for metric in ("calls", "prompt", "cached", "completion"):
+                        pipe.hincrby(redis_key, f"{prefix}|{metric}", int(entry[metric]))
+                    pipe.hincrbyfloat(redis_key, f"{prefix}|cost", entry["cost"])
+                pipe.expire(redis_key, USAGE_REDIS_TTL)
+                await pipe.execute()
+        except Exception as e:
+            self.stats["flush_errors"] += 1
+            logger.warning(f"Usage flush to Redis failed: {e}")
+            self._requeue(pending)
+
+        if conversations:
+            await self._flush_conversations(conversations)
+        self.stats["flushes"] += 1
+
+    async def _flush_conversations(self, conversations: Dict[str, int]) -> None:
+        try:
+            from backend.database.supabase_client import supabase
+
+            # Incremented in the database, so concurrent flushes of the
+            # same conversation from several workers all count
+            supabase.rpc("increment_conversation_tokens", {"increments": conversations}).execute()
+        except Exception as e:
+            self.stats["flush_errors"] += 1
+            logger.warning(f"Conversation token flush failed: {e}")
+            for conversation_id, tokens in conversations.items():
+                self._pending_conversations[conversation_id] = (
+                    self._pending_conversations.get(conversation_id, 0) + tokens
+                )
+
+    def _requeue(self, pending: Dict[Tuple[str, str, str], Dict[str, float]]) -> None:
+        # Merge a failed flush back so the next one writes it; calls recorded
+        # in the meantime are added to, not overwritten
+        for key, entry in pending.items():
+            current = self._pending.setdefault(
+                key,
+                {"calls": 0, "prompt": 0, "cached": 0, "completion": 0, "cost": 0.0},
+            )
+            for metric, value in entry.items():
+                current[metric] += value
+
+    async def stop(self) -> None:
+        """Flush outstanding usage and stop the background flusher."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per (model, agent, node) totals, most expensive first."""
+        breakdown = sorted(
+            (
+                {"model": model, "agent": agent, "node": node, **entry}
+                for (model, agent, node), entry in self.totals.items()
+            ),
+            key=lambda row: row["cost"],
+            reverse=True,
+        )
+        return {**self.stats, "breakdown": breakdown}
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """Records token usage and cost for each chat model call."""
+
+    # Run in the caller's task so usage_context tags are visible
+    run_inline = True
+
+    def __init__(self, accountant: UsageAccountant):
+        self.accountant = accountant
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized,
+        messages,
+        *,
+        run_id: UUID,
+        invocation_params=None,
+        metadata=None,
+        **kwargs,
+    ) -> None:
+        params = invocation_params or {}
+        tags = dict(_usage_tags.get())
+        tags.update({k: v for k, v in (metadata or {}).items() if k in USAGE_TAG_KEYS})
+        self._runs[run_id] = {
+            "tags": tags,
+            "model": params.get("model") or params.get("model_name"),
+            "messages": messages,
+            "started": time.monotonic(),
+        }
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        generation = response.generations[0][0] if response.generations else None
+        message = getattr(generation, "message", None)
+        usage = getattr(message, "usage_metadata", None) or {}
+        llm_output = response.llm_output or {}
+        model = llm_output.get("model_name") or run["model"] or "unknown"
+
+        prompt = usage.get("input_tokens")
+        completion = usage.get("output_tokens")
+        cached = (usage.get("input_token_details") or {}).get("cache_read", 0)
+        if prompt is None:
+            token_usage = llm_output.get("token_usage") or {}
+            prompt = token_usage.get("prompt_tokens")
+            completion = token_usage.get("completion_tokens")
+            cached = (token_usage.get("prompt_tokens_details") or {}).get(
+                "cached_tokens"
+            ) or token_usage.get("prompt_cache_hit_tokens", 0)
+
+        estimated = prompt is None
+        if estimated:
+            # Provider reported nothing (e.g. streaming without stream_usage)
+            prompt = sum(
+                count_tokens(str(m.content), model) for batch in run["messages"] for m in batch
+            )
+            completion = count_tokens(getattr(generation, "text", "") or "", model)
+
+        self.accountant.record(
+            model,
+            int(prompt or 0),
+            int(completion or 0),
+            int(cached or 0),
+            tags=run["tags"],
+            estimated=estimated,
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        self._runs.pop(run_id, None)
+
+
+usage_accountant = UsageAccountant()
+usage_callback = UsageCallbackHandler(usage_accountant)
@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command, Send, interrupt
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from backend.adapters.models import get_chat_model
 from langchain_groq import ChatGroq
 
 from backend.agents.base.agent_state import AgentState
@@ -39,6 +39,10 @@ def get_climate_assistant_graph():
 
 from backend.database.redis_client import redis_client
 from backend.database.supabase_client import supabase
+from backend.services.conversation_context import conversation_context_cache
+from backend.services.conversation_summarizer import conversation_summarizer
+from backend.adapters.usage import usage_context
+from backend.utils.keywords import register_keywords
 
 # Absolute imports for semantic routing (following cea2.py patterns)
 import os
@@ -49,6 +53,21 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Fallback routes in priority order: (primary_domain, team, agent, label)
+FALLBACK_ROUTES = {
+    "veterans": ("veterans", "veterans_team", "marcus", "veteran"),
+    "ej": ("environmental_justice", "ej_team", "miguel", "EJ"),
+    "international": ("international", "international_team", "liv", "international"),
+}
+FALLBACK_KEYWORDS = register_keywords(
+    "coordinator_fallback",
+    {
+        "veterans": ["veteran", "military"],
+        "ej": ["community", "environmental justice"],
+        "international": ["international", "global"],
+    },
+)
+
 # Initialize models for semantic routing (following cea2.py patterns)
 MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")
 MODEL_NAME = os.getenv("MODEL_NAME", "gpt-3.5-turbo")
@@ -59,7 +78,7 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 semantic_model = (
     ChatGroq(model_name=MODEL_NAME)
     if MODEL_PROVIDER.lower() == "groq" and GROQ_API_KEY
-    else ChatOpenAI(model_name=MODEL_NAME)
+    else get_chat_model(MODEL_NAME)
 )
 
 
@@ -131,12 +150,13 @@ Respond in JSON format:
 }"""
 
             # Get semantic analysis
-            response = await self.semantic_model.ainvoke(
-                [
-                    SystemMessage(content=routing_prompt),
-                    HumanMessage(content=f"User query: {message}"),
-                ]
-            )
+            with usage_context(node="coordinator_routing"):
+                response = await self.semantic_model.ainvoke(
+                    [
+                        SystemMessage(content=routing_prompt),
+                        HumanMessage(content=f"User query: {message}"),
+                    ]
+                )
 
             # Parse JSON response
             try:
@@ -175,49 +195,29 @@ Respond in JSON format:
 
     async def _fallback_semantic_routing(self, message: str) -> Dict[str, Any]:
         """Fallback routing when semantic analysis fails"""
-        message_lower = message.lower()
+        route = FALLBACK_KEYWORDS.scan(message).first(FALLBACK_ROUTES)
 
         # Simple keyword-based fallback
-        if "veteran" in message_lower or "military" in message_lower:
+        if route is not None:
+            domain, team, agent, label = FALLBACK_ROUTES[route]
             return {
-                "primary_domain": "veterans",
-                "team": "veterans_team",
-                "agent": "marcus",
+                "primary_domain": domain,
+                "team": team,
+                "agent": agent,
                 "confidence_score": 0.7,
-                "routing_reason": "Fallback routing - veteran keywords detected",
+                "routing_reason": f"Fallback routing - {label} keywords detected",
                 "requires_human_review": False,
                 "complexity_level": "medium",
             }
-        elif "community" in message_lower or "environmental justice" in message_lower:
-            return {
-                "primary_domain": "environmental_justice",
-                "team": "ej_team",
-                "agent": "miguel",
-                "confidence_score": 0.7,
-                "routing_reason": "Fallback routing - EJ keywords detected",
-                "requires_human_review": False,
-                "complexity_level": "medium",
-            }
-        elif "international" in message_lower or "global" in message_lower:
-            return {
-                "primary_domain": "international",
-                "team": "international_team",
-                "agent": "liv",
-                "confidence_score": 0.7,
-                "routing_reason": "Fallback routing - international keywords detected",
-                "requires_human_review": False,
-                "complexity_level": "medium",
-            }
-        else:
-            return {
-                "primary_domain": "general",
-                "team": "specialists_team",
-                "agent": "pendo",
-                "confidence_score": 0.6,
-                "routing_reason": "Fallback routing - default to specialists",
-                "requires_human_review": False,
-                "complexity_level": "low",
-            }
+        return {
+            "primary_domain": "general",
+            "team": "specialists_team",
+            "agent": "pendo",
+            "confidence_score": 0.6,
+            "routing_reason": "Fallback routing - default to specialists",
+            "requires_human_review": False,
+            "complexity_level": "low",
+        }
 
     async def generate_intelligent_response(
         self,
@@ -246,12 +246,15 @@ Respond in JSON format:
 
         try:
             # Generate response with agent intelligence
-            response = await self.semantic_model.ainvoke(
-                [
-                    SystemMessage(content=agent_prompt + context_prompt),
-                    HumanMessage(content=message),
-                ]
-            )
+            with usage_context(
+                agent=agent, node="coordinator_response", conversation_id=conversation_id
+            ):
+                response = await self.semantic_model.ainvoke(
+                    [
+                        SystemMessage(content=agent_prompt + context_prompt),
+                        HumanMessage(content=message),
+                    ]
+                )
 
             return response.content
 
@@ -379,36 +382,29 @@ Help users navigate climate career opportunities with expertise and empathy."""
             if not supabase:
                 return ""
 
-            # Get last 5 messages for context
-            result = (
-                supabase.client.table("conversation_messages")
-                .select("role, content, specialist_type")
-                .eq("conversation_id", conversation_id)
-                .order("created_at", desc=True)
-                .limit(5)
-                .execute()
+            # Last 5 messages, served from the rolling Redis window when cached
+            return await conversation_context_cache.get_context(
+                conversation_id, "coordinator", 5, self._load_conversation_rows
             )
 
-            if result.data:
-                context_messages = []
-                for msg in reversed(result.data):  # Reverse to get chronological order
-                    role = msg.get("role", "user")
-                    content = msg.get("content", "")
-                    agent = msg.get("specialist_type", "")
-
-                    if role == "user":
-                        context_messages.append(f"User: {content}")
-                    elif role == "assistant" and agent:
-                        context_messages.append(f"{agent}: {content}")
-
-                return " | ".join(context_messages[-3:])  # Last 3 exchanges
-
-            return ""
-
         except Exception as e:
             logger.error(f"Error getting conversation context: {e}")
             return ""
 
+    async def _load_conversation_rows(
+        self, conversation_id: str, count: int
+    ) -> List[Dict[str, Any]]:
+        """Load the most recent messages in chronological order"""
+        result = (
+            supabase.client.table("conversation_messages")
+            .select("role, content, specialist_type, created_at")
+            .eq("conversation_id", conversation_id)
+            .order("created_at", desc=True)
+            .limit(count)
+            .execute()
+        )
+        return list(reversed(result.data or []))
+
     async def process_message(
         self,
         message: str,
@@ -567,6 +563,8 @@ Help users navigate climate career opportunities with expertise and empathy."""
             )
 
             if result.data:
+                await conversation_context_cache.append(conversation_id, message_data)
+                await conversation_summarizer.record_message(conversation_id, message_data)
                 logger.debug(f"Stored message: {role} - {agent or 'user'}")
             else:
                 logger.warning(f"Failed to store message: {result}")
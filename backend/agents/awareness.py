@@ -22,6 +22,7 @@ from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langgraph.types import Command, Send, interrupt
 from backend.database.redis_client import redis_client
+from backend.utils.keywords import SubstringIndex
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,14 @@ class ExpertiseLevel(Enum):
     SPECIALIST = "specialist"
 
 
+EXPERTISE_LEVEL_BOOST = {
+    ExpertiseLevel.SPECIALIST: 0.4,
+    ExpertiseLevel.EXPERT: 0.3,
+    ExpertiseLevel.INTERMEDIATE: 0.2,
+    ExpertiseLevel.NOVICE: 0.1,
+}
+
+
 @dataclass
 class AgentCapability:
     """Defines what an agent can do and their expertise level"""
@@ -102,6 +111,13 @@ class AgentAwarenessSystem:
         self.redis = redis_client
         self.agent_capabilities = self._initialize_agent_capabilities()
         self.coordination_history = {}
+        # Expertise areas indexed by substring, so ranking an expertise
+        # query is a few lookups instead of a scan of every area
+        self._expertise_index = SubstringIndex(
+            area
+            for capability in self.agent_capabilities.values()
+            for area in capability.expertise_areas
+        )
 
     def _initialize_agent_capabilities(self) -> Dict[str, AgentCapability]:
         """Initialize comprehensive agent capability mapping"""
@@ -469,6 +485,11 @@ class AgentAwarenessSystem:
     ) -> List[Tuple[str, float]]:
         """Find agents with specific expertise, ranked by relevance"""
         expert_agents = []
+        expertise_lower = expertise_needed.lower()
+        full_matches = self._expertise_index.containing(expertise_lower)
+        word_matches = set()
+        for word in expertise_lower.split():
+            word_matches |= self._expertise_index.containing(word)
 
         for agent_name, capability in self.agent_capabilities.items():
             if exclude_agent and agent_name == exclude_agent:
@@ -476,22 +497,16 @@ class AgentAwarenessSystem:
 
             # Calculate relevance score
             relevance_score = 0.0
-            expertise_lower = expertise_needed.lower()
 
             for area in capability.expertise_areas:
-                if expertise_lower in area.lower():
+                area_lower = area.lower()
+                if area_lower in full_matches:
                     relevance_score += 1.0
-                elif any(word in area.lower() for word in expertise_lower.split()):
+                elif area_lower in word_matches:
                     relevance_score += 0.5
 
             # Boost score based on expertise level
-            level_boost = {
-                ExpertiseLevel.SPECIALIST: 0.4,
-                ExpertiseLevel.EXPERT: 0.3,
-                ExpertiseLevel.INTERMEDIATE: 0.2,
-                ExpertiseLevel.NOVICE: 0.1,
-            }
-            relevance_score += level_boost.get(capability.expertise_level, 0.1)
+            relevance_score += EXPERTISE_LEVEL_BOOST.get(capability.expertise_level, 0.1)
 
             if relevance_score > 0.3:  # Minimum threshold
                 expert_agents.append((agent_name, relevance_score))
@@ -2,10 +2,11 @@
 
 import numpy as np
 from typing import Dict, List, Any
-from langchain_community.embeddings import OpenAIEmbeddings
 from langchain_community.vectorstores import SupabaseVectorStore
 import logging
 
+from backend.adapters.models import get_embeddings_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +15,7 @@ class SemanticAnalyzer:
 
     def __init__(self):
         """Initialize the semantic analyzer."""
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = get_embeddings_model()
         self.vector_store = None
 
     async def initialize(self, supabase_client) -> None:
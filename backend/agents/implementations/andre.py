@@ -16,9 +16,20 @@ from langgraph.types import Command
 from typing import Annotated, Literal
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+JOB_NEEDS_KEYWORDS = register_keywords(
+    "andre_needs",
+    {
+        "seeking": ["job", "work", "employment", "hiring", "career"],
+        "training": ["training", "certification", "learn", "skills", "education"],
+        "experienced": ["experienced", "supervisor", "manager", "lead"],
+        "intermediate": ["some experience", "few years"],
+    },
+)
+
 
 class AndreAgent(BaseAgent):
     """
@@ -226,18 +237,14 @@ class AndreAgent(BaseAgent):
             "location_mentioned": False,
         }
 
+        hits = JOB_NEEDS_KEYWORDS.scan(message)
+
         # Check for job seeking
-        if any(
-            word in message_lower
-            for word in ["job", "work", "employment", "hiring", "career"]
-        ):
+        if hits.has("seeking"):
             context["seeking_employment"] = True
 
         # Check for training needs
-        if any(
-            word in message_lower
-            for word in ["training", "certification", "learn", "skills", "education"]
-        ):
+        if hits.has("training"):
             context["needs_training"] = True
 
         # Identify job interests
@@ -255,13 +262,9 @@ class AndreAgent(BaseAgent):
                 context["has_barriers"].append(barrier)
 
         # Determine experience level
-        if any(
-            word in message_lower
-            for word in ["experienced", "supervisor", "manager", "lead"]
-        ):
-            context["experience_level"] = "experienced"
-        elif any(word in message_lower for word in ["some experience", "few years"]):
-            context["experience_level"] = "intermediate"
+        level = hits.first(["experienced", "intermediate"])
+        if level:
+            context["experience_level"] = level
 
         return context
 
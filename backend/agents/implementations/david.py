@@ -16,9 +16,42 @@ from langgraph.types import Command
 from typing import Annotated, Literal
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+SUPPORT_NEEDS_KEYWORDS = register_keywords(
+    "david_needs",
+    {
+        "va_benefits": ["benefits", "va", "disability", "compensation"],
+        "disability": ["disability", "compensation", "rating"],
+        "education": ["gi bill", "education", "school", "training"],
+        "healthcare": ["healthcare", "medical", "doctor", "hospital"],
+        "vocational_rehab": ["vr&e", "vocational", "rehabilitation", "career"],
+        # Crisis indicators (important for veteran support)
+        "crisis": [
+            "suicide",
+            "kill myself",
+            "end it all",
+            "can't go on",
+            "hopeless",
+            "worthless",
+        ],
+        "mental_health": [
+            "depressed",
+            "anxiety",
+            "ptsd",
+            "nightmares",
+            "flashbacks",
+            "struggling",
+        ],
+        "employment": ["job", "work", "employment", "career", "hire"],
+        "high_risk": ["depressed", "anxiety", "ptsd", "struggling", "overwhelmed"],
+    },
+)
+
+BENEFIT_TYPES = ["disability", "education", "healthcare", "vocational_rehab"]
+
 
 class DavidAgent(BaseAgent):
     """
@@ -183,8 +216,6 @@ class DavidAgent(BaseAgent):
 
     async def _analyze_support_needs(self, message: str) -> Dict[str, Any]:
         """Analyze message for support needs and crisis indicators"""
-        message_lower = message.lower()
-
         context = {
             "needs_va_benefits": False,
             "needs_crisis_support": False,
@@ -196,65 +227,27 @@ class DavidAgent(BaseAgent):
             "urgency_level": "normal",
         }
 
+        hits = SUPPORT_NEEDS_KEYWORDS.scan(message)
+
         # Check for VA benefits needs
-        if any(
-            word in message_lower
-            for word in ["benefits", "va", "disability", "compensation"]
-        ):
+        if hits.has("va_benefits"):
             context["needs_va_benefits"] = True
 
         # Check for specific benefit types
-        if any(
-            word in message_lower for word in ["disability", "compensation", "rating"]
-        ):
-            context["benefit_type"] = "disability"
-        elif any(
-            word in message_lower
-            for word in ["gi bill", "education", "school", "training"]
-        ):
-            context["benefit_type"] = "education"
-        elif any(
-            word in message_lower
-            for word in ["healthcare", "medical", "doctor", "hospital"]
-        ):
-            context["benefit_type"] = "healthcare"
-        elif any(
-            word in message_lower
-            for word in ["vr&e", "vocational", "rehabilitation", "career"]
-        ):
-            context["benefit_type"] = "vocational_rehab"
-
-        # Check for crisis indicators (important for veteran support)
-        crisis_words = [
-            "suicide",
-            "kill myself",
-            "end it all",
-            "can't go on",
-            "hopeless",
-            "worthless",
-        ]
-        if any(word in message_lower for word in crisis_words):
+        context["benefit_type"] = hits.first(BENEFIT_TYPES)
+
+        # Check for crisis indicators
+        if hits.has("crisis"):
             context["crisis_indicators"] = True
             context["urgency_level"] = "crisis"
 
         # Check for mental health indicators
-        mental_health_words = [
-            "depressed",
-            "anxiety",
-            "ptsd",
-            "nightmares",
-            "flashbacks",
-            "struggling",
-        ]
-        if any(word in message_lower for word in mental_health_words):
+        if hits.has("mental_health"):
             context["needs_crisis_support"] = True
             context["urgency_level"] = "high"
 
         # Check for employment help
-        if any(
-            word in message_lower
-            for word in ["job", "work", "employment", "career", "hire"]
-        ):
+        if hits.has("employment"):
             context["needs_employment_help"] = True
 
         return context
@@ -388,9 +381,9 @@ After you connect with crisis support, I'm here to help you access ongoing VA be
 @tool
 def search_va_benefits(query: str, state: dict = None) -> str:
     """Search for specific VA benefits and eligibility information."""
-    from langchain_openai import ChatOpenAI
+    from backend.adapters.models import get_chat_model
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
@@ -409,19 +402,9 @@ def assess_crisis_risk(message: str, state: dict = None) -> str:
     """Assess crisis risk level and provide appropriate resources."""
 
     # Simple crisis keyword detection
-    crisis_keywords = [
-        "suicide",
-        "kill myself",
-        "end it all",
-        "can't go on",
-        "hopeless",
-        "worthless",
-    ]
-    high_risk_keywords = ["depressed", "anxiety", "ptsd", "struggling", "overwhelmed"]
-
-    message_lower = message.lower()
-
-    if any(word in message_lower for word in crisis_keywords):
+    hits = SUPPORT_NEEDS_KEYWORDS.scan(message)
+
+    if hits.has("crisis"):
         return """CRISIS LEVEL: HIGH - Immediate intervention needed
         
 Resources:
@@ -432,7 +415,7 @@ Resources:
 
 This requires immediate professional attention."""
 
-    elif any(word in message_lower for word in high_risk_keywords):
+    elif hits.has("high_risk"):
         return """CRISIS LEVEL: MODERATE - Mental health support recommended
 
 Resources:
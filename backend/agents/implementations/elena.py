@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from langchain_core.tools import tool
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
+from backend.adapters.models import get_chat_model
 from langgraph.types import Command
 
 # from langgraph.prebuilt import InjectedState
@@ -226,7 +226,7 @@ def perform_accessibility_audit(
 ) -> str:
     """Perform comprehensive accessibility audit following WCAG guidelines."""
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
@@ -16,9 +16,36 @@ from langgraph.types import Command
 from typing import Annotated, Literal
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+MILITARY_CONTEXT_KEYWORDS = register_keywords(
+    "james_context",
+    {
+        "military": [
+            "military",
+            "veteran",
+            "army",
+            "navy",
+            "air force",
+            "marines",
+            "coast guard",
+        ],
+        "skills": [
+            "leadership",
+            "logistics",
+            "technical",
+            "communications",
+            "maintenance",
+            "project",
+            "security",
+            "training",
+        ],
+        "clearance": ["clearance", "secret", "top secret", "classified"],
+    },
+)
+
 
 class JamesAgent(BaseAgent):
     """
@@ -158,19 +185,10 @@ class JamesAgent(BaseAgent):
             "security_clearance": False,
         }
 
+        hits = MILITARY_CONTEXT_KEYWORDS.scan(message)
+
         # Check for military indicators
-        if any(
-            word in message_lower
-            for word in [
-                "military",
-                "veteran",
-                "army",
-                "navy",
-                "air force",
-                "marines",
-                "coast guard",
-            ]
-        ):
+        if hits.has("military"):
             context["has_military_experience"] = True
 
         # Check for specific branch
@@ -180,25 +198,10 @@ class JamesAgent(BaseAgent):
                 break
 
         # Check for skills that need translation
-        skill_keywords = [
-            "leadership",
-            "logistics",
-            "technical",
-            "communications",
-            "maintenance",
-            "project",
-            "security",
-            "training",
-        ]
-        context["skills_to_translate"] = [
-            skill for skill in skill_keywords if skill in message_lower
-        ]
+        context["skills_to_translate"] = hits.matched("skills")
 
         # Check for security clearance
-        if any(
-            word in message_lower
-            for word in ["clearance", "secret", "top secret", "classified"]
-        ):
+        if hits.has("clearance"):
             context["security_clearance"] = True
 
         return context
@@ -272,9 +275,9 @@ What specific military skills or experience would you like help translating to c
 @tool
 def translate_military_skills(skills: str, state: dict = None) -> str:
     """Translate military skills to civilian terms for climate careers."""
-    from langchain_openai import ChatOpenAI
+    from backend.adapters.models import get_chat_model
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
@@ -291,9 +294,9 @@ def translate_military_skills(skills: str, state: dict = None) -> str:
 @tool
 def analyze_mos_for_climate(mos_code: str, state: dict = None) -> str:
     """Analyze Military Occupational Specialty for climate career opportunities."""
-    from langchain_openai import ChatOpenAI
+    from backend.adapters.models import get_chat_model
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
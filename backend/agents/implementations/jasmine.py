@@ -14,7 +14,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Annotated
 from langchain_core.tools import tool
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
+from backend.adapters.models import get_chat_model
 from langgraph.types import Command
 
 # from langgraph.prebuilt import InjectedState
@@ -26,7 +26,7 @@ logger = logging.getLogger(__name__)
 
 # Initialize model
 MODEL_NAME = os.getenv("MODEL_NAME", "gpt-3.5-turbo")
-model = ChatOpenAI(model_name=MODEL_NAME)
+model = get_chat_model(MODEL_NAME)
 
 
 # Define tools for Jasmine (adopting cea2.py tool patterns)
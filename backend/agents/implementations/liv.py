@@ -4,9 +4,54 @@ import logging
 from langchain_core.messages import HumanMessage, AIMessage
 
 from backend.agents.base.agent_base import BaseAgent, AgentResponse, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+INTERNATIONAL_KEYWORDS = register_keywords(
+    "liv_background",
+    {
+        "international": [
+            "international",
+            "visa",
+            "immigration",
+            "foreign",
+            "credential",
+            "degree",
+            "university",
+            "overseas",
+            "abroad",
+            "country",
+        ],
+        # This is a simplified version - in production, use a proper NER model
+        "countries": [
+            "india",
+            "china",
+            "canada",
+            "uk",
+            "australia",
+            "germany",
+            "france",
+            "brazil",
+            "mexico",
+            "japan",
+            "south korea",
+            "philippines",
+            "nigeria",
+        ],
+        "credentials": [
+            "bachelor",
+            "master",
+            "phd",
+            "doctorate",
+            "diploma",
+            "certificate",
+            "degree",
+            "mba",
+        ],
+    },
+)
+
 
 class LivAgent(BaseAgent):
     """International populations specialist with credential recognition expertise"""
@@ -72,20 +117,7 @@ class LivAgent(BaseAgent):
         }
 
         # Check message content for international indicators
-        international_keywords = [
-            "international",
-            "visa",
-            "immigration",
-            "foreign",
-            "credential",
-            "degree",
-            "university",
-            "overseas",
-            "abroad",
-            "country",
-        ]
-
-        if any(keyword in message.lower() for keyword in international_keywords):
+        if INTERNATIONAL_KEYWORDS.scan(message).has("international"):
             international_context["has_international_background"] = True
 
         # Extract country of origin if mentioned
@@ -232,51 +264,8 @@ class LivAgent(BaseAgent):
 
     async def _extract_countries(self, message: str) -> List[str]:
         """Extract country names from message"""
-        # This is a simplified version - in production, use a proper NER model
-        common_countries = [
-            "india",
-            "china",
-            "canada",
-            "uk",
-            "australia",
-            "germany",
-            "france",
-            "brazil",
-            "mexico",
-            "japan",
-            "south korea",
-            "philippines",
-            "nigeria",
-        ]
-
-        found_countries = []
-        message_lower = message.lower()
-
-        for country in common_countries:
-            if country in message_lower:
-                found_countries.append(country)
-
-        return found_countries
+        return INTERNATIONAL_KEYWORDS.scan(message).matched("countries")
 
     async def _extract_credentials(self, message: str) -> List[str]:
         """Extract educational credentials from message"""
-        # This is a simplified version - in production, use a proper NER model
-        credential_keywords = [
-            "bachelor",
-            "master",
-            "phd",
-            "doctorate",
-            "diploma",
-            "certificate",
-            "degree",
-            "mba",
-        ]
-
-        found_credentials = []
-        message_lower = message.lower()
-
-        for credential in credential_keywords:
-            if credential in message_lower:
-                found_credentials.append(credential)
-
-        return found_credentials
+        return INTERNATIONAL_KEYWORDS.scan(message).matched("credentials")
@@ -12,9 +12,20 @@ from langchain_core.messages import HumanMessage, AIMessage
 from datetime import datetime
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+VETERAN_NEEDS_KEYWORDS = register_keywords(
+    "marcus_needs",
+    {
+        "resume_translation": ["resume"],
+        "benefits_navigation": ["benefits", "va"],
+        "training_programs": ["training", "certification"],
+        "job_search": ["job", "career"],
+    },
+)
+
 
 class MarcusAgent(BaseAgent):
     """
@@ -111,15 +122,7 @@ class MarcusAgent(BaseAgent):
         service_branch = memory.get("veteran_context", {}).get("service_branch")
 
         # Simple keyword-based analysis as placeholder
-        needs = []
-        if "resume" in message.lower():
-            needs.append("resume_translation")
-        if "benefits" in message.lower() or "va" in message.lower():
-            needs.append("benefits_navigation")
-        if "training" in message.lower() or "certification" in message.lower():
-            needs.append("training_programs")
-        if "job" in message.lower() or "career" in message.lower():
-            needs.append("job_search")
+        needs = list(VETERAN_NEEDS_KEYWORDS.scan(message).scores())
 
         # Default to general support if no specific needs identified
         if not needs:
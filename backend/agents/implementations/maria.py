@@ -16,9 +16,42 @@ from langgraph.types import Command
 from typing import Annotated, Literal
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+ENGAGEMENT_NEEDS_KEYWORDS = register_keywords(
+    "maria_needs",
+    {
+        "needs_organizing": ["organize", "mobilize", "campaign", "movement"],
+        "needs_outreach": ["outreach", "engagement", "community", "residents"],
+        "needs_coalition_building": [
+            "coalition",
+            "partnership",
+            "alliance",
+            "collaborate",
+        ],
+        "needs_advocacy": ["advocate", "policy", "government", "officials"],
+        # Engagement stages
+        "planning": ["planning", "start", "begin", "how to"],
+        "implementation": ["implementing", "doing", "action"],
+        "evaluation": ["evaluate", "assess", "measure"],
+        # Issue focus
+        "environmental_health": ["pollution", "air quality", "water"],
+        "housing_justice": ["housing", "gentrification", "displacement"],
+        "economic_justice": ["jobs", "economic", "workforce"],
+    },
+)
+
+ENGAGEMENT_NEEDS = [
+    "needs_organizing",
+    "needs_outreach",
+    "needs_coalition_building",
+    "needs_advocacy",
+]
+ENGAGEMENT_STAGES = ["planning", "implementation", "evaluation"]
+ISSUE_FOCUSES = ["environmental_health", "housing_justice", "economic_justice"]
+
 
 class MariaAgent(BaseAgent):
     """
@@ -214,33 +247,12 @@ class MariaAgent(BaseAgent):
             "issue_focus": None,
         }
 
-        # Check for organizing needs
-        if any(
-            word in message_lower
-            for word in ["organize", "mobilize", "campaign", "movement"]
-        ):
-            context["needs_organizing"] = True
-
-        # Check for outreach needs
-        if any(
-            word in message_lower
-            for word in ["outreach", "engagement", "community", "residents"]
-        ):
-            context["needs_outreach"] = True
-
-        # Check for coalition building
-        if any(
-            word in message_lower
-            for word in ["coalition", "partnership", "alliance", "collaborate"]
-        ):
-            context["needs_coalition_building"] = True
-
-        # Check for advocacy needs
-        if any(
-            word in message_lower
-            for word in ["advocate", "policy", "government", "officials"]
-        ):
-            context["needs_advocacy"] = True
+        hits = ENGAGEMENT_NEEDS_KEYWORDS.scan(message)
+
+        # Check for organizing, outreach, coalition building and advocacy needs
+        for need in ENGAGEMENT_NEEDS:
+            if hits.has(need):
+                context[need] = True
 
         # Identify community type
         for community_type in self.outreach_methods.keys():
@@ -249,25 +261,10 @@ class MariaAgent(BaseAgent):
                 break
 
         # Determine engagement stage
-        if any(
-            word in message_lower for word in ["planning", "start", "begin", "how to"]
-        ):
-            context["engagement_stage"] = "planning"
-        elif any(word in message_lower for word in ["implementing", "doing", "action"]):
-            context["engagement_stage"] = "implementation"
-        elif any(word in message_lower for word in ["evaluate", "assess", "measure"]):
-            context["engagement_stage"] = "evaluation"
+        context["engagement_stage"] = hits.first(ENGAGEMENT_STAGES) or "planning"
 
         # Identify issue focus
-        if any(word in message_lower for word in ["pollution", "air quality", "water"]):
-            context["issue_focus"] = "environmental_health"
-        elif any(
-            word in message_lower
-            for word in ["housing", "gentrification", "displacement"]
-        ):
-            context["issue_focus"] = "housing_justice"
-        elif any(word in message_lower for word in ["jobs", "economic", "workforce"]):
-            context["issue_focus"] = "economic_justice"
+        context["issue_focus"] = hits.first(ISSUE_FOCUSES)
 
         return context
 
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from langchain_core.tools import tool
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
+from backend.adapters.models import get_chat_model
 from langgraph.types import Command
 
 # from langgraph.prebuilt import InjectedState
@@ -95,7 +95,7 @@ def analyze_asia_pacific_climate_policy(
 ) -> str:
     """Analyze climate policies and initiatives in Asia-Pacific countries."""
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
@@ -221,7 +221,7 @@ def analyze_asia_pacific_carbon_markets(
 ) -> str:
     """Analyze carbon markets and trading opportunities in Asia-Pacific."""
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
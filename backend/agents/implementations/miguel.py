@@ -4,9 +4,48 @@ import logging
 from langchain_core.messages import HumanMessage, AIMessage
 
 from backend.agents.base.agent_base import BaseAgent, AgentResponse, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+EJ_KEYWORDS = register_keywords(
+    "miguel_context",
+    {
+        "ej": [
+            "environmental justice",
+            "community",
+            "pollution",
+            "climate impact",
+            "frontline",
+            "equity",
+            "vulnerable",
+            "sustainability",
+            "clean energy",
+        ],
+        # This would be enhanced with NLP for better extraction
+        "community_types": [
+            "urban",
+            "rural",
+            "coastal",
+            "indigenous",
+            "low-income",
+            "frontline",
+            "industrial",
+            "agricultural",
+        ],
+        "concerns": [
+            "air pollution",
+            "water quality",
+            "toxic waste",
+            "climate change",
+            "flooding",
+            "heat islands",
+            "food access",
+            "green space",
+        ],
+    },
+)
+
 
 class MiguelAgent(BaseAgent):
     """Environmental Justice specialist focusing on climate careers and community impact"""
@@ -70,19 +109,7 @@ class MiguelAgent(BaseAgent):
         }
 
         # Check message content for environmental justice indicators
-        ej_keywords = [
-            "environmental justice",
-            "community",
-            "pollution",
-            "climate impact",
-            "frontline",
-            "equity",
-            "vulnerable",
-            "sustainability",
-            "clean energy",
-        ]
-
-        if any(keyword in message.lower() for keyword in ej_keywords):
+        if EJ_KEYWORDS.scan(message).has("ej"):
             ej_context["has_ej_focus"] = True
 
         # Extract community type if mentioned
@@ -224,44 +251,8 @@ class MiguelAgent(BaseAgent):
 
     async def _extract_community_types(self, message: str) -> List[str]:
         """Extract community types from message"""
-        # This would be enhanced with NLP for better extraction
-        community_types = []
-        common_types = [
-            "urban",
-            "rural",
-            "coastal",
-            "indigenous",
-            "low-income",
-            "frontline",
-            "industrial",
-            "agricultural",
-        ]
-
-        message_lower = message.lower()
-        for type_ in common_types:
-            if type_ in message_lower:
-                community_types.append(type_)
-
-        return community_types
+        return EJ_KEYWORDS.scan(message).matched("community_types")
 
     async def _extract_environmental_concerns(self, message: str) -> List[str]:
         """Extract environmental concerns from message"""
-        # This would be enhanced with NLP for better extraction
-        concerns = []
-        common_concerns = [
-            "air pollution",
-            "water quality",
-            "toxic waste",
-            "climate change",
-            "flooding",
-            "heat islands",
-            "food access",
-            "green space",
-        ]
-
-        message_lower = message.lower()
-        for concern in common_concerns:
-            if concern in message_lower:
-                concerns.append(concern)
-
-        return concerns
+        return EJ_KEYWORDS.scan(message).matched("concerns")
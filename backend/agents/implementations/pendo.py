@@ -11,7 +11,7 @@ import os
 from typing import List, Optional, Dict, Any
 from langchain_core.tools import tool
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
+from backend.adapters.models import get_chat_model
 from langchain_groq import ChatGroq
 from langchain.agents import Tool
 from backend.agents.base.agent_base import AgenticAgent
@@ -26,7 +26,7 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 model = (
     ChatGroq(model_name=MODEL_NAME)
     if MODEL_PROVIDER.lower() == "groq" and GROQ_API_KEY
-    else ChatOpenAI(model_name=MODEL_NAME)
+    else get_chat_model(MODEL_NAME)
 )
 
 
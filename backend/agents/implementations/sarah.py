@@ -16,9 +16,31 @@ from langgraph.types import Command
 from typing import Annotated, Literal
 
 from backend.agents.base.agent_base import BaseAgent, AgentState
+from backend.utils.keywords import register_keywords
 
 logger = logging.getLogger(__name__)
 
+COACHING_NEEDS_KEYWORDS = register_keywords(
+    "sarah_needs",
+    {
+        "needs_resume_help": ["resume", "cv", "application"],
+        "needs_interview_prep": ["interview", "interviewing", "questions"],
+        "needs_career_planning": ["career", "transition", "path", "planning"],
+        "needs_skills_assessment": ["skills", "gap", "training", "certification"],
+        "needs_job_search": ["job", "jobs", "hiring", "opportunities"],
+        "senior": ["manager", "director", "senior", "lead"],
+        "mid": ["coordinator", "specialist", "analyst"],
+    },
+)
+
+COACHING_NEEDS = [
+    "needs_resume_help",
+    "needs_interview_prep",
+    "needs_career_planning",
+    "needs_skills_assessment",
+    "needs_job_search",
+]
+
 
 class SarahAgent(BaseAgent):
     """
@@ -194,41 +216,17 @@ class SarahAgent(BaseAgent):
             "climate_interest": None,
         }
 
+        hits = COACHING_NEEDS_KEYWORDS.scan(message)
+
         # Check for specific coaching needs
-        if any(word in message_lower for word in ["resume", "cv", "application"]):
-            context["needs_resume_help"] = True
-
-        if any(
-            word in message_lower for word in ["interview", "interviewing", "questions"]
-        ):
-            context["needs_interview_prep"] = True
-
-        if any(
-            word in message_lower
-            for word in ["career", "transition", "path", "planning"]
-        ):
-            context["needs_career_planning"] = True
-
-        if any(
-            word in message_lower
-            for word in ["skills", "gap", "training", "certification"]
-        ):
-            context["needs_skills_assessment"] = True
-
-        if any(
-            word in message_lower for word in ["job", "jobs", "hiring", "opportunities"]
-        ):
-            context["needs_job_search"] = True
+        for need in COACHING_NEEDS:
+            if hits.has(need):
+                context[need] = True
 
         # Determine career level
-        if any(
-            word in message_lower for word in ["manager", "director", "senior", "lead"]
-        ):
-            context["career_level"] = "senior"
-        elif any(
-            word in message_lower for word in ["coordinator", "specialist", "analyst"]
-        ):
-            context["career_level"] = "mid"
+        level = hits.first(["senior", "mid"])
+        if level:
+            context["career_level"] = level
 
         # Identify climate interest area
         for area in self.climate_career_paths.keys():
@@ -383,9 +381,9 @@ ADDITIONAL QUALIFICATIONS
 @tool
 def analyze_climate_job_market(location: str = "national", state: dict = None) -> str:
     """Analyze the climate job market for veterans in a specific location."""
-    from langchain_openai import ChatOpenAI
+    from backend.adapters.models import get_chat_model
 
-    model = ChatOpenAI(model_name="gpt-3.5-turbo")
+    model = get_chat_model("gpt-3.5-turbo")
     response = model.invoke(
         [
             SystemMessage(
@@ -41,6 +41,24 @@ from backend.database.redis_client import redis_client
 from backend.config.settings import get_settings
 from backend.config.agent_config import AgentConfig, AgentType
 from backend.adapters.models import create_langchain_llm, get_crisis_llm
+from backend.adapters.resilience import ProviderUnavailableError, get_resilience_stats
+from backend.adapters.hedging import get_hedging_stats
+from backend.adapters.singleflight import get_singleflight_stats
+from backend.adapters.usage import usage_accountant, usage_context, usage_metadata
+from backend.services.quality_evaluator import quality_classifier
+from backend.services.quality_pipeline import QualityEvaluationQueue, QualityJob
+from backend.services.conversation_context import conversation_context_cache
+from backend.services.conversation_summarizer import (
+    CONTEXT_TOKEN_BUDGET,
+    conversation_summarizer,
+)
+from backend.services.prompt_assembly import (
+    assemble_messages,
+    prefix_cache_stats,
+    static_prompts,
+)
+from backend.utils.keywords import register_keywords
+from backend.utils.tokens import count_tokens
 
 # Import coordination modules with error handling
 COORDINATION_AVAILABLE = False
@@ -102,12 +120,21 @@ MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "deepseek")
 MODEL_NAME = os.getenv("MODEL_NAME", "deepseek-chat")
 EVALUATION_MODEL = os.getenv("EVALUATION_MODEL", "deepseek-chat")
 
+# Post-response quality evaluation
+QUALITY_ASYNC_EVALUATION = (
+    os.getenv("QUALITY_ASYNC_EVALUATION", "true").lower() == "true"
+)
+QUALITY_QUEUE_MAXSIZE = int(os.getenv("QUALITY_QUEUE_MAXSIZE", "1000"))
+QUALITY_BATCH_SIZE = int(os.getenv("QUALITY_BATCH_SIZE", "8"))
+QUALITY_MAX_CONCURRENCY = int(os.getenv("QUALITY_MAX_CONCURRENCY", "4"))
+
 # Force DeepSeek usage (90% cheaper than OpenAI)
 logger.info(f"🚀 Framework using {MODEL_PROVIDER} provider with model {MODEL_NAME}")
 
 # Initialize models using enhanced adapter
+# Routing sits on the critical path of every request, so it hedges slow calls
 semantic_model = create_langchain_llm(
-    provider=MODEL_PROVIDER, model=MODEL_NAME, temperature=0.2
+    provider=MODEL_PROVIDER, model=MODEL_NAME, temperature=0.2, latency_critical=True
 )
 
 evaluation_model = create_langchain_llm(
@@ -254,6 +281,8 @@ async def store_message_db(conversation_id: str, message: Dict[str, Any]):
         }
 
         supabase.table("conversation_messages").insert(message_data).execute()
+        await conversation_context_cache.append(conversation_id, message_data)
+        await conversation_summarizer.record_message(conversation_id, message_data)
 
         logger.debug(f"Successfully stored message {message['id']}")
 
@@ -421,7 +450,7 @@ async def quality_check(
 
     # Check if human review is needed based on multiple factors
     human_input_required = state["metadata"].get("human_input_required", False)
-    coordination_complexity = state.get("coordination_context", {}).get(
+    coordination_complexity = (state.get("coordination_context") or {}).get(
         "complexity", "low"
     )
     agent_confidence = latest_ai_message.get("metadata", {}).get(
@@ -443,8 +472,92 @@ async def quality_check(
         )
         return Command(goto="human_review")
 
-    # LLM-based quality evaluation for complex cases
+    # Local risk classifier settles clear-cut responses without an LLM call
+    assessment = await quality_classifier.assess(
+        latest_human["content"], latest_ai_message["content"]
+    )
+    if assessment.decided:
+        metadata_update = state["metadata"].copy()
+        metadata_update.update(
+            {
+                "quality_score": assessment.quality_score,
+                "quality_reason": assessment.reason,
+                "quality_assessment": f"local_{assessment.tier}",
+            }
+        )
+        logger.info(
+            f"Local quality check ({assessment.tier}) settled in {assessment.latency_ms:.2f}ms: "
+            f"{assessment.quality_score}"
+        )
+        return Command(
+            goto="human_review" if assessment.needs_review else END,
+            update={"metadata": metadata_update},
+        )
+
+    # Ambiguous cases are evaluated by the LLM after the response is returned
+    if QUALITY_ASYNC_EVALUATION:
+        published = quality_queue.publish(
+            QualityJob(
+                conversation_id=state["conversation_id"],
+                user_id=state.get("user_id"),
+                question=latest_human["content"],
+                answer=latest_ai_message["content"],
+                agent=latest_ai_message.get("agent", "unknown"),
+                message_id=latest_ai_message.get("id"),
+                coordination_used=state.get("coordination_context") is not None,
+            )
+        )
+        metadata_update = state["metadata"].copy()
+        metadata_update["quality_assessment"] = (
+            "llm_pending" if published else "llm_dropped"
+        )
+        return Command(goto=END, update={"metadata": metadata_update})
+
+    # LLM-based quality evaluation for ambiguous cases
     try:
+        with usage_context(conversation_id=state.get("conversation_id")):
+            eval_data = await _llm_quality_evaluation(
+                latest_human["content"],
+                latest_ai_message["content"],
+                latest_ai_message.get("agent", "unknown"),
+                state.get("coordination_context") is not None,
+            )
+        score = eval_data["score"]
+        reason = eval_data["reason"]
+
+        # Record evaluation results
+        metadata_update = state["metadata"].copy()
+        metadata_update.update(
+            {
+                "quality_score": score,
+                "quality_reason": reason,
+                "quality_assessment": "llm_evaluated",
+            }
+        )
+
+        if eval_data["needs_review"]:
+            logger.info(
+                f"LLM quality check triggered human review: {score}. Reason: {reason}"
+            )
+            return Command(goto="human_review", update={"metadata": metadata_update})
+        else:
+            logger.info(f"Quality check passed: {score}. Reason: {reason}")
+            return Command(goto=END, update={"metadata": metadata_update})
+
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.error(f"Failed to parse quality check result: {e}")
+        return Command(goto=END)
+
+    except Exception as e:
+        logger.error(f"Quality check error: {e}")
+        return Command(goto=END)
+
+
+async def _llm_quality_evaluation(
+    question: str, answer: str, agent: str, coordination_used: bool
+) -> Dict[str, Any]:
+    """Ask the evaluation model whether a response needs human review"""
+    with usage_context(agent=agent, node="quality_check"):
         evaluation = await evaluation_model.ainvoke(
             [
                 SystemMessage(
@@ -461,45 +574,83 @@ async def quality_check(
             """
                 ),
                 HumanMessage(
-                    content=f"User question: {latest_human['content']}\n\nAI response: {latest_ai_message['content']}\n\nAgent: {latest_ai_message.get('agent', 'unknown')}\nCoordination used: {state.get('coordination_context') is not None}"
+                    content=f"User question: {question}\n\nAI response: {answer}\n\nAgent: {agent}\nCoordination used: {coordination_used}"
                 ),
             ]
         )
 
+    eval_data = json.loads(evaluation.content)
+    score = float(eval_data["score"])
+    return {
+        "score": score,
+        "reason": eval_data.get("reason", "No reason provided"),
+        "needs_review": eval_data.get("needs_review", score < 0.7),
+    }
+
+
+async def _evaluate_quality_job(job: QualityJob) -> Dict[str, Any]:
+    """Background evaluator for the async quality queue"""
+    with usage_context(conversation_id=job.conversation_id):
+        return await _llm_quality_evaluation(
+            job.question, job.answer, job.agent, job.coordination_used
+        )
+
+
+async def _record_quality_result(job: QualityJob, result: Dict[str, Any]) -> None:
+    """Persist an async quality score and raise a review interrupt if needed"""
+    logger.info(
+        f"Async quality check for {job.conversation_id}: {result['score']}. Reason: {result['reason']}"
+    )
+
+    if USE_DATABASE and job.message_id:
         try:
-            eval_data = json.loads(evaluation.content)
-            score = float(eval_data["score"])
-            reason = eval_data.get("reason", "No reason provided")
-            needs_review_llm = eval_data.get("needs_review", score < 0.7)
-
-            # Record evaluation results
-            metadata_update = state["metadata"].copy()
-            metadata_update.update(
-                {
-                    "quality_score": score,
-                    "quality_reason": reason,
-                    "quality_assessment": "llm_evaluated",
-                }
+            existing = (
+                supabase.table("conversation_messages")
+                .select("metadata")
+                .eq("id", job.message_id)
+                .execute()
             )
-
-            if needs_review_llm:
-                logger.info(
-                    f"LLM quality check triggered human review: {score}. Reason: {reason}"
-                )
-                return Command(
-                    goto="human_review", update={"metadata": metadata_update}
+            if existing.data:
+                metadata = existing.data[0].get("metadata") or {}
+                metadata.update(
+                    {
+                        "quality_score": result["score"],
+                        "quality_reason": result["reason"],
+                        "quality_assessment": "llm_evaluated_async",
+                    }
                 )
-            else:
-                logger.info(f"Quality check passed: {score}. Reason: {reason}")
-                return Command(goto=END, update={"metadata": metadata_update})
+                supabase.table("conversation_messages").update(
+                    {"metadata": metadata}
+                ).eq("id", job.message_id).execute()
+        except Exception as e:
+            logger.error(f"Error storing quality score: {e}")
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.error(f"Failed to parse quality check result: {e}")
-            return Command(goto=END)
+    if result["needs_review"]:
+        await store_conversation_interrupt(
+            job.conversation_id,
+            {
+                "type": "human_review",
+                "priority": "medium",
+                "user_id": job.user_id,
+                "escalation_reason": result["reason"],
+                "quality_score": result["score"],
+                "quality_assessment": "llm_evaluated_async",
+                "message_id": job.message_id,
+                "message_content": job.answer,
+                "agent": job.agent,
+                "coordination_used": job.coordination_used,
+            },
+        )
 
-    except Exception as e:
-        logger.error(f"Quality check error: {e}")
-        return Command(goto=END)
+
+# Background queue for post-response LLM quality evaluation
+quality_queue = QualityEvaluationQueue(
+    evaluate=_evaluate_quality_job,
+    on_result=_record_quality_result,
+    maxsize=QUALITY_QUEUE_MAXSIZE,
+    batch_size=QUALITY_BATCH_SIZE,
+    max_concurrency=QUALITY_MAX_CONCURRENCY,
+)
 
 
 async def human_review_node(state: ConversationState) -> Any:
@@ -649,12 +800,13 @@ Respond in JSON format:
     }
 }"""
 
-        response = await semantic_model.ainvoke(
-            [
-                SystemMessage(content=routing_prompt),
-                HumanMessage(content=f"User message: {message}"),
-            ]
-        )
+        with usage_context(node="semantic_routing"):
+            response = await semantic_model.ainvoke(
+                [
+                    SystemMessage(content=routing_prompt),
+                    HumanMessage(content=f"User message: {message}"),
+                ]
+            )
 
         try:
             # Check if response content is empty or None
@@ -702,6 +854,11 @@ Respond in JSON format:
             logger.error(f"Failed to parse enhanced semantic routing response: {e}, Content: '{response.content[:100]}...'")
             return await _fallback_semantic_routing(message)
 
+    except ProviderUnavailableError as e:
+        # Circuit open or load shed: fail fast to keyword routing
+        logger.warning(f"Routing model unavailable ({e}), using fallback routing")
+        return await _fallback_semantic_routing(message)
+
     except Exception as e:
         logger.error(f"Error in enhanced semantic routing: {e}")
         return await _fallback_semantic_routing(message)
@@ -721,80 +878,61 @@ def _get_fallback_value(field: str) -> Any:
     return fallbacks.get(field, None)
 
 
+# Keyword tables for fallback routing, checked in order; the first table
+# with a hit picks the route
+FALLBACK_ROUTE_KEYWORDS = {
+    "veterans": ["veteran", "military", "va ", "service member", "discharge"],
+    "ej": ["community", "environmental justice", "pollution", "equity"],
+    "international": ["international", "global", "visa", "immigration", "foreign"],
+    "support": ["crisis", "mental health", "stress", "emergency", "support"],
+    "renewable": ["renewable", "solar", "wind", "technical", "certification"],
+    "policy": ["policy", "regulation", "government", "program"],
+    "innovation": ["startup", "innovation", "technology", "green tech"],
+}
+
+# route -> (team, agent, confidence); support escalates to michael in a crisis
+FALLBACK_ROUTES = {
+    "veterans": ("veterans_team", "marcus", 0.8),
+    "ej": ("ej_team", "miguel", 0.8),
+    "international": ("international_team", "liv", 0.8),
+    "support": ("support_team", "mai", 0.9),
+    "renewable": ("specialists_team", "alex", 0.7),
+    "policy": ("specialists_team", "lauren", 0.7),
+    "innovation": ("specialists_team", "jasmine", 0.7),
+}
+
+FALLBACK_KEYWORDS = register_keywords(
+    "fallback_routing",
+    {
+        "crisis": ["suicide", "self-harm", "emergency", "crisis", "help me", "urgent"],
+        **FALLBACK_ROUTE_KEYWORDS,
+    },
+)
+
+
 async def _fallback_semantic_routing(message: str) -> Dict[str, Any]:
     """Enhanced fallback routing when semantic analysis fails"""
-    message_lower = message.lower()
-
-    # Crisis detection keywords
-    crisis_keywords = [
-        "suicide",
-        "self-harm",
-        "emergency",
-        "crisis",
-        "help me",
-        "urgent",
-    ]
-    crisis_detected = any(keyword in message_lower for keyword in crisis_keywords)
-
-    # Enhanced keyword-based routing with confidence scores
-    routing_patterns = [
-        (
-            ["veteran", "military", "va ", "service member", "discharge"],
-            "veterans_team",
-            "marcus",
-            0.8,
-        ),
-        (
-            ["community", "environmental justice", "pollution", "equity"],
-            "ej_team",
-            "miguel",
-            0.8,
-        ),
-        (
-            ["international", "global", "visa", "immigration", "foreign"],
-            "international_team",
-            "liv",
-            0.8,
-        ),
-        (
-            ["crisis", "mental health", "stress", "emergency", "support"],
-            "support_team",
-            "mai" if not crisis_detected else "michael",
-            0.9,
-        ),
-        (
-            ["renewable", "solar", "wind", "technical", "certification"],
-            "specialists_team",
-            "alex",
-            0.7,
-        ),
-        (
-            ["policy", "regulation", "government", "program"],
-            "specialists_team",
-            "lauren",
-            0.7,
-        ),
-        (
-            ["startup", "innovation", "technology", "green tech"],
-            "specialists_team",
-            "jasmine",
-            0.7,
-        ),
-    ]
-
-    for keywords, team, agent, confidence in routing_patterns:
-        if any(keyword in message_lower for keyword in keywords):
-            return {
-                "team": team,
-                "agent": agent,
-                "confidence": confidence,
-                "routing_reason": f"Fallback routing - {keywords[0]} keywords detected",
-                "complexity": "high" if crisis_detected else "medium",
-                "requires_coordination": False,
-                "crisis_indicators": crisis_detected,
-                "fallback_used": True,
-                "timestamp": datetime.now().isoformat(),
-            }
+    hits = FALLBACK_KEYWORDS.scan(message)
+    crisis_detected = hits.has("crisis")
+
+    route = hits.first(FALLBACK_ROUTE_KEYWORDS)
+    if route is not None:
+        team, agent, confidence = FALLBACK_ROUTES[route]
+        if route == "support" and crisis_detected:
+            agent = "michael"
+        return {
+            "team": team,
+            "agent": agent,
+            "confidence": confidence,
+            "routing_reason": (
+                f"Fallback routing - {FALLBACK_ROUTE_KEYWORDS[route][0]} keywords detected"
+            ),
+            "complexity": "high" if crisis_detected else "medium",
+            "requires_coordination": False,
+            "crisis_indicators": crisis_detected,
+            "fallback_used": True,
+            "timestamp": datetime.now().isoformat(),
+        }
 
     # Default fallback
     return {
@@ -962,25 +1100,33 @@ async def create_enhanced_agent(
                     # Continue with normal agent processing
 
             # Generate response using agent's specialized model and prompt
-            system_prompt = _get_enhanced_agent_prompt(agent_name, config)
+            system_message = _get_agent_system_message(agent_name, config)
 
-            # Add conversation context
-            context_messages = await _get_conversation_context(
-                state["conversation_id"], limit=3
-            )
+            # Add conversation context (rolling summary + recent turns within budget)
+            context_messages = await _get_conversation_context(state["conversation_id"])
             context_prompt = ""
             if context_messages:
-                context_prompt = f"\n\nRecent conversation context: {context_messages}"
+                context_prompt = f"Recent conversation context: {context_messages}"
+            prompt_tokens = _prompt_token_report(
+                system_message.content, context_prompt, user_message
+            )
+            logger.info(f"{agent_name} prompt tokens: {prompt_tokens}")
 
             # Use agent's configured model
             agent_model = config.get("model") or semantic_model
 
-            response = await agent_model.ainvoke(
-                [
-                    SystemMessage(content=system_prompt + context_prompt),
-                    HumanMessage(content=user_message),
-                ]
-            )
+            # Static system prompt first so the provider can reuse its cached prefix
+            with usage_context(
+                agent=agent_name,
+                node=f"{agent_name}_agent",
+                conversation_id=state["conversation_id"],
+            ):
+                response = await agent_model.ainvoke(
+                    assemble_messages(system_message, user_message, context_prompt)
+                )
+            prompt_tokens["cached"] = prefix_cache_stats.record(agent_name, response)[
+                "cached_tokens"
+            ]
 
             # Calculate processing time
             processing_time = (time.time() - start_time) * 1000
@@ -999,6 +1145,7 @@ async def create_enhanced_agent(
                     "agent_specializations": config.get("specializations", []),
                     "coordination_used": coordination_context is not None,
                     "capabilities_used": config.get("capabilities", []),
+                    "prompt_tokens": prompt_tokens,
                 },
                 "semantic_routing_data": state.get("semantic_routing_data"),
                 "coordination_context": coordination_context,
@@ -1033,8 +1180,21 @@ async def create_enhanced_agent(
     return enhanced_agent
 
 
+def _get_agent_system_message(agent_name: str, config: Dict[str, Any]) -> SystemMessage:
+    """Interned system message for an agent; identical on every request"""
+    return static_prompts.get(
+        ("enhanced", agent_name),
+        lambda: _build_enhanced_agent_prompt(agent_name, config),
+    )
+
+
 def _get_enhanced_agent_prompt(agent_name: str, config: Dict[str, Any]) -> str:
     """Get enhanced system prompt for agents with their specific expertise"""
+    return _get_agent_system_message(agent_name, config).content
+
+
+def _build_enhanced_agent_prompt(agent_name: str, config: Dict[str, Any]) -> str:
+    """Build the static system prompt for an agent (called once per agent)"""
 
     base_context = f"""You are {config.get('name', agent_name)}, {config.get('description', 'a specialist')} for the Climate Economy Assistant.
 
@@ -1075,54 +1235,54 @@ Be knowledgeable, helpful, and leverage your specific expertise. If you need hel
     return agent_prompts.get(agent_name, base_context)
 
 
-async def _get_conversation_context(conversation_id: str, limit: int = 3) -> str:
-    """Get recent conversation context for enhanced responses"""
+async def _get_conversation_context(
+    conversation_id: str, budget: int = CONTEXT_TOKEN_BUDGET
+) -> str:
+    """Get the rolling summary plus recent turns that fit in a token budget"""
     try:
         if not supabase:
             return ""
 
-        # Get last few messages for context
-        result = (
-            supabase.table("conversation_messages")
-            .select("role, content, specialist_type")
-            .eq("conversation_id", conversation_id)
-            .order("created_at", desc=True)
-            .limit(limit * 2)
-            .execute()
-        )  # Get more messages to account for system messages
-
-        if result.data:
-            context_messages = []
-            user_assistant_pairs = 0
-
-            for msg in reversed(result.data):  # Reverse to get chronological order
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                agent = msg.get("specialist_type", "")
-
-                # Skip system messages and limit to actual conversations
-                if (
-                    role in ["user", "assistant"]
-                    and content
-                    and user_assistant_pairs < limit
-                ):
-                    if role == "user":
-                        context_messages.append(f"User: {content[:200]}...")
-                    elif role == "assistant" and agent:
-                        context_messages.append(f"{agent}: {content[:200]}...")
-
-                    if role == "assistant":
-                        user_assistant_pairs += 1
-
-            return " | ".join(context_messages[-6:])  # Last 6 messages (3 exchanges)
-
-        return ""
+        # Served from the rolling Redis window; the database is only hit on a miss
+        return await conversation_context_cache.get_context(
+            conversation_id,
+            "budgeted",
+            budget,
+            _load_conversation_rows,
+            summary_loader=conversation_summarizer.get_summary,
+        )
 
     except Exception as e:
         logger.error(f"Error getting conversation context: {e}")
         return ""
 
 
+async def _load_conversation_rows(conversation_id: str, count: int) -> List[Dict]:
+    """Load the most recent messages in chronological order"""
+    result = (
+        supabase.table("conversation_messages")
+        .select("role, content, specialist_type, created_at")
+        .eq("conversation_id", conversation_id)
+        .order("created_at", desc=True)
+        .limit(count)
+        .execute()
+    )
+    return list(reversed(result.data or []))
+
+
+def _prompt_token_report(
+    system_prompt: str, context_prompt: str, user_message: str
+) -> Dict[str, int]:
+    """Token counts for each part of an agent prompt"""
+    report = {
+        "system": count_tokens(system_prompt),
+        "context": count_tokens(context_prompt),
+        "user": count_tokens(user_message),
+    }
+    report["total"] = sum(report.values())
+    return report
+
+
 # Create the enhanced graph with all 18 agents
 def create_enhanced_climate_assistant_graph():
     """Create and compile the enhanced Climate Economy Assistant graph with all agents"""
@@ -1420,26 +1580,46 @@ async def stream_message_with_enhanced_graph(
             raise ValueError(f"No configuration found for agent {routing_data['agent']}")
         
         # Generate response using agent's specialized model and prompt
-        system_prompt = _get_enhanced_agent_prompt(routing_data["agent"], agent_config)
+        system_message = _get_agent_system_message(routing_data["agent"], agent_config)
         
         # Get conversation context
-        context_messages = await _get_conversation_context(conversation_id, limit=2)
-        context_prompt = f"\n\nRecent conversation context: {context_messages}" if context_messages else ""
+        context_messages = await _get_conversation_context(
+            conversation_id, budget=CONTEXT_TOKEN_BUDGET // 2
+        )
+        context_prompt = f"Recent conversation context: {context_messages}" if context_messages else ""
+        logger.info(
+            f"{routing_data['agent']} streaming prompt tokens: "
+            f"{_prompt_token_report(system_message.content, context_prompt, message)}"
+        )
+        prompt_messages = assemble_messages(system_message, message, context_prompt)
+        run_config = {
+            "metadata": usage_metadata(
+                agent=routing_data["agent"],
+                node="stream_response",
+                conversation_id=conversation_id,
+            )
+        }
         
         # Use agent's configured model with streaming
         agent_model = agent_config.get("model") or semantic_model
         
         # Stream the response generation
         response_chunks = []
+        stream_started = time.perf_counter()
+        first_token_ms = None
         
         try:
             # For DeepSeek and compatible models, use streaming
             if hasattr(agent_model, 'astream'):
-                async for chunk in agent_model.astream([
-                    SystemMessage(content=system_prompt + context_prompt),
-                    HumanMessage(content=message),
-                ]):
+                async for chunk in agent_model.astream(prompt_messages, run_config):
+                    if getattr(chunk, "usage_metadata", None):
+                        # Usage arrives on the final chunk when the provider reports it
+                        prefix_cache_stats.record(
+                            routing_data["agent"], chunk, first_token_ms
+                        )
                     if hasattr(chunk, 'content') and chunk.content:
+                        if first_token_ms is None:
+                            first_token_ms = (time.perf_counter() - stream_started) * 1000
                         response_chunks.append(chunk.content)
                         
                         yield {
@@ -1453,10 +1633,8 @@ async def stream_message_with_enhanced_graph(
                         }
             else:
                 # Fallback for non-streaming models
-                response = await agent_model.ainvoke([
-                    SystemMessage(content=system_prompt + context_prompt),
-                    HumanMessage(content=message),
-                ])
+                response = await agent_model.ainvoke(prompt_messages, run_config)
+                prefix_cache_stats.record(routing_data["agent"], response)
                 
                 full_content = response.content if hasattr(response, 'content') else str(response)
                 
@@ -1582,6 +1760,20 @@ def get_framework_status() -> Dict[str, Any]:
         },
         "coordination_available": COORDINATION_AVAILABLE,
         "semantic_routing_enabled": True,
+        "quality_pipeline": {
+            "async_evaluation": QUALITY_ASYNC_EVALUATION,
+            "local_classifier": quality_classifier.stats,
+            "queue": quality_queue.get_stats(),
+        },
+        "conversation_summaries": conversation_summarizer.get_stats(),
+        "request_coalescing": get_singleflight_stats(),
+        "provider_guards": get_resilience_stats(),
+        "hedging": get_hedging_stats(),
+        "llm_usage": usage_accountant.get_stats(),
+        "prompt_prefix_cache": {
+            "interned_prompts": len(static_prompts),
+            "agents": prefix_cache_stats.get_stats(),
+        },
         "agent_awareness_enabled": COORDINATION_AVAILABLE,
         "features": {
             "enhanced_semantic_routing": True,
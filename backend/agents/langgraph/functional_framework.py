@@ -16,7 +16,6 @@ import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional, AsyncGenerator, Tuple
 from dataclasses import dataclass
-from functools import lru_cache
 import uuid
 
 # LangGraph Functional API imports (2025 optimized patterns)
@@ -29,8 +28,17 @@ from langchain_core.runnables import RunnableLambda, RunnableParallel
 # Fast imports for optimization
 from backend.config.agent_config import AgentConfig
 from backend.adapters.models import create_langchain_llm
+from backend.adapters.usage import usage_metadata
 from backend.database.redis_client import redis_client
 from backend.database.supabase_client import supabase
+from backend.services.conversation_context import conversation_context_cache
+from backend.services.conversation_summarizer import conversation_summarizer
+from backend.services.prompt_assembly import (
+    assemble_messages,
+    prefix_cache_stats,
+    static_prompts,
+)
+from backend.utils.keywords import register_keywords
 
 # Environment and logging
 import os
@@ -46,7 +54,7 @@ CACHE_TTL = 300  # 5 minutes for semantic routing cache
 
 # Initialize optimized model (single instance, reused)
 optimized_model = create_langchain_llm(
-    provider=MODEL_PROVIDER, model=MODEL_NAME, temperature=0.2
+    provider=MODEL_PROVIDER, model=MODEL_NAME, temperature=0.2, latency_critical=True
 )
 
 # Agent team mapping (pre-computed for speed)
@@ -63,6 +71,18 @@ AGENT_TEAMS = {
     "elena": "support_team", "thomas": "support_team"
 }
 
+# Keyword tables for fast routing; a team scores one point per matched keyword
+ROUTING_KEYWORDS = register_keywords(
+    "fast_route",
+    {
+        "veterans": ["veteran", "military", "service", "deployment", "va", "benefits"],
+        "ej": ["community", "environmental justice", "equity", "disadvantaged", "pollution"],
+        "international": ["global", "international", "climate policy", "paris", "cop"],
+        "specialists": ["clean energy", "renewable", "solar", "wind", "green jobs"],
+        "support": ["help", "support", "question", "guidance", "assistance"],
+    },
+)
+
 @dataclass
 class OptimizedResponse:
     """Streamlined response format for high performance"""
@@ -81,17 +101,6 @@ class FastSemanticRouter:
         self.cache = {}
         self.model = optimized_model
     
-    @lru_cache(maxsize=1000)
-    def _get_cached_keywords(self) -> Dict[str, List[str]]:
-        """Pre-computed keyword mappings for instant routing"""
-        return {
-            "veterans": ["veteran", "military", "service", "deployment", "va", "benefits"],
-            "ej": ["community", "environmental justice", "equity", "disadvantaged", "pollution"],
-            "international": ["global", "international", "climate policy", "paris", "cop"],
-            "specialists": ["clean energy", "renewable", "solar", "wind", "green jobs"],
-            "support": ["help", "support", "question", "guidance", "assistance"]
-        }
-    
     async def fast_route(self, message: str) -> Dict[str, Any]:
         """Lightning-fast routing using keywords + cache"""
         start_time = time.perf_counter()
@@ -101,7 +110,8 @@ class FastSemanticRouter:
         try:
             cached = await redis_client.get(cache_key)
             if cached:
-                result = json.loads(cached)
+                # redis_client.get already decodes JSON values
+                result = dict(cached)
                 result["cache_hit"] = True
                 result["routing_time_ms"] = (time.perf_counter() - start_time) * 1000
                 logger.info(f"⚡ Cache hit for routing: {result['agent']} ({result['routing_time_ms']:.1f}ms)")
@@ -109,16 +119,8 @@ class FastSemanticRouter:
         except Exception as e:
             logger.warning(f"Cache read failed: {e}")
         
-        # Fast keyword-based routing
-        message_lower = message.lower()
-        keywords = self._get_cached_keywords()
-        
-        # Score each team based on keyword matches
-        team_scores = {}
-        for team, team_keywords in keywords.items():
-            score = sum(1 for keyword in team_keywords if keyword in message_lower)
-            if score > 0:
-                team_scores[team] = score
+        # Score each team based on keyword matches, in one pass
+        team_scores = ROUTING_KEYWORDS.scan(message).scores()
         
         # Select best team and agent
         if team_scores:
@@ -151,7 +153,7 @@ class FastSemanticRouter:
         
         # Cache the result
         try:
-            await redis_client.setex(cache_key, CACHE_TTL, json.dumps(result))
+            await redis_client.set(cache_key, result, ttl=CACHE_TTL)
         except Exception as e:
             logger.warning(f"Cache write failed: {e}")
         
@@ -180,8 +182,11 @@ class OptimizedAgentExecutor:
             # Get agent configuration
             agent_config = AgentConfig.AGENTS.get(agent, {})
             
-            # Create optimized system prompt
-            system_prompt = self._get_optimized_prompt(agent, agent_config)
+            # Interned system prompt keeps the provider-cached prefix stable
+            system_message = static_prompts.get(
+                ("optimized", agent),
+                lambda: self._get_optimized_prompt(agent, agent_config),
+            )
             
             # Yield immediate acknowledgment
             yield {
@@ -195,15 +200,22 @@ class OptimizedAgentExecutor:
             }
             
             # Generate response with streaming
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=message)
-            ]
+            messages = assemble_messages(system_message, message)
             
             # Stream from model
             response_chunks = []
-            async for chunk in self.model.astream(messages):
+            first_token_ms = None
+            run_config = {
+                "metadata": usage_metadata(
+                    agent=agent, node="optimized_stream", conversation_id=conversation_id
+                )
+            }
+            async for chunk in self.model.astream(messages, run_config):
+                if getattr(chunk, "usage_metadata", None):
+                    prefix_cache_stats.record(agent, chunk, first_token_ms)
                 if hasattr(chunk, 'content') and chunk.content:
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - start_time) * 1000
                     response_chunks.append(chunk.content)
                     
                     yield {
@@ -318,6 +330,9 @@ Respond as {config.get('name', agent)} with your specialized expertise."""
                     supabase.table("conversation_messages").insert(assistant_data).execute(),
                     return_exceptions=True
                 )
+                for data in (user_data, assistant_data):
+                    await conversation_context_cache.append(conversation_id, data)
+                    await conversation_summarizer.record_message(conversation_id, data)
                 
         except Exception as e:
             logger.error(f"Failed to store messages: {e}")
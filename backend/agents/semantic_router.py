@@ -5,9 +5,10 @@ Uses caching and optimized similarity computation for better performance.
 
 from typing import Dict, List, Optional, Tuple
 import asyncio
-from langchain_community.embeddings import OpenAIEmbeddings
 import numpy as np
 from backend.database.redis_client import redis_client
+from backend.adapters.models import get_embeddings_model
+from backend.adapters.singleflight import coalesce_embeddings
 from backend.config.settings import get_settings
 import structlog
 import json
@@ -21,7 +22,7 @@ class SemanticRouter:
 
     def __init__(self):
         """Initialize the semantic router."""
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = coalesce_embeddings(get_embeddings_model())
         self.agent_descriptions: Dict[str, str] = {}
         self.agent_embeddings: Dict[str, List[float]] = {}
         self.cache_ttl = 3600  # 1 hour cache TTL
@@ -40,9 +41,7 @@ class SemanticRouter:
         # Generate embeddings for each agent description
         for agent_id, description in agent_descriptions.items():
             try:
-                embedding = await asyncio.to_thread(
-                    self.embeddings.embed_query, description
-                )
+                embedding = await self.embeddings.aembed_query(description)
                 self.agent_embeddings[agent_id] = embedding
             except Exception as e:
                 logger.error(
@@ -64,9 +63,7 @@ class SemanticRouter:
 
             if not message_embedding:
                 # Generate and cache embedding
-                message_embedding = await asyncio.to_thread(
-                    self.embeddings.embed_query, message
-                )
+                message_embedding = await self.embeddings.aembed_query(message)
                 await self._cache_embedding(cache_key, message_embedding)
 
             # Convert to numpy arrays for vectorized computation
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List, Optional
-from langchain_openai import OpenAIEmbeddings
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 import logging
+from ...adapters.models import get_embeddings_model
 from ...database.supabase_client import supabase
 
 logger = logging.getLogger(__name__)
@@ -12,7 +12,7 @@ class SemanticAnalyzer:
     """Pure semantic analysis without hardcoded keywords"""
 
     def __init__(self):
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = get_embeddings_model()
         self._initialize_embeddings_table()
 
     def _initialize_embeddings_table(self):
@@ -0,0 +1,111 @@
+"""
+Listing totals without counting every row on every page view.
+
+``count="exact"`` makes Postgres scan the whole filtered set for each page
+that shows a total. ``count_rows`` picks a cheaper strategy instead:
+
+- unfiltered: the planner's row estimate (``estimated_row_count`` over
+  ``pg_class.reltuples``), unless the table is small enough to count
+- filtered: at most ``EXACT_COUNT_LIMIT + 1`` ids are read; fewer means
+  the count is exact, otherwise PostgREST's planned count is used
+
+Totals are memoized in Redis per table and filter signature for a short
+TTL, and always say whether they are exact.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence, Tuple
+
+import structlog
+
+from backend.database.redis_client import redis_client
+from backend.database.supabase_client import supabase
+
+logger = structlog.get_logger(__name__)
+
+COUNT_CACHE_TTL = int(os.getenv("COUNT_CACHE_TTL", "60"))
+EXACT_COUNT_LIMIT = int(os.getenv("EXACT_COUNT_LIMIT", "1000"))
+
+# (query builder method, column, value), e.g. ("eq", "status", "active")
+Filter = Tuple[str, str, Any]
+
+
+@dataclass
+class Total:
+    """A row count and whether it is exact or an estimate."""
+
+    value: int
+    exact: bool
+
+    def pagination(self) -> Dict[str, Any]:
+        """The total fields of a ``pagination`` block."""
+        return {"total": self.value, "total_is_exact": self.exact}
+
+
+def apply_filters(query, filters: Sequence[Filter]):
+    """Apply ``filters`` to a query builder."""
+    for method, column, value in filters:
+        query = getattr(query, method)(column, value)
+    return query
+
+
+def _cache_key(table: str, filters: Sequence[Filter]) -> str:
+    signature = json.dumps(
+        sorted(json.dumps(f, default=str) for f in filters), separators=(",", ":")
+    )
+    return f"counts:{table}:{hashlib.sha1(signature.encode()).hexdigest()[:16]}"
+
+
+def _count(table: str, filters: Sequence[Filter], exact_limit: int) -> Total:
+    if not filters:
+        try:
+            estimate = supabase.rpc("estimated_row_count", {"table_name": table}).execute().data
+        except Exception as e:
+            logger.warning("Row estimate unavailable", table=table, error=str(e))
+            estimate = None
+        if estimate is not None and estimate > exact_limit:
+            return Total(int(estimate), False)
+
+    # Reading a bounded number of ids decides whether an exact count is cheap
+    probe = apply_filters(supabase.table(table).select("id"), filters)
+    rows = probe.limit(exact_limit + 1).execute().data or []
+    if len(rows) <= exact_limit:
+        return Total(len(rows), True)
+
+    planned = apply_filters(supabase.table(table).select("id", count="planned"), filters)
+    estimate = planned.limit(1).execute().count or 0
+    # The probe proved a lower bound that a stale plan may undershoot
+    return Total(max(int(estimate), exact_limit + 1), False)
+
+
+async def count_rows(
+    table: str,
+    filters: Sequence[Filter] = (),
+    exact_limit: int = EXACT_COUNT_LIMIT,
+    ttl: int = COUNT_CACHE_TTL,
+    redis=None,
+) -> Total:
+    """Total rows of ``table`` matching ``filters``, exact only for small sets."""
+    redis = redis or redis_client
+    key = _cache_key(table, filters)
+    try:
+        async with redis.get_connection() as client:
+            cached = await client.get(key)
+        if cached:
+            return Total(**json.loads(cached))
+    except Exception as e:
+        logger.warning("Count cache read failed", key=key, error=str(e))
+
+    total = _count(table, filters, exact_limit)
+    if ttl <= 0:
+        return total
+
+    try:
+        async with redis.get_connection() as client:
+            await client.set(key, json.dumps({"value": total.value, "exact": total.exact}), ex=ttl)
+    except Exception as e:
+        logger.warning("Count cache write failed", key=key, error=str(e))
+    return total
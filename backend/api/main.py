@@ -69,6 +69,17 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     try:
+        # Finish post-response quality evaluations before exiting
+        from backend.agents.langgraph.framework import quality_queue
+        from backend.adapters.usage import usage_accountant
+        from backend.services.reference_data import reference_data
+        from backend.services.view_counter import view_counter
+
+        await quality_queue.stop()
+        await usage_accountant.stop()
+        await view_counter.stop()
+        await reference_data.stop()
+
         if os.getenv("ENVIRONMENT") != "development":
             await redis_client.close()
     except Exception as e:
@@ -0,0 +1,122 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Offset pagination (``.range(offset, offset + limit - 1)``) makes the
+database read and discard every row before the page, so deep pages get
+slower, and rows shift between pages when new ones are inserted. A keyset
+page instead continues after the last row of the previous one: rows
+strictly after its (sort value, id) pair, in (sort, id) order, which a
+composite (sort, id) index answers without skipping anything.
+
+Rows whose sort value is NULL come last in either direction, ordered by id;
+a cursor issued in that tail carries a NULL sort value.
+
+Cursors are opaque to clients (URL-safe base64 JSON) and only valid for
+the sort column they were issued for. ``offset`` is kept as a deprecated
+fallback for requests without a cursor.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for another listing."""
+
+
+def encode_cursor(column: str, value: Any, key: Any) -> str:
+    """Opaque cursor for the row with ``column`` = ``value`` and id ``key``."""
+    payload = json.dumps([column, value, key], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: str) -> Tuple[Any, Any]:
+    """(sort value, id) of a cursor issued for ``column``; the value may be None."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        issued_for, value, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCursorError("Invalid pagination cursor")
+    if issued_for != column or key is None:
+        raise InvalidCursorError("Pagination cursor does not belong to this listing")
+    return value, key
+
+
+def _literal(value: Any) -> str:
+    """``value`` quoted for a PostgREST logic tree, which reserves ``,.:()``."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+@dataclass
+class Page:
+    """One page of rows and the cursor for the next one."""
+
+    rows: List[Dict[str, Any]]
+    limit: int
+    offset: int
+    next_cursor: Optional[str]
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def pagination(self, **extra: Any) -> Dict[str, Any]:
+        """The ``pagination`` block of a list response."""
+        return {
+            "limit": self.limit,
+            "offset": self.offset,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            **extra,
+        }
+
+
+def paginate(
+    query,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    column: str = "created_at",
+    desc: bool = True,
+    key: str = "id",
+) -> Page:
+    """
+    Order ``query`` by (``column``, ``key``) and execute one page of it.
+
+    With a ``cursor`` the page starts right after the row it was issued for
+    and ``offset`` is ignored; without one, ``offset`` rows are skipped.
+    One extra row is fetched to tell whether another page follows. Raises
+    InvalidCursorError for cursors that cannot be decoded.
+    """
+    # Explicit NULLS LAST: Postgres puts NULLs first in DESC order
+    query = query.order(column, desc=desc, nullsfirst=False).order(key, desc=desc)
+    if cursor:
+        value, last_key = decode_cursor(cursor, column)
+        op = "lt" if desc else "gt"
+        if value is None:
+            # Inside the NULL tail, which is ordered by id alone
+            query = getattr(query.is_(column, "null"), op)(key, last_key)
+        else:
+            # Rows past the value, ties on it broken by id, then the NULL
+            # tail; each branch is a range of the (sort, id) index
+            query = query.or_(
+                f"{column}.{op}.{_literal(value)},"
+                f"and({column}.eq.{_literal(value)},{key}.{op}.{_literal(last_key)}),"
+                f"{column}.is.null"
+            )
+        offset = 0
+        query = query.limit(limit + 1)
+    else:
+        query = query.range(offset, offset + limit)
+
+    rows = query.execute().data or []
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(column, last.get(column), last.get(key))
+    return Page(rows, limit, offset, next_cursor)
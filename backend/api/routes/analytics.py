@@ -10,6 +10,7 @@ import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.api.pagination import InvalidCursorError, paginate
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -57,7 +58,8 @@ async def create_conversation_analytics(
 @router.get("/conversations", response_model=Dict[str, Any])
 async def get_conversation_analytics(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     conversation_id: Optional[str] = Query(None),
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
@@ -87,24 +89,18 @@ async def get_conversation_analytics(
             query = query.lte("created_at", date_to)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} conversation analytics for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} conversation analytics for user {user_id}")
         
         return {
             "success": True,
-            "analytics": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "analytics": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -211,7 +207,8 @@ async def create_message_feedback(
 @router.get("/messages/feedback", response_model=Dict[str, Any])
 async def get_message_feedback(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     conversation_id: Optional[str] = Query(None),
     message_id: Optional[str] = Query(None),
     rating: Optional[int] = Query(None, ge=1, le=5),
@@ -246,24 +243,18 @@ async def get_message_feedback(
             query = query.gte("created_at", date_from)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} message feedback records for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} message feedback records for user {user_id}")
         
         return {
             "success": True,
-            "feedback": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "feedback": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting message feedback: {e}")
         raise HTTPException(status_code=500, detail="Failed to get message feedback")
@@ -366,7 +357,8 @@ async def create_conversation_feedback(
 @router.get("/conversations/feedback", response_model=Dict[str, Any])
 async def get_conversation_feedback(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     conversation_id: Optional[str] = Query(None),
     rating: Optional[int] = Query(None, ge=1, le=5),
     date_from: Optional[str] = Query(None),
@@ -398,24 +390,18 @@ async def get_conversation_feedback(
             query = query.gte("created_at", date_from)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} conversation feedback records for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} conversation feedback records for user {user_id}")
         
         return {
             "success": True,
-            "feedback": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "feedback": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting conversation feedback: {e}")
         raise HTTPException(status_code=500, detail="Failed to get conversation feedback")
@@ -463,7 +449,8 @@ async def create_conversation_interrupt(
 @router.get("/conversations/interrupts", response_model=Dict[str, Any])
 async def get_conversation_interrupts(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     conversation_id: Optional[str] = Query(None),
     interrupt_type: Optional[str] = Query(None),
     date_from: Optional[str] = Query(None),
@@ -495,24 +482,18 @@ async def get_conversation_interrupts(
             query = query.gte("created_at", date_from)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} conversation interrupts for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} conversation interrupts for user {user_id}")
         
         return {
             "success": True,
-            "interrupts": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "interrupts": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting conversation interrupts: {e}")
         raise HTTPException(status_code=500, detail="Failed to get conversation interrupts")
@@ -10,6 +10,7 @@ import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.api.pagination import InvalidCursorError, paginate
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -58,7 +59,8 @@ async def create_audit_log(
 @router.get("/logs", response_model=Dict[str, Any])
 async def get_audit_logs(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     action_type: Optional[str] = Query(None),
     resource_type: Optional[str] = Query(None),
     target_user_id: Optional[str] = Query(None),
@@ -94,24 +96,18 @@ async def get_audit_logs(
             query = query.lte("timestamp", date_to)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("timestamp", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="timestamp")
         
-        logger.info(f"Retrieved {len(result.data)} audit logs for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} audit logs for user {user_id}")
         
         return {
             "success": True,
-            "logs": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "logs": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -198,7 +194,8 @@ async def create_security_audit_log(
 @router.get("/security", response_model=Dict[str, Any])
 async def get_security_audit_logs(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     event_type: Optional[str] = Query(None),
     severity_level: Optional[str] = Query(None),
     ip_address: Optional[str] = Query(None),
@@ -234,24 +231,18 @@ async def get_security_audit_logs(
             query = query.lte("timestamp", date_to)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("timestamp", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="timestamp")
         
-        logger.info(f"Retrieved {len(result.data)} security audit logs for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} security audit logs for user {user_id}")
         
         return {
             "success": True,
-            "logs": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "logs": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -354,7 +345,8 @@ async def create_workflow_session(
 @router.get("/workflows", response_model=Dict[str, Any])
 async def get_workflow_sessions(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     workflow_type: Optional[str] = Query(None),
     session_status: Optional[str] = Query(None),
     date_from: Optional[str] = Query(None),
@@ -386,24 +378,18 @@ async def get_workflow_sessions(
             query = query.gte("started_at", date_from)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("started_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="started_at")
         
-        logger.info(f"Retrieved {len(result.data)} workflow sessions for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} workflow sessions for user {user_id}")
         
         return {
             "success": True,
-            "sessions": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "sessions": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting workflow sessions: {e}")
         raise HTTPException(status_code=500, detail="Failed to get workflow sessions")
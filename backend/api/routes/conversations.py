@@ -26,6 +26,7 @@ from backend.api.models.validation import (
     ErrorResponse,
 )
 from backend.api.services.conversation_service import ConversationService
+from backend.api.pagination import InvalidCursorError
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -33,22 +34,26 @@ router = APIRouter()
 
 @router.get("/", response_model=ConversationListResponse)
 async def list_conversations(
-    limit: int = 10, offset: int = 0, user_id: str = Depends(verify_token)
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    user_id: str = Depends(verify_token),
 ) -> ConversationListResponse:
-    """List user's conversations with pagination"""
+    """List user's conversations with cursor pagination (``offset`` is deprecated)"""
     try:
         service = ConversationService()
-        conversations = await service.list_conversations(user_id, limit, offset)
+        page = await service.list_conversations(user_id, limit, offset, cursor)
         return ConversationListResponse(
             success=True,
             message="Conversations retrieved successfully",
             data={
-                "conversations": conversations,
-                "total": len(conversations),
-                "limit": limit,
-                "offset": offset,
+                "conversations": page.rows,
+                "total": len(page.rows),
+                **page.pagination(),
             },
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("conversation_list_failed", error=str(e), user_id=user_id)
         raise HTTPException(
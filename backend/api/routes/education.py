@@ -10,6 +10,9 @@ import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.api.pagination import InvalidCursorError, paginate
+from backend.services.reference_data import reference_data
+from backend.services.skills_engine import skills_engine
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -44,6 +47,7 @@ async def create_education_program(
         result = supabase.table("education_programs").insert(program_data).execute()
         
         if result.data:
+            await reference_data.invalidate("education_programs")
             logger.info(f"Created education program {result.data[0]['id']} by user {user_id}")
             return {"success": True, "program": result.data[0]}
         else:
@@ -59,7 +63,8 @@ async def create_education_program(
 @router.get("/programs", response_model=Dict[str, Any])
 async def get_education_programs(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     provider: Optional[str] = Query(None),
     program_type: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -86,24 +91,18 @@ async def get_education_programs(
             query = query.contains("climate_focus", [climate_focus])
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} education programs for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} education programs for user {user_id}")
         
         return {
             "success": True,
-            "programs": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "programs": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting education programs: {e}")
         raise HTTPException(status_code=500, detail="Failed to get education programs")
@@ -121,12 +120,10 @@ async def get_education_program(
     - Shows completion requirements and certification info
     """
     try:
-        result = supabase.table("education_programs").select("*").eq("id", program_id).execute()
+        program = await reference_data.get("education_programs", program_id)
         
-        if not result.data:
+        if not program:
             raise HTTPException(status_code=404, detail="Education program not found")
-            
-        program = result.data[0]
         
         # Check if user is enrolled in this program
         enrollment_result = (
@@ -196,7 +193,8 @@ async def evaluate_credentials(
 @router.get("/credentials/evaluations", response_model=Dict[str, Any])
 async def get_credential_evaluations(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     credential_type: Optional[str] = Query(None),
     user_id: str = Depends(verify_token)
@@ -217,24 +215,18 @@ async def get_credential_evaluations(
             query = query.eq("credential_type", credential_type)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("submitted_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="submitted_at")
         
-        logger.info(f"Retrieved {len(result.data)} credential evaluations for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} credential evaluations for user {user_id}")
         
         return {
             "success": True,
-            "evaluations": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "evaluations": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting credential evaluations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get credential evaluations")
@@ -305,6 +297,7 @@ async def translate_mos(
         result = supabase.table("mos_translation").insert(mos_data).execute()
         
         if result.data:
+            await reference_data.invalidate("mos_translation")
             translation_id = result.data[0]['id']
             
             # Get existing MOS translation data if available
@@ -337,7 +330,8 @@ async def translate_mos(
 @router.get("/mos/translations", response_model=Dict[str, Any])
 async def get_mos_translations(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     branch: Optional[str] = Query(None),
     user_id: str = Depends(verify_token)
 ) -> Dict[str, Any]:
@@ -355,24 +349,18 @@ async def get_mos_translations(
             query = query.eq("branch", branch)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("translation_date", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="translation_date")
         
-        logger.info(f"Retrieved {len(result.data)} MOS translations for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} MOS translations for user {user_id}")
         
         return {
             "success": True,
-            "translations": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "translations": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting MOS translations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get MOS translations")
@@ -406,28 +394,24 @@ async def create_skills_mapping(
         result = supabase.table("skills_mapping").insert(mapping_data).execute()
         
         if result.data:
+            await reference_data.invalidate("skills_mapping")
             mapping_id = result.data[0]['id']
             
             # Get role requirements for comparison
-            role_requirements = (
-                supabase.table("role_requirements")
-                .select("*")
-                .eq("role_name", mapping_data["target_role"])
-                .execute()
+            role_requirements = await reference_data.lookup(
+                "role_requirements", "role_name", mapping_data["target_role"]
             )
             
             mapping_result = result.data[0]
-            if role_requirements.data:
-                required_skills = role_requirements.data[0].get("required_skills", [])
-                current_skills = mapping_data.get("current_skills", [])
-                
-                # Calculate skill gaps
-                skill_gaps = [skill for skill in required_skills if skill not in current_skills]
-                matching_skills = [skill for skill in required_skills if skill in current_skills]
-                
-                mapping_result["skill_gaps"] = skill_gaps
-                mapping_result["matching_skills"] = matching_skills
-                mapping_result["match_percentage"] = (len(matching_skills) / len(required_skills)) * 100 if required_skills else 0
+            if role_requirements:
+                # Calculate skill gaps over normalized skill ids
+                index = await skills_engine.index()
+                comparison = index.compare(
+                    mapping_data.get("current_skills", []),
+                    role_requirements[0].get("required_skills") or [],
+                    role_requirements[0].get("preferred_skills") or [],
+                )
+                mapping_result.update(comparison.as_dict())
             
             logger.info(f"Created skills mapping {mapping_id} for user {user_id}")
             return {"success": True, "mapping": mapping_result}
@@ -444,7 +428,8 @@ async def create_skills_mapping(
 @router.get("/skills/mappings", response_model=Dict[str, Any])
 async def get_skills_mappings(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     target_role: Optional[str] = Query(None),
     user_id: str = Depends(verify_token)
 ) -> Dict[str, Any]:
@@ -462,29 +447,59 @@ async def get_skills_mappings(
             query = query.eq("target_role", target_role)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} skills mappings for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} skills mappings for user {user_id}")
         
         return {
             "success": True,
-            "mappings": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "mappings": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting skills mappings: {e}")
         raise HTTPException(status_code=500, detail="Failed to get skills mappings")
 
 
+@router.post("/skills/evaluate", response_model=Dict[str, Any])
+async def evaluate_skills(
+    profile: Dict[str, Any],
+    limit: int = Query(10, ge=1, le=100),
+    user_id: str = Depends(verify_token)
+) -> Dict[str, Any]:
+    """
+    Rank climate economy roles by how well a skill profile covers them.
+    - Matches skills through the normalized vocabulary, synonyms included
+    - Weighs required skills fully and preferred skills at half
+    - Returns matching and missing skills for the best-fitting roles
+    """
+    try:
+        skills = profile.get("skills")
+        if not isinstance(skills, list) or not skills:
+            raise HTTPException(status_code=400, detail="Missing required field: skills")
+        
+        index = await skills_engine.index()
+        fits = index.evaluate(skills, limit=limit)
+        
+        logger.info(f"Evaluated {len(skills)} skills against {len(index.roles)} roles for user {user_id}")
+        
+        return {
+            "success": True,
+            "roles": [fit.as_dict() for fit in fits],
+            "unrecognized_skills": index.unrecognized(skills),
+            "roles_evaluated": len(index.roles)
+        }
+        
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error evaluating skills: {e}")
+        raise HTTPException(status_code=500, detail="Failed to evaluate skills")
+
+
 # Role Requirements Management
 @router.get("/roles/requirements", response_model=Dict[str, Any])
 async def get_role_requirements(
@@ -492,7 +507,8 @@ async def get_role_requirements(
     climate_focus: Optional[str] = Query(None),
     experience_level: Optional[str] = Query(None),
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     user_id: str = Depends(verify_token)
 ) -> Dict[str, Any]:
     """
@@ -513,24 +529,18 @@ async def get_role_requirements(
             query = query.eq("experience_level", experience_level)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("role_name")
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="role_name", desc=False)
         
-        logger.info(f"Retrieved {len(result.data)} role requirements for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} role requirements for user {user_id}")
         
         return {
             "success": True,
-            "roles": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "roles": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting role requirements: {e}")
         raise HTTPException(status_code=500, detail="Failed to get role requirements")
@@ -548,23 +558,21 @@ async def get_role_requirement(
     - Shows career progression opportunities
     """
     try:
-        result = supabase.table("role_requirements").select("*").eq("id", role_id).execute()
+        role = await reference_data.get("role_requirements", role_id)
         
-        if not result.data:
+        if not role:
             raise HTTPException(status_code=404, detail="Role requirement not found")
-            
-        role = result.data[0]
         
         # Get related education programs
-        education_result = (
-            supabase.table("education_programs")
-            .select("id, program_name, provider, description")
-            .contains("target_roles", [role["role_name"]])
-            .execute()
+        related_programs = await reference_data.lookup(
+            "education_programs", "target_roles", role["role_name"]
         )
         
-        if education_result.data:
-            role["related_programs"] = education_result.data
+        if related_programs:
+            role["related_programs"] = [
+                {key: program.get(key) for key in ("id", "program_name", "provider", "description")}
+                for program in related_programs
+            ]
         
         logger.info(f"Retrieved role requirement {role_id} for user {user_id}")
         
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 from ..middleware.auth import verify_token
+from ...services.reference_data import reference_data
 from supabase import create_client, Client
 import os
 
@@ -82,20 +83,23 @@ async def education_programs_tool(
 ) -> ToolResponse:
     """Search education programs from database"""
     try:
-        query = supabase.table("education_programs").select("*")
-        
+        # Served from the reference data snapshot
         if request.parameters.get("program_type"):
-            query = query.eq("program_type", request.parameters['program_type'])
+            programs = await reference_data.lookup(
+                "education_programs", "program_type", request.parameters['program_type']
+            )
+        else:
+            programs = await reference_data.rows("education_programs")
             
         if request.parameters.get("climate_focus"):
-            query = query.overlaps("climate_focus", request.parameters['climate_focus'])
+            focus = set(request.parameters['climate_focus'])
+            programs = [p for p in programs if focus & set(p.get("climate_focus") or [])]
             
-        query = query.eq("is_active", True)
-        result = query.execute()
+        programs = [p for p in programs if p.get("is_active") is True]
         
         return ToolResponse(
             success=True,
-            result={"programs": result.data, "total_count": len(result.data)},
+            result={"programs": programs, "total_count": len(programs)},
             tool_name="education-programs",
             timestamp=datetime.now().isoformat()
         )
@@ -170,11 +174,11 @@ async def veteran_mos_translation_tool(
         if not mos_code:
             raise HTTPException(status_code=400, detail="MOS code is required")
             
-        result = supabase.table("mos_translation").select("*").eq("mos_code", mos_code).execute()
+        translations = await reference_data.lookup("mos_translation", "mos_code", mos_code)
         
         return ToolResponse(
             success=True,
-            result={"mos_translation": result.data, "found": len(result.data) > 0},
+            result={"mos_translation": translations, "found": len(translations) > 0},
             tool_name="veteran-mos-translation",
             timestamp=datetime.now().isoformat()
         )
@@ -191,15 +195,17 @@ async def skills_analysis_tool(
     try:
         skills = request.parameters.get("skills", [])
         
-        query = supabase.table("skills_mapping").select("*")
         if skills:
-            query = query.in_("skill_name", skills)
-            
-        result = query.execute()
+            snapshot = await reference_data.snapshot("skills_mapping")
+            mappings = [
+                row for skill in dict.fromkeys(skills) for row in snapshot.lookup("skill_name", skill)
+            ]
+        else:
+            mappings = await reference_data.rows("skills_mapping")
         
         return ToolResponse(
             success=True,
-            result={"skills_mapping": result.data, "total_skills_found": len(result.data)},
+            result={"skills_mapping": mappings, "total_skills_found": len(mappings)},
             tool_name="skills-analysis",
             timestamp=datetime.now().isoformat()
         )
@@ -10,6 +10,9 @@ import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.api.counts import apply_filters, count_rows
+from backend.api.pagination import InvalidCursorError, paginate
+from backend.services.job_matching import job_matcher
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -51,6 +54,8 @@ async def create_job_listing(
         result = supabase.table("job_listings").insert(job_data).execute()
         
         if result.data:
+            # Embedded once here so matching never embeds listings per request
+            await job_matcher.embed_job(result.data[0])
             logger.info(f"Created job listing {result.data[0]['id']} by user {user_id}")
             return {"success": True, "job": result.data[0]}
         else:
@@ -66,7 +71,8 @@ async def create_job_listing(
 @router.get("/listings", response_model=Dict[str, Any])
 async def get_job_listings(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
     remote_work_preference: Optional[str] = Query(None),
@@ -75,45 +81,38 @@ async def get_job_listings(
     """
     Get job listings with optional filtering and pagination.
     - Supports filtering by status, location, remote work preference
-    - Returns paginated results with total count
+    - Returns cursor-paginated results with total count; pass ``next_cursor``
+      back as ``cursor`` for the next page (``offset`` is deprecated)
+    - Large totals are planner estimates (``total_is_exact`` is false)
     - Includes basic job information and metadata
     """
     try:
-        query = supabase.table("job_listings").select("*")
-        
         # Apply filters
+        filters = []
         if status:
-            query = query.eq("status", status)
+            filters.append(("eq", "status", status))
         if location:
-            query = query.ilike("location", f"%{location}%")
+            filters.append(("ilike", "location", f"%{location}%"))
         if remote_work_preference:
-            query = query.eq("remote_work_preference", remote_work_preference)
+            filters.append(("eq", "remote_work_preference", remote_work_preference))
+        query = apply_filters(supabase.table("job_listings").select("*"), filters)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        # Get total count for pagination
-        count_result = supabase.table("job_listings").select("id", count="exact").execute()
-        total_count = count_result.count if count_result.count else 0
+        # Total of the filtered listing, estimated for large sets
+        total = await count_rows("job_listings", filters)
         
-        logger.info(f"Retrieved {len(result.data)} job listings for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} job listings for user {user_id}")
         
         return {
             "success": True,
-            "jobs": result.data if result.data else [],
-            "pagination": {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "has_more": (offset + limit) < total_count
-            }
+            "jobs": page.rows,
+            "pagination": page.pagination(**total.pagination())
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting job listings: {e}")
         raise HTTPException(status_code=500, detail="Failed to get job listings")
@@ -195,6 +194,8 @@ async def update_job_listing(
         )
         
         if result.data:
+            # Re-embedded only when the embedded text changed
+            await job_matcher.embed_job(result.data[0])
             logger.info(f"Updated job listing {job_id} by user {user_id}")
             return {"success": True, "job": result.data[0]}
         else:
@@ -292,6 +293,53 @@ async def create_partner_match(
         raise HTTPException(status_code=500, detail="Failed to create partner match")
 
 
+@router.get("/recommendations", response_model=Dict[str, Any])
+async def get_job_recommendations(
+    limit: int = Query(10, ge=1, le=50),
+    resume_id: Optional[str] = Query(None),
+    location: Optional[str] = Query(None),
+    experience_level: Optional[str] = Query(None),
+    remote_work_preference: Optional[str] = Query(None),
+    user_id: str = Depends(verify_token)
+) -> Dict[str, Any]:
+    """
+    Match the user's resume against all active job listings.
+    - Uses the latest resume unless ``resume_id`` is given
+    - Nearest listings by embedding, re-ranked on skills, experience,
+      location and salary fit from the job seeker profile
+    - Each match has its feature scores, skill gaps and explanations
+    """
+    try:
+        profile = await job_matcher.candidate_profile(user_id, resume_id)
+        if profile is None:
+            raise HTTPException(status_code=404, detail="No processed resume found")
+        
+        matches = await job_matcher.match(
+            user_id,
+            profile,
+            limit=limit,
+            filters={
+                "location": location,
+                "experience_level": experience_level,
+                "remote_work_preference": remote_work_preference
+            }
+        )
+        
+        logger.info(f"Matched {len(matches)} jobs for user {user_id}")
+        
+        return {
+            "success": True,
+            "resume_id": profile.resume_id,
+            "matches": matches
+        }
+        
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error matching jobs: {e}")
+        raise HTTPException(status_code=500, detail="Failed to match jobs")
+
+
 @router.get("/search", response_model=Dict[str, Any])
 async def search_jobs(
     query: Optional[str] = Query(None),
@@ -301,45 +349,59 @@ async def search_jobs(
     climate_focus: Optional[str] = Query(None),
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     user_id: str = Depends(verify_token)
 ) -> Dict[str, Any]:
     """
     Search job listings with advanced filtering.
     - Full-text search across title, description, and requirements
     - Multiple filter criteria support
-    - Returns ranked results based on relevance
+    - Returns ranked results based on relevance (``rank`` on each job)
+    - Without search terms, results are cursor-paginated newest first;
+      ranked results are paged by ``offset``
     """
     try:
-        # Start with basic query
-        db_query = supabase.table("job_listings").select("*").eq("status", "active")
-        
-        # Apply text search if query provided
-        if query:
-            db_query = db_query.or_(f"title.ilike.%{query}%,description.ilike.%{query}%,requirements.ilike.%{query}%")
-        
-        # Apply filters
-        if location:
-            db_query = db_query.ilike("location", f"%{location}%")
-        if experience_level:
-            db_query = db_query.eq("experience_level", experience_level)
-        if remote_work_preference:
-            db_query = db_query.eq("remote_work_preference", remote_work_preference)
-        if climate_focus:
-            db_query = db_query.contains("climate_focus", [climate_focus])
-        
-        # Execute query with pagination
-        result = (
-            db_query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        if query and query.strip():
+            # Ranked full-text search over the GIN-indexed search_vector,
+            # with the same filters applied inside the database function
+            result = supabase.rpc("search_job_listings", {
+                "search_query": query,
+                "location_filter": location,
+                "experience_level_filter": experience_level,
+                "remote_work_filter": remote_work_preference,
+                "climate_focus_filter": climate_focus,
+                "result_limit": limit,
+                "result_offset": offset
+            }).execute()
+            jobs = result.data or []
+            pagination = {
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": None,
+                "has_more": len(jobs) == limit
+            }
+        else:
+            # No search terms: filtered listing, newest first
+            db_query = supabase.table("job_listings").select("*").eq("status", "active")
+            
+            if location:
+                db_query = db_query.ilike("location", f"%{location}%")
+            if experience_level:
+                db_query = db_query.eq("experience_level", experience_level)
+            if remote_work_preference:
+                db_query = db_query.eq("remote_work_preference", remote_work_preference)
+            if climate_focus:
+                db_query = db_query.contains("climate_focus", [climate_focus])
+            
+            page = paginate(db_query, limit, cursor, offset, column="created_at")
+            jobs = page.rows
+            pagination = page.pagination()
         
-        logger.info(f"Job search returned {len(result.data)} results for user {user_id}")
+        logger.info(f"Job search returned {len(jobs)} results for user {user_id}")
         
         return {
             "success": True,
-            "jobs": result.data if result.data else [],
+            "jobs": jobs,
             "search_params": {
                 "query": query,
                 "location": location,
@@ -347,12 +409,11 @@ async def search_jobs(
                 "remote_work_preference": remote_work_preference,
                 "climate_focus": climate_focus
             },
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "pagination": pagination
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to search jobs")
\ No newline at end of file
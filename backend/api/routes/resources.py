@@ -4,16 +4,73 @@ Handles knowledge resources, resource views, and content flags.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
 import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.api.pagination import InvalidCursorError, paginate
+from backend.services.view_counter import view_counter
+from backend.utils.cache import AsyncTTLCache
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Popularity moves slowly; a minute of staleness keeps the endpoint off the
+# database under load. Keys are (days, limit, visibility).
+POPULAR_RESOURCES_TTL = 60.0
+popular_resources_cache = AsyncTTLCache(max_entries=1024, name="popular_resources")
+
+# Facet counts are cleared on every resource write in this process; the TTL
+# bounds staleness after writes made by other workers
+RESOURCE_FACETS_TTL = 300.0
+FACET_TAG_LIMIT = 200
+resource_facets_cache = AsyncTTLCache(max_entries=1024, name="resource_facets")
+
+FACET_NAMES = ("categories", "tags", "content_types", "climate_sectors")
+
+
+async def _load_resource_facets(filters: Tuple) -> Dict[str, Any]:
+    status, visibility, content_type, category, tags = filters
+    result = supabase.rpc(
+        "knowledge_resource_facets",
+        {
+            "status_filter": status,
+            "visibility_filter": visibility,
+            "content_type_filter": content_type,
+            "category_filter": category,
+            "tags_filter": list(tags) if tags else None,
+            "tag_limit": FACET_TAG_LIMIT,
+        },
+    ).execute()
+    facets = result.data or {}
+    return {
+        "total": facets.get("total", 0),
+        "tag_total": facets.get("tag_total", 0),
+        **{name: facets.get(name) or [] for name in FACET_NAMES},
+    }
+
+
+async def get_facet_counts(
+    status: Optional[str] = "published",
+    visibility: Optional[str] = "public",
+    content_type: Optional[str] = None,
+    category: Optional[str] = None,
+    tags: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Cached facet counts for a filter; ``None`` filters match everything."""
+    tag_list = tuple(sorted({tag.strip() for tag in tags.split(",") if tag.strip()})) if tags else ()
+    filters = (status, visibility, content_type, category, tag_list)
+    return await resource_facets_cache.get_or_compute(
+        filters, lambda: _load_resource_facets(filters), ttl=RESOURCE_FACETS_TTL
+    )
+
+
+def invalidate_resource_facets() -> None:
+    """Drop cached facet counts after a knowledge resource write."""
+    resource_facets_cache.clear()
+
 
 # Knowledge Resources Management
 @router.post("/knowledge", response_model=Dict[str, Any])
@@ -46,6 +103,7 @@ async def create_knowledge_resource(
         result = supabase.table("knowledge_resources").insert(resource_data).execute()
         
         if result.data:
+            invalidate_resource_facets()
             logger.info(f"Created knowledge resource {result.data[0]['id']} by user {user_id}")
             return {"success": True, "resource": result.data[0]}
         else:
@@ -61,7 +119,8 @@ async def create_knowledge_resource(
 @router.get("/knowledge", response_model=Dict[str, Any])
 async def get_knowledge_resources(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     content_type: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     tags: Optional[str] = Query(None),
@@ -105,22 +164,14 @@ async def get_knowledge_resources(
             query = query.or_(f"title.ilike.%{search}%,description.ilike.%{search}%,content.ilike.%{search}%")
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} knowledge resources for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} knowledge resources for user {user_id}")
         
         return {
             "success": True,
-            "resources": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            },
+            "resources": page.rows,
+            "pagination": page.pagination(),
             "filters_applied": {
                 "content_type": content_type,
                 "category": category,
@@ -130,6 +181,8 @@ async def get_knowledge_resources(
             }
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting knowledge resources: {e}")
         raise HTTPException(status_code=500, detail="Failed to get knowledge resources")
@@ -143,7 +196,7 @@ async def get_knowledge_resource(
     """
     Get specific knowledge resource by ID.
     - Returns complete resource content and metadata
-    - Increments view count for analytics
+    - Records the view through the buffered view counter
     - Checks user permissions for access
     """
     try:
@@ -163,19 +216,12 @@ async def get_knowledge_resource(
         if not (is_admin or is_owner or is_public):
             raise HTTPException(status_code=403, detail="Not authorized to view this resource")
         
-        # Increment view count
-        new_view_count = resource.get("view_count", 0) + 1
-        supabase.table("knowledge_resources").update({"view_count": new_view_count}).eq("id", resource_id).execute()
-        resource["view_count"] = new_view_count
-        
-        # Record resource view for analytics
-        view_data = {
-            "resource_id": resource_id,
-            "user_id": user_id,
-            "viewed_at": datetime.utcnow().isoformat(),
-            "access_method": "direct"
-        }
-        supabase.table("resource_views").insert(view_data).execute()
+        # Count the view; the counter and event are written in batches
+        counted = await view_counter.record(
+            resource_id, user_id=user_id, metadata={"access_method": "direct"}
+        )
+        if counted:
+            resource["view_count"] = (resource.get("view_count") or 0) + 1
         
         logger.info(f"Retrieved knowledge resource {resource_id} for user {user_id}")
         
@@ -228,6 +274,7 @@ async def update_knowledge_resource(
         )
         
         if result.data:
+            invalidate_resource_facets()
             logger.info(f"Updated knowledge resource {resource_id} by user {user_id}")
             return {"success": True, "resource": result.data[0]}
         else:
@@ -279,6 +326,7 @@ async def delete_knowledge_resource(
         )
         
         if result.data:
+            invalidate_resource_facets()
             logger.info(f"Deleted knowledge resource {resource_id} by user {user_id}")
             return {"success": True, "message": "Knowledge resource deleted successfully"}
         else:
@@ -367,6 +415,15 @@ async def get_resource_views_analytics(
         raise HTTPException(status_code=500, detail="Failed to get resource views analytics")
 
 
+async def _load_popular_resources(days: int, limit: int, public_only: bool) -> List[Dict[str, Any]]:
+    """Top resources summed from the resource_view_daily rollup."""
+    result = supabase.rpc(
+        "top_viewed_resources",
+        {"days": days, "result_limit": limit, "public_only": public_only},
+    ).execute()
+    return result.data or []
+
+
 @router.get("/analytics/popular", response_model=Dict[str, Any])
 async def get_popular_resources(
     limit: int = Query(10, ge=1, le=50),
@@ -376,67 +433,22 @@ async def get_popular_resources(
     """
     Get popular resources by view count.
     - Returns most viewed resources in specified time period
-    - Includes view counts and trending information
+    - Reads per-day rollups, so cost does not grow with raw view volume
     - Shows only public resources unless admin
     """
     try:
-        # Calculate date range
-        date_from = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        
         # Check user permissions
         admin_result = supabase.table("admin_profiles").select("id").eq("user_id", user_id).execute()
         is_admin = bool(admin_result.data)
         
-        # Get view counts for resources in date range
-        views_query = (
-            supabase.table("resource_views")
-            .select("resource_id")
-            .gte("viewed_at", date_from)
-            .execute()
+        # Results are shared by every user with the same visibility
+        visibility = "all" if is_admin else "public"
+        popular_resources = await popular_resources_cache.get_or_compute(
+            (days, limit, visibility),
+            lambda: _load_popular_resources(days, limit, public_only=not is_admin),
+            ttl=POPULAR_RESOURCES_TTL,
         )
         
-        if not views_query.data:
-            return {
-                "success": True,
-                "popular_resources": [],
-                "time_period": f"Last {days} days"
-            }
-        
-        # Count views per resource
-        view_counts = {}
-        for view in views_query.data:
-            resource_id = view["resource_id"]
-            view_counts[resource_id] = view_counts.get(resource_id, 0) + 1
-        
-        # Get top resource IDs
-        top_resources = sorted(view_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-        top_resource_ids = [r[0] for r in top_resources]
-        
-        if not top_resource_ids:
-            return {
-                "success": True,
-                "popular_resources": [],
-                "time_period": f"Last {days} days"
-            }
-        
-        # Get resource details
-        resources_query = supabase.table("knowledge_resources").select("*").in_("id", top_resource_ids)
-        
-        # Apply visibility filter for non-admin users
-        if not is_admin:
-            resources_query = resources_query.eq("visibility", "public")
-        
-        resources_result = resources_query.execute()
-        
-        # Combine with view counts
-        popular_resources = []
-        for resource in resources_result.data if resources_result.data else []:
-            resource["recent_views"] = view_counts.get(resource["id"], 0)
-            popular_resources.append(resource)
-        
-        # Sort by recent views
-        popular_resources.sort(key=lambda x: x["recent_views"], reverse=True)
-        
         logger.info(f"Retrieved {len(popular_resources)} popular resources for user {user_id}")
         
         return {
@@ -498,7 +510,8 @@ async def create_content_flag(
 @router.get("/flags", response_model=Dict[str, Any])
 async def get_content_flags(
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     flag_type: Optional[str] = Query(None),
     resource_id: Optional[str] = Query(None),
@@ -528,24 +541,18 @@ async def get_content_flags(
             query = query.eq("resource_id", resource_id)
         
         # Apply pagination and ordering
-        result = (
-            query
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
-        )
+        page = paginate(query, limit, cursor, offset, column="created_at")
         
-        logger.info(f"Retrieved {len(result.data)} content flags for user {user_id}")
+        logger.info(f"Retrieved {len(page.rows)} content flags for user {user_id}")
         
         return {
             "success": True,
-            "flags": result.data if result.data else [],
-            "pagination": {
-                "limit": limit,
-                "offset": offset
-            }
+            "flags": page.rows,
+            "pagination": page.pagination()
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -614,27 +621,8 @@ async def get_resource_categories(
     - Helps users navigate and filter resources
     """
     try:
-        # Get distinct categories with counts
-        result = (
-            supabase.table("knowledge_resources")
-            .select("category")
-            .eq("status", "published")
-            .eq("visibility", "public")
-            .execute()
-        )
-        
-        # Count occurrences of each category
-        category_counts = {}
-        for resource in result.data if result.data else []:
-            category = resource.get("category")
-            if category:
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        # Convert to list format
-        categories = [
-            {"name": category, "count": count}
-            for category, count in sorted(category_counts.items())
-        ]
+        facets = await get_facet_counts()
+        categories = sorted(facets["categories"], key=lambda c: c["name"])
         
         logger.info(f"Retrieved {len(categories)} resource categories for user {user_id}")
         
@@ -661,41 +649,67 @@ async def get_resource_tags(
     - Helps users discover related content
     """
     try:
-        # Get all tags from published resources
-        result = (
-            supabase.table("knowledge_resources")
-            .select("tags")
-            .eq("status", "published")
-            .eq("visibility", "public")
-            .execute()
-        )
-        
-        # Count occurrences of each tag
-        tag_counts = {}
-        for resource in result.data if result.data else []:
-            tags = resource.get("tags", [])
-            if isinstance(tags, list):
-                for tag in tags:
-                    if tag:
-                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        # Sort by usage count and limit results
-        popular_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-        
-        # Convert to list format
-        tags = [
-            {"name": tag, "count": count}
-            for tag, count in popular_tags
-        ]
+        facets = await get_facet_counts()
+        tags = facets["tags"][:limit]
         
         logger.info(f"Retrieved {len(tags)} popular tags for user {user_id}")
         
         return {
             "success": True,
             "tags": tags,
-            "total_unique_tags": len(tag_counts)
+            "total_unique_tags": facets["tag_total"]
         }
         
     except Exception as e:
         logger.error(f"Error getting resource tags: {e}")
-        raise HTTPException(status_code=500, detail="Failed to get resource tags") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to get resource tags")
+
+
+@router.get("/facets", response_model=Dict[str, Any])
+async def get_resource_facets(
+    content_type: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    tags: Optional[str] = Query(None),
+    status: Optional[str] = Query("published"),
+    visibility: Optional[str] = Query(None),
+    tag_limit: int = Query(50, ge=1, le=FACET_TAG_LIMIT),
+    user_id: str = Depends(verify_token)
+) -> Dict[str, Any]:
+    """
+    Get resource facet counts for a filter.
+    - Returns category, tag, content type and climate sector counts
+    - Counts are computed in the database and cached until the next write
+    - Counts public resources only unless admin
+    """
+    try:
+        admin_result = supabase.table("admin_profiles").select("id").eq("user_id", user_id).execute()
+        is_admin = bool(admin_result.data)
+        if not is_admin:
+            visibility = "public"
+        
+        facets = await get_facet_counts(status, visibility, content_type, category, tags)
+        
+        logger.info(f"Retrieved resource facets for user {user_id}")
+        
+        return {
+            "success": True,
+            "total": facets["total"],
+            "facets": {
+                "categories": facets["categories"],
+                "tags": facets["tags"][:tag_limit],
+                "content_types": facets["content_types"],
+                "climate_sectors": facets["climate_sectors"],
+            },
+            "total_unique_tags": facets["tag_total"],
+            "filters_applied": {
+                "content_type": content_type,
+                "category": category,
+                "tags": tags,
+                "status": status,
+                "visibility": visibility
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting resource facets: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get resource facets")
@@ -10,10 +10,18 @@ import structlog
 
 from backend.database.supabase_client import supabase
 from backend.api.middleware.auth import verify_token
+from backend.utils.keywords import register_keywords
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+RESUME_KEYWORDS = register_keywords("resume_analysis", {
+    "climate": ["climate", "environment", "sustainability", "renewable", "green", "carbon"],
+    "summary_climate": ["climate", "environment"],
+    "impact": ["impact", "reduced", "improved", "sustainability"],
+    "climate_skills": ["gis", "environmental analysis", "sustainability reporting", "carbon accounting"],
+})
+
 
 # Resume Chunks Management
 @router.post("/process", response_model=Dict[str, Any])
@@ -278,8 +286,7 @@ async def analyze_resume_chunks(
             if len(content) > 50:
                 analysis_results["score_breakdown"]["content_quality"] += 10
             
-            climate_keywords = ["climate", "environment", "sustainability", "renewable", "green", "carbon"]
-            if any(keyword in content.lower() for keyword in climate_keywords):
+            if RESUME_KEYWORDS.scan(content).has("climate"):
                 analysis_results["score_breakdown"]["climate_relevance"] += 15
             
             if chunk_type in ["skills", "experience"]:
@@ -375,10 +382,10 @@ async def optimize_resume_chunks(
             
             # Generate suggestions based on chunk type
             chunk_type = chunk.get("chunk_type", "")
-            content = chunk.get("chunk_content", "").lower()
+            hits = RESUME_KEYWORDS.scan(chunk.get("chunk_content", ""))
             
             if chunk_type == "summary":
-                if "climate" not in content and "environment" not in content:
+                if not hits.has("summary_climate"):
                     chunk_optimization["suggestions"].append({
                         "type": "keyword_addition",
                         "description": "Add climate-related keywords to your professional summary",
@@ -387,7 +394,7 @@ async def optimize_resume_chunks(
                     chunk_optimization["priority"] = "high"
             
             elif chunk_type == "experience":
-                if not any(word in content for word in ["impact", "reduced", "improved", "sustainability"]):
+                if not hits.has("impact"):
                     chunk_optimization["suggestions"].append({
                         "type": "quantify_impact",
                         "description": "Quantify environmental or sustainability impact of your work",
@@ -395,8 +402,7 @@ async def optimize_resume_chunks(
                     })
             
             elif chunk_type == "skills":
-                climate_skills = ["gis", "environmental analysis", "sustainability reporting", "carbon accounting"]
-                if not any(skill in content for skill in climate_skills):
+                if not hits.has("climate_skills"):
                     chunk_optimization["suggestions"].append({
                         "type": "skill_enhancement",
                         "description": "Consider adding climate-relevant technical skills",
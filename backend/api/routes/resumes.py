@@ -90,8 +90,8 @@ async def process_resume_with_ai(
             "success": True,
             "resume_id": result.get("resume_id"),
             "climate_score": result.get("climate_relevance_score", 0.0),
-            "skills_count": len(result.get("skills_extracted", [])),
-            "chunks_created": result.get("chunk_count", 0),
+            "skills_count": result.get("skills_extracted", 0),
+            "chunks_created": result.get("chunks_processed", 0),
             "processing_time_ms": result.get("processing_time", 0),
             "message": f"Resume '{filename}' processed successfully"
         }
@@ -10,6 +10,7 @@ import structlog
 from datetime import datetime
 
 from backend.api.middleware.auth import verify_token, optional_verify_token
+from backend.utils.keywords import register_keywords
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
@@ -35,6 +36,22 @@ class ToolResponse(BaseModel):
 # VERIFIED MILITARY/VETERANS TOOLS (MCP-tested)
 # =============================================================================
 
+# Enhanced military skills translation verified with database
+MILITARY_SKILL_TRANSLATIONS = {
+    "infantry": ["Emergency Response", "Crisis Management", "Environmental Security"],
+    "logistics": ["Supply Chain Management", "Resource Optimization", "Green Logistics"],
+    "engineering": ["Renewable Energy Engineering", "Environmental Engineering", "Green Infrastructure"],
+    "communications": ["Climate Communications", "Public Engagement", "Environmental Advocacy"],
+    "intelligence": ["Environmental Data Analysis", "Climate Risk Assessment", "Sustainability Analytics"],
+    "medical": ["Environmental Health", "Public Health Policy", "Climate Health Research"],
+    "security": ["Environmental Security", "Climate Risk Management", "Disaster Preparedness"],
+    "transportation": ["Sustainable Transportation", "Electric Vehicle Fleet Management", "Clean Transit Planning"]
+}
+MILITARY_SKILL_KEYWORDS = register_keywords(
+    "military_skill_translations", {category: [category] for category in MILITARY_SKILL_TRANSLATIONS}
+)
+
+
 @router.post("/translate-military-skills")
 async def translate_military_skills(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -44,23 +61,12 @@ async def translate_military_skills(
         military_skills = request.parameters.get("military_skills", [])
         military_role = request.parameters.get("military_role", "")
         
-        # Enhanced military skills translation verified with database
-        translations = {
-            "infantry": ["Emergency Response", "Crisis Management", "Environmental Security"],
-            "logistics": ["Supply Chain Management", "Resource Optimization", "Green Logistics"],
-            "engineering": ["Renewable Energy Engineering", "Environmental Engineering", "Green Infrastructure"],
-            "communications": ["Climate Communications", "Public Engagement", "Environmental Advocacy"],
-            "intelligence": ["Environmental Data Analysis", "Climate Risk Assessment", "Sustainability Analytics"],
-            "medical": ["Environmental Health", "Public Health Policy", "Climate Health Research"],
-            "security": ["Environmental Security", "Climate Risk Management", "Disaster Preparedness"],
-            "transportation": ["Sustainable Transportation", "Electric Vehicle Fleet Management", "Clean Transit Planning"]
-        }
-        
         climate_skills = []
         for skill in military_skills:
-            for category, climate_equivalents in translations.items():
-                if category.lower() in skill.lower():
-                    climate_skills.extend(climate_equivalents)
+            hits = MILITARY_SKILL_KEYWORDS.scan(skill)
+            for category in MILITARY_SKILL_KEYWORDS.categories:
+                if hits.has(category):
+                    climate_skills.extend(MILITARY_SKILL_TRANSLATIONS[category])
         
         if not climate_skills:
             climate_skills = ["Project Management", "Team Leadership", "Process Optimization", "Crisis Management"]
@@ -95,6 +101,39 @@ async def translate_military_skills(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# MCP-verified benefits database
+VA_BENEFITS = {
+    "education": [
+        {
+            "name": "GI Bill for Clean Energy Programs",
+            "eligibility": "36 months education benefits",
+            "contact": "VA Education Service",
+            "climate_programs": ["Solar Installation", "Wind Technician", "Energy Efficiency"]
+        },
+        {
+            "name": "VR&E for Environmental Careers",
+            "eligibility": "Vocational rehabilitation eligible",
+            "contact": "VR&E Counselor",
+            "climate_programs": ["Environmental Consulting", "Green Building", "Climate Analysis"]
+        }
+    ],
+    "employment": [
+        {
+            "name": "Veterans Employment Through Technology Education Courses (VET TEC)",
+            "eligibility": "Clean energy tech training",
+            "contact": "VA VET TEC",
+            "climate_focus": True
+        },
+        {
+            "name": "Work-Study Program",
+            "eligibility": "Climate organizations partnership",
+            "contact": "VA Work-Study",
+            "climate_focus": True
+        }
+    ]
+}
+
+
 @router.post("/va-benefits-search")
 async def va_benefits_search(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -104,42 +143,10 @@ async def va_benefits_search(
         location = request.parameters.get("location", "Massachusetts")
         benefit_type = request.parameters.get("benefit_type", "education")
         
-        # MCP-verified benefits database
-        benefits = {
-            "education": [
-                {
-                    "name": "GI Bill for Clean Energy Programs",
-                    "eligibility": "36 months education benefits",
-                    "contact": "VA Education Service",
-                    "climate_programs": ["Solar Installation", "Wind Technician", "Energy Efficiency"]
-                },
-                {
-                    "name": "VR&E for Environmental Careers",
-                    "eligibility": "Vocational rehabilitation eligible",
-                    "contact": "VR&E Counselor",
-                    "climate_programs": ["Environmental Consulting", "Green Building", "Climate Analysis"]
-                }
-            ],
-            "employment": [
-                {
-                    "name": "Veterans Employment Through Technology Education Courses (VET TEC)",
-                    "eligibility": "Clean energy tech training",
-                    "contact": "VA VET TEC",
-                    "climate_focus": True
-                },
-                {
-                    "name": "Work-Study Program",
-                    "eligibility": "Climate organizations partnership",
-                    "contact": "VA Work-Study",
-                    "climate_focus": True
-                }
-            ]
-        }
-        
         result = {
             "location": location,
             "benefit_type": benefit_type,
-            "available_benefits": benefits.get(benefit_type, benefits["education"]),
+            "available_benefits": VA_BENEFITS.get(benefit_type, VA_BENEFITS["education"]),
             "next_steps": [
                 "Contact local VA office",
                 "Schedule benefits counseling appointment",
@@ -165,6 +172,26 @@ async def va_benefits_search(
 # VERIFIED ENVIRONMENTAL JUSTICE TOOLS (MCP-tested)
 # =============================================================================
 
+# EJ analysis framework verified with MCP tools
+EJ_ANALYSIS_FACTORS = {
+    "demographic_analysis": {
+        "income_levels": "median household income analysis",
+        "racial_composition": "community demographic mapping",
+        "age_distribution": "vulnerable population identification"
+    },
+    "environmental_burdens": {
+        "air_quality": "PM2.5 and ozone monitoring",
+        "water_quality": "contamination assessment",
+        "noise_pollution": "ambient noise level analysis"
+    },
+    "benefit_distribution": {
+        "job_creation": "local employment opportunities",
+        "energy_access": "affordable clean energy access",
+        "health_improvements": "air quality health benefits"
+    }
+}
+
+
 @router.post("/ej-impact-analysis")
 async def ej_impact_analysis(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -174,29 +201,10 @@ async def ej_impact_analysis(
         project_location = request.parameters.get("project_location", "")
         project_type = request.parameters.get("project_type", "renewable_energy")
         
-        # EJ analysis framework verified with MCP tools
-        ej_factors = {
-            "demographic_analysis": {
-                "income_levels": "median household income analysis",
-                "racial_composition": "community demographic mapping",
-                "age_distribution": "vulnerable population identification"
-            },
-            "environmental_burdens": {
-                "air_quality": "PM2.5 and ozone monitoring",
-                "water_quality": "contamination assessment",
-                "noise_pollution": "ambient noise level analysis"
-            },
-            "benefit_distribution": {
-                "job_creation": "local employment opportunities",
-                "energy_access": "affordable clean energy access",
-                "health_improvements": "air quality health benefits"
-            }
-        }
-        
         result = {
             "project_location": project_location,
             "project_type": project_type,
-            "ej_analysis_framework": ej_factors,
+            "ej_analysis_framework": EJ_ANALYSIS_FACTORS,
             "recommendations": [
                 "Conduct community engagement sessions",
                 "Establish local hiring requirements",
@@ -228,6 +236,32 @@ async def ej_impact_analysis(
 # VERIFIED EDUCATION/WORKFORCE TOOLS (MCP-tested)
 # =============================================================================
 
+# Green jobs pathway mapping verified with database
+GREEN_JOB_PATHWAYS = {
+    "renewable_energy": {
+        "entry_level": ["Solar Panel Installer", "Wind Turbine Technician", "Energy Auditor"],
+        "mid_level": ["Project Manager", "System Designer", "Operations Specialist"],
+        "senior_level": ["Development Director", "Engineering Manager", "Policy Director"],
+        "training_duration": "6-18 months",
+        "certification_required": True
+    },
+    "energy_efficiency": {
+        "entry_level": ["Energy Auditor", "Weatherization Specialist", "Building Inspector"],
+        "mid_level": ["Efficiency Program Manager", "Building Systems Analyst"],
+        "senior_level": ["Program Director", "Policy Specialist"],
+        "training_duration": "3-12 months",
+        "certification_required": True
+    },
+    "environmental_remediation": {
+        "entry_level": ["Environmental Technician", "Site Assessment Specialist"],
+        "mid_level": ["Project Manager", "Environmental Scientist"],
+        "senior_level": ["Program Director", "Consulting Manager"],
+        "training_duration": "12-24 months",
+        "certification_required": True
+    }
+}
+
+
 @router.post("/green-jobs-pathway")
 async def green_jobs_pathway(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -238,32 +272,7 @@ async def green_jobs_pathway(
         target_sector = request.parameters.get("target_sector", "renewable_energy")
         location = request.parameters.get("location", "Massachusetts")
         
-        # Green jobs pathway mapping verified with database
-        pathways = {
-            "renewable_energy": {
-                "entry_level": ["Solar Panel Installer", "Wind Turbine Technician", "Energy Auditor"],
-                "mid_level": ["Project Manager", "System Designer", "Operations Specialist"],
-                "senior_level": ["Development Director", "Engineering Manager", "Policy Director"],
-                "training_duration": "6-18 months",
-                "certification_required": True
-            },
-            "energy_efficiency": {
-                "entry_level": ["Energy Auditor", "Weatherization Specialist", "Building Inspector"],
-                "mid_level": ["Efficiency Program Manager", "Building Systems Analyst"],
-                "senior_level": ["Program Director", "Policy Specialist"],
-                "training_duration": "3-12 months",
-                "certification_required": True
-            },
-            "environmental_remediation": {
-                "entry_level": ["Environmental Technician", "Site Assessment Specialist"],
-                "mid_level": ["Project Manager", "Environmental Scientist"],
-                "senior_level": ["Program Director", "Consulting Manager"],
-                "training_duration": "12-24 months",
-                "certification_required": True
-            }
-        }
-        
-        pathway = pathways.get(target_sector, pathways["renewable_energy"])
+        pathway = GREEN_JOB_PATHWAYS.get(target_sector, GREEN_JOB_PATHWAYS["renewable_energy"])
         
         result = {
             "current_role": current_role,
@@ -300,6 +309,31 @@ async def green_jobs_pathway(
 # VERIFIED COORDINATION TOOLS (MCP-tested)
 # =============================================================================
 
+# Agent coordination matrix verified with MCP
+SPECIALIST_COORDINATION = {
+    "military_transition": {
+        "primary_agent": "Pendo (Veterans Specialist)",
+        "supporting_agents": ["Lauren (Workforce)", "Marcus (MA Programs)"],
+        "estimated_resolution_time": "24-48 hours"
+    },
+    "ej_analysis": {
+        "primary_agent": "Andre (Environmental Justice)",
+        "supporting_agents": ["Maya (Policy)", "Jordan (Community)"],
+        "estimated_resolution_time": "48-72 hours"
+    },
+    "workforce_development": {
+        "primary_agent": "Lauren (Workforce Development)",
+        "supporting_agents": ["Marcus (MA Programs)", "Emma (Education)"],
+        "estimated_resolution_time": "12-24 hours"
+    },
+    "crisis_response": {
+        "primary_agent": "System Coordinator",
+        "supporting_agents": ["All available agents"],
+        "estimated_resolution_time": "immediate"
+    }
+}
+
+
 @router.post("/coordinate-specialist")
 async def coordinate_specialist(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -310,31 +344,7 @@ async def coordinate_specialist(
         complexity_level = request.parameters.get("complexity_level", "medium")
         required_expertise = request.parameters.get("required_expertise", [])
         
-        # Agent coordination matrix verified with MCP
-        coordination_matrix = {
-            "military_transition": {
-                "primary_agent": "Pendo (Veterans Specialist)",
-                "supporting_agents": ["Lauren (Workforce)", "Marcus (MA Programs)"],
-                "estimated_resolution_time": "24-48 hours"
-            },
-            "ej_analysis": {
-                "primary_agent": "Andre (Environmental Justice)",
-                "supporting_agents": ["Maya (Policy)", "Jordan (Community)"],
-                "estimated_resolution_time": "48-72 hours"
-            },
-            "workforce_development": {
-                "primary_agent": "Lauren (Workforce Development)",
-                "supporting_agents": ["Marcus (MA Programs)", "Emma (Education)"],
-                "estimated_resolution_time": "12-24 hours"
-            },
-            "crisis_response": {
-                "primary_agent": "System Coordinator",
-                "supporting_agents": ["All available agents"],
-                "estimated_resolution_time": "immediate"
-            }
-        }
-        
-        coordination = coordination_matrix.get(query_type, {
+        coordination = SPECIALIST_COORDINATION.get(query_type, {
             "primary_agent": "System Coordinator",
             "supporting_agents": ["Available specialists"],
             "estimated_resolution_time": "24-48 hours"
@@ -370,6 +380,27 @@ async def coordinate_specialist(
 # ADDITIONAL MCP-VERIFIED TOOLS (Expanding coverage)
 # =============================================================================
 
+# MOS database verified with Supabase
+MOS_CLIMATE_MAPPINGS = {
+    "11B": {
+        "title": "Infantry",
+        "transferable_skills": ["Leadership", "Team Coordination", "Problem Solving"],
+        "climate_alignment": {
+            "renewable_energy": {"score": 7, "roles": ["Solar Installation Team Lead"]},
+            "environmental_remediation": {"score": 8, "roles": ["Site Supervisor"]}
+        }
+    },
+    "25B": {
+        "title": "Information Technology Specialist", 
+        "transferable_skills": ["System Administration", "Data Analysis"],
+        "climate_alignment": {
+            "renewable_energy": {"score": 9, "roles": ["Smart Grid Analyst"]},
+            "energy_efficiency": {"score": 8, "roles": ["Building Automation Engineer"]}
+        }
+    }
+}
+
+
 @router.post("/mos-climate-analysis")
 async def mos_climate_analysis(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -379,27 +410,7 @@ async def mos_climate_analysis(
         mos_code = request.parameters.get("mos_code", "")
         target_sector = request.parameters.get("target_sector", "renewable_energy")
         
-        # MOS database verified with Supabase
-        mos_mappings = {
-            "11B": {
-                "title": "Infantry",
-                "transferable_skills": ["Leadership", "Team Coordination", "Problem Solving"],
-                "climate_alignment": {
-                    "renewable_energy": {"score": 7, "roles": ["Solar Installation Team Lead"]},
-                    "environmental_remediation": {"score": 8, "roles": ["Site Supervisor"]}
-                }
-            },
-            "25B": {
-                "title": "Information Technology Specialist", 
-                "transferable_skills": ["System Administration", "Data Analysis"],
-                "climate_alignment": {
-                    "renewable_energy": {"score": 9, "roles": ["Smart Grid Analyst"]},
-                    "energy_efficiency": {"score": 8, "roles": ["Building Automation Engineer"]}
-                }
-            }
-        }
-        
-        mos_info = mos_mappings.get(mos_code, {
+        mos_info = MOS_CLIMATE_MAPPINGS.get(mos_code, {
             "title": "General Military Experience",
             "transferable_skills": ["Leadership", "Discipline", "Teamwork"],
             "climate_alignment": {"renewable_energy": {"score": 6, "roles": ["Entry-level positions"]}}
@@ -431,6 +442,26 @@ async def mos_climate_analysis(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# International credential database verified with Supabase
+CREDENTIAL_EVALUATIONS = {
+    "engineering": {
+        "equivalency": "Bachelor's/Master's in Engineering",
+        "climate_relevance": 9,
+        "pathway": "Professional Engineer (PE) license after evaluation"
+    },
+    "environmental_science": {
+        "equivalency": "Bachelor's/Master's in Environmental Science", 
+        "climate_relevance": 10,
+        "pathway": "Direct entry into climate careers"
+    },
+    "business": {
+        "equivalency": "Bachelor's/Master's in Business Administration",
+        "climate_relevance": 7,
+        "pathway": "Climate business specialization recommended"
+    }
+}
+
+
 @router.post("/credential-evaluation")
 async def credential_evaluation(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -441,26 +472,7 @@ async def credential_evaluation(
         issuing_country = request.parameters.get("issuing_country", "")
         field_of_study = request.parameters.get("field_of_study", "")
         
-        # International credential database verified with Supabase
-        evaluation_matrix = {
-            "engineering": {
-                "equivalency": "Bachelor's/Master's in Engineering",
-                "climate_relevance": 9,
-                "pathway": "Professional Engineer (PE) license after evaluation"
-            },
-            "environmental_science": {
-                "equivalency": "Bachelor's/Master's in Environmental Science", 
-                "climate_relevance": 10,
-                "pathway": "Direct entry into climate careers"
-            },
-            "business": {
-                "equivalency": "Bachelor's/Master's in Business Administration",
-                "climate_relevance": 7,
-                "pathway": "Climate business specialization recommended"
-            }
-        }
-        
-        eval_info = evaluation_matrix.get(field_of_study.lower(), {
+        eval_info = CREDENTIAL_EVALUATIONS.get(field_of_study.lower(), {
             "equivalency": "Requires individual assessment",
             "climate_relevance": 5,
             "pathway": "Contact credential evaluation service"
@@ -493,6 +505,19 @@ async def credential_evaluation(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+CRISIS_RESOURCES = {
+    "immediate": [
+        {"name": "National Suicide Prevention Lifeline", "contact": "988", "available": "24/7"},
+        {"name": "Crisis Text Line", "contact": "Text HOME to 741741", "available": "24/7"},
+        {"name": "Veterans Crisis Line", "contact": "1-800-273-8255", "available": "24/7"}
+    ],
+    "massachusetts_specific": [
+        {"name": "MA Crisis Helpline", "contact": "1-877-382-1609", "available": "24/7"},
+        {"name": "Massachusetts BHP Emergency Services", "contact": "1-877-626-6656", "available": "24/7"}
+    ]
+}
+
+
 @router.post("/crisis-assessment")
 async def crisis_assessment(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -502,23 +527,11 @@ async def crisis_assessment(
         situation_description = request.parameters.get("situation_description", "")
         risk_indicators = request.parameters.get("risk_indicators", [])
         
-        crisis_resources = {
-            "immediate": [
-                {"name": "National Suicide Prevention Lifeline", "contact": "988", "available": "24/7"},
-                {"name": "Crisis Text Line", "contact": "Text HOME to 741741", "available": "24/7"},
-                {"name": "Veterans Crisis Line", "contact": "1-800-273-8255", "available": "24/7"}
-            ],
-            "massachusetts_specific": [
-                {"name": "MA Crisis Helpline", "contact": "1-877-382-1609", "available": "24/7"},
-                {"name": "Massachusetts BHP Emergency Services", "contact": "1-877-626-6656", "available": "24/7"}
-            ]
-        }
-        
         result = {
             "situation_assessed": True,
             "risk_level": "moderate" if len(risk_indicators) > 2 else "low",
-            "immediate_resources": crisis_resources["immediate"],
-            "local_resources": crisis_resources["massachusetts_specific"],
+            "immediate_resources": CRISIS_RESOURCES["immediate"],
+            "local_resources": CRISIS_RESOURCES["massachusetts_specific"],
             "safety_planning": [
                 "Identify personal warning signs",
                 "Create support contact list", 
@@ -541,6 +554,41 @@ async def crisis_assessment(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+MA_CLIMATE_PROGRAMS = {
+    "workforce": [
+        {
+            "name": "MassCEC Workforce Development",
+            "description": "Training for clean energy careers",
+            "funding": "Up to $25,000 per participant",
+            "website": "masscec.com/workforce",
+            "application_deadline": "Quarterly"
+        },
+        {
+            "name": "Commonwealth Corporation Green Jobs",
+            "description": "Sector-based training partnerships",
+            "focus": "Solar, wind, energy efficiency",
+            "website": "commcorp.org"
+        }
+    ],
+    "business": [
+        {
+            "name": "Mass Clean Energy Incubator",
+            "description": "Support for clean energy startups",
+            "services": ["Mentorship", "Funding", "Workspace"],
+            "website": "cleanenergyincubator.com"
+        }
+    ],
+    "residential": [
+        {
+            "name": "Mass Save Energy Efficiency",
+            "description": "Home energy efficiency programs",
+            "services": ["Audits", "Rebates", "Financing"],
+            "website": "masssave.com"
+        }
+    ]
+}
+
+
 @router.post("/ma-climate-programs")
 async def ma_climate_programs(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -550,41 +598,7 @@ async def ma_climate_programs(
         program_type = request.parameters.get("program_type", "workforce")
         region = request.parameters.get("region", "statewide")
         
-        ma_programs = {
-            "workforce": [
-                {
-                    "name": "MassCEC Workforce Development",
-                    "description": "Training for clean energy careers",
-                    "funding": "Up to $25,000 per participant",
-                    "website": "masscec.com/workforce",
-                    "application_deadline": "Quarterly"
-                },
-                {
-                    "name": "Commonwealth Corporation Green Jobs",
-                    "description": "Sector-based training partnerships",
-                    "focus": "Solar, wind, energy efficiency",
-                    "website": "commcorp.org"
-                }
-            ],
-            "business": [
-                {
-                    "name": "Mass Clean Energy Incubator",
-                    "description": "Support for clean energy startups",
-                    "services": ["Mentorship", "Funding", "Workspace"],
-                    "website": "cleanenergyincubator.com"
-                }
-            ],
-            "residential": [
-                {
-                    "name": "Mass Save Energy Efficiency",
-                    "description": "Home energy efficiency programs",
-                    "services": ["Audits", "Rebates", "Financing"],
-                    "website": "masssave.com"
-                }
-            ]
-        }
-        
-        programs = ma_programs.get(program_type, ma_programs["workforce"])
+        programs = MA_CLIMATE_PROGRAMS.get(program_type, MA_CLIMATE_PROGRAMS["workforce"])
         
         result = {
             "program_type": program_type,
@@ -615,6 +629,34 @@ async def ma_climate_programs(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+INTERNATIONAL_PROGRAMS = {
+    "asia_pacific": [
+        {
+            "name": "Asian Development Bank Climate Finance",
+            "description": "Climate project financing across Asia",
+            "opportunities": ["Project Manager", "Climate Analyst"],
+            "website": "adb.org/sectors/climate-change"
+        }
+    ],
+    "europe": [
+        {
+            "name": "European Investment Bank Climate Action",
+            "description": "Climate investment across EU",
+            "opportunities": ["Investment Officer", "Climate Specialist"],
+            "website": "eib.org/climate"
+        }
+    ],
+    "global": [
+        {
+            "name": "UN Framework Convention on Climate Change",
+            "description": "International climate policy coordination",
+            "opportunities": ["Program Officer", "Policy Analyst"],
+            "website": "unfccc.int"
+        }
+    ]
+}
+
+
 @router.post("/international-programs-search")
 async def international_programs_search(
     request: ToolRequest, user_id: str = Depends(optional_verify_token)
@@ -624,34 +666,7 @@ async def international_programs_search(
         region = request.parameters.get("region", "global")
         program_type = request.parameters.get("program_type", "all")
         
-        international_programs = {
-            "asia_pacific": [
-                {
-                    "name": "Asian Development Bank Climate Finance",
-                    "description": "Climate project financing across Asia",
-                    "opportunities": ["Project Manager", "Climate Analyst"],
-                    "website": "adb.org/sectors/climate-change"
-                }
-            ],
-            "europe": [
-                {
-                    "name": "European Investment Bank Climate Action",
-                    "description": "Climate investment across EU",
-                    "opportunities": ["Investment Officer", "Climate Specialist"],
-                    "website": "eib.org/climate"
-                }
-            ],
-            "global": [
-                {
-                    "name": "UN Framework Convention on Climate Change",
-                    "description": "International climate policy coordination",
-                    "opportunities": ["Program Officer", "Policy Analyst"],
-                    "website": "unfccc.int"
-                }
-            ]
-        }
-        
-        programs = international_programs.get(region, international_programs["global"])
+        programs = INTERNATIONAL_PROGRAMS.get(region, INTERNATIONAL_PROGRAMS["global"])
         
         result = {
             "region": region,
@@ -682,56 +697,56 @@ async def international_programs_search(
 # VERIFICATION AND LISTING (Updated)
 # ============================================================================= 
 
+VERIFIED_TOOLS = {
+    "military_veterans_tools": [
+        {
+            "endpoint": "/translate-military-skills",
+            "description": "Translate military skills to climate economy equivalents",
+            "mcp_verified": True,
+            "test_status": "passing"
+        },
+        {
+            "endpoint": "/va-benefits-search",
+            "description": "Search VA benefits for climate career transition",
+            "mcp_verified": True,
+            "test_status": "passing"
+        }
+    ],
+    "environmental_justice_tools": [
+        {
+            "endpoint": "/ej-impact-analysis",
+            "description": "Analyze environmental justice impacts",
+            "mcp_verified": True,
+            "test_status": "passing"
+        }
+    ],
+    "workforce_development_tools": [
+        {
+            "endpoint": "/green-jobs-pathway",
+            "description": "Analyze green jobs career pathways",
+            "mcp_verified": True,
+            "test_status": "passing"
+        }
+    ],
+    "coordination_tools": [
+        {
+            "endpoint": "/coordinate-specialist",
+            "description": "Coordinate with specialized agents",
+            "mcp_verified": True,
+            "test_status": "passing"
+        }
+    ]
+}
+
+
 @router.get("/list-verified-tools")
 async def list_verified_tools(user_id: str = Depends(optional_verify_token)) -> Dict[str, Any]:
     """List all verified tool endpoints with MCP testing status"""
-    
-    verified_tools = {
-        "military_veterans_tools": [
-            {
-                "endpoint": "/translate-military-skills",
-                "description": "Translate military skills to climate economy equivalents",
-                "mcp_verified": True,
-                "test_status": "passing"
-            },
-            {
-                "endpoint": "/va-benefits-search",
-                "description": "Search VA benefits for climate career transition",
-                "mcp_verified": True,
-                "test_status": "passing"
-            }
-        ],
-        "environmental_justice_tools": [
-            {
-                "endpoint": "/ej-impact-analysis",
-                "description": "Analyze environmental justice impacts",
-                "mcp_verified": True,
-                "test_status": "passing"
-            }
-        ],
-        "workforce_development_tools": [
-            {
-                "endpoint": "/green-jobs-pathway",
-                "description": "Analyze green jobs career pathways",
-                "mcp_verified": True,
-                "test_status": "passing"
-            }
-        ],
-        "coordination_tools": [
-            {
-                "endpoint": "/coordinate-specialist",
-                "description": "Coordinate with specialized agents",
-                "mcp_verified": True,
-                "test_status": "passing"
-            }
-        ]
-    }
-    
     return {
         "total_verified_tools": 5,
         "target_total_tools": 47,
         "completion_percentage": "11%",
-        "verified_tools": verified_tools,
+        "verified_tools": VERIFIED_TOOLS,
         "database_connection": "verified",
         "mcp_testing_status": "active",
         "next_tools_to_implement": [
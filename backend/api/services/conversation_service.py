@@ -7,6 +7,7 @@ import structlog
 from datetime import datetime
 
 from backend.database.supabase_client import supabase
+from backend.api.pagination import Page, paginate
 from backend.api.models.conversation import ConversationCreate, MessageCreate
 
 logger = structlog.get_logger(__name__)
@@ -101,21 +102,16 @@ class ConversationService:
             raise
 
     async def list_conversations(
-        self, user_id: str, limit: int = 10, offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """List conversations for a user."""
+        self,
+        user_id: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """List a page of a user's conversations, most recently updated first."""
         try:
-            conversations = (
-                await supabase.table("conversations")
-                .select("*")
-                .eq("user_id", user_id)
-                .order("updated_at", desc=True)
-                .limit(limit)
-                .offset(offset)
-                .execute()
-            )
-
-            return conversations.data or []
+            query = supabase.table("conversations").select("*").eq("user_id", user_id)
+            return paginate(query, limit, cursor, offset, column="updated_at")
 
         except Exception as e:
             logger.error(f"Error listing conversations: {e}")
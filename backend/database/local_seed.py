@@ -0,0 +1,415 @@
+"""
+Synthetic data for the local Supabase stand-in.
+
+Deterministic generators for the tables behind the hot API paths (job
+listings, knowledge resources and their views, conversations with their
+messages, resume chunks with embeddings), inserted in batches so 10^5-10^6 row datasets load
+in bounded memory. The same seed always produces the same rows.
+
+Usage:
+    python -m backend.database.local_seed --database /tmp/local.db \\
+        --jobs 100000 --resources 100000 --conversations 20000 --resumes 5000
+"""
+
+import argparse
+import itertools
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from backend.database.local_supabase import LocalSupabase
+
+SEED_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SEED_WINDOW_SECONDS = 365 * 24 * 3600
+DEFAULT_BATCH_SIZE = 5000
+
+JOB_TITLES = [
+    "Solar Installer",
+    "Wind Turbine Technician",
+    "Energy Analyst",
+    "Heat Pump Technician",
+    "Energy Efficiency Auditor",
+    "Grid Engineer",
+    "Sustainability Coordinator",
+    "EV Charging Technician",
+    "Climate Policy Associate",
+    "Building Performance Specialist",
+]
+LOCATIONS = [
+    "Boston, MA",
+    "Worcester, MA",
+    "New Bedford, MA",
+    "Springfield, MA",
+    "Lowell, MA",
+    "Cambridge, MA",
+]
+CLIMATE_FOCUS = [
+    "solar",
+    "wind",
+    "energy_efficiency",
+    "buildings",
+    "transportation",
+    "grid_modernization",
+    "environmental_justice",
+]
+SKILLS = [
+    "OSHA 10",
+    "project management",
+    "electrical systems",
+    "AutoCAD",
+    "data analysis",
+    "customer service",
+    "HVAC",
+    "Python",
+    "energy modeling",
+    "community outreach",
+    "welding",
+    "commercial driver's license",
+]
+EXPERIENCE_LEVELS = ["entry_level", "mid_level", "senior_level"]
+EMPLOYMENT_TYPES = ["full_time", "part_time", "contract", "internship", "apprenticeship"]
+REMOTE_PREFERENCES = ["onsite", "hybrid", "remote"]
+CONTENT_TYPES = ["article", "guide", "video", "course", "report", "tool"]
+RESOURCE_CATEGORIES = ["careers", "training", "policy", "funding", "technology", "community"]
+RESOURCE_TAGS = [
+    "solar",
+    "wind",
+    "veterans",
+    "apprenticeship",
+    "grants",
+    "heat-pumps",
+    "offshore-wind",
+    "ej",
+    "credentials",
+    "internships",
+]
+SPECIALISTS = ["pendo", "marcus", "liv", "miguel", "jasmine", "alex", "lauren", "mai"]
+RESUME_SECTIONS = ["summary", "experience", "education", "skills", "certifications"]
+SENTENCES = [
+    "Massachusetts is adding thousands of clean energy jobs every year.",
+    "Field technicians install and maintain rooftop solar arrays.",
+    "Candidates should be comfortable working at heights and outdoors.",
+    "The role coordinates with utilities, inspectors and homeowners.",
+    "Training is provided through a registered apprenticeship program.",
+    "Experience with building energy audits is a plus.",
+    "Veterans with logistics backgrounds are encouraged to apply.",
+    "The team supports environmental justice communities across the state.",
+]
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (SEED_EPOCH + timedelta(seconds=rng.randrange(SEED_WINDOW_SECONDS))).isoformat()
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _text(rng: random.Random, sentences: int) -> str:
+    return " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+
+
+def job_listing_rows(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    partners = [_uuid(rng) for _ in range(max(1, min(500, count // 50)))]
+    for i in range(count):
+        created_at = _timestamp(rng)
+        yield {
+            "id": _uuid(rng),
+            "title": rng.choice(JOB_TITLES),
+            "description": _text(rng, 4),
+            "requirements": ", ".join(rng.sample(SKILLS, 3)),
+            "responsibilities": _text(rng, 2),
+            "location": rng.choice(LOCATIONS),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "experience_level": rng.choice(EXPERIENCE_LEVELS),
+            "remote_work_preference": rng.choice(REMOTE_PREFERENCES),
+            "salary_range": f"${40 + i % 60}k-${60 + i % 80}k",
+            "climate_focus": rng.sample(CLIMATE_FOCUS, 2),
+            "skills_required": rng.sample(SKILLS, 4),
+            "partner_id": rng.choice(partners),
+            "organization_name": f"Partner {i % 200}",
+            "status": "active" if i % 10 else "closed",
+            "is_active": bool(i % 10),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def knowledge_resource_rows(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed + 1)
+    authors = [_uuid(rng) for _ in range(max(1, min(200, count // 100)))]
+    for i in range(count):
+        created_at = _timestamp(rng)
+        tags = rng.sample(RESOURCE_TAGS, 3)
+        yield {
+            "id": _uuid(rng),
+            "title": f"{rng.choice(JOB_TITLES)} {rng.choice(['guide', 'pathway', 'overview'])}",
+            "description": _text(rng, 2),
+            "content": _text(rng, 12),
+            "content_type": rng.choice(CONTENT_TYPES),
+            "category": rng.choice(RESOURCE_CATEGORIES),
+            "categories": rng.sample(RESOURCE_CATEGORIES, 2),
+            "tags": tags,
+            "topics": tags[:2],
+            "climate_sectors": rng.sample(CLIMATE_FOCUS, 2),
+            "target_audience": rng.sample(["job_seekers", "veterans", "students", "partners"], 2),
+            "status": "published" if i % 8 else "draft",
+            "is_published": bool(i % 8),
+            "visibility": "public" if i % 5 else "private",
+            "created_by": rng.choice(authors),
+            "view_count": int(rng.paretovariate(1.2)) - 1,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def conversation_rows(
+    count: int, messages_per_conversation: int = 6, seed: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Conversations, each followed by its messages (tagged with ``_table``)."""
+    rng = random.Random(seed + 2)
+    users = [_uuid(rng) for _ in range(max(1, count // 4))]
+    for _ in range(count):
+        conversation_id = _uuid(rng)
+        started = SEED_EPOCH + timedelta(seconds=rng.randrange(SEED_WINDOW_SECONDS))
+        last = started + timedelta(minutes=2 * messages_per_conversation)
+        yield {
+            "_table": "conversations",
+            "id": conversation_id,
+            "user_id": rng.choice(users),
+            "title": rng.choice(JOB_TITLES) + " questions",
+            "initial_query": rng.choice(SENTENCES),
+            "status": rng.choice(["active", "active", "ended"]),
+            "message_count": messages_per_conversation,
+            "total_tokens_used": rng.randrange(200, 8000),
+            "created_at": started.isoformat(),
+            "updated_at": last.isoformat(),
+            "last_activity": last.isoformat(),
+        }
+        for m in range(messages_per_conversation):
+            role = "user" if m % 2 == 0 else "assistant"
+            yield {
+                "_table": "conversation_messages",
+                "id": _uuid(rng),
+                "conversation_id": conversation_id,
+                "role": role,
+                "content": _text(rng, 2 if role == "user" else 5),
+                "specialist_type": rng.choice(SPECIALISTS) if role == "assistant" else None,
+                "created_at": (started + timedelta(minutes=2 * m)).isoformat(),
+            }
+
+
+def resume_chunk_rows(
+    resumes: int,
+    chunks_per_resume: int = 8,
+    dimensions: int = 1536,
+    seed: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Chunks with unit-normalized random embeddings of ``dimensions``."""
+    rng = random.Random(seed + 3)
+    vectors = np.random.default_rng(seed + 3)
+    for _ in range(resumes):
+        resume_id, user_id = _uuid(rng), _uuid(rng)
+        created_at = _timestamp(rng)
+        embeddings = vectors.standard_normal((chunks_per_resume, dimensions)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        for i, embedding in enumerate(np.round(embeddings, 5).tolist()):
+            section = RESUME_SECTIONS[i % len(RESUME_SECTIONS)]
+            yield {
+                "id": _uuid(rng),
+                "resume_id": resume_id,
+                "user_id": user_id,
+                "chunk_index": i,
+                "content": _text(rng, 3),
+                "section_type": section,
+                "importance_score": round(rng.random(), 3),
+                "metadata": {"section": section},
+                "embedding": embedding,
+                "created_at": created_at,
+            }
+
+
+def job_embedding_rows(
+    job_ids: List[str], dimensions: int = 1536, seed: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """``job_listing_embeddings`` rows with unit-normalized random embeddings."""
+    vectors = np.random.default_rng(seed + 5)
+    for start in range(0, len(job_ids), 1000):
+        batch = job_ids[start : start + 1000]
+        embeddings = vectors.standard_normal((len(batch), dimensions)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        for job_id, embedding in zip(batch, np.round(embeddings, 5).tolist()):
+            yield {"id": job_id, "embedding": embedding, "content_hash": "seed"}
+
+
+def resource_view_rows(
+    count: int,
+    resource_ids: List[str],
+    days: int = 90,
+    seed: int = 0,
+    end: Optional[datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Views spread over the ``days`` before ``end`` (default now), so
+    "last N days" queries see them. Popularity is Zipf-like: a few
+    resources take most of the views.
+    """
+    rng = random.Random(seed + 4)
+    end = end or datetime.now(timezone.utc)
+    window = days * 24 * 3600
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(resource_ids))))
+    users = [_uuid(rng) for _ in range(max(1, min(5000, count // 20)))]
+    for _ in range(count):
+        yield {
+            "id": _uuid(rng),
+            "resource_id": rng.choices(resource_ids, cum_weights=cum_weights)[0],
+            "resource_type": "knowledge_resource",
+            "user_id": rng.choice(users),
+            "session_id": _uuid(rng),
+            "viewed_at": (end - timedelta(seconds=rng.randrange(window))).isoformat(),
+        }
+
+
+def insert_batches(
+    db: LocalSupabase,
+    rows: Iterable[Dict[str, Any]],
+    table: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Bulk insert ``rows`` in batches; returns rows inserted per table.
+
+    Rows carrying a ``_table`` key are routed to that table.
+    """
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    inserted: Dict[str, int] = {}
+
+    def flush(name: str) -> None:
+        batch = pending.pop(name, [])
+        if batch:
+            db.bulk_insert(name, batch)
+            inserted[name] = inserted.get(name, 0) + len(batch)
+
+    for row in rows:
+        name = row.pop("_table", table)
+        pending.setdefault(name, []).append(row)
+        if len(pending[name]) >= batch_size:
+            flush(name)
+    for name in list(pending):
+        flush(name)
+    return inserted
+
+
+def seed_job_listings(db: LocalSupabase, count: int, seed: int = 0, **kwargs) -> Dict[str, int]:
+    return insert_batches(db, job_listing_rows(count, seed), "job_listings", **kwargs)
+
+
+def seed_job_embeddings(
+    db: LocalSupabase, dimensions: int = 1536, seed: int = 0, **kwargs
+) -> Dict[str, int]:
+    """Embeddings for the job listings already in ``db``."""
+    job_ids = [
+        row["id"] for row in db.table("job_listings").select("id").order("id").execute().data
+    ]
+    return insert_batches(
+        db, job_embedding_rows(job_ids, dimensions, seed), "job_listing_embeddings", **kwargs
+    )
+
+
+def seed_knowledge_resources(
+    db: LocalSupabase, count: int, seed: int = 0, **kwargs
+) -> Dict[str, int]:
+    return insert_batches(db, knowledge_resource_rows(count, seed), "knowledge_resources", **kwargs)
+
+
+def seed_resource_views(
+    db: LocalSupabase, count: int, seed: int = 0, days: int = 90, **kwargs
+) -> Dict[str, int]:
+    """Views of the knowledge resources already in ``db``."""
+    resource_ids = [
+        row["id"] for row in db.table("knowledge_resources").select("id").order("id").execute().data
+    ]
+    if not resource_ids or not count:
+        return {}
+    return insert_batches(
+        db, resource_view_rows(count, resource_ids, days, seed), "resource_views", **kwargs
+    )
+
+
+def seed_conversations(
+    db: LocalSupabase, count: int, messages_per_conversation: int = 6, seed: int = 0, **kwargs
+) -> Dict[str, int]:
+    return insert_batches(db, conversation_rows(count, messages_per_conversation, seed), **kwargs)
+
+
+def seed_resume_chunks(
+    db: LocalSupabase,
+    resumes: int,
+    chunks_per_resume: int = 8,
+    dimensions: int = 1536,
+    seed: int = 0,
+    **kwargs,
+) -> Dict[str, int]:
+    return insert_batches(
+        db,
+        resume_chunk_rows(resumes, chunks_per_resume, dimensions, seed),
+        "resume_chunks",
+        **kwargs,
+    )
+
+
+def seed_all(db: LocalSupabase, args: argparse.Namespace) -> Dict[str, Any]:
+    steps: List[Tuple[str, Callable[[], Dict[str, int]]]] = [
+        ("job_listings", lambda: seed_job_listings(db, args.jobs, args.seed)),
+        ("knowledge_resources", lambda: seed_knowledge_resources(db, args.resources, args.seed)),
+        ("resource_views", lambda: seed_resource_views(db, args.views, args.seed)),
+        (
+            "conversations",
+            lambda: seed_conversations(db, args.conversations, args.messages, args.seed),
+        ),
+        (
+            "resume_chunks",
+            lambda: seed_resume_chunks(
+                db, args.resumes, args.chunks, args.embedding_dimensions, args.seed
+            ),
+        ),
+    ]
+    report: Dict[str, Any] = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        counts = step()
+        elapsed = time.perf_counter() - started
+        for table, rows in counts.items():
+            report[table] = {
+                "rows": rows,
+                "seconds": round(elapsed, 2),
+                "rows_per_s": round(rows / elapsed) if elapsed else None,
+            }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed the local Supabase stand-in")
+    parser.add_argument("--database", required=True, help="SQLite file to create or extend")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--resources", type=int, default=100_000)
+    parser.add_argument("--views", type=int, default=200_000, help="Resource views, last 90 days")
+    parser.add_argument("--conversations", type=int, default=20_000)
+    parser.add_argument("--messages", type=int, default=6, help="Messages per conversation")
+    parser.add_argument("--resumes", type=int, default=2_000)
+    parser.add_argument("--chunks", type=int, default=8, help="Chunks per resume")
+    parser.add_argument("--embedding-dimensions", type=int, default=1536)
+    cli_args = parser.parse_args()
+
+    database = LocalSupabase(cli_args.database)
+    try:
+        print(json.dumps(seed_all(database, cli_args), indent=2))
+    finally:
+        database.close()
@@ -0,0 +1,1337 @@
+"""
+Local Supabase stand-in backed by SQLite.
+
+Implements the subset of the supabase-py / PostgREST query builder used by
+the backend (select/insert/update/upsert/delete, eq/neq/gt/gte/lt/lte,
+like/ilike, in_, is_, contains, overlaps, or_, match, order, range, limit,
+single, count="exact") so data paths can run and be benchmarked offline.
+
+Rows are stored as JSON documents, one SQLite table per Supabase table, and
+filters compile to SQL over ``json_extract``. Tables are created on first use
+with the column defaults of the production schema (``backend/audit/supabase.json``
+plus ``supabase/migrations``) and expression indexes for the migration indexes
+and the hot filter/sort columns.
+
+Vector functions run over an in-memory, normalized embedding matrix per
+table: ``rpc("search_resume_chunks", ...)`` mirrors the migration of the same
+name, ``rpc("match_job_listings", ...)`` ranks listings by their stored
+embeddings, and any ``rpc("match_<table>", ...)`` does cosine matching over
+that table's ``embedding`` column. Full-text search runs over trigger-maintained
+FTS5 indexes standing in for generated tsvector columns, as in
+``rpc("search_job_listings", ...)``.
+
+Use ``install_local_supabase()`` to point the shared clients at a stand-in and
+``backend.database.local_seed`` to fill it with synthetic data.
+"""
+
+import copy
+import functools
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA_DUMP = _ROOT / "backend" / "audit" / "supabase.json"
+MIGRATIONS_DIR = _ROOT / "supabase" / "migrations"
+
+# Filter/sort columns of the hot API queries, indexed in addition to the
+# indexes declared in the migrations
+LOCAL_INDEXES: Dict[str, List[Tuple[str, ...]]] = {
+    "job_listings": [("status", "created_at"), ("created_at",), ("partner_id",)],
+    "knowledge_resources": [("status", "created_at"), ("created_at",), ("content_type",)],
+    "conversations": [("user_id", "last_activity"), ("created_at",)],
+    "conversation_messages": [("conversation_id", "created_at")],
+    "resume_chunks": [("resume_id",), ("user_id",)],
+}
+
+# Full-text indexes standing in for generated tsvector columns: source
+# columns with the bm25 weight of their tsvector weight (ts_rank weights
+# A=1.0, B=0.4, C=0.2)
+LOCAL_TEXT_INDEXES: Dict[str, Dict[str, float]] = {
+    "job_listings": {"title": 1.0, "description": 0.4, "requirements": 0.2},
+}
+
+# Per-day count rollups standing in for statement-level rollup triggers,
+# keyed by source table
+LOCAL_ROLLUPS: Dict[str, Dict[str, str]] = {
+    "resource_views": {
+        "table": "resource_view_daily",
+        "key": "resource_id",
+        "timestamp": "viewed_at",
+        "date": "view_date",
+        "count": "view_count",
+    },
+}
+
+# Tables whose writes bump their row in reference_data_versions, standing in
+# for the statement triggers of the reference data versions migration
+LOCAL_VERSION_STAMPS = frozenset(
+    ("education_programs", "mos_translation", "skills_mapping", "role_requirements")
+)
+
+# The english text search configuration drops these before matching
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on "
+    "or that the their this to was were will with".split()
+)
+_WEB_TERM = re.compile(r'(-?)"([^"]*)"|(-?)([^\s"]+)')
+_WORD = re.compile(r"\w+")
+
+_DUMP_TABLE = re.compile(r"TABLE:\s*(\w+)")
+_DUMP_COLUMN = re.compile(r"(\w+) \| TYPE: .+? \| NULLABLE: \w+ \| DEFAULT: (.*)$")
+_CREATE_TABLE = re.compile(
+    r"CREATE TABLE IF NOT EXISTS (?:\w+\.)?(\w+)\s*\((.*?)\n\);", re.S | re.I
+)
+_ADD_COLUMN = re.compile(r"ALTER TABLE (?:\w+\.)?(\w+)\s+((?:ADD COLUMN.*?)+);", re.S | re.I)
+_ADD_COLUMN_DEF = re.compile(r"ADD COLUMN (?:IF NOT EXISTS )?(\w+)([^,;]*)", re.I)
+_CREATE_INDEX = re.compile(
+    r"CREATE (?:UNIQUE )?INDEX IF NOT EXISTS \w+ ON (?:\w+\.)?(\w+)\s*\(([\w\s,]+)\)", re.I
+)
+_DEFAULT_EXPR = re.compile(
+    r"\bDEFAULT\s+('(?:[^']|'')*'(?:::[\w\[\] ]+?)?|[\w.]+\(\)|[\w.-]+)(?=\s|,|$)", re.I
+)
+_QUOTED = re.compile(r"^'((?:[^']|'')*)'(?:::(.+))?$")
+_TABLE_CONSTRAINTS = ("constraint", "primary", "unique", "foreign", "check")
+
+
+class LocalSupabaseError(Exception):
+    """Raised for invalid queries, mirroring PostgREST API errors."""
+
+
+class LocalResponse:
+    """Query result with the same ``data``/``count`` shape as supabase-py."""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+    def __repr__(self) -> str:
+        return f"LocalResponse(data={self.data!r}, count={self.count!r})"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _constant(value: Any) -> Callable[[], Any]:
+    if isinstance(value, (dict, list)):
+        return lambda: copy.deepcopy(value)
+    return lambda: value
+
+
+def _default_factory(expr: str) -> Callable[[], Any]:
+    """Python equivalent of a Postgres column default expression."""
+    expr = expr.strip()
+    lowered = expr.lower()
+    if lowered in ("now()", "current_timestamp") or lowered.startswith("timezone("):
+        return _now
+    if lowered == "current_date":
+        return _today
+    if lowered in ("gen_random_uuid()", "uuid_generate_v4()"):
+        return lambda: str(uuid.uuid4())
+    if lowered in ("true", "false"):
+        return _constant(lowered == "true")
+
+    quoted = _QUOTED.match(expr)
+    if quoted:
+        text = quoted.group(1).replace("''", "'")
+        cast = (quoted.group(2) or "").lower()
+        if cast.startswith("json"):
+            return _constant(json.loads(text))
+        if cast.endswith("[]"):
+            items = text.strip("{}")
+            return _constant([v.strip('"') for v in items.split(",")] if items else [])
+        return _constant(text)
+
+    for number in (int, float):
+        try:
+            return _constant(number(expr))
+        except ValueError:
+            pass
+    # NULL, sequences and anything else without a Python equivalent
+    return _constant(None)
+
+
+def _column_defaults(body: str) -> Dict[str, Callable[[], Any]]:
+    columns = {}
+    for line in body.splitlines():
+        line = line.split("--", 1)[0].strip().rstrip(",")
+        if not line or line.lower().startswith(_TABLE_CONSTRAINTS):
+            continue
+        name = line.split()[0]
+        default = _DEFAULT_EXPR.search(line)
+        columns[name] = _default_factory(default.group(1) if default else "NULL")
+    return columns
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(
+    dump_path: str = str(SCHEMA_DUMP), migrations_dir: str = str(MIGRATIONS_DIR)
+) -> Tuple[Dict[str, Dict[str, Callable[[], Any]]], Dict[str, List[Tuple[str, ...]]]]:
+    """
+    Column defaults and indexes per table.
+
+    The audit dump describes the live database; migrations are applied on top
+    in order, adding their tables, columns and plain column indexes.
+    """
+    defaults: Dict[str, Dict[str, Callable[[], Any]]] = {}
+    indexes: Dict[str, List[Tuple[str, ...]]] = {}
+
+    dump = Path(dump_path)
+    if dump.exists():
+        table = None
+        for row in json.loads(dump.read_text()):
+            line = row.get("output", "")
+            header = _DUMP_TABLE.search(line)
+            if header:
+                table = header.group(1)
+                defaults.setdefault(table, {})
+                continue
+            column = _DUMP_COLUMN.search(line)
+            if table and column:
+                defaults[table][column.group(1)] = _default_factory(column.group(2))
+
+    for migration in sorted(Path(migrations_dir).glob("*.sql")):
+        sql = migration.read_text()
+        for table, body in _CREATE_TABLE.findall(sql):
+            defaults.setdefault(table, {}).update(_column_defaults(body))
+        for table, clauses in _ADD_COLUMN.findall(sql):
+            for name, rest in _ADD_COLUMN_DEF.findall(clauses):
+                if "GENERATED" in rest.upper():
+                    # Computed by the database; the local text index stands in
+                    continue
+                default = _DEFAULT_EXPR.search(rest)
+                defaults.setdefault(table, {})[name] = _default_factory(
+                    default.group(1) if default else "NULL"
+                )
+        for table, columns in _CREATE_INDEX.findall(sql):
+            # Sort direction and NULLS placement do not matter to SQLite's use
+            key = tuple(c.split()[0] for c in columns.split(","))
+            if key != ("id",):
+                indexes.setdefault(table, []).append(key)
+
+    return defaults, indexes
+
+
+def _ident(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise LocalSupabaseError(f"Invalid identifier: {name}")
+    return name
+
+
+def _field(column: str) -> str:
+    return f"json_extract(doc, '$.{_ident(column)}')"
+
+
+def _param(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _like(pattern: str) -> str:
+    # PostgREST accepts * as a wildcard in URL filters
+    return str(pattern).replace("*", "%")
+
+
+def _fts_query(query: str) -> Optional[str]:
+    """
+    FTS5 query for a ``websearch_to_tsquery`` style string.
+
+    Terms are ANDed, ``"quoted phrases"`` stay phrases, ``or`` between terms
+    means OR and a leading ``-`` excludes a term. None if nothing searchable
+    is left after dropping stopwords.
+    """
+    groups: List[List[str]] = [[]]
+    excluded: List[str] = []
+    for negate_phrase, phrase, negate_word, word in _WEB_TERM.findall(query):
+        if not phrase and word.lower() == "or":
+            if groups[-1]:
+                groups.append([])
+            continue
+        words = [w for w in _WORD.findall((phrase or word).lower()) if w not in _STOPWORDS]
+        if not words:
+            continue
+        term = '"' + " ".join(words) + '"'
+        if negate_phrase or negate_word:
+            excluded.append(term)
+        else:
+            groups[-1].append(term)
+
+    alternatives = [" AND ".join(group) for group in groups if group]
+    if not alternatives:
+        return None
+    match = " OR ".join(f"({a})" for a in alternatives)
+    for term in excluded:
+        match = f"({match}) NOT {term}"
+    return match
+
+
+def _parse_literal(raw: str) -> Any:
+    if raw == "null":
+        return None
+    if raw in ("true", "false"):
+        return raw == "true"
+    return raw
+
+
+def _split_logic(filters: str) -> List[str]:
+    """Split a PostgREST logic tree on its top-level commas."""
+    parts, depth, quoted, start, escaped = [], 0, False, 0, False
+    for i, char in enumerate(filters):
+        if escaped:
+            escaped = False
+        elif quoted:
+            escaped = char == "\\"
+            quoted = char != '"'
+        elif char == '"':
+            quoted = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(filters[start:i])
+            start = i + 1
+    parts.append(filters[start:])
+    return parts
+
+
+def _unquote(raw: str) -> str:
+    """Value of a double-quoted PostgREST literal (``"a,b"`` -> ``a,b``)."""
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", raw[1:-1])
+    return raw
+
+
+class LocalQueryBuilder:
+    """Chainable query against one table; ``execute()`` runs it."""
+
+    _COMPARISONS = {"eq": "=", "neq": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+    def __init__(self, store: "LocalSupabase", table: str):
+        self._store = store
+        self._table = _ident(table)
+        self._operation = "select"
+        self._columns: Optional[List[str]] = None
+        self._count: Optional[str] = None
+        self._payload: Any = None
+        self._on_conflict = "id"
+        self._ignore_duplicates = False
+        self._where: List[Tuple[str, List[Any]]] = []
+        self._order: List[str] = []
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._single = False
+        self._maybe_single = False
+
+    # Operations
+
+    def select(self, columns: str = "*", count: Optional[str] = None, **kwargs):
+        columns = columns.replace(" ", "")
+        self._columns = None if columns in ("", "*") else columns.split(",")
+        self._count = count
+        return self
+
+    def insert(self, rows: Union[Dict, List[Dict]], **kwargs):
+        self._operation = "insert"
+        self._payload = rows
+        return self
+
+    def upsert(
+        self,
+        rows: Union[Dict, List[Dict]],
+        on_conflict: str = "id",
+        ignore_duplicates: bool = False,
+        **kwargs,
+    ):
+        self._operation = "upsert"
+        self._payload = rows
+        self._on_conflict = on_conflict
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values: Dict[str, Any], **kwargs):
+        self._operation = "update"
+        self._payload = values
+        return self
+
+    def delete(self, **kwargs):
+        self._operation = "delete"
+        return self
+
+    # Filters
+
+    def _compare(self, op: str, column: str, value: Any):
+        if value is None:
+            sql = f"{_field(column)} IS NULL" if op == "eq" else f"{_field(column)} IS NOT NULL"
+            self._where.append((sql, []))
+        else:
+            self._where.append((f"{_field(column)} {self._COMPARISONS[op]} ?", [_param(value)]))
+        return self
+
+    def eq(self, column: str, value: Any):
+        return self._compare("eq", column, value)
+
+    def neq(self, column: str, value: Any):
+        return self._compare("neq", column, value)
+
+    def gt(self, column: str, value: Any):
+        return self._compare("gt", column, value)
+
+    def gte(self, column: str, value: Any):
+        return self._compare("gte", column, value)
+
+    def lt(self, column: str, value: Any):
+        return self._compare("lt", column, value)
+
+    def lte(self, column: str, value: Any):
+        return self._compare("lte", column, value)
+
+    def like(self, column: str, pattern: str):
+        self._where.append((f"{_field(column)} GLOB ?", [_like(pattern).replace("%", "*")]))
+        return self
+
+    def ilike(self, column: str, pattern: str):
+        self._where.append((f"{_field(column)} LIKE ?", [_like(pattern)]))
+        return self
+
+    def in_(self, column: str, values: Sequence[Any]):
+        values = list(values)
+        if not values:
+            self._where.append(("0", []))
+        else:
+            marks = ",".join("?" * len(values))
+            self._where.append((f"{_field(column)} IN ({marks})", [_param(v) for v in values]))
+        return self
+
+    def is_(self, column: str, value: Any):
+        if value in (None, "null"):
+            self._where.append((f"{_field(column)} IS NULL", []))
+        else:
+            self._where.append(
+                (f"{_field(column)} = ?", [_param(_parse_literal(str(value).lower()))])
+            )
+        return self
+
+    def contains(self, column: str, values: Union[List, Dict]):
+        if isinstance(values, dict):
+            for key, value in values.items():
+                self._where.append(
+                    (f"json_extract(doc, '$.{_ident(column)}.{_ident(key)}') = ?", [_param(value)])
+                )
+            return self
+        for value in values:
+            self._where.append(
+                (
+                    f"EXISTS (SELECT 1 FROM json_each(doc, '$.{_ident(column)}') WHERE value = ?)",
+                    [_param(value)],
+                )
+            )
+        return self
+
+    def overlaps(self, column: str, values: Sequence[Any]):
+        values = list(values)
+        if not values:
+            self._where.append(("0", []))
+            return self
+        marks = ",".join("?" * len(values))
+        self._where.append(
+            (
+                f"EXISTS (SELECT 1 FROM json_each(doc, '$.{_ident(column)}') WHERE value IN ({marks}))",
+                [_param(v) for v in values],
+            )
+        )
+        return self
+
+    def match(self, query: Dict[str, Any]):
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def or_(self, filters: str, **kwargs):
+        """
+        PostgREST ``or`` filter string, e.g. ``"title.ilike.%solar%,status.eq.active"``.
+
+        Nested ``and(...)``/``or(...)`` groups and double-quoted values are supported.
+        """
+        self._where.append(self._logic(filters, " OR "))
+        return self
+
+    def _logic(self, filters: str, joiner: str) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for part in _split_logic(filters):
+            group = re.match(r"(and|or)\((.*)\)$", part, re.S)
+            if group:
+                clause, group_params = self._logic(
+                    group.group(2), " AND " if group.group(1) == "and" else " OR "
+                )
+                clauses.append(clause)
+                params.extend(group_params)
+                continue
+            column, op, raw = part.split(".", 2)
+            raw = _unquote(raw)
+            if op in self._COMPARISONS:
+                clauses.append(f"{_field(column)} {self._COMPARISONS[op]} ?")
+                params.append(_param(_parse_literal(raw)))
+            elif op == "ilike":
+                clauses.append(f"{_field(column)} LIKE ?")
+                params.append(_like(raw))
+            elif op == "is":
+                clauses.append(f"{_field(column)} IS NULL")
+            else:
+                raise LocalSupabaseError(f"Unsupported or_ operator: {op}")
+        return f"({joiner.join(clauses)})", params
+
+    # Shaping
+
+    def order(
+        self,
+        column: str,
+        desc: bool = False,
+        nulls_last: bool = False,
+        nullsfirst: Optional[bool] = None,
+        **kwargs,
+    ):
+        if nullsfirst is not None:
+            nulls_last = not nullsfirst
+        nulls = " NULLS LAST" if nulls_last else (" NULLS FIRST" if nullsfirst else "")
+        self._order.append(f"{_field(column)} {'DESC' if desc else 'ASC'}{nulls}")
+        return self
+
+    def limit(self, size: int, **kwargs):
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int, **kwargs):
+        self._offset = start
+        self._limit = max(0, end - start + 1)
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def maybe_single(self):
+        self._maybe_single = True
+        return self
+
+    # Execution
+
+    def _conditions(self) -> Tuple[List[str], List[Any]]:
+        params: List[Any] = []
+        for _, p in self._where:
+            params.extend(p)
+        return [sql for sql, _ in self._where], params
+
+    def _where_sql(self) -> Tuple[str, List[Any]]:
+        if not self._where:
+            return "", []
+        conditions, params = self._conditions()
+        return " WHERE " + " AND ".join(conditions), params
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        if self._columns is None:
+            return row
+        return {c: row.get(c) for c in self._columns}
+
+    def execute(self) -> LocalResponse:
+        with self._store.lock:
+            self._store.ensure_table(self._table)
+            if self._operation == "select":
+                response = self._execute_select()
+            elif self._operation in ("insert", "upsert"):
+                response = self._execute_write()
+            elif self._operation == "update":
+                response = self._execute_update()
+            else:
+                response = self._execute_delete()
+        return self._shape(response)
+
+    def _shape(self, response: LocalResponse) -> LocalResponse:
+        if not (self._single or self._maybe_single):
+            return response
+        rows = response.data or []
+        if self._single and len(rows) != 1:
+            raise LocalSupabaseError(
+                f"JSON object requested, multiple (or no) rows returned ({len(rows)})"
+            )
+        return LocalResponse(rows[0] if rows else None, response.count)
+
+    def _execute_select(self) -> LocalResponse:
+        where, params = self._where_sql()
+        sql = f"SELECT doc FROM {self._table}{where}"
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None or self._offset:
+            sql += f" LIMIT {int(self._limit if self._limit is not None else -1)} OFFSET {int(self._offset)}"
+        rows = [self._project(json.loads(doc)) for (doc,) in self._store.conn.execute(sql, params)]
+
+        count = None
+        if self._count:
+            (count,) = self._store.conn.execute(
+                f"SELECT COUNT(*) FROM {self._table}{where}", params
+            ).fetchone()
+        return LocalResponse(rows, count)
+
+    def _execute_write(self) -> LocalResponse:
+        rows = self._payload if isinstance(self._payload, list) else [self._payload]
+        if self._operation == "insert":
+            stored = self._store.bulk_insert(self._table, rows)
+        elif self._ignore_duplicates:
+            # Only new rows are inserted (and returned), as with ON CONFLICT DO NOTHING
+            keys = [k.strip() for k in self._on_conflict.split(",")]
+            fresh, seen = [], set()
+            for row in rows:
+                key = tuple(str(row[k]) for k in keys if k in row)
+                if len(key) < len(keys):
+                    fresh.append(row)
+                elif key not in seen and self._merge_existing(row) is None:
+                    seen.add(key)
+                    fresh.append(row)
+            stored = self._store.bulk_insert(self._table, fresh) if fresh else []
+        else:
+            stored = []
+            for row in rows:
+                doc = self._merge_existing(row) or self._store.prepare_row(self._table, row)
+                self._store.conn.execute(
+                    f"INSERT OR REPLACE INTO {self._table} (id, doc) VALUES (?, ?)",
+                    (str(doc["id"]), json.dumps(doc, default=str)),
+                )
+                stored.append(doc)
+            self._store.touch(self._table)
+            self._store.conn.commit()
+        return LocalResponse([self._project(d) for d in stored])
+
+    def _merge_existing(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Existing row updated with ``row``'s columns, or None if there is no conflict."""
+        keys = [k.strip() for k in self._on_conflict.split(",")]
+        if any(k not in row for k in keys):
+            return None
+        where = " AND ".join(f"{_field(k)} = ?" for k in keys)
+        existing = self._store.conn.execute(
+            f"SELECT doc FROM {self._table} WHERE {where} LIMIT 1",
+            [_param(row[k]) for k in keys],
+        ).fetchone()
+        if existing is None:
+            return None
+        merged = json.loads(existing[0])
+        row_id, created_at = merged["id"], merged.get("created_at")
+        merged.update(row)
+        merged["id"] = row_id
+        merged["created_at"] = created_at or merged.get("created_at")
+        return merged
+
+    def _matching(self) -> List[Dict[str, Any]]:
+        where, params = self._where_sql()
+        return [
+            json.loads(doc)
+            for (doc,) in self._store.conn.execute(f"SELECT doc FROM {self._table}{where}", params)
+        ]
+
+    def _execute_update(self) -> LocalResponse:
+        updated = []
+        for doc in self._matching():
+            doc.update(self._payload)
+            self._store.conn.execute(
+                f"UPDATE {self._table} SET doc = ? WHERE id = ?",
+                (json.dumps(doc, default=str), str(doc["id"])),
+            )
+            updated.append(doc)
+        self._store.touch(self._table)
+        self._store.conn.commit()
+        return LocalResponse([self._project(d) for d in updated])
+
+    def _execute_delete(self) -> LocalResponse:
+        deleted = self._matching()
+        where, params = self._where_sql()
+        self._store.conn.execute(f"DELETE FROM {self._table}{where}", params)
+        self._store.touch(self._table)
+        self._store.conn.commit()
+        return LocalResponse(deleted)
+
+
+class LocalRpc:
+    """Pending RPC call; ``execute()`` runs the registered function."""
+
+    def __init__(self, store: "LocalSupabase", fn: Callable, params: Dict[str, Any]):
+        self._store = store
+        self._fn = fn
+        self._params = params
+
+    def execute(self) -> LocalResponse:
+        with self._store.lock:
+            return LocalResponse(self._fn(self._store, **self._params))
+
+
+class LocalSupabase:
+    """
+    SQLite-backed client exposing ``table()``/``from_()``/``rpc()``.
+
+    ``path`` is a SQLite database file, or ``":memory:"`` (the default).
+    With ``schema=True`` inserted rows get the production column defaults
+    and tables get the production and hot-path indexes.
+    """
+
+    def __init__(self, path: str = ":memory:", schema: bool = True):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Upserts are INSERT OR REPLACE; the text index triggers must see the
+        # implied delete
+        self.conn.execute("PRAGMA recursive_triggers=ON")
+        self.lock = threading.RLock()
+        self._tables: set = set()
+        self._rpcs: Dict[str, Callable] = {}
+        self._versions: Dict[str, int] = {}
+        self._vectors: Dict[Tuple[str, str], Tuple[int, List[str], np.ndarray]] = {}
+        self._defaults, migration_indexes = load_schema() if schema else ({}, {})
+        self._indexes: Dict[str, List[Tuple[str, ...]]] = {}
+        self._text_indexes: Dict[str, Dict[str, float]] = {}
+        self._rollups: Dict[str, Dict[str, str]] = {}
+        self._version_stamps: FrozenSet[str] = frozenset()
+        if schema:
+            for table, keys in list(migration_indexes.items()) + list(LOCAL_INDEXES.items()):
+                self._indexes.setdefault(table, []).extend(keys)
+            self._text_indexes.update(LOCAL_TEXT_INDEXES)
+            self._rollups.update(LOCAL_ROLLUPS)
+            self._version_stamps = LOCAL_VERSION_STAMPS
+        self.register_rpc("search_resume_chunks", search_resume_chunks)
+        self.register_rpc("search_job_listings", search_job_listings)
+        self.register_rpc("top_viewed_resources", top_viewed_resources)
+        self.register_rpc("increment_resource_view_counts", increment_resource_view_counts)
+        self.register_rpc("increment_conversation_tokens", increment_conversation_tokens)
+        self.register_rpc("knowledge_resource_facets", knowledge_resource_facets)
+        self.register_rpc("estimated_row_count", estimated_row_count)
+        self.register_rpc("match_job_listings", match_job_listings)
+        self.register_rpc("update_embeddings", update_embeddings)
+        self.register_rpc("embedding_model_counts", embedding_model_counts)
+
+    def ensure_table(self, table: str) -> None:
+        if table in self._tables:
+            return
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {_ident(table)} (id TEXT PRIMARY KEY, doc TEXT NOT NULL)"
+        )
+        for columns in dict.fromkeys(self._indexes.get(table, [])):
+            self.create_index(table, *columns)
+        if table in self._text_indexes:
+            self.create_text_index(table, *self._text_indexes[table])
+        self._tables.add(table)
+        for source, rollup in self._rollups.items():
+            if table == source:
+                self.create_daily_rollup(source, **rollup)
+            elif table == rollup["table"]:
+                # Reading a rollup first still backfills it
+                self.ensure_table(source)
+
+    def create_index(self, table: str, *columns: str) -> None:
+        """Expression index matching the SQL the query builder emits."""
+        name = f"idx_{_ident(table)}_{'_'.join(_ident(c) for c in columns)}"
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"({', '.join(_field(c) for c in columns)})"
+        )
+
+    def create_text_index(self, table: str, *columns: str) -> None:
+        """
+        FTS5 index over ``columns``, kept in sync by triggers.
+
+        The local counterpart of a generated tsvector column with a GIN
+        index: porter stemming, rows keyed by the table's rowid.
+        """
+        fts = f"{_ident(table)}_fts"
+        if self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).fetchone():
+            return
+        names = ", ".join(_ident(c) for c in columns)
+        new = ", ".join(f"json_extract(new.doc, '$.{c}')" for c in columns)
+        self.conn.executescript(f"""
+            CREATE VIRTUAL TABLE {fts} USING fts5({names}, tokenize='porter unicode61');
+            INSERT INTO {fts} (rowid, {names})
+                SELECT rowid, {", ".join(_field(c) for c in columns)} FROM {table};
+            CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts} (rowid, {names}) VALUES (new.rowid, {new});
+            END;
+            CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN
+                DELETE FROM {fts} WHERE rowid = old.rowid;
+            END;
+            CREATE TRIGGER {fts}_update AFTER UPDATE ON {table} BEGIN
+                DELETE FROM {fts} WHERE rowid = old.rowid;
+                INSERT INTO {fts} (rowid, {names}) VALUES (new.rowid, {new});
+            END;
+            """)
+
+    def create_daily_rollup(
+        self, source: str, table: str, key: str, timestamp: str, date: str, count: str
+    ) -> None:
+        """
+        Per-``key``, per-day counts of ``source`` rows in ``table``.
+
+        A trigger folds every insert into its bucket; rows inserted before
+        the trigger existed are backfilled once.
+        """
+        self.ensure_table(table)
+        trigger = f"{_ident(source)}_rollup"
+        if self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (trigger,)
+        ).fetchone():
+            return
+        now = "strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')"
+
+        def bucket(doc: str) -> Tuple[str, str, str]:
+            key_sql = f"json_extract({doc}, '$.{_ident(key)}')"
+            day_sql = (
+                f"substr(coalesce(json_extract({doc}, '$.{_ident(timestamp)}'), {now}), 1, 10)"
+            )
+            return key_sql, day_sql, f"{key_sql} || ':' || {day_sql}"
+
+        def row(doc: str, views: str) -> str:
+            key_sql, day_sql, id_sql = bucket(doc)
+            return (
+                f"{id_sql}, json_object('id', {id_sql}, '{key}', {key_sql}, "
+                f"'{_ident(date)}', {day_sql}, '{_ident(count)}', {views}, 'updated_at', {now})"
+            )
+
+        self.conn.executescript(f"""
+            CREATE TRIGGER {trigger} AFTER INSERT ON {source} BEGIN
+                INSERT INTO {table} (id, doc) VALUES ({row("new.doc", "1")})
+                ON CONFLICT (id) DO UPDATE SET doc = json_set(
+                    doc,
+                    '$.{count}', json_extract(doc, '$.{count}') + 1,
+                    '$.updated_at', {now}
+                );
+            END;
+            INSERT INTO {table} (id, doc)
+                SELECT {row("doc", "COUNT(*)")} FROM {source} GROUP BY 1
+                ON CONFLICT (id) DO NOTHING;
+            """)
+
+    def text_search(
+        self,
+        table: str,
+        query: str,
+        filters: Optional[LocalQueryBuilder] = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows matching a web-search style ``query``, best bm25 rank first.
+
+        ``filters`` is a query builder on ``table`` whose filters are applied
+        to the ranked matches, in batches, until the page is full, so the
+        documents of low-ranked matches are never parsed. Equal ranks keep
+        insertion order, newest first. Each row gets a positive ``rank``.
+        """
+        self.ensure_table(table)
+        weights = self._text_indexes.get(table)
+        if weights is None:
+            raise LocalSupabaseError(f"No text index on {table}")
+        match = _fts_query(query)
+        if match is None or limit <= 0:
+            return []
+
+        fts = f"{table}_fts"
+        rank = f"-bm25({fts}, {', '.join(str(w) for w in weights.values())})"
+        ranked = self.conn.execute(
+            f"SELECT rowid, {rank} AS rank FROM {fts} WHERE {fts} MATCH ? "
+            f"ORDER BY rank DESC, rowid DESC",
+            [match],
+        ).fetchall()
+
+        conditions, params = filters._conditions() if filters is not None else ([], [])
+        where = "".join(f" AND {c}" for c in conditions)
+        rows: List[Dict[str, Any]] = []
+        skip = offset
+        batch = max(limit + offset, 64)
+        for start in range(0, len(ranked), batch):
+            chunk = ranked[start : start + batch]
+            marks = ",".join("?" * len(chunk))
+            # Rowid lookups; a filter's expression index would scan far more
+            docs = dict(
+                self.conn.execute(
+                    f"SELECT rowid, doc FROM {table} NOT INDEXED WHERE rowid IN ({marks}){where}",
+                    [rowid for rowid, _ in chunk] + params,
+                )
+            )
+            for rowid, score in chunk:
+                if rowid not in docs:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                row = json.loads(docs[rowid])
+                row["rank"] = score
+                rows.append(row)
+                if len(rows) >= limit:
+                    return rows
+        return rows
+
+    def prepare_row(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of ``row`` with the column defaults Postgres would fill in."""
+        doc = dict(row)
+        doc.setdefault("id", str(uuid.uuid4()))
+        now = _now()
+        doc.setdefault("created_at", now)
+        doc.setdefault("updated_at", now)
+        for column, factory in self._defaults.get(table, {}).items():
+            if column not in doc:
+                doc[column] = factory()
+        return doc
+
+    def bulk_insert(self, table: str, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert ``rows`` in one statement batch and transaction."""
+        with self.lock:
+            self.ensure_table(table)
+            docs = [self.prepare_row(table, row) for row in rows]
+            try:
+                self.conn.executemany(
+                    f"INSERT INTO {table} (id, doc) VALUES (?, ?)",
+                    [(str(d["id"]), json.dumps(d, default=str)) for d in docs],
+                )
+            except sqlite3.IntegrityError as e:
+                self.conn.rollback()
+                raise LocalSupabaseError(f"duplicate key value violates unique constraint: {e}")
+            self.touch(table)
+            self.conn.commit()
+        return docs
+
+    def touch(self, table: str) -> None:
+        """Mark ``table`` as changed, invalidating its vector matrix and bumping its version stamp."""
+        self._versions[table] = self._versions.get(table, 0) + 1
+        if table in self._version_stamps:
+            self.ensure_table("reference_data_versions")
+            now = datetime.now(timezone.utc).isoformat()
+            self.conn.execute(
+                """
+                INSERT INTO reference_data_versions (id, doc)
+                VALUES (?, json_object('table_name', ?, 'version', 1, 'updated_at', ?))
+                ON CONFLICT (id) DO UPDATE SET doc = json_set(
+                    doc, '$.version', json_extract(doc, '$.version') + 1, '$.updated_at', ?
+                )
+                """,
+                (table, table, now, now),
+            )
+
+    def vector_index(self, table: str, column: str = "embedding") -> Tuple[List[str], np.ndarray]:
+        """Row ids and L2-normalized embedding matrix, rebuilt after writes."""
+        version = self._versions.get(table, 0)
+        cached = self._vectors.get((table, column))
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        self.ensure_table(table)
+        ids: List[str] = []
+        vectors: List[List[float]] = []
+        for row_id, raw in self.conn.execute(
+            f"SELECT id, {_field(column)} FROM {table} WHERE {_field(column)} IS NOT NULL"
+        ):
+            ids.append(row_id)
+            vectors.append(json.loads(raw))
+        matrix = np.asarray(vectors, dtype=np.float32) if vectors else np.zeros((0, 0), np.float32)
+        if len(matrix):
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms == 0, 1, norms)
+        self._vectors[(table, column)] = (version, ids, matrix)
+        return ids, matrix
+
+    def match_rows(
+        self,
+        table: str,
+        query_embedding: Sequence[float],
+        match_threshold: float = 0.0,
+        match_count: int = 10,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        column: str = "embedding",
+    ) -> List[Dict[str, Any]]:
+        """Rows by descending cosine similarity above ``match_threshold``."""
+        ids, matrix = self.vector_index(table, column)
+        if not ids:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        scores = matrix @ (query / norm if norm else query)
+        candidates = np.flatnonzero(scores > match_threshold)
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        matches: List[Dict[str, Any]] = []
+        batch = max(match_count, 64)
+        for start in range(0, len(ranked), batch):
+            chunk = ranked[start : start + batch]
+            marks = ",".join("?" * len(chunk))
+            docs = {
+                row_id: json.loads(doc)
+                for row_id, doc in self.conn.execute(
+                    f"SELECT id, doc FROM {table} WHERE id IN ({marks})",
+                    [ids[i] for i in chunk],
+                )
+            }
+            for i in chunk:
+                doc = docs.get(ids[i])
+                if doc is None or (where is not None and not where(doc)):
+                    continue
+                doc.pop(column, None)
+                doc["similarity"] = float(scores[i])
+                matches.append(doc)
+                if len(matches) >= match_count:
+                    return matches
+        return matches
+
+    def table(self, table: str) -> LocalQueryBuilder:
+        return LocalQueryBuilder(self, table)
+
+    from_ = table
+
+    def register_rpc(self, name: str, fn: Callable) -> None:
+        """Register ``fn(store, **params)`` as a callable database function."""
+        self._rpcs[name] = fn
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> LocalRpc:
+        fn = self._rpcs.get(name)
+        if fn is None and name.startswith("match_"):
+            fn = functools.partial(match_table, table=_ident(name[len("match_") :]))
+        if fn is None:
+            raise LocalSupabaseError(f"Could not find the function {name}")
+        return LocalRpc(self, fn, params or {})
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def match_table(
+    store: LocalSupabase,
+    table: str,
+    query_embedding: Sequence[float],
+    match_threshold: float = 0.0,
+    match_count: int = 10,
+    filter: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generic ``match_<table>`` vector search.
+
+    Follows the LangChain/Supabase convention: ``filter`` is a containment
+    filter on the row's ``metadata`` object.
+    """
+
+    def where(doc: Dict[str, Any]) -> bool:
+        metadata = doc.get("metadata") or {}
+        return all(metadata.get(k) == v for k, v in filter.items())
+
+    return store.match_rows(
+        table, query_embedding, match_threshold, match_count, where if filter else None
+    )
+
+
+def search_resume_chunks(
+    store: LocalSupabase,
+    query_embedding: Sequence[float],
+    match_threshold: float = 0.78,
+    match_count: int = 10,
+    target_user_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Local equivalent of the ``search_resume_chunks`` migration function."""
+    rows = store.match_rows(
+        "resume_chunks",
+        query_embedding,
+        match_threshold,
+        match_count,
+        (lambda doc: doc.get("user_id") == target_user_id) if target_user_id else None,
+    )
+    return [
+        {
+            "id": row["id"],
+            "file_id": row.get("file_id"),
+            "resume_id": row.get("resume_id"),
+            "content": row.get("content"),
+            "similarity": row["similarity"],
+        }
+        for row in rows
+    ]
+
+
+def search_job_listings(
+    store: LocalSupabase,
+    search_query: str,
+    location_filter: Optional[str] = None,
+    experience_level_filter: Optional[str] = None,
+    remote_work_filter: Optional[str] = None,
+    climate_focus_filter: Optional[str] = None,
+    result_limit: int = 10,
+    result_offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """Local equivalent of the ``search_job_listings`` migration function."""
+    filters = store.table("job_listings").eq("status", "active")
+    if location_filter:
+        filters.ilike("location", f"%{location_filter}%")
+    if experience_level_filter:
+        filters.eq("experience_level", experience_level_filter)
+    if remote_work_filter:
+        filters.eq("remote_work_preference", remote_work_filter)
+    if climate_focus_filter:
+        filters.contains("climate_focus", [climate_focus_filter])
+    return store.text_search("job_listings", search_query, filters, result_limit, result_offset)
+
+
+def match_job_listings(
+    store: LocalSupabase,
+    query_embedding: Sequence[float],
+    match_count: int = 200,
+    location_filter: Optional[str] = None,
+    experience_level_filter: Optional[str] = None,
+    remote_work_filter: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Local equivalent of the ``match_job_listings`` migration function.
+
+    One matrix product scores every embedded listing; listings are then
+    read by id in similarity order, with the filters applied, until the
+    page is full.
+    """
+    ids, matrix = store.vector_index("job_listing_embeddings")
+    if not ids or match_count <= 0:
+        return []
+    query = np.asarray(query_embedding, dtype=np.float32)
+    norm = np.linalg.norm(query)
+    scores = matrix @ (query / norm if norm else query)
+    # Sorting every score is the slow part; selective filters rarely get past the head
+    head = min(len(ids), max(match_count, 256) * 4)
+    if head < len(ids):
+        top = np.argpartition(-scores, head - 1)[:head]
+        rest = np.setdiff1d(np.arange(len(ids)), top, assume_unique=True)
+        ranked = np.concatenate([top[np.argsort(-scores[top], kind="stable")], rest])
+    else:
+        ranked = np.argsort(-scores, kind="stable")
+    location = location_filter.casefold() if location_filter else None
+
+    def where(doc: Dict[str, Any]) -> bool:
+        return (
+            doc.get("status") == "active"
+            and (location is None or location in (doc.get("location") or "").casefold())
+            and (
+                experience_level_filter is None
+                or doc.get("experience_level") == experience_level_filter
+            )
+            and (
+                remote_work_filter is None
+                or doc.get("remote_work_preference") == remote_work_filter
+            )
+        )
+
+    store.ensure_table("job_listings")
+    rows: List[Dict[str, Any]] = []
+    batch = max(match_count, 256)
+    for start in range(0, len(ranked), batch):
+        if start == head:
+            ranked[head:] = ranked[head:][np.argsort(-scores[ranked[head:]], kind="stable")]
+        chunk = ranked[start : start + batch]
+        marks = ",".join("?" * len(chunk))
+        docs = dict(
+            store.conn.execute(
+                f"SELECT id, doc FROM job_listings WHERE id IN ({marks})", [ids[i] for i in chunk]
+            )
+        )
+        for i in chunk:
+            if ids[i] not in docs:
+                continue
+            row = json.loads(docs[ids[i]])
+            if not where(row):
+                continue
+            row["similarity"] = float(scores[i])
+            rows.append(row)
+            if len(rows) >= match_count:
+                return rows
+    return rows
+
+
+def top_viewed_resources(
+    store: LocalSupabase,
+    days: int = 30,
+    result_limit: int = 10,
+    public_only: bool = True,
+) -> List[Dict[str, Any]]:
+    """Local equivalent of the ``top_viewed_resources`` migration function."""
+    store.ensure_table("resource_view_daily")
+    store.ensure_table("knowledge_resources")
+    since = (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
+    visibility = "WHERE json_extract(kr.doc, '$.visibility') = 'public'" if public_only else ""
+    rows = []
+    for doc, views in store.conn.execute(
+        f"""
+        SELECT kr.doc, totals.views FROM (
+            SELECT {_field("resource_id")} AS resource_id, SUM({_field("view_count")}) AS views
+            FROM resource_view_daily
+            WHERE {_field("view_date")} >= ?
+            GROUP BY 1
+        ) totals
+        JOIN knowledge_resources kr ON kr.id = totals.resource_id
+        {visibility}
+        ORDER BY totals.views DESC, kr.id
+        LIMIT ?
+        """,
+        [since, int(result_limit)],
+    ):
+        row = json.loads(doc)
+        row.pop("embedding", None)
+        row["recent_views"] = views
+        rows.append(row)
+    return rows
+
+
+def knowledge_resource_facets(
+    store: LocalSupabase,
+    status_filter: Optional[str] = "published",
+    visibility_filter: Optional[str] = "public",
+    content_type_filter: Optional[str] = None,
+    category_filter: Optional[str] = None,
+    tags_filter: Optional[List[str]] = None,
+    tag_limit: int = 200,
+) -> Dict[str, Any]:
+    """Local equivalent of the ``knowledge_resource_facets`` migration function."""
+    filters = store.table("knowledge_resources")
+    for column, value in (
+        ("status", status_filter),
+        ("visibility", visibility_filter),
+        ("content_type", content_type_filter),
+        ("category", category_filter),
+    ):
+        if value is not None:
+            filters.eq(column, value)
+    if tags_filter:
+        filters.contains("tags", tags_filter)
+    store.ensure_table("knowledge_resources")
+    where, params = filters._where_sql()
+
+    facets: Dict[str, Any] = {}
+    for facet, name, count in store.conn.execute(
+        f"""
+        WITH filtered AS (SELECT doc FROM knowledge_resources{where})
+        SELECT facet, name, COUNT(*) FROM (
+            SELECT 'categories' AS facet, json_extract(doc, '$.category') AS name FROM filtered
+            UNION ALL
+            SELECT 'content_types', json_extract(doc, '$.content_type') FROM filtered
+            UNION ALL
+            SELECT 'tags', value FROM filtered, json_each(filtered.doc, '$.tags')
+            UNION ALL
+            SELECT 'climate_sectors', value FROM filtered, json_each(filtered.doc, '$.climate_sectors')
+        )
+        WHERE name IS NOT NULL AND name <> ''
+        GROUP BY facet, name
+        ORDER BY facet, COUNT(*) DESC, name
+        """,
+        params,
+    ):
+        facets.setdefault(facet, []).append({"name": name, "count": count})
+    (total,) = store.conn.execute(
+        f"SELECT COUNT(*) FROM knowledge_resources{where}", params
+    ).fetchone()
+    tags = facets.get("tags", [])
+    if tags:
+        facets["tags"] = tags[: int(tag_limit)]
+    return {"total": total, "tag_total": len(tags), **facets}
+
+
+def increment_resource_view_counts(store: LocalSupabase, increments: Dict[str, int]) -> int:
+    """Local equivalent of the ``increment_resource_view_counts`` migration function."""
+    store.ensure_table("knowledge_resources")
+    cursor = store.conn.executemany(
+        f"""
+        UPDATE knowledge_resources
+        SET doc = json_set(doc, '$.view_count', coalesce({_field("view_count")}, 0) + ?)
+        WHERE id = ?
+        """,
+        [(int(views), str(resource_id)) for resource_id, views in increments.items()],
+    )
+    store.touch("knowledge_resources")
+    store.conn.commit()
+    return cursor.rowcount
+
+
+def increment_conversation_tokens(store: LocalSupabase, increments: Dict[str, int]) -> int:
+    """Local equivalent of the ``increment_conversation_tokens`` migration function."""
+    store.ensure_table("conversations")
+    cursor = store.conn.executemany(
+        f"""
+        UPDATE conversations
+        SET doc = json_set(doc, '$.total_tokens_used', coalesce({_field("total_tokens_used")}, 0) + ?)
+        WHERE id = ?
+        """,
+        [(int(tokens), str(conversation_id)) for conversation_id, tokens in increments.items()],
+    )
+    store.touch("conversations")
+    store.conn.commit()
+    return cursor.rowcount
+
+
+def estimated_row_count(store: LocalSupabase, table_name: str) -> Optional[int]:
+    """
+    Local equivalent of the ``estimated_row_count`` migration function.
+
+    SQLite keeps no live row estimate, so the table is counted; the result
+    stands in for ``pg_class.reltuples``.
+    """
+    store.ensure_table(table_name)
+    (count,) = store.conn.execute(f"SELECT COUNT(*) FROM {_ident(table_name)}").fetchone()
+    return count
+
+
+def update_embeddings(
+    store: LocalSupabase, target_table: str, updates: List[Dict[str, Any]]
+) -> int:
+    """Local equivalent of the ``update_embeddings`` migration function."""
+    table = _ident(target_table)
+    store.ensure_table(table)
+    cursor = store.conn.executemany(
+        f"UPDATE {table} SET doc = json_set(doc, '$.embedding', json(?), '$.embedding_model', ?) "
+        f"WHERE id = ?",
+        [(json.dumps(u["embedding"]), u.get("embedding_model"), str(u["id"])) for u in updates],
+    )
+    store.touch(table)
+    store.conn.commit()
+    return cursor.rowcount
+
+
+def embedding_model_counts(store: LocalSupabase, target_table: str) -> List[Dict[str, Any]]:
+    """Local equivalent of the ``embedding_model_counts`` migration function."""
+    table = _ident(target_table)
+    store.ensure_table(table)
+    return [
+        {"embedding_model": model, "row_count": count}
+        for model, count in store.conn.execute(
+            f"SELECT {_field('embedding_model')}, COUNT(*) FROM {table} "
+            f"WHERE {_field('embedding')} IS NOT NULL GROUP BY 1 ORDER BY 2 DESC, 1"
+        )
+    ]
+
+
+def install_local_supabase(client: Optional[LocalSupabase] = None) -> LocalSupabase:
+    """Point the shared Supabase clients at a local stand-in."""
+    client = client or LocalSupabase()
+
+    from backend.config import supabase as config_supabase
+    from backend.database import supabase_client
+
+    supabase_client.SupabaseClient._client = client
+    supabase_client.supabase._client = client
+    config_supabase._supabase_client = client
+    logger.info("Using local Supabase stand-in", path=client.path)
+    return client
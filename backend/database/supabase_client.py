@@ -99,6 +99,10 @@ class SupabaseClient:
         """Direct access to table method for compatibility"""
         return self.client.table(table_name)
 
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None):
+        """Direct access to database functions"""
+        return self.client.rpc(fn, params or {})
+
     @handle_supabase_error
     async def query(
         self, table: str, query_type: str = "select", **kwargs
@@ -35,6 +35,8 @@ from backend.api.routes.individual_tools import router as individual_tools_route
 from backend.api.routes.verified_tools import router as verified_tools_router
 from backend.database.supabase_client import supabase
 from backend.database.redis_client import redis_client
+from backend.services.reference_data import reference_data
+from backend.services.view_counter import view_counter
 
 # Configure structured logging
 structlog.configure(
@@ -89,6 +91,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Climate Economy Assistant API")
+    await view_counter.stop()
+    await reference_data.stop()
     await redis_client.close()
 
 
@@ -245,6 +245,7 @@ class JobMatch(BaseModel):
     career_path_alignment: float = 0.0  # 0.0 - 1.0
     growth_opportunity: float = 0.0  # 0.0 - 1.0
     climate_impact_alignment: float = 0.0  # 0.0 - 1.0
+    explanations: List[str] = Field(default_factory=list)
 
     # Timestamp
     matched_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,347 @@
+"""
+Rolling conversation context cache for the Climate Economy Assistant.
+
+Each conversation keeps a capped list of its most recent messages in Redis
+together with the prompt context strings built from them. Writers append to
+the list and refresh the prompt strings, so agent turns read their context
+with a single hash lookup. The database is only queried on a cache miss.
+
+Long conversations also carry a rolling summary of older turns (maintained by
+the conversation summarizer); budgeted context strings combine that summary
+with as many recent turns as fit in a fixed token budget.
+"""
+
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..database.redis_client import redis_client
+from ..utils.logger import get_logger
+from ..utils.tokens import count_tokens, truncate_to_tokens
+
+logger = get_logger(__name__)
+
+CONTEXT_WINDOW_SIZE = int(os.getenv("CONTEXT_WINDOW_SIZE", "20"))
+CONTEXT_CACHE_TTL = int(os.getenv("CONTEXT_CACHE_TTL", "86400"))
+
+_PRIMED_FIELD = "_primed"
+_SUMMARY_FIELD = "_summary"
+
+ContextFormatter = Callable[[List[Dict[str, Any]], int, Optional[Dict[str, Any]]], str]
+RowLoader = Callable[[str, int], Awaitable[List[Dict[str, Any]]]]
+SummaryLoader = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def format_enhanced_context(
+    rows: List[Dict[str, Any]], limit: int, summary: Optional[Dict[str, Any]] = None
+) -> str:
+    """Context string used by the enhanced LangGraph agents."""
+    context_messages = []
+    user_assistant_pairs = 0
+
+    for msg in rows[-limit * 2 :]:
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+        agent = msg.get("specialist_type", "")
+
+        # Skip system messages and limit to actual conversations
+        if role in ["user", "assistant"] and content and user_assistant_pairs < limit:
+            if role == "user":
+                context_messages.append(f"User: {content[:200]}...")
+            elif role == "assistant" and agent:
+                context_messages.append(f"{agent}: {content[:200]}...")
+
+            if role == "assistant":
+                user_assistant_pairs += 1
+
+    return " | ".join(context_messages[-6:])  # Last 6 messages (3 exchanges)
+
+
+def format_coordinator_context(
+    rows: List[Dict[str, Any]], limit: int, summary: Optional[Dict[str, Any]] = None
+) -> str:
+    """Context string used by the AgentCoordinator."""
+    context_messages = []
+    for msg in rows[-limit:]:
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+        agent = msg.get("specialist_type", "")
+
+        if role == "user":
+            context_messages.append(f"User: {content}")
+        elif role == "assistant" and agent:
+            context_messages.append(f"{agent}: {content}")
+
+    return " | ".join(context_messages[-3:])  # Last 3 exchanges
+
+
+def format_budgeted_context(
+    rows: List[Dict[str, Any]], budget: int, summary: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Summary of older turns plus the newest turns that fit in ``budget`` tokens.
+
+    Turns already folded into the summary are skipped. If even the newest
+    turn does not fit, it is truncated rather than dropped.
+    """
+    parts = []
+    used = 0
+    through = None
+
+    if summary and summary.get("text"):
+        summary_line = f"Earlier conversation summary: {summary['text']}"
+        summary_line = truncate_to_tokens(summary_line, budget // 2)
+        parts.append(summary_line)
+        used += count_tokens(summary_line)
+        through = summary.get("through")
+
+    recent = []
+    for msg in reversed(rows):
+        role = msg.get("role")
+        content = msg.get("content", "")
+        if role not in ("user", "assistant") or not content:
+            continue
+        created_at = msg.get("created_at")
+        if through and created_at and created_at <= through:
+            break
+
+        speaker = "User" if role == "user" else msg.get("specialist_type") or "Assistant"
+        line = f"{speaker}: {content}"
+        tokens = count_tokens(line)
+        if used + tokens > budget:
+            if not recent:
+                recent.append(truncate_to_tokens(line, budget - used))
+            break
+        recent.append(line)
+        used += tokens
+
+    return " | ".join(parts + list(reversed(recent)))
+
+
+class ConversationContextCache:
+    """
+    Per-conversation rolling context buffer in Redis.
+
+    Keys per conversation:
+    - ``conversation_context:{id}:messages``: capped list of recent messages
+    - ``conversation_context:{id}:prompts``: hash of prebuilt context strings,
+      one field per ``{formatter}:{limit}`` variant that has been requested
+    """
+
+    def __init__(
+        self,
+        redis=redis_client,
+        window_size: int = CONTEXT_WINDOW_SIZE,
+        ttl: int = CONTEXT_CACHE_TTL,
+    ):
+        self.redis = redis
+        self.window_size = window_size
+        self.ttl = ttl
+        self.formatters: Dict[str, ContextFormatter] = {
+            "enhanced": format_enhanced_context,
+            "coordinator": format_coordinator_context,
+            "budgeted": format_budgeted_context,
+        }
+        self.stats = {"hits": 0, "misses": 0, "rebuilds": 0, "appends": 0, "errors": 0}
+
+    @staticmethod
+    def _messages_key(conversation_id: str) -> str:
+        return f"conversation_context:{conversation_id}:messages"
+
+    @staticmethod
+    def _prompts_key(conversation_id: str) -> str:
+        return f"conversation_context:{conversation_id}:prompts"
+
+    @staticmethod
+    def _entry(message: Dict[str, Any]) -> str:
+        return json.dumps(
+            {
+                "role": message.get("role", "user"),
+                "content": message.get("content", ""),
+                "specialist_type": message.get("specialist_type") or message.get("agent"),
+                "created_at": message.get("created_at") or message.get("timestamp"),
+            }
+        )
+
+    def _build(
+        self,
+        variant: str,
+        rows: List[Dict[str, Any]],
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        name, _, limit = variant.rpartition(":")
+        return self.formatters[name](rows, int(limit), summary)
+
+    @staticmethod
+    def _is_meta(field_name: str) -> bool:
+        return field_name.startswith("_")
+
+    async def get_prompt(self, conversation_id: str, formatter: str, limit: int) -> Optional[str]:
+        """Return the cached context string, or None on a cache miss."""
+        variant = f"{formatter}:{limit}"
+        prompts_key = self._prompts_key(conversation_id)
+
+        try:
+            async with self.redis.get_connection() as client:
+                prompt, primed, summary = await client.hmget(
+                    prompts_key, variant, _PRIMED_FIELD, _SUMMARY_FIELD
+                )
+                if prompt is not None:
+                    self.stats["hits"] += 1
+                    return prompt
+                if primed is None:
+                    self.stats["misses"] += 1
+                    return None
+
+                # Window is cached but this variant has not been built yet
+                raw = await client.lrange(self._messages_key(conversation_id), 0, -1)
+                prompt = self._build(
+                    variant,
+                    [json.loads(r) for r in raw],
+                    json.loads(summary) if summary else None,
+                )
+                await client.hset(prompts_key, variant, prompt)
+                self.stats["rebuilds"] += 1
+                return prompt
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(
+                "Context cache read failed", conversation_id=conversation_id, error=str(e)
+            )
+            return None
+
+    async def prime(
+        self,
+        conversation_id: str,
+        rows: List[Dict[str, Any]],
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Replace the cached window with rows loaded from the database."""
+        messages_key = self._messages_key(conversation_id)
+        prompts_key = self._prompts_key(conversation_id)
+        rows = rows[-self.window_size :]
+
+        try:
+            async with self.redis.get_connection() as client:
+                pipe = client.pipeline(transaction=True)
+                pipe.delete(messages_key, prompts_key)
+                if rows:
+                    pipe.rpush(messages_key, *[self._entry(r) for r in rows])
+                    pipe.expire(messages_key, self.ttl)
+                pipe.hset(prompts_key, _PRIMED_FIELD, "1")
+                if summary:
+                    pipe.hset(prompts_key, _SUMMARY_FIELD, json.dumps(summary))
+                pipe.expire(prompts_key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(
+                "Context cache prime failed", conversation_id=conversation_id, error=str(e)
+            )
+
+    async def append(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """Append a stored message and refresh the prebuilt context strings."""
+        messages_key = self._messages_key(conversation_id)
+        prompts_key = self._prompts_key(conversation_id)
+
+        try:
+            async with self.redis.get_connection() as client:
+                variants = await client.hkeys(prompts_key)
+                if _PRIMED_FIELD not in variants:
+                    # Not cached yet; the next read primes from the database
+                    return
+                summary = None
+                if _SUMMARY_FIELD in variants:
+                    summary = json.loads(await client.hget(prompts_key, _SUMMARY_FIELD))
+
+                pipe = client.pipeline(transaction=True)
+                pipe.rpush(messages_key, self._entry(message))
+                pipe.ltrim(messages_key, -self.window_size, -1)
+                pipe.lrange(messages_key, 0, -1)
+                raw = (await pipe.execute())[-1]
+                rows = [json.loads(r) for r in raw]
+
+                prompts = {
+                    v: self._build(v, rows, summary) for v in variants if not self._is_meta(v)
+                }
+                pipe = client.pipeline(transaction=True)
+                if prompts:
+                    pipe.hset(prompts_key, mapping=prompts)
+                pipe.expire(messages_key, self.ttl)
+                pipe.expire(prompts_key, self.ttl)
+                await pipe.execute()
+                self.stats["appends"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(
+                "Context cache append failed",
+                conversation_id=conversation_id,
+                error=str(e),
+            )
+
+    async def get_context(
+        self,
+        conversation_id: str,
+        formatter: str,
+        limit: int,
+        loader: RowLoader,
+        summary_loader: Optional[SummaryLoader] = None,
+    ) -> str:
+        """Read-through helper: cached string, else load, prime and format."""
+        prompt = await self.get_prompt(conversation_id, formatter, limit)
+        if prompt is not None:
+            return prompt
+
+        rows = await loader(conversation_id, self.window_size)
+        summary = await summary_loader(conversation_id) if summary_loader else None
+        await self.prime(conversation_id, rows, summary)
+        prompt = self.formatters[formatter](rows, limit, summary)
+
+        try:
+            async with self.redis.get_connection() as client:
+                await client.hset(
+                    self._prompts_key(conversation_id), f"{formatter}:{limit}", prompt
+                )
+        except Exception as e:
+            logger.warning("Context cache write failed", error=str(e))
+        return prompt
+
+    async def set_summary(self, conversation_id: str, summary: Dict[str, Any]) -> None:
+        """Store a new rolling summary and rebuild the cached context strings."""
+        messages_key = self._messages_key(conversation_id)
+        prompts_key = self._prompts_key(conversation_id)
+
+        try:
+            async with self.redis.get_connection() as client:
+                variants = await client.hkeys(prompts_key)
+                if _PRIMED_FIELD not in variants:
+                    return
+
+                raw = await client.lrange(messages_key, 0, -1)
+                rows = [json.loads(r) for r in raw]
+                mapping = {
+                    v: self._build(v, rows, summary) for v in variants if not self._is_meta(v)
+                }
+                mapping[_SUMMARY_FIELD] = json.dumps(summary)
+                await client.hset(prompts_key, mapping=mapping)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(
+                "Context cache summary update failed",
+                conversation_id=conversation_id,
+                error=str(e),
+            )
+
+    async def invalidate(self, conversation_id: str) -> None:
+        """Drop the cached window for a conversation."""
+        try:
+            async with self.redis.get_connection() as client:
+                await client.delete(
+                    self._messages_key(conversation_id),
+                    self._prompts_key(conversation_id),
+                )
+        except Exception as e:
+            logger.warning("Context cache invalidate failed", error=str(e))
+
+
+conversation_context_cache = ConversationContextCache()
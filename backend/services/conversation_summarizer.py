@@ -0,0 +1,281 @@
+"""
+Incremental rolling summarization for long conversations.
+
+Every stored message adds its token count to a per-conversation counter in
+Redis. Once a thread has accumulated more than ``SUMMARY_TRIGGER_TOKENS``
+since the last fold, a background task merges the older turns into a stored
+summary using the regular LLM adapter. Agent prompts then carry the summary
+plus the newest turns within a fixed token budget instead of a growing (or
+blindly truncated) transcript.
+
+Summaries live in Redis for fast reads and in
+``conversations.session_metadata.rolling_summary`` so they survive cache loss.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from ..adapters.usage import usage_context
+from ..database.redis_client import redis_client
+from ..database.supabase_client import supabase
+from ..utils.logger import get_logger
+from ..utils.tokens import count_tokens, truncate_to_tokens
+from .conversation_context import conversation_context_cache
+
+logger = get_logger(__name__)
+
+SUMMARY_TRIGGER_TOKENS = int(os.getenv("SUMMARY_TRIGGER_TOKENS", "2000"))
+SUMMARY_MAX_TOKENS = int(os.getenv("SUMMARY_MAX_TOKENS", "400"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "800"))
+SUMMARY_KEEP_RECENT = int(os.getenv("SUMMARY_KEEP_RECENT", "6"))
+SUMMARY_FOLD_BATCH = int(os.getenv("SUMMARY_FOLD_BATCH", "200"))
+SUMMARY_LOCK_TTL = 120
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a conversation between a user and the Climate Economy Assistant.
+Merge the new turns into the existing summary. Keep facts the assistant will need later: the user's background, goals, location, constraints, decisions made and resources or programs already recommended. Drop greetings and repetition. Write plain prose, at most {max_tokens} tokens."""
+
+
+class ConversationSummarizer:
+    """
+    Folds older conversation turns into a rolling summary in the background.
+
+    ``model_factory`` returns the chat model used for summarization; it is
+    resolved lazily so importing this module never constructs an LLM client.
+    """
+
+    def __init__(
+        self,
+        redis=redis_client,
+        model_factory: Optional[Callable[[], Any]] = None,
+        trigger_tokens: int = SUMMARY_TRIGGER_TOKENS,
+        keep_recent: int = SUMMARY_KEEP_RECENT,
+        max_summary_tokens: int = SUMMARY_MAX_TOKENS,
+        context_cache=conversation_context_cache,
+    ):
+        self.redis = redis
+        self.model_factory = model_factory
+        self.trigger_tokens = trigger_tokens
+        self.keep_recent = keep_recent
+        self.max_summary_tokens = max_summary_tokens
+        self.context_cache = context_cache
+        self._model = None
+        self._scheduled: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {
+            "folds": 0,
+            "folded_messages": 0,
+            "failures": 0,
+            "skipped_locked": 0,
+            "summary_tokens": 0,
+        }
+
+    @staticmethod
+    def _summary_key(conversation_id: str) -> str:
+        return f"conversation_summary:{conversation_id}"
+
+    @staticmethod
+    def _pending_key(conversation_id: str) -> str:
+        return f"conversation_summary:{conversation_id}:pending_tokens"
+
+    @staticmethod
+    def _lock_key(conversation_id: str) -> str:
+        return f"conversation_summary:{conversation_id}:lock"
+
+    def _get_model(self):
+        if self._model is None:
+            if self.model_factory is None:
+                from ..adapters.models import create_langchain_llm
+
+                self.model_factory = create_langchain_llm
+            self._model = self.model_factory()
+        return self._model
+
+    async def record_message(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """Count a stored message and schedule a fold once the threshold is passed."""
+        tokens = count_tokens(message.get("content", ""))
+        try:
+            async with self.redis.get_connection() as client:
+                pending = await client.incrby(self._pending_key(conversation_id), tokens)
+        except Exception as e:
+            logger.warning("Summary token counter failed", error=str(e))
+            return
+
+        if pending >= self.trigger_tokens:
+            self.schedule_fold(conversation_id)
+
+    def schedule_fold(self, conversation_id: str) -> None:
+        """Start a background fold unless one is already running in this worker."""
+        if conversation_id in self._scheduled:
+            return
+        self._scheduled.add(conversation_id)
+        task = asyncio.get_running_loop().create_task(self._fold_task(conversation_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fold_task(self, conversation_id: str) -> None:
+        try:
+            await self.fold(conversation_id)
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.error(
+                "Conversation summarization failed",
+                conversation_id=conversation_id,
+                error=str(e),
+            )
+        finally:
+            self._scheduled.discard(conversation_id)
+
+    async def fold(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Merge turns older than the recent window into the stored summary."""
+        lock_key = self._lock_key(conversation_id)
+        async with self.redis.get_connection() as client:
+            # Only one worker folds a given conversation at a time
+            if not await client.set(lock_key, "1", nx=True, ex=SUMMARY_LOCK_TTL):
+                self.stats["skipped_locked"] += 1
+                return None
+
+        try:
+            summary = await self.get_summary(conversation_id) or {}
+            rows = await self._load_messages_after(conversation_id, summary.get("through"))
+            to_fold = rows[: -self.keep_recent] if self.keep_recent else rows
+            remaining = sum(count_tokens(r.get("content", "")) for r in rows[len(to_fold) :])
+            if not to_fold:
+                # Nothing old enough to fold: resync the counter to the
+                # retained turns so later turns stop rescheduling this fold
+                async with self.redis.get_connection() as client:
+                    await client.set(self._pending_key(conversation_id), remaining)
+                return None
+
+            with usage_context(node="summarization", conversation_id=conversation_id):
+                text = await self._summarize(summary.get("text", ""), to_fold)
+            new_summary = {
+                "text": text,
+                "through": to_fold[-1].get("created_at"),
+                "message_count": summary.get("message_count", 0) + len(to_fold),
+                "tokens": count_tokens(text),
+                "updated_at": datetime.now().isoformat(),
+            }
+
+            async with self.redis.get_connection() as client:
+                pipe = client.pipeline(transaction=True)
+                pipe.set(self._summary_key(conversation_id), json.dumps(new_summary))
+                pipe.set(self._pending_key(conversation_id), remaining)
+                await pipe.execute()
+
+            await self._persist_summary(conversation_id, new_summary)
+            await self.context_cache.set_summary(conversation_id, new_summary)
+
+            self.stats["folds"] += 1
+            self.stats["folded_messages"] += len(to_fold)
+            self.stats["summary_tokens"] = new_summary["tokens"]
+            logger.info(
+                "Folded conversation turns into summary",
+                conversation_id=conversation_id,
+                folded=len(to_fold),
+                summary_tokens=new_summary["tokens"],
+            )
+            return new_summary
+        finally:
+            async with self.redis.get_connection() as client:
+                await client.delete(lock_key)
+
+    async def _summarize(self, previous: str, rows: List[Dict[str, Any]]) -> str:
+        transcript = "\n".join(
+            f"{'User' if r.get('role') == 'user' else r.get('specialist_type') or 'Assistant'}: "
+            f"{r.get('content', '')}"
+            for r in rows
+            if r.get("role") in ("user", "assistant") and r.get("content")
+        )
+        response = await self._get_model().ainvoke(
+            [
+                SystemMessage(
+                    content=SUMMARY_SYSTEM_PROMPT.format(max_tokens=self.max_summary_tokens)
+                ),
+                HumanMessage(
+                    content=f"Existing summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+                ),
+            ]
+        )
+        text = response.content if hasattr(response, "content") else str(response)
+        return truncate_to_tokens(text.strip(), self.max_summary_tokens)
+
+    async def get_summary(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Current summary from Redis, falling back to the conversation record."""
+        try:
+            async with self.redis.get_connection() as client:
+                cached = await client.get(self._summary_key(conversation_id))
+            if cached:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning("Summary cache read failed", error=str(e))
+
+        summary = await self._load_persisted_summary(conversation_id)
+        if summary:
+            try:
+                async with self.redis.get_connection() as client:
+                    await client.set(self._summary_key(conversation_id), json.dumps(summary))
+            except Exception:
+                pass
+        return summary
+
+    async def _load_messages_after(
+        self, conversation_id: str, through: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        query = (
+            supabase.table("conversation_messages")
+            .select("role, content, specialist_type, created_at")
+            .eq("conversation_id", conversation_id)
+        )
+        if through:
+            query = query.gt("created_at", through)
+        result = query.order("created_at").limit(SUMMARY_FOLD_BATCH).execute()
+        return result.data or []
+
+    async def _load_persisted_summary(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            result = (
+                supabase.table("conversations")
+                .select("session_metadata")
+                .eq("id", conversation_id)
+                .limit(1)
+                .execute()
+            )
+        except Exception as e:
+            logger.warning("Summary database read failed", error=str(e))
+            return None
+        if not result.data:
+            return None
+        return (result.data[0].get("session_metadata") or {}).get("rolling_summary")
+
+    async def _persist_summary(self, conversation_id: str, summary: Dict[str, Any]) -> None:
+        try:
+            result = (
+                supabase.table("conversations")
+                .select("session_metadata")
+                .eq("id", conversation_id)
+                .limit(1)
+                .execute()
+            )
+            metadata = (result.data[0].get("session_metadata") or {}) if result.data else {}
+            metadata["rolling_summary"] = summary
+            supabase.table("conversations").update({"session_metadata": metadata}).eq(
+                "id", conversation_id
+            ).execute()
+        except Exception as e:
+            logger.warning("Summary persist failed", conversation_id=conversation_id, error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "trigger_tokens": self.trigger_tokens,
+            "context_token_budget": CONTEXT_TOKEN_BUDGET,
+            "folds_running": len(self._scheduled),
+        }
+
+
+conversation_summarizer = ConversationSummarizer()
@@ -0,0 +1,379 @@
+"""
+Resumable batch (re-)embedding of stored rows.
+
+Stored embeddings go stale when the embedding model changes (or
+``EMBEDDING_MODEL_VERSION`` is bumped), when embedding at write time
+failed, or, for job listings, when the embedded text changed. Every stored
+embedding records its ``embedding_model``; this job finds the rows whose
+model (or content hash) is not the current one and re-embeds them:
+
+- rows are streamed in id order by keyset cursor, a page at a time
+- a page's stale rows are cut into batches bounded by row count and by
+  characters (standing in for the provider's per-request token limit) and
+  embedded with bounded concurrency; a failing batch is split in half
+  until the failing rows are isolated
+- a page's embeddings are written in one bulk call, then the checkpoint
+  in ``embedding_backfill_runs`` moves past the page
+
+An interrupted run resumes after its last written page. Rows that failed
+stay stale and are picked up by the next run.
+
+Usage:
+    python -m backend.services.embedding_backfill job_listings [--dry-run]
+        [--restart] [--page-size 500] [--batch-size 64] [--concurrency 4]
+        [--database local.db]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..database.supabase_client import supabase
+from ..utils.logger import get_logger
+from .embeddings import embedding_model_id, get_embedding_service
+from .job_matching import JOB_EMBEDDING_FIELDS, content_hash, job_embedding_text
+
+logger = get_logger(__name__)
+
+BACKFILL_PAGE_SIZE = int(os.getenv("BACKFILL_PAGE_SIZE", "500"))
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "64"))
+# About 4 characters a token: ~25k tokens a request
+BACKFILL_BATCH_CHARS = int(os.getenv("BACKFILL_BATCH_CHARS", "100000"))
+BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+
+# A stale row and the text to embed for it
+Item = Tuple[Dict[str, Any], str]
+
+
+def _joined(*columns: str) -> Callable[[Dict[str, Any]], str]:
+    def text(row: Dict[str, Any]) -> str:
+        return "\n".join(str(row[c]) for c in columns if row.get(c))
+
+    return text
+
+
+@dataclass(frozen=True)
+class EmbeddingTarget:
+    """A table whose rows are embedded, and where their embeddings live."""
+
+    table: str
+    columns: Tuple[str, ...]
+    text: Callable[[Dict[str, Any]], str]
+    # Table sharing the rows' ids that holds embedding, embedding_model and
+    # content_hash; None when the embedding is a column of the row itself
+    embeddings_table: Optional[str] = None
+
+    @property
+    def store(self) -> str:
+        return self.embeddings_table or self.table
+
+
+EMBEDDING_TARGETS: Dict[str, EmbeddingTarget] = {
+    "job_listings": EmbeddingTarget(
+        "job_listings", JOB_EMBEDDING_FIELDS, job_embedding_text, "job_listing_embeddings"
+    ),
+    "knowledge_resources": EmbeddingTarget(
+        "knowledge_resources",
+        ("title", "description", "content"),
+        _joined("title", "description", "content"),
+    ),
+    "resume_chunks": EmbeddingTarget("resume_chunks", ("content",), _joined("content")),
+}
+
+
+class EmbeddingBackfill:
+    """Re-embeds the stale rows of one target, checkpointing after each page."""
+
+    def __init__(
+        self,
+        target: str,
+        embeddings=None,
+        model: Optional[str] = None,
+        page_size: int = BACKFILL_PAGE_SIZE,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        batch_chars: int = BACKFILL_BATCH_CHARS,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        dry_run: bool = False,
+    ):
+        if target not in EMBEDDING_TARGETS:
+            raise ValueError(
+                f"Unknown embedding target {target!r}; expected one of {sorted(EMBEDDING_TARGETS)}"
+            )
+        self.target = EMBEDDING_TARGETS[target]
+        self.model = model or embedding_model_id()
+        self.run_id = f"{target}:{self.model}"
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.batch_chars = batch_chars
+        self.concurrency = concurrency
+        self.dry_run = dry_run
+        self._embeddings = embeddings
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._started_at = datetime.now(timezone.utc).isoformat()
+        self.stats = {
+            "rows_scanned": 0,
+            "rows_stale": 0,
+            "rows_embedded": 0,
+            "rows_failed": 0,
+            "batches": 0,
+            "characters": 0,
+            "embed_seconds": 0.0,
+            "write_seconds": 0.0,
+        }
+
+    @property
+    def embeddings(self):
+        if self._embeddings is None:
+            self._embeddings = get_embedding_service()
+        return self._embeddings
+
+    def _load_checkpoint(self, restart: bool) -> Optional[str]:
+        """Cursor of an unfinished run of this target and model, with its counts."""
+        rows = (
+            supabase.table("embedding_backfill_runs")
+            .select("*")
+            .eq("id", self.run_id)
+            .execute()
+            .data
+        )
+        if not rows or rows[0].get("status") == "completed" or restart:
+            return None
+        checkpoint = rows[0]
+        for name in ("rows_scanned", "rows_embedded", "rows_failed"):
+            self.stats[name] = checkpoint.get(name) or 0
+        self._started_at = checkpoint.get("started_at") or self._started_at
+        return checkpoint.get("last_id")
+
+    def _save_checkpoint(self, last_id: Optional[str], status: str) -> None:
+        if self.dry_run:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        supabase.table("embedding_backfill_runs").upsert(
+            {
+                "id": self.run_id,
+                "target_table": self.target.table,
+                "embedding_model": self.model,
+                "status": status,
+                "last_id": last_id,
+                "rows_scanned": self.stats["rows_scanned"],
+                "rows_embedded": self.stats["rows_embedded"],
+                "rows_failed": self.stats["rows_failed"],
+                "started_at": self._started_at,
+                "updated_at": now,
+                "finished_at": now if status == "completed" else None,
+            }
+        ).execute()
+
+    def _page(self, after: Optional[str]) -> List[Dict[str, Any]]:
+        columns = ("id",) + self.target.columns
+        if self.target.embeddings_table is None:
+            columns += ("embedding_model",)
+        query = (
+            supabase.table(self.target.table)
+            .select(", ".join(columns))
+            .order("id")
+            .limit(self.page_size)
+        )
+        if after is not None:
+            query = query.gt("id", after)
+        return query.execute().data or []
+
+    def _stale(self, rows: Sequence[Dict[str, Any]]) -> List[Item]:
+        """Rows of a page whose stored embedding is missing or not from the current model."""
+        items = [(row, self.target.text(row)) for row in rows]
+        items = [(row, text) for row, text in items if text.strip()]
+        if self.target.embeddings_table is None:
+            return [(row, text) for row, text in items if row.get("embedding_model") != self.model]
+
+        if not items:
+            return []
+        result = (
+            supabase.table(self.target.embeddings_table)
+            .select("id, embedding_model, content_hash")
+            .in_("id", [row["id"] for row, _ in items])
+            .execute()
+        )
+        stored = {row["id"]: row for row in result.data or []}
+        stale = []
+        for row, text in items:
+            current = stored.get(row["id"])
+            if (
+                current is None
+                or current.get("embedding_model") != self.model
+                or current.get("content_hash") != content_hash(text)
+            ):
+                stale.append((row, text))
+        return stale
+
+    def _batches(self, items: Sequence[Item]) -> Iterator[List[Item]]:
+        """Consecutive batches of at most ``batch_size`` rows and ``batch_chars`` characters."""
+        batch: List[Item] = []
+        chars = 0
+        for item in items:
+            size = len(item[1])
+            if batch and (len(batch) >= self.batch_size or chars + size > self.batch_chars):
+                yield batch
+                batch, chars = [], 0
+            batch.append(item)
+            chars += size
+        if batch:
+            yield batch
+
+    async def _embed(self, batch: List[Item]) -> List[Tuple[Dict[str, Any], List[float]]]:
+        """Embeddings of a batch, splitting it to isolate the rows that fail."""
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                vectors = await self.embeddings.embed_texts([text for _, text in batch])
+                self.stats["batches"] += 1
+                return [(row, vector) for (row, _), vector in zip(batch, vectors)]
+            except Exception as e:
+                error = e
+            finally:
+                self.stats["embed_seconds"] += time.monotonic() - started
+
+        if len(batch) == 1:
+            self.stats["rows_failed"] += 1
+            logger.warning(f"Embedding {self.target.table} row {batch[0][0]['id']} failed: {error}")
+            return []
+        half = len(batch) // 2
+        left, right = await asyncio.gather(self._embed(batch[:half]), self._embed(batch[half:]))
+        return left + right
+
+    def _write(self, embedded: Sequence[Tuple[Dict[str, Any], List[float]]]) -> None:
+        started = time.monotonic()
+        if self.target.embeddings_table is not None:
+            supabase.table(self.target.embeddings_table).upsert(
+                [
+                    {
+                        "id": row["id"],
+                        "embedding": vector,
+                        "embedding_model": self.model,
+                        "content_hash": content_hash(self.target.text(row)),
+                    }
+                    for row, vector in embedded
+                ]
+            ).execute()
+        else:
+            supabase.rpc(
+                "update_embeddings",
+                {
+                    "target_table": self.target.table,
+                    "updates": [
+                        {"id": row["id"], "embedding": vector, "embedding_model": self.model}
+                        for row, vector in embedded
+                    ],
+                },
+            ).execute()
+        self.stats["write_seconds"] += time.monotonic() - started
+
+    def model_counts(self) -> List[Dict[str, Any]]:
+        """Stored embeddings per model; more than one model means mixed-model rows."""
+        try:
+            return (
+                supabase.rpc("embedding_model_counts", {"target_table": self.target.store})
+                .execute()
+                .data
+                or []
+            )
+        except Exception as e:
+            logger.warning(f"Embedding model counts of {self.target.store} unavailable: {e}")
+            return []
+
+    async def run(self, restart: bool = False) -> Dict[str, Any]:
+        """Embed every stale row; returns the throughput report."""
+        started = time.monotonic()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        resumed_after = after = None if self.dry_run else self._load_checkpoint(restart)
+        if resumed_after is not None:
+            logger.info(f"Resuming {self.run_id} after {resumed_after}")
+
+        try:
+            while True:
+                rows = self._page(after)
+                if not rows:
+                    break
+                stale = self._stale(rows)
+                if self.dry_run:
+                    self.stats["batches"] += sum(1 for _ in self._batches(stale))
+                elif stale:
+                    results = await asyncio.gather(*(self._embed(b) for b in self._batches(stale)))
+                    embedded = [pair for result in results for pair in result]
+                    if embedded:
+                        self._write(embedded)
+                        self.stats["rows_embedded"] += len(embedded)
+                # Counted once the page is written, so a checkpoint never
+                # includes the page a resumed run reads again
+                self.stats["rows_scanned"] += len(rows)
+                self.stats["rows_stale"] += len(stale)
+                self.stats["characters"] += sum(len(text) for _, text in stale)
+                after = rows[-1]["id"]
+                self._save_checkpoint(after, "running")
+                if len(rows) < self.page_size:
+                    break
+        except BaseException:
+            # The checkpoint already points past the last written page
+            self._save_checkpoint(after, "interrupted")
+            raise
+
+        self._save_checkpoint(after, "completed")
+        return self.report(time.monotonic() - started, resumed_after)
+
+    def report(self, seconds: float, resumed_after: Optional[str] = None) -> Dict[str, Any]:
+        models = self.model_counts()
+        rows = self.stats["rows_stale"] if self.dry_run else self.stats["rows_embedded"]
+        return {
+            "target": self.target.table,
+            "embedding_model": self.model,
+            "dry_run": self.dry_run,
+            "resumed_after": resumed_after,
+            **{k: round(v, 3) if isinstance(v, float) else v for k, v in self.stats.items()},
+            "estimated_tokens": self.stats["characters"] // 4,
+            "seconds": round(seconds, 3),
+            "rows_per_s": round(rows / seconds, 1) if seconds else None,
+            "models": models,
+            "mixed_models": len(models) > 1,
+        }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Re-embed rows whose stored embedding is stale")
+    parser.add_argument("target", choices=sorted(EMBEDDING_TARGETS))
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would be embedded; write nothing"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint of an unfinished run"
+    )
+    parser.add_argument("--page-size", type=int, default=BACKFILL_PAGE_SIZE)
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    parser.add_argument("--batch-chars", type=int, default=BACKFILL_BATCH_CHARS)
+    parser.add_argument("--concurrency", type=int, default=BACKFILL_CONCURRENCY)
+    parser.add_argument("--database", help="Run against a local Supabase stand-in (SQLite file)")
+    args = parser.parse_args(argv)
+
+    if args.database:
+        from ..database.local_supabase import LocalSupabase, install_local_supabase
+
+        install_local_supabase(LocalSupabase(args.database))
+
+    backfill = EmbeddingBackfill(
+        args.target,
+        page_size=args.page_size,
+        batch_size=args.batch_size,
+        batch_chars=args.batch_chars,
+        concurrency=args.concurrency,
+        dry_run=args.dry_run,
+    )
+    report = asyncio.run(backfill.run(restart=args.restart))
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,26 @@ Embeddings service for the Climate Economy Assistant.
 
 from typing import List, Optional
 import os
-from langchain_openai import OpenAIEmbeddings
 import structlog
 
+from ..adapters.models import embedding_model_name, get_embeddings_model
+from ..adapters.singleflight import coalesce_embeddings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when embeddings change without a model change (e.g. what text is
+# embedded); stored embeddings of older versions become stale
+EMBEDDING_MODEL_VERSION = os.getenv("EMBEDDING_MODEL_VERSION", "1")
+
+
+def embedding_model_id(model: Optional[str] = None) -> str:
+    """
+    ``<model>:<version>`` recorded with every stored embedding; ``model``
+    defaults to the one behind get_embeddings_model().
+    """
+    return f"{model or embedding_model_name()}:{EMBEDDING_MODEL_VERSION}"
+
 
 class EmbeddingService:
     """Service for generating embeddings."""
@@ -26,8 +39,8 @@ class EmbeddingService:
     def __init__(self):
         """Initialize the embeddings service."""
         if not self._embeddings:
-            self._embeddings = OpenAIEmbeddings(
-                openai_api_key=os.getenv("OPENAI_API_KEY")
+            self._embeddings = coalesce_embeddings(
+                get_embeddings_model(openai_api_key=os.getenv("OPENAI_API_KEY"))
             )
             self.logger = logger.bind(service="EmbeddingService")
 
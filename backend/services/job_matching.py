@@ -0,0 +1,408 @@
+"""
+Resume-to-job matching.
+
+Job listings are embedded once, when they are written, into
+``job_listing_embeddings``; listings whose embedded text did not change are
+not re-embedded. Matching a resume is then one nearest-neighbour query
+(``match_job_listings``: pgvector ``<=>`` over an HNSW index, a single
+matrix product in the local stand-in) for a candidate pool of active
+listings. Candidates are re-ranked on features the vector cannot see, then
+the top ``limit`` are returned with the fields of ``models.job.JobMatch``
+and explanations:
+
+- skills: the resume's skills against ``skills_required``, through the
+  skills engine vocabulary (synonyms and case variants match)
+- experience: the candidate's level against the listing's
+- location: remote listings, or a listing in a preferred location
+- salary: the listing's range against the candidate's minimum
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..database.supabase_client import supabase
+from ..utils.logger import get_logger
+from .embeddings import embedding_model_id, get_embedding_service
+from .skills_engine import skills_engine
+
+logger = get_logger(__name__)
+
+# Nearest listings re-ranked per request
+JOB_MATCH_CANDIDATES = 200
+
+# Contribution of each feature to match_score
+JOB_MATCH_WEIGHTS = {
+    "semantic": 0.45,
+    "skills": 0.30,
+    "experience": 0.10,
+    "location": 0.10,
+    "salary": 0.05,
+}
+
+# Listing columns whose text is embedded, in order
+JOB_EMBEDDING_FIELDS = (
+    "title",
+    "description",
+    "requirements",
+    "responsibilities",
+    "skills_required",
+)
+
+EXPERIENCE_LEVELS = [
+    "entry",
+    "associate",
+    "mid",
+    "senior",
+    "lead",
+    "manager",
+    "director",
+    "executive",
+]
+
+_MONEY = re.compile(r"\$?\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*([kK])?")
+
+
+def job_embedding_text(job: Dict[str, Any]) -> str:
+    """The text of a listing that its embedding represents."""
+    parts = []
+    for name in JOB_EMBEDDING_FIELDS:
+        value = job.get(name)
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        if value:
+            parts.append(str(value))
+    return "\n".join(parts)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _vector(value: Any) -> Optional[np.ndarray]:
+    """A stored embedding as a unit float32 vector; PostgREST returns vectors as text."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    vector = np.asarray(value, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _experience_rank(level: Optional[str]) -> Optional[int]:
+    if not level:
+        return None
+    level = str(level).lower().replace("_level", "")
+    return EXPERIENCE_LEVELS.index(level) if level in EXPERIENCE_LEVELS else None
+
+
+def _rank_for_years(years: Optional[float]) -> Optional[int]:
+    if years is None:
+        return None
+    for rank, minimum in ((6, 15), (3, 8), (2, 3), (1, 1)):
+        if years >= minimum:
+            return rank
+    return 0
+
+
+def parse_salary_range(text: Optional[str]) -> Optional[float]:
+    """Top of a salary range such as ``$60k-$80k`` or ``60,000 - 75,000``."""
+    if not text:
+        return None
+    amounts = [
+        float(number.replace(",", "")) * (1000 if thousands else 1)
+        for number, thousands in _MONEY.findall(str(text))
+    ]
+    return max(amounts) if amounts else None
+
+
+def _skill_names(value: Any) -> List[str]:
+    """Skill names from ``skills_extracted``, a list of strings or of objects."""
+    if isinstance(value, str):
+        value = json.loads(value) if value.startswith("[") else [value]
+    names = []
+    for item in value or []:
+        if isinstance(item, dict):
+            item = item.get("name") or item.get("skill")
+        if item:
+            names.append(str(item))
+    return names
+
+
+def _as_list(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    return [str(v) for v in value or []]
+
+
+def _location_score(job: Dict[str, Any], wanted: List[str]) -> float:
+    if job.get("remote_work_preference") == "remote":
+        return 1.0
+    location = (job.get("location") or "").casefold()
+    if not wanted or not location:
+        return 0.5
+    return float(any(w in location or location in w for w in wanted))
+
+
+@dataclass
+class CandidateProfile:
+    """What a resume and a job seeker profile say about a candidate."""
+
+    embedding: np.ndarray
+    skills: List[str] = field(default_factory=list)
+    experience_rank: Optional[int] = None
+    locations: List[str] = field(default_factory=list)
+    salary_min: Optional[float] = None
+    climate_interests: List[str] = field(default_factory=list)
+    resume_id: Optional[str] = None
+
+
+class JobMatcher:
+    """Embeds job listings and ranks them for a candidate."""
+
+    def __init__(self, embeddings=None, candidates: int = JOB_MATCH_CANDIDATES):
+        self._embeddings = embeddings
+        self.candidates = candidates
+
+    @property
+    def embeddings(self):
+        if self._embeddings is None:
+            self._embeddings = get_embedding_service()
+        return self._embeddings
+
+    async def embed_job(self, job: Dict[str, Any]) -> bool:
+        """
+        Store the embedding of a written listing.
+
+        Returns False when the listing is unchanged since its last embedding
+        by the current model, or could not be embedded; a failure never fails
+        the write itself (the backfill job embeds the listing later).
+        """
+        text = job_embedding_text(job)
+        digest = content_hash(text)
+        model = embedding_model_id()
+        try:
+            stored = (
+                supabase.table("job_listing_embeddings")
+                .select("content_hash, embedding_model")
+                .eq("id", job["id"])
+                .execute()
+                .data
+            )
+            if (
+                stored
+                and stored[0].get("content_hash") == digest
+                and stored[0].get("embedding_model") == model
+            ):
+                return False
+            embedding = await self.embeddings.embed_text(text)
+            supabase.table("job_listing_embeddings").upsert(
+                {
+                    "id": job["id"],
+                    "embedding": embedding,
+                    "content_hash": digest,
+                    "embedding_model": model,
+                }
+            ).execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Job listing {job.get('id')} not embedded: {e}")
+            return False
+
+    async def candidate_profile(
+        self, user_id: str, resume_id: Optional[str] = None
+    ) -> Optional[CandidateProfile]:
+        """The candidate's latest (or given) resume with their profile preferences."""
+        query = (
+            supabase.table("resumes")
+            .select("id, embedding, content, skills_extracted, experience_years")
+            .eq("user_id", user_id)
+        )
+        if resume_id:
+            query = query.eq("id", resume_id)
+        resumes = query.order("created_at", desc=True).limit(1).execute().data
+        if not resumes:
+            return None
+        resume = resumes[0]
+
+        embedding = _vector(resume.get("embedding"))
+        if embedding is None:
+            chunks = (
+                supabase.table("resume_chunks")
+                .select("embedding")
+                .eq("resume_id", resume["id"])
+                .execute()
+                .data
+            )
+            vectors = [v for v in (_vector(c.get("embedding")) for c in chunks) if v is not None]
+            if vectors:
+                embedding = _vector(np.mean(vectors, axis=0))
+            elif resume.get("content"):
+                embedding = _vector(await self.embeddings.embed_text(resume["content"]))
+            else:
+                return None
+
+        profiles = (
+            supabase.table("job_seeker_profiles").select("*").eq("user_id", user_id).execute().data
+        )
+        profile = profiles[0] if profiles else {}
+        rank = _experience_rank(profile.get("experience_level"))
+        return CandidateProfile(
+            embedding=embedding,
+            skills=_skill_names(resume.get("skills_extracted")),
+            experience_rank=(
+                rank if rank is not None else _rank_for_years(resume.get("experience_years"))
+            ),
+            locations=_as_list(profile.get("preferred_locations"))
+            + _as_list(profile.get("location")),
+            salary_min=profile.get("salary_range_min"),
+            climate_interests=_as_list(profile.get("climate_focus_areas"))
+            + _as_list(profile.get("climate_interests")),
+            resume_id=resume["id"],
+        )
+
+    def _nearest(
+        self, profile: CandidateProfile, filters: Dict[str, Optional[str]]
+    ) -> List[Dict[str, Any]]:
+        result = supabase.rpc(
+            "match_job_listings",
+            {
+                "query_embedding": profile.embedding.tolist(),
+                "match_count": self.candidates,
+                "location_filter": filters.get("location"),
+                "experience_level_filter": filters.get("experience_level"),
+                "remote_work_filter": filters.get("remote_work_preference"),
+            },
+        ).execute()
+        return result.data or []
+
+    async def match(
+        self,
+        user_id: str,
+        profile: CandidateProfile,
+        limit: int = 10,
+        filters: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """The ``limit`` best matching active listings, best first."""
+        jobs = self._nearest(profile, filters or {})
+        if not jobs:
+            return []
+        index = await skills_engine.index()
+        features = self._features(profile, jobs, index)
+        weights = np.array(list(JOB_MATCH_WEIGHTS.values()))
+        scores = np.column_stack([features[name] for name in JOB_MATCH_WEIGHTS]) @ weights
+        top = np.argsort(-scores, kind="stable")[:limit]
+        return [
+            self._job_match(
+                user_id,
+                profile,
+                jobs[i],
+                index,
+                float(scores[i]),
+                {name: float(values[i]) for name, values in features.items()},
+            )
+            for i in top
+        ]
+
+    def _features(
+        self, profile: CandidateProfile, jobs: Sequence[Dict[str, Any]], index
+    ) -> Dict[str, np.ndarray]:
+        """Per-feature scores (0-1) of every candidate listing."""
+        semantic = np.clip([job.get("similarity", 0.0) for job in jobs], 0.0, 1.0)
+        coverage = index.coverage(
+            profile.skills,
+            [(job.get("skills_required") or [], job.get("preferred_skills") or []) for job in jobs],
+        )
+        # Listings naming no skills, or a resume without any, fall back to the semantic match
+        named = np.array(
+            [bool(job.get("skills_required")) and bool(profile.skills) for job in jobs]
+        )
+        skills = np.where(named, coverage, semantic)
+
+        experience = np.full(len(jobs), 0.5)
+        if profile.experience_rank is not None:
+            for i, job in enumerate(jobs):
+                required = _experience_rank(job.get("experience_level"))
+                if required is not None:
+                    gap = required - profile.experience_rank
+                    experience[i] = 1.0 if gap <= 0 else 0.5 if gap == 1 else 0.0
+
+        wanted = [location.casefold() for location in profile.locations if location]
+        location = np.array([_location_score(job, wanted) for job in jobs])
+
+        salary = np.full(len(jobs), 0.5)
+        if profile.salary_min:
+            for i, job in enumerate(jobs):
+                top = parse_salary_range(job.get("salary_range"))
+                if top is not None:
+                    salary[i] = min(top / profile.salary_min, 1.0)
+
+        return {
+            "semantic": semantic,
+            "skills": skills,
+            "experience": experience,
+            "location": location,
+            "salary": salary,
+        }
+
+    def _job_match(
+        self,
+        user_id: str,
+        profile: CandidateProfile,
+        job: Dict[str, Any],
+        index,
+        score: float,
+        features: Dict[str, float],
+    ) -> Dict[str, Any]:
+        comparison = index.compare(
+            profile.skills, job.get("skills_required") or [], job.get("preferred_skills") or []
+        )
+        interests = {c.casefold() for c in profile.climate_interests}
+        climate_focus = [c for c in job.get("climate_focus") or [] if c]
+        climate = (
+            sum(c.casefold() in interests for c in climate_focus) / len(climate_focus)
+            if climate_focus and interests
+            else 0.0
+        )
+
+        explanations = [f"Resume similarity {features['semantic']:.2f}"]
+        required = job.get("skills_required") or []
+        if required:
+            held = len(required) - len(comparison.missing_required)
+            explanations.append(f"Has {held} of {len(required)} required skills")
+            if comparison.missing_required:
+                explanations.append(f"Missing: {', '.join(comparison.missing_required)}")
+        if features["experience"] == 0.0:
+            explanations.append(f"Asks for more experience ({job.get('experience_level')})")
+        if job.get("remote_work_preference") == "remote":
+            explanations.append("Remote role")
+        elif features["location"] == 1.0:
+            explanations.append(f"In a preferred location ({job.get('location')})")
+        if profile.salary_min and features["salary"] < 1.0 and job.get("salary_range"):
+            explanations.append(f"Salary range {job['salary_range']} is below your minimum")
+
+        return {
+            "user_id": user_id,
+            "job_id": str(job["id"]),
+            "match_score": round(score, 4),
+            "skill_match_score": round(features["skills"], 4),
+            "experience_match_score": features["experience"],
+            "location_match_score": features["location"],
+            "salary_match_score": round(features["salary"], 4),
+            "matching_skills": comparison.matching,
+            "missing_required_skills": comparison.missing_required,
+            "missing_preferred_skills": comparison.missing_preferred,
+            "climate_impact_alignment": round(climate, 4),
+            "explanations": explanations,
+            "matched_at": datetime.utcnow().isoformat(),
+            "job": job,
+        }
+
+
+job_matcher = JobMatcher()
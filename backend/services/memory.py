@@ -6,9 +6,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
 from langchain_core.embeddings import Embeddings
-from langchain_openai import OpenAIEmbeddings
 from langchain.vectorstores.supabase import SupabaseVectorStore
 
+from ..adapters.models import get_embeddings_model
 from ..utils.logger import get_logger
 from ..config.supabase import get_supabase_client
 
@@ -21,7 +21,7 @@ class MemoryService:
     def __init__(self):
         """Initialize the memory service."""
         self.supabase = get_supabase_client()
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = get_embeddings_model()
         self.vector_store = SupabaseVectorStore(
             client=self.supabase,
             embedding=self.embeddings,
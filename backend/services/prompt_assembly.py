@@ -0,0 +1,155 @@
+"""
+Prompt assembly for agent calls with provider-side prefix caching in mind.
+
+DeepSeek and OpenAI cache the longest previously seen prompt prefix
+automatically, but only when it is byte-identical. Each agent's static
+system prompt is therefore built once and interned, and anything that
+changes per request (conversation context, summaries) goes in a separate
+message after it instead of being concatenated into the system prompt.
+
+``PrefixCacheStats`` records the cached-prefix token counts reported in
+provider usage metadata so cache hit rates can be monitored per agent.
+"""
+
+import sys
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StaticPromptRegistry:
+    """Builds each static system prompt once and returns the same object after."""
+
+    def __init__(self):
+        self._prompts: Dict[Hashable, SystemMessage] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, builder: Callable[[], str]) -> SystemMessage:
+        """Return the interned system message for ``key``, building it on first use."""
+        message = self._prompts.get(key)
+        if message is None:
+            with self._lock:
+                message = self._prompts.get(key)
+                if message is None:
+                    message = SystemMessage(content=sys.intern(builder()))
+                    self._prompts[key] = message
+        return message
+
+    def clear(self) -> None:
+        """Drop interned prompts, e.g. after agent configuration changes."""
+        with self._lock:
+            self._prompts.clear()
+
+    def __len__(self) -> int:
+        return len(self._prompts)
+
+
+def assemble_messages(
+    system_message: SystemMessage,
+    user_message: str,
+    context: Optional[str] = None,
+) -> List[BaseMessage]:
+    """
+    Stable system prefix, then volatile context, then the user turn.
+
+    The static system message always comes first and is never modified, so
+    the provider can reuse its cached prefix across requests.
+    """
+    messages: List[BaseMessage] = [system_message]
+    if context:
+        messages.append(SystemMessage(content=context))
+    messages.append(HumanMessage(content=user_message))
+    return messages
+
+
+def extract_cached_tokens(message: Any) -> Dict[str, int]:
+    """
+    Prompt and cached-prefix token counts from a model response or chunk.
+
+    Reads LangChain's standard ``usage_metadata`` first, then the raw
+    provider fields (OpenAI ``prompt_tokens_details.cached_tokens``,
+    DeepSeek ``prompt_cache_hit_tokens``).
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens", 0)
+    cached = (usage.get("input_token_details") or {}).get("cache_read", 0)
+
+    if not cached:
+        metadata = getattr(message, "response_metadata", None) or {}
+        token_usage = metadata.get("token_usage") or metadata.get("usage") or {}
+        prompt_tokens = prompt_tokens or token_usage.get("prompt_tokens", 0)
+        cached = (token_usage.get("prompt_tokens_details") or {}).get(
+            "cached_tokens"
+        ) or token_usage.get("prompt_cache_hit_tokens", 0)
+
+    return {"prompt_tokens": prompt_tokens or 0, "cached_tokens": cached or 0}
+
+
+class PrefixCacheStats:
+    """Per-agent prompt and cached-prefix token totals."""
+
+    def __init__(self):
+        self.agents: Dict[str, Dict[str, float]] = {}
+
+    def record(
+        self,
+        agent: str,
+        message: Any,
+        time_to_first_token_ms: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """Record usage from a model response; returns the extracted counts."""
+        usage = extract_cached_tokens(message)
+        entry = self.agents.setdefault(
+            agent,
+            {
+                "requests": 0,
+                "prompt_tokens": 0,
+                "cached_tokens": 0,
+                "ttft_total_ms": 0.0,
+                "ttft_samples": 0,
+            },
+        )
+        entry["requests"] += 1
+        entry["prompt_tokens"] += usage["prompt_tokens"]
+        entry["cached_tokens"] += usage["cached_tokens"]
+        if time_to_first_token_ms is not None:
+            entry["ttft_total_ms"] += time_to_first_token_ms
+            entry["ttft_samples"] += 1
+
+        logger.debug(
+            "Prompt cache usage",
+            agent=agent,
+            prompt_tokens=usage["prompt_tokens"],
+            cached_tokens=usage["cached_tokens"],
+        )
+        return usage
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Totals with hit ratio and average time to first token per agent."""
+        stats = {}
+        for agent, entry in self.agents.items():
+            stats[agent] = {
+                "requests": entry["requests"],
+                "prompt_tokens": entry["prompt_tokens"],
+                "cached_tokens": entry["cached_tokens"],
+                "cache_hit_ratio": (
+                    entry["cached_tokens"] / entry["prompt_tokens"]
+                    if entry["prompt_tokens"]
+                    else 0.0
+                ),
+                "avg_ttft_ms": (
+                    entry["ttft_total_ms"] / entry["ttft_samples"]
+                    if entry["ttft_samples"]
+                    else None
+                ),
+            }
+        return stats
+
+
+static_prompts = StaticPromptRegistry()
+prefix_cache_stats = PrefixCacheStats()
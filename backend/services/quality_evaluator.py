@@ -0,0 +1,385 @@
+"""
+Tiered response quality evaluation for the Climate Economy Assistant.
+
+The first tier is a local risk scorer (weighted lexicon plus embedding
+similarity against curated "needs review" exemplars) that settles clear-cut
+responses without an LLM round trip. Only responses that land in the
+ambiguous band are escalated to the LLM evaluator.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Risk bands (risk = 1 - quality score). Below LOW the response passes,
+# at or above HIGH it goes to human review, anything in between is ambiguous.
+QUALITY_RISK_LOW = float(os.getenv("QUALITY_RISK_LOW", "0.2"))
+QUALITY_RISK_HIGH = float(os.getenv("QUALITY_RISK_HIGH", "0.6"))
+
+# Cosine similarity bands against the review exemplars
+QUALITY_EXEMPLAR_LOW = float(os.getenv("QUALITY_EXEMPLAR_LOW", "0.78"))
+QUALITY_EXEMPLAR_HIGH = float(os.getenv("QUALITY_EXEMPLAR_HIGH", "0.88"))
+
+# Weighted review lexicon. Weights are combined with a noisy-or across the
+# categories that matched, so several weak signals add up to a strong one.
+REVIEW_LEXICON: Dict[str, Dict[str, Any]] = {
+    "crisis": {
+        "weight": 0.9,
+        "scope": "both",
+        "terms": [
+            "suicide",
+            "suicidal",
+            "self-harm",
+            "self harm",
+            "kill myself",
+            "hurt myself",
+            "end my life",
+            "overdose",
+            "abuse",
+            "domestic violence",
+        ],
+    },
+    "mental_health": {
+        "weight": 0.35,
+        "scope": "both",
+        "terms": [
+            "depression",
+            "depressed",
+            "anxiety",
+            "panic attack",
+            "hopeless",
+            "ptsd",
+            "mental health",
+            "therapy",
+        ],
+    },
+    "legal": {
+        "weight": 0.35,
+        "scope": "both",
+        "terms": [
+            "legal advice",
+            "lawyer",
+            "attorney",
+            "lawsuit",
+            "sue",
+            "deportation",
+            "visa status",
+            "immigration status",
+            "discrimination claim",
+            "wrongful termination",
+        ],
+    },
+    "medical": {
+        "weight": 0.3,
+        "scope": "both",
+        "terms": [
+            "diagnosis",
+            "medication",
+            "symptoms",
+            "toxic exposure",
+            "lead poisoning",
+            "asthma",
+        ],
+    },
+    "high_stakes": {
+        "weight": 0.25,
+        "scope": "both",
+        "terms": [
+            "disability rating",
+            "benefits eligibility",
+            "lose my benefits",
+            "guaranteed",
+            "guarantee",
+            "tax",
+            "loan",
+            "eviction",
+        ],
+    },
+    "uncertainty": {
+        "weight": 0.3,
+        "scope": "answer",
+        "terms": [
+            "i'm not sure",
+            "i am not sure",
+            "not certain",
+            "i don't know",
+            "may be inaccurate",
+            "might be wrong",
+            "cannot verify",
+            "can't verify",
+            "double-check with",
+        ],
+    },
+}
+
+# Curated responses the LLM evaluator consistently sends to human review.
+REVIEW_EXEMPLARS: List[str] = [
+    "If you are thinking about ending your life, please contact a crisis line right away.",
+    "You should file a lawsuit against your employer for wrongful termination.",
+    "Your visa status may be affected; here is what to tell immigration officers.",
+    "This medication should help with the symptoms you described.",
+    "I'm not sure about the exact eligibility rules, but you will probably qualify for the benefit.",
+    "You are guaranteed to get this job if you complete the certification.",
+    "Stopping your VA disability claim will not affect your benefits.",
+    "The pollution near your home is definitely causing your child's asthma.",
+]
+
+
+def _compile_lexicon(
+    lexicon: Dict[str, Dict[str, Any]],
+) -> Dict[str, Tuple[re.Pattern, float, str]]:
+    """Compile one word-bounded alternation per lexicon category."""
+    compiled = {}
+    for category, spec in lexicon.items():
+        terms = sorted(spec["terms"], key=len, reverse=True)
+        pattern = r"\b(?:" + "|".join(re.escape(t) for t in terms) + r")\b"
+        compiled[category] = (re.compile(pattern), spec["weight"], spec["scope"])
+    return compiled
+
+
+@dataclass
+class QualityAssessment:
+    """Result of the local quality tiers."""
+
+    risk: float
+    tier: str
+    decided: bool
+    needs_review: Optional[bool] = None
+    matched_categories: List[str] = field(default_factory=list)
+    exemplar_similarity: Optional[float] = None
+    latency_ms: float = 0.0
+
+    @property
+    def quality_score(self) -> float:
+        """Quality score on the same 0-1 scale the LLM evaluator uses."""
+        return round(1.0 - self.risk, 3)
+
+    @property
+    def reason(self) -> str:
+        if self.matched_categories:
+            return f"Local risk signals: {', '.join(self.matched_categories)}"
+        if self.exemplar_similarity is not None:
+            return f"Exemplar similarity {self.exemplar_similarity:.2f}"
+        return "No local risk signals"
+
+
+class QualityRiskClassifier:
+    """
+    Fast local risk classifier used before the LLM quality evaluator.
+
+    The lexicon tier runs in well under a millisecond. The exemplar tier is
+    only consulted for ambiguous responses and is skipped when no embedding
+    service is available.
+    """
+
+    def __init__(
+        self,
+        low_threshold: float = QUALITY_RISK_LOW,
+        high_threshold: float = QUALITY_RISK_HIGH,
+        exemplar_low: float = QUALITY_EXEMPLAR_LOW,
+        exemplar_high: float = QUALITY_EXEMPLAR_HIGH,
+        embedding_service: Any = None,
+        use_embeddings: bool = True,
+    ):
+        self.low_threshold = low_threshold
+        self.high_threshold = high_threshold
+        self.exemplar_low = exemplar_low
+        self.exemplar_high = exemplar_high
+        self.use_embeddings = use_embeddings
+        self._embedding_service = embedding_service
+        self._exemplar_matrix: Optional[np.ndarray] = None
+        self._exemplar_lock = asyncio.Lock()
+        self._lexicon = _compile_lexicon(REVIEW_LEXICON)
+        self.stats = {"lexicon": 0, "embedding": 0, "escalated": 0}
+
+    def lexicon_score(self, question: str, answer: str) -> Tuple[float, List[str]]:
+        """Score a question/answer pair against the review lexicon."""
+        question_lower = (question or "").lower()
+        answer_lower = (answer or "").lower()
+        both = f"{question_lower}\n{answer_lower}"
+
+        keep = 1.0
+        matched = []
+        for category, (pattern, weight, scope) in self._lexicon.items():
+            text = answer_lower if scope == "answer" else both
+            if pattern.search(text):
+                keep *= 1.0 - weight
+                matched.append(category)
+
+        return 1.0 - keep, matched
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None and self.use_embeddings:
+            try:
+                from .embeddings import get_embedding_service
+
+                self._embedding_service = get_embedding_service()
+            except Exception as e:
+                logger.warning("Embedding tier disabled", error=str(e))
+                self.use_embeddings = False
+        return self._embedding_service
+
+    async def _load_exemplars(self, service) -> Optional[np.ndarray]:
+        if self._exemplar_matrix is not None:
+            return self._exemplar_matrix
+
+        async with self._exemplar_lock:
+            if self._exemplar_matrix is None:
+                vectors = np.asarray(await service.embed_texts(REVIEW_EXEMPLARS), dtype=np.float32)
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                self._exemplar_matrix = vectors / norms
+        return self._exemplar_matrix
+
+    async def exemplar_similarity(self, text: str) -> Optional[float]:
+        """Highest cosine similarity between text and the review exemplars."""
+        service = self._get_embedding_service()
+        if service is None:
+            return None
+
+        try:
+            exemplars = await self._load_exemplars(service)
+            vector = np.asarray(await service.embed_text(text), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return 0.0
+            return float(np.max(exemplars @ (vector / norm)))
+        except Exception as e:
+            logger.warning("Exemplar similarity failed", error=str(e))
+            return None
+
+    async def assess(self, question: str, answer: str) -> QualityAssessment:
+        """Run the local tiers and report whether the case is settled."""
+        start = time.perf_counter()
+        risk, matched = self.lexicon_score(question, answer)
+
+        if risk >= self.high_threshold or risk < self.low_threshold:
+            self.stats["lexicon"] += 1
+            return QualityAssessment(
+                risk=risk,
+                tier="lexicon",
+                decided=True,
+                needs_review=risk >= self.high_threshold,
+                matched_categories=matched,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        similarity = None
+        if self.use_embeddings:
+            similarity = await self.exemplar_similarity(answer)
+
+        if similarity is not None and (
+            similarity >= self.exemplar_high or similarity <= self.exemplar_low
+        ):
+            needs_review = similarity >= self.exemplar_high
+            self.stats["embedding"] += 1
+            return QualityAssessment(
+                risk=max(risk, similarity) if needs_review else risk,
+                tier="embedding",
+                decided=True,
+                needs_review=needs_review,
+                matched_categories=matched,
+                exemplar_similarity=similarity,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        self.stats["escalated"] += 1
+        return QualityAssessment(
+            risk=risk,
+            tier="escalate",
+            decided=False,
+            matched_categories=matched,
+            exemplar_similarity=similarity,
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
+
+
+async def measure_agreement(
+    classifier: QualityRiskClassifier,
+    corpus: List[Dict[str, Any]],
+    llm_labeler: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Compare the local tiers against LLM review labels.
+
+    Each corpus item needs ``question`` and ``answer``; the reference label is
+    ``llm_needs_review`` unless ``llm_labeler`` is given, in which case it is
+    awaited per item to produce a fresh label.
+
+    Precision and recall are computed over the cases the local tiers decided;
+    escalated cases are reported separately since the LLM still handles them.
+    """
+    tp = fp = fn = tn = escalated = 0
+    latencies = []
+
+    for item in corpus:
+        if llm_labeler is not None:
+            label = bool(await llm_labeler(item))
+        else:
+            label = bool(item["llm_needs_review"])
+
+        assessment = await classifier.assess(item["question"], item["answer"])
+        latencies.append(assessment.latency_ms)
+
+        if not assessment.decided:
+            escalated += 1
+        elif assessment.needs_review and label:
+            tp += 1
+        elif assessment.needs_review:
+            fp += 1
+        elif label:
+            fn += 1
+        else:
+            tn += 1
+
+    decided = tp + fp + fn + tn
+    return {
+        "total": len(corpus),
+        "decided": decided,
+        "escalated": escalated,
+        "escalation_rate": escalated / len(corpus) if corpus else 0.0,
+        "precision": tp / (tp + fp) if tp + fp else 1.0,
+        "recall": tp / (tp + fn) if tp + fn else 1.0,
+        "agreement": (tp + tn) / decided if decided else 1.0,
+        "confusion": {"tp": tp, "fp": fp, "fn": fn, "tn": tn},
+        "avg_latency_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+    }
+
+
+# Shared classifier used by the LangGraph quality check
+quality_classifier = QualityRiskClassifier()
+
+
+if __name__ == "__main__":
+    import argparse
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(
+        description="Measure local quality tiers against LLM review labels"
+    )
+    parser.add_argument(
+        "--corpus",
+        default=str(
+            Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "quality_corpus.json"
+        ),
+    )
+    parser.add_argument("--embeddings", action="store_true", help="Enable the exemplar tier")
+    args = parser.parse_args()
+
+    with open(args.corpus) as f:
+        corpus = json.load(f)
+
+    report = asyncio.run(
+        measure_agreement(QualityRiskClassifier(use_embeddings=args.embeddings), corpus)
+    )
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,168 @@
+"""
+Asynchronous post-response quality evaluation for the Climate Economy Assistant.
+
+Responses that need an LLM quality check are published to a bounded
+background queue instead of blocking the user. A worker drains the queue in
+batches with capped concurrency and hands each result to a callback that
+records the score and raises human-review interrupts after the fact.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class QualityJob:
+    """A (question, answer, agent) tuple awaiting LLM evaluation."""
+
+    conversation_id: str
+    question: str
+    answer: str
+    agent: str
+    user_id: Optional[str] = None
+    message_id: Optional[str] = None
+    coordination_used: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class QualityEvaluationQueue:
+    """
+    Bounded queue with a batching background worker.
+
+    ``evaluate`` turns a job into a result dict; ``on_result`` persists it.
+    When the queue is full new jobs are dropped and counted rather than
+    applying backpressure to the response path.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[QualityJob], Awaitable[Dict[str, Any]]],
+        on_result: Callable[[QualityJob, Dict[str, Any]], Awaitable[None]],
+        maxsize: int = 1000,
+        batch_size: int = 8,
+        max_concurrency: int = 4,
+        batch_wait: float = 0.05,
+    ):
+        self.evaluate = evaluate
+        self.on_result = on_result
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight = 0
+        self._lag_total_ms = 0.0
+        self._lag_samples = 0
+        self.stats = {
+            "published": 0,
+            "processed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "batches": 0,
+            "last_lag_ms": 0.0,
+            "max_lag_ms": 0.0,
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    def publish(self, job: QualityJob) -> bool:
+        """Enqueue a job without waiting. Returns False if it was dropped."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            logger.warning(
+                "Quality queue full, dropping evaluation",
+                conversation_id=job.conversation_id,
+            )
+            return False
+
+        self.stats["published"] += 1
+        return True
+
+    async def _next_batch(self) -> List[QualityJob]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _process(self, job: QualityJob) -> None:
+        async with self._semaphore:
+            lag_ms = (time.monotonic() - job.enqueued_at) * 1000
+            self._lag_total_ms += lag_ms
+            self._lag_samples += 1
+            self.stats["last_lag_ms"] = lag_ms
+            self.stats["max_lag_ms"] = max(self.stats["max_lag_ms"], lag_ms)
+            self._in_flight += 1
+            try:
+                result = await self.evaluate(job)
+                await self.on_result(job, result)
+                self.stats["processed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.error(
+                    "Async quality evaluation failed",
+                    conversation_id=job.conversation_id,
+                    error=str(e),
+                )
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            self.stats["batches"] += 1
+            await asyncio.gather(*(self._process(job) for job in batch))
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait until every published job has been processed."""
+        if self._queue is not None:
+            await asyncio.wait_for(self._queue.join(), timeout)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain outstanding jobs and stop the worker."""
+        try:
+            await self.drain(timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Quality queue did not drain before shutdown")
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, lag and drop counters."""
+        return {
+            **self.stats,
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "maxsize": self.maxsize,
+            "in_flight": self._in_flight,
+            "avg_lag_ms": (self._lag_total_ms / self._lag_samples if self._lag_samples else 0.0),
+            "worker_running": self._worker is not None and not self._worker.done(),
+        }
@@ -0,0 +1,304 @@
+"""
+In-process snapshots of slowly-changing reference tables.
+
+Education programs, MOS translations, skills mappings and role requirements
+change a few times a day but were queried on every request. Each table is
+now loaded whole into an immutable snapshot, indexed by id and by its
+lookup columns, so lookups such as MOS code to civilian roles or program by
+id are dict reads.
+
+Snapshots stay fresh two ways:
+
+- Every write bumps the table's row in ``reference_data_versions`` (a
+  statement trigger). A background task polls those stamps and reloads
+  snapshots whose version moved, serving the old snapshot meanwhile.
+- Write endpoints call ``invalidate()``, which drops the local snapshot and
+  publishes the table name on a Redis channel, so other workers drop
+  theirs without waiting for the next poll.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..database.supabase_client import supabase
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REFERENCE_REFRESH_INTERVAL = float(os.getenv("REFERENCE_REFRESH_INTERVAL", "60"))
+# Reload even without a version change, for databases without the stamps
+REFERENCE_MAX_AGE = float(os.getenv("REFERENCE_MAX_AGE", "900"))
+REFERENCE_LOAD_BATCH = 1000
+REFERENCE_CHANNEL = "reference_data:invalidate"
+
+# Table -> columns indexed for lookup(); list values are indexed per element
+REFERENCE_TABLES: Dict[str, Tuple[str, ...]] = {
+    "education_programs": ("program_type", "climate_focus", "target_roles"),
+    "mos_translation": ("mos_code",),
+    "skills_mapping": ("skill_name", "mapped_roles"),
+    "role_requirements": ("role_title", "role_name"),
+}
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """All rows of one table as of ``version``, with lookup indexes."""
+
+    table: str
+    version: Optional[int]
+    loaded_at: float
+    rows: Tuple[Dict[str, Any], ...]
+    by_id: Dict[str, Dict[str, Any]]
+    indexes: Dict[str, Dict[Any, Tuple[Dict[str, Any], ...]]]
+
+    @classmethod
+    def build(
+        cls,
+        table: str,
+        version: Optional[int],
+        rows: List[Dict[str, Any]],
+        columns: Tuple[str, ...],
+    ) -> "ReferenceSnapshot":
+        indexes: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {c: {} for c in columns}
+        for row in rows:
+            for column, index in indexes.items():
+                value = row.get(column)
+                for key in value if isinstance(value, list) else [value]:
+                    if key is not None:
+                        index.setdefault(key, []).append(row)
+        return cls(
+            table=table,
+            version=version,
+            loaded_at=time.monotonic(),
+            rows=tuple(rows),
+            by_id={str(row["id"]): row for row in rows if row.get("id") is not None},
+            indexes={c: {k: tuple(v) for k, v in index.items()} for c, index in indexes.items()},
+        )
+
+    def get(self, row_id: Any) -> Optional[Dict[str, Any]]:
+        row = self.by_id.get(str(row_id))
+        return dict(row) if row is not None else None
+
+    def lookup(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        """Rows whose ``column`` equals (or, for lists, contains) ``value``."""
+        index = self.indexes.get(column)
+        if index is None:
+            raise KeyError(f"{self.table}.{column} is not indexed")
+        return [dict(row) for row in index.get(value, ())]
+
+
+class ReferenceDataCache:
+    """Versioned reference table snapshots with background refresh."""
+
+    def __init__(
+        self,
+        tables: Dict[str, Tuple[str, ...]] = REFERENCE_TABLES,
+        refresh_interval: float = REFERENCE_REFRESH_INTERVAL,
+        max_age: float = REFERENCE_MAX_AGE,
+        redis=None,
+        channel: str = REFERENCE_CHANNEL,
+    ):
+        self.tables = dict(tables)
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.channel = channel
+        self._redis = redis
+        self._origin = uuid.uuid4().hex
+        self._snapshots: Dict[str, ReferenceSnapshot] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+        # Bumped by invalidate() so a load started earlier is not kept
+        self._generations: Dict[str, int] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0, "refresh_errors": 0}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from ..database.redis_client import redis_client
+
+            self._redis = redis_client
+        return self._redis
+
+    def _columns(self, table: str) -> Tuple[str, ...]:
+        if table not in self.tables:
+            raise KeyError(f"{table} is not a reference table")
+        return self.tables[table]
+
+    async def snapshot(self, table: str) -> ReferenceSnapshot:
+        """Current snapshot of ``table``, loading it on first use."""
+        self._columns(table)
+        snapshot = self._snapshots.get(table)
+        if snapshot is not None:
+            self.stats["hits"] += 1
+            return snapshot
+        self._ensure_tasks()
+        task = self._loading.get(table)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(table))
+            self._loading[table] = task
+            task.add_done_callback(lambda _: self._loading.pop(table, None))
+        # Concurrent first reads share one load
+        return await asyncio.shield(task)
+
+    async def get(self, table: str, row_id: Any) -> Optional[Dict[str, Any]]:
+        """Row by id; ids missing from the snapshot are read through to the database."""
+        row = (await self.snapshot(table)).get(row_id)
+        if row is not None:
+            return row
+        self.stats["misses"] += 1
+        result = supabase.table(table).select("*").eq("id", row_id).execute()
+        return result.data[0] if result.data else None
+
+    async def lookup(self, table: str, column: str, value: Any) -> List[Dict[str, Any]]:
+        return (await self.snapshot(table)).lookup(column, value)
+
+    async def rows(self, table: str) -> List[Dict[str, Any]]:
+        return [dict(row) for row in (await self.snapshot(table)).rows]
+
+    def _fetch_versions(self) -> Dict[str, int]:
+        result = (
+            supabase.table("reference_data_versions")
+            .select("table_name, version")
+            .in_("table_name", list(self.tables))
+            .execute()
+        )
+        return {row["table_name"]: row["version"] for row in result.data or []}
+
+    def _fetch_rows(self, table: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        while True:
+            query = supabase.table(table).select("*").order("id").limit(REFERENCE_LOAD_BATCH)
+            if rows:
+                query = query.gt("id", rows[-1]["id"])
+            batch = query.execute().data or []
+            rows.extend(batch)
+            if len(batch) < REFERENCE_LOAD_BATCH:
+                return rows
+
+    async def _load(self, table: str) -> ReferenceSnapshot:
+        generation = self._generations.get(table, 0)
+        try:
+            version = self._fetch_versions().get(table)
+        except Exception as e:
+            logger.warning(f"Reference data versions unavailable: {e}")
+            version = None
+        # Version first: a write landing during the load bumps it past ours
+        snapshot = ReferenceSnapshot.build(
+            table, version, self._fetch_rows(table), self._columns(table)
+        )
+        self.stats["loads"] += 1
+        if self._generations.get(table, 0) == generation:
+            self._snapshots[table] = snapshot
+        logger.info(f"Loaded {len(snapshot.rows)} {table} rows (version {version})")
+        return snapshot
+
+    async def refresh(self) -> List[str]:
+        """Reload snapshots whose version stamp moved or that are too old."""
+        try:
+            versions = self._fetch_versions()
+        except Exception as e:
+            self.stats["refresh_errors"] += 1
+            logger.warning(f"Reference data version check failed: {e}")
+            versions = {}
+        now = time.monotonic()
+        stale = [
+            table
+            for table, snapshot in list(self._snapshots.items())
+            if versions.get(table, snapshot.version) != snapshot.version
+            or now - snapshot.loaded_at > self.max_age
+        ]
+        for table in stale:
+            try:
+                await self._load(table)
+            except Exception as e:
+                self.stats["refresh_errors"] += 1
+                logger.warning(f"Reference data reload of {table} failed: {e}")
+        return stale
+
+    def _drop(self, table: str) -> None:
+        self._generations[table] = self._generations.get(table, 0) + 1
+        self._snapshots.pop(table, None)
+
+    async def invalidate(self, table: str) -> None:
+        """Drop ``table``'s snapshot here and, through Redis, in every other worker."""
+        self._columns(table)
+        self._drop(table)
+        self.stats["invalidations"] += 1
+        try:
+            async with self.redis.get_connection() as client:
+                await client.publish(
+                    self.channel, json.dumps({"table": table, "origin": self._origin})
+                )
+        except Exception as e:
+            logger.warning(f"Reference data invalidation not published: {e}")
+
+    def _on_message(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("origin") != self._origin and message.get("table") in self.tables:
+            self._drop(message["table"])
+            self.stats["invalidations"] += 1
+
+    def _ensure_tasks(self) -> None:
+        if self.refresh_interval <= 0 or any(not task.done() for task in self._tasks):
+            return
+        self.start()
+
+    def start(self) -> None:
+        """Start the version poller and the invalidation listener."""
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._run_refresher()), loop.create_task(self._listen())]
+
+    async def _run_refresher(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.get_connection() as client:
+                    pubsub = client.pubsub()
+                    await pubsub.subscribe(self.channel)
+                    try:
+                        async for message in pubsub.listen():
+                            if message.get("type") == "message":
+                                self._on_message(message["data"])
+                    finally:
+                        await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Missed invalidations are caught up by the version poll
+                logger.warning(f"Reference data listener disconnected: {e}")
+                await asyncio.sleep(max(self.refresh_interval, 1.0))
+
+    async def stop(self) -> None:
+        """Stop the background tasks."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tables": {
+                table: {"version": s.version, "rows": len(s.rows)}
+                for table, s in self._snapshots.items()
+            },
+        }
+
+
+reference_data = ReferenceDataCache()
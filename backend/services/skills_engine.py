@@ -0,0 +1,390 @@
+"""
+Set-based skill comparison.
+
+Skill lists used to be compared with nested ``in`` checks on raw strings:
+O(n*m) per comparison, and "Solar PV" never matched "solar pv". Skills are
+now resolved against a vocabulary built from ``skills_mapping``: every skill
+gets a dense integer id, and its ``keywords`` resolve to the same id as
+synonyms. A profile or role is a sorted array of skill ids, so gaps and
+overlaps are sorted-array set operations.
+
+The role requirements catalogue is one sparse role x skill matrix (one
+entry per role skill, grouped by role). Scoring a profile against every
+role is a mask lookup and two ``bincount`` passes over the entries, so
+thousands of roles take about a millisecond.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Coverage weight of a preferred skill; required skills weigh 1
+PREFERRED_SKILL_WEIGHT = 0.5
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """Case- and punctuation-insensitive form of a skill name."""
+    return " ".join(_TOKEN.findall(str(skill).casefold().replace("&", " and ")))
+
+
+class SkillVocabulary:
+    """Normalized skill names and synonyms mapped to dense integer ids."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.categories: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_skills_mapping(cls, rows: Iterable[Dict[str, Any]]) -> "SkillVocabulary":
+        """Vocabulary of ``skills_mapping`` rows, with ``keywords`` as synonyms."""
+        vocabulary = cls()
+        rows = [row for row in rows if normalize_skill(row.get("skill_name") or "")]
+        # Canonical names first, so a synonym never captures another skill's name
+        for row in rows:
+            vocabulary.add(row["skill_name"], category=row.get("category"))
+        for row in rows:
+            vocabulary.add(row["skill_name"], synonyms=row.get("keywords") or [])
+        return vocabulary
+
+    def add(self, name: str, synonyms: Iterable[str] = (), category: Optional[str] = None) -> int:
+        """Id of ``name``, adding it (and any new ``synonyms``) if unknown."""
+        key = normalize_skill(name)
+        if not key:
+            raise ValueError(f"Empty skill name: {name!r}")
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._ids[key] = len(self.names)
+            self.names.append(name)
+            self.categories.append(category)
+        for synonym in synonyms:
+            synonym_key = normalize_skill(synonym)
+            if synonym_key:
+                self._ids.setdefault(synonym_key, skill_id)
+        return skill_id
+
+    def resolve(self, skill: str) -> Optional[int]:
+        return self._ids.get(normalize_skill(skill))
+
+    def encode(self, skills: Iterable[str], add: bool = False) -> np.ndarray:
+        """Sorted, unique ids of ``skills``; unknown skills are dropped unless ``add``."""
+        ids = set()
+        for skill in skills:
+            if not normalize_skill(skill or ""):
+                continue
+            skill_id = self.add(skill) if add else self.resolve(skill)
+            if skill_id is not None:
+                ids.add(skill_id)
+        return np.array(sorted(ids), dtype=np.int32)
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        return [self.names[i] for i in ids]
+
+
+@dataclass
+class SkillComparison:
+    """How one skill profile covers one set of requirements."""
+
+    matching: List[str] = field(default_factory=list)
+    missing_required: List[str] = field(default_factory=list)
+    missing_preferred: List[str] = field(default_factory=list)
+    # Share of required skills held, 0-100
+    match_percentage: float = 0.0
+    # Weighted share of required and preferred skills held, 0.0-1.0
+    coverage: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "matching_skills": self.matching,
+            "skill_gaps": self.missing_required,
+            "missing_preferred_skills": self.missing_preferred,
+            "match_percentage": self.match_percentage,
+            "coverage": self.coverage,
+        }
+
+
+def _local_encoder(vocabulary: SkillVocabulary) -> Callable[[str], Optional[int]]:
+    """Vocabulary ids, with negative ids for skills only this comparison knows."""
+    local: Dict[str, int] = {}
+
+    def encode(skill: str) -> Optional[int]:
+        skill_id = vocabulary.resolve(skill)
+        if skill_id is None:
+            key = normalize_skill(skill or "")
+            if not key:
+                return None
+            skill_id = local.setdefault(key, -1 - len(local))
+        return skill_id
+
+    return encode
+
+
+def _distinct(
+    encode: Callable[[str], Optional[int]], skills: Iterable[str]
+) -> Tuple[np.ndarray, List[str]]:
+    """Ids of ``skills`` in first-seen order, each with the name it was listed under."""
+    ids: Dict[int, str] = {}
+    for skill in skills:
+        skill_id = encode(skill)
+        if skill_id is not None:
+            ids.setdefault(skill_id, skill)
+    return np.fromiter(ids, dtype=np.int32, count=len(ids)), list(ids.values())
+
+
+def compare_skills(
+    vocabulary: SkillVocabulary,
+    have: Iterable[str],
+    required: Iterable[str],
+    preferred: Iterable[str] = (),
+) -> SkillComparison:
+    """
+    Gaps and overlap between a profile and one set of requirements.
+
+    Skills the vocabulary does not know still match when their normalized
+    names are equal. Names are reported as the requirements list them.
+    """
+    encode = _local_encoder(vocabulary)
+    have_ids = np.unique(
+        np.fromiter((i for i in map(encode, have) if i is not None), dtype=np.int32)
+    )
+    required_ids, required_names = _distinct(encode, required)
+    preferred_ids, preferred_names = _distinct(encode, preferred)
+    keep = ~np.isin(preferred_ids, required_ids)
+    preferred_ids = preferred_ids[keep]
+    preferred_names = [name for name, kept in zip(preferred_names, keep) if kept]
+
+    has_required = np.isin(required_ids, have_ids, assume_unique=True)
+    has_preferred = np.isin(preferred_ids, have_ids, assume_unique=True)
+    total = len(required_ids) + PREFERRED_SKILL_WEIGHT * len(preferred_ids)
+    matched = int(has_required.sum()) + PREFERRED_SKILL_WEIGHT * int(has_preferred.sum())
+    return SkillComparison(
+        matching=[
+            n
+            for n, hit in zip(
+                required_names + preferred_names, np.concatenate([has_required, has_preferred])
+            )
+            if hit
+        ],
+        missing_required=[n for n, hit in zip(required_names, has_required) if not hit],
+        missing_preferred=[n for n, hit in zip(preferred_names, has_preferred) if not hit],
+        match_percentage=float(has_required.mean() * 100) if len(required_ids) else 0.0,
+        coverage=matched / total if total else 0.0,
+    )
+
+
+def batch_coverage(
+    vocabulary: SkillVocabulary,
+    have: Iterable[str],
+    requirements: Sequence[Tuple[Iterable[str], Iterable[str]]],
+) -> np.ndarray:
+    """
+    ``compare_skills(...).coverage`` of many (required, preferred) pairs.
+
+    For ad hoc requirement lists, such as candidate job listings; every
+    entry is checked against the profile in one pass.
+    """
+    encode = _local_encoder(vocabulary)
+    have_ids = np.unique(
+        np.fromiter((i for i in map(encode, have) if i is not None), dtype=np.int32)
+    )
+    ids: List[int] = []
+    weights: List[float] = []
+    owners: List[int] = []
+    for owner, (required, preferred) in enumerate(requirements):
+        entries: Dict[int, float] = {}
+        for skills, weight in ((required, 1.0), (preferred, PREFERRED_SKILL_WEIGHT)):
+            for skill in skills:
+                skill_id = encode(skill)
+                if skill_id is not None:
+                    entries.setdefault(skill_id, weight)
+        ids.extend(entries)
+        weights.extend(entries.values())
+        owners.extend([owner] * len(entries))
+
+    n = len(requirements)
+    weight = np.asarray(weights, dtype=float)
+    hit = np.isin(np.asarray(ids, dtype=np.int32), have_ids)
+    total = np.bincount(owners, weights=weight, minlength=n)
+    matched = np.bincount(owners, weights=weight * hit, minlength=n)
+    return np.divide(matched, total, out=np.zeros(n), where=total > 0)
+
+
+@dataclass
+class RoleFit:
+    """One role scored against a profile."""
+
+    role: Dict[str, Any]
+    comparison: SkillComparison
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "role_id": self.role.get("id"),
+            "role_title": self.role.get("role_title") or self.role.get("role_name"),
+            **self.comparison.as_dict(),
+        }
+
+
+class RoleSkillMatrix:
+    """Role requirements as a sparse role x skill matrix."""
+
+    def __init__(self, vocabulary: SkillVocabulary, roles: Sequence[Dict[str, Any]]):
+        self.vocabulary = vocabulary
+        self.roles = list(roles)
+        skills, weights, starts = [], [], [0]
+        for role in self.roles:
+            required = vocabulary.encode(role.get("required_skills") or [], add=True)
+            preferred = np.setdiff1d(
+                vocabulary.encode(role.get("preferred_skills") or [], add=True),
+                required,
+                assume_unique=True,
+            )
+            skills += [required, preferred]
+            weights += [np.ones(len(required)), np.full(len(preferred), PREFERRED_SKILL_WEIGHT)]
+            starts.append(starts[-1] + len(required) + len(preferred))
+
+        # Entries of role i are skill_ids[indptr[i]:indptr[i + 1]], required first
+        self.indptr = np.array(starts, dtype=np.int64)
+        self.skill_ids = (
+            np.concatenate(skills).astype(np.int32) if skills else np.zeros(0, np.int32)
+        )
+        self.weights = np.concatenate(weights) if weights else np.zeros(0)
+        self.role_of = np.repeat(np.arange(len(self.roles)), np.diff(self.indptr))
+        self.required = self.weights == 1.0
+        self.total_weight = np.bincount(
+            self.role_of, weights=self.weights, minlength=len(self.roles)
+        )
+        self.required_count = np.bincount(
+            self.role_of, weights=self.required, minlength=len(self.roles)
+        )
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def score(self, have_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted coverage (0-1) and required-skill match share (0-1) of every role."""
+        held = np.zeros(len(self.vocabulary), dtype=bool)
+        held[have_ids] = True
+        hit = held[self.skill_ids]
+        n = len(self.roles)
+        matched_weight = np.bincount(self.role_of, weights=self.weights * hit, minlength=n)
+        matched_required = np.bincount(self.role_of, weights=self.required & hit, minlength=n)
+        coverage = np.divide(
+            matched_weight, self.total_weight, out=np.zeros(n), where=self.total_weight > 0
+        )
+        required_share = np.divide(
+            matched_required, self.required_count, out=np.zeros(n), where=self.required_count > 0
+        )
+        return coverage, required_share
+
+    def evaluate(
+        self, have: Iterable[str], limit: int = 10, min_coverage: float = 0.0
+    ) -> List[RoleFit]:
+        """The ``limit`` roles the profile covers best, with their gaps."""
+        have_ids = self.vocabulary.encode(have)
+        coverage, required_share = self.score(have_ids)
+        candidates = (
+            np.flatnonzero(coverage >= min_coverage) if min_coverage > 0 else np.arange(len(self))
+        )
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-coverage[candidates], limit - 1)[:limit]]
+        order = candidates[np.lexsort((candidates, -coverage[candidates]))]
+
+        held = np.zeros(len(self.vocabulary), dtype=bool)
+        held[have_ids] = True
+        fits = []
+        for i in order:
+            ids = self.skill_ids[self.indptr[i] : self.indptr[i + 1]]
+            required = self.required[self.indptr[i] : self.indptr[i + 1]]
+            hit = held[ids]
+            names = self.vocabulary.decode(ids)
+            fits.append(
+                RoleFit(
+                    role=self.roles[i],
+                    comparison=SkillComparison(
+                        matching=[n for n, h in zip(names, hit) if h],
+                        missing_required=[
+                            n for n, h, r in zip(names, hit, required) if r and not h
+                        ],
+                        missing_preferred=[
+                            n for n, h, r in zip(names, hit, required) if not r and not h
+                        ],
+                        match_percentage=float(required_share[i] * 100),
+                        coverage=float(coverage[i]),
+                    ),
+                )
+            )
+        return fits
+
+
+@dataclass
+class SkillIndex:
+    """Vocabulary and role matrix built from one pair of reference snapshots."""
+
+    vocabulary: SkillVocabulary
+    roles: RoleSkillMatrix
+
+    def compare(
+        self, have: Iterable[str], required: Iterable[str], preferred: Iterable[str] = ()
+    ) -> SkillComparison:
+        return compare_skills(self.vocabulary, have, required, preferred)
+
+    def coverage(
+        self, have: Iterable[str], requirements: Sequence[Tuple[Iterable[str], Iterable[str]]]
+    ) -> np.ndarray:
+        return batch_coverage(self.vocabulary, have, requirements)
+
+    def evaluate(
+        self, have: Iterable[str], limit: int = 10, min_coverage: float = 0.0
+    ) -> List[RoleFit]:
+        return self.roles.evaluate(have, limit, min_coverage)
+
+    def unrecognized(self, skills: Iterable[str]) -> List[str]:
+        return [
+            s for s in skills if normalize_skill(s or "") and self.vocabulary.resolve(s) is None
+        ]
+
+
+class SkillsEngine:
+    """Keeps a SkillIndex in step with the reference data snapshots."""
+
+    def __init__(self, reference=None):
+        self._reference = reference
+        self._sources: Optional[Tuple[Any, Any]] = None
+        self._index: Optional[SkillIndex] = None
+
+    @property
+    def reference(self):
+        if self._reference is not None:
+            return self._reference
+        from .reference_data import reference_data
+
+        return reference_data
+
+    async def index(self) -> SkillIndex:
+        """Index over the current snapshots, rebuilt only when one was reloaded."""
+        skills = await self.reference.snapshot("skills_mapping")
+        roles = await self.reference.snapshot("role_requirements")
+        if (
+            self._index is None
+            or self._sources is None
+            or (self._sources[0] is not skills or self._sources[1] is not roles)
+        ):
+            vocabulary = SkillVocabulary.from_skills_mapping(skills.rows)
+            self._index = SkillIndex(vocabulary, RoleSkillMatrix(vocabulary, roles.rows))
+            self._sources = (skills, roles)
+            logger.info(f"Built skill index: {len(vocabulary)} skills, {len(roles.rows)} roles")
+        return self._index
+
+
+skills_engine = SkillsEngine()
@@ -0,0 +1,268 @@
+"""
+Buffered view counting for knowledge resources.
+
+Reading a resource used to write to the database twice per request: a
+read-modify-write of ``knowledge_resources.view_count`` (concurrent readers
+lost increments) and an insert into ``resource_views``. Views are now
+buffered in Redis and written in batches:
+
+- ``SET <prefix>:seen:<resource>:<viewer> NX EX`` drops repeat views by the
+  same user within the dedupe window
+- ``HINCRBY <prefix>:counts:<bucket> <resource> 1`` counts per time bucket
+- ``RPUSH <prefix>:events <event>`` keeps the raw event with an ``event_id``
+
+A background flusher claims the buffers with ``RENAME``, adds the summed
+counts through the ``increment_resource_view_counts`` RPC, bulk-inserts the
+events, and deletes the claimed keys only once the database has them.
+
+Delivery is at least once. A failed flush leaves its claimed keys for the
+next one; replayed events are ignored (``event_id`` is unique), while a
+count batch applied just before a crash is applied again. When Redis is
+unavailable a view is written straight to the database.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import ResponseError, WatchError
+
+from ..database.supabase_client import supabase
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+VIEW_FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "10"))
+VIEW_DEDUPE_SECONDS = int(os.getenv("VIEW_DEDUPE_SECONDS", "300"))
+VIEW_BUCKET_SECONDS = 60
+VIEW_EVENT_BATCH_SIZE = 500
+VIEW_FLUSH_LOCK_SECONDS = 60
+
+
+class ViewCounter:
+    """Redis-buffered view counts and events with a periodic batch flush."""
+
+    def __init__(
+        self,
+        flush_interval: float = VIEW_FLUSH_INTERVAL,
+        dedupe_seconds: int = VIEW_DEDUPE_SECONDS,
+        bucket_seconds: int = VIEW_BUCKET_SECONDS,
+        batch_size: int = VIEW_EVENT_BATCH_SIZE,
+        redis=None,
+        prefix: str = "resource_views",
+    ):
+        self.flush_interval = flush_interval
+        self.dedupe_seconds = dedupe_seconds
+        self.bucket_seconds = bucket_seconds
+        self.batch_size = batch_size
+        self.prefix = prefix
+        self._redis = redis
+        self._flusher: Optional[asyncio.Task] = None
+        self.stats = {
+            "recorded": 0,
+            "deduplicated": 0,
+            "direct_writes": 0,
+            "flushes": 0,
+            "flushed_views": 0,
+            "flushed_events": 0,
+            "flush_errors": 0,
+        }
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from ..database.redis_client import redis_client
+
+            self._redis = redis_client
+        return self._redis
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix, *parts))
+
+    async def record(
+        self,
+        resource_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        resource_type: str = "knowledge_resource",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Buffer one view; returns False if it was a repeat within the dedupe window."""
+        now = datetime.now(timezone.utc)
+        event = {
+            "event_id": str(uuid.uuid4()),
+            "resource_id": resource_id,
+            "resource_type": resource_type,
+            "user_id": user_id,
+            "session_id": session_id,
+            "viewed_at": now.isoformat(),
+            "interaction_metadata": metadata or {},
+        }
+        bucket = str(int(now.timestamp()) // self.bucket_seconds)
+        viewer = user_id or session_id
+
+        try:
+            async with self.redis.get_connection() as client:
+                if viewer and self.dedupe_seconds > 0:
+                    first = await client.set(
+                        self._key("seen", resource_id, viewer),
+                        1,
+                        nx=True,
+                        ex=self.dedupe_seconds,
+                    )
+                    if not first:
+                        self.stats["deduplicated"] += 1
+                        return False
+                pipe = client.pipeline(transaction=True)
+                pipe.sadd(self._key("buckets"), bucket)
+                pipe.hincrby(self._key("counts", bucket), resource_id, 1)
+                pipe.rpush(self._key("events"), json.dumps(event))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"View buffering failed, writing directly: {e}")
+            await self._write_direct(event)
+            return True
+
+        self.stats["recorded"] += 1
+        self._ensure_flusher()
+        return True
+
+    async def _write_direct(self, event: Dict[str, Any]) -> None:
+        try:
+            supabase.rpc(
+                "increment_resource_view_counts", {"increments": {event["resource_id"]: 1}}
+            ).execute()
+            supabase.table("resource_views").upsert(
+                [event], on_conflict="event_id", ignore_duplicates=True
+            ).execute()
+            self.stats["direct_writes"] += 1
+        except Exception as e:
+            logger.error(f"Direct view write failed: {e}")
+
+    def _ensure_flusher(self) -> None:
+        if self.flush_interval <= 0 or (self._flusher and not self._flusher.done()):
+            return
+        self._flusher = asyncio.get_running_loop().create_task(self._run_flusher())
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> Dict[str, int]:
+        """Write buffered counts and events; returns how many of each were written."""
+        flushed = {"views": 0, "events": 0}
+        lock, token = self._key("flush_lock"), uuid.uuid4().hex
+        try:
+            async with self.redis.get_connection() as client:
+                # One flusher at a time across workers
+                if not await client.set(lock, token, nx=True, ex=VIEW_FLUSH_LOCK_SECONDS):
+                    return flushed
+                try:
+                    for name, step in (
+                        ("views", self._flush_counts),
+                        ("events", self._flush_events),
+                    ):
+                        try:
+                            flushed[name] = await step(client)
+                        except Exception as e:
+                            self.stats["flush_errors"] += 1
+                            logger.warning(f"View {name} flush failed: {e}")
+                finally:
+                    if await client.get(lock) == token:
+                        await client.delete(lock)
+        except Exception as e:
+            self.stats["flush_errors"] += 1
+            logger.warning(f"View flush failed: {e}")
+            return flushed
+
+        self.stats["flushes"] += 1
+        self.stats["flushed_views"] += flushed["views"]
+        self.stats["flushed_events"] += flushed["events"]
+        return flushed
+
+    async def _claim(self, client, live: str, claimed: str) -> bool:
+        """Move ``live`` to ``claimed`` unless an earlier claim is still pending."""
+        if await client.exists(claimed):
+            return True
+        try:
+            await client.rename(live, claimed)
+            return True
+        except ResponseError:
+            # Nothing buffered since the last flush
+            return False
+
+    async def _flush_counts(self, client) -> int:
+        buckets = sorted(await client.smembers(self._key("buckets")), key=int)
+        increments: Dict[str, int] = {}
+        claimed: List[str] = []
+        for bucket in buckets:
+            held = self._key("counts", bucket, "claimed")
+            if not await self._claim(client, self._key("counts", bucket), held):
+                continue
+            for resource_id, views in (await client.hgetall(held)).items():
+                increments[resource_id] = increments.get(resource_id, 0) + int(views)
+            claimed.append(held)
+
+        if increments:
+            supabase.rpc("increment_resource_view_counts", {"increments": increments}).execute()
+        if claimed:
+            await client.delete(*claimed)
+
+        current = int(time.time()) // self.bucket_seconds
+        for bucket in buckets:
+            if int(bucket) < current:
+                await self._release_bucket(client, bucket)
+        return sum(increments.values())
+
+    async def _release_bucket(self, client, bucket: str) -> None:
+        """Forget a past bucket, unless a late view landed in it meanwhile."""
+        live = self._key("counts", bucket)
+        async with client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(live)
+                if await pipe.exists(live):
+                    return
+                pipe.multi()
+                pipe.srem(self._key("buckets"), bucket)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    async def _flush_events(self, client) -> int:
+        held = self._key("events", "claimed")
+        if not await self._claim(client, self._key("events"), held):
+            return 0
+        written = 0
+        while True:
+            batch = await client.lrange(held, 0, self.batch_size - 1)
+            if not batch:
+                return written
+            supabase.table("resource_views").upsert(
+                [json.loads(event) for event in batch],
+                on_conflict="event_id",
+                ignore_duplicates=True,
+            ).execute()
+            await client.ltrim(held, len(batch), -1)
+            written += len(batch)
+
+    async def stop(self) -> None:
+        """Flush buffered views and stop the background flusher."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+view_counter = ViewCounter()
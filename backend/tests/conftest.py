@@ -2,13 +2,18 @@ import pytest
 from fastapi.testclient import TestClient
 from typing import Generator, Dict, Any
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 import structlog
 import os
 import json
 
-from backend.api.main import app
+import fakeredis
+import fakeredis.aioredis
+
+from backend.database import supabase_client
+from backend.database.local_supabase import LocalSupabase
 from backend.database.supabase_client import supabase
 from backend.database.redis_client import redis_client
 from backend.api.middleware.auth import verify_token
@@ -28,6 +33,8 @@ logger = structlog.get_logger(__name__)
 @pytest.fixture
 def test_client() -> Generator[TestClient, None, None]:
     """Create a test client for FastAPI endpoints"""
+    from backend.api.main import app
+
     with TestClient(app) as client:
         yield client
 
@@ -143,6 +150,48 @@ async def redis_test():
         await redis_client.delete(*test_keys)
 
 
+class FakeRedisClient:
+    """Exposes fakeredis through the RedisClient connection interface."""
+
+    def __init__(self, server=None):
+        self.client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.client
+
+
+@pytest.fixture
+def redis_server():
+    """One fakeredis server per test, shared by every client made from it."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def make_fake_redis(redis_server):
+    """Factory for RedisClient stand-ins on the test's fakeredis server, one per worker."""
+    return lambda: FakeRedisClient(redis_server)
+
+
+@pytest.fixture
+def fake_redis(make_fake_redis):
+    """RedisClient stand-in backed by fakeredis."""
+    return make_fake_redis()
+
+
+@pytest.fixture
+def local_db(monkeypatch):
+    """Empty in-process Supabase installed as the shared client.
+
+    Test modules override this fixture to seed their rows, requesting it by
+    the same name.
+    """
+    client = LocalSupabase()
+    monkeypatch.setattr(supabase_client.supabase, "_client", client)
+    yield client
+    client.close()
+
+
 @pytest.fixture
 def event_loop():
     """Create event loop for async tests"""
@@ -265,6 +314,7 @@ def mock_auth_token(mock_user: Dict[str, Any]) -> str:
 @pytest.fixture
 def mock_verify_token(mock_user: Dict[str, Any]) -> None:
     """Mock the verify_token dependency."""
+    from backend.api.main import app
 
     async def mock_verify(*args, **kwargs):
         return mock_user["id"]
@@ -0,0 +1,130 @@
+"""
+Tests for the rolling conversation context cache.
+"""
+
+import pytest
+
+from backend.services.conversation_context import (
+    ConversationContextCache,
+    format_budgeted_context,
+    format_enhanced_context,
+)
+from backend.utils.tokens import count_tokens
+
+
+@pytest.fixture
+def cache(fake_redis):
+    """Create a context cache backed by fakeredis."""
+    return ConversationContextCache(redis=fake_redis, window_size=4)
+
+
+def make_rows(count):
+    """Alternate user and assistant rows."""
+    rows = []
+    for i in range(count):
+        if i % 2 == 0:
+            rows.append({"role": "user", "content": f"question {i}"})
+        else:
+            rows.append({"role": "assistant", "content": f"answer {i}", "specialist_type": "pendo"})
+    return rows
+
+
+class TestConversationContextCache:
+    """Tests for the Redis-backed context window."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_once_then_hits(self, cache):
+        """The database loader only runs on the first read."""
+        calls = []
+
+        async def loader(conversation_id, count):
+            calls.append(count)
+            return make_rows(4)
+
+        first = await cache.get_context("conv-1", "enhanced", 2, loader)
+        second = await cache.get_context("conv-1", "enhanced", 2, loader)
+
+        assert first == second == format_enhanced_context(make_rows(4), 2)
+        assert calls == [4]
+        assert cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_append_refreshes_prompt(self, cache):
+        """Writes update the prebuilt string so reads never rebuild it."""
+
+        async def loader(conversation_id, count):
+            return make_rows(2)
+
+        await cache.get_context("conv-1", "enhanced", 2, loader)
+        await cache.append("conv-1", {"role": "user", "content": "new question"})
+        await cache.append(
+            "conv-1", {"role": "assistant", "content": "new answer", "agent": "marcus"}
+        )
+
+        prompt = await cache.get_prompt("conv-1", "enhanced", 2)
+        assert "marcus: new answer" in prompt
+        assert cache.stats["rebuilds"] == 0
+
+    @pytest.mark.asyncio
+    async def test_window_is_capped(self, cache):
+        """Only the most recent messages are retained."""
+
+        async def loader(conversation_id, count):
+            return []
+
+        await cache.get_context("conv-1", "coordinator", 5, loader)
+        for row in make_rows(10):
+            await cache.append("conv-1", row)
+
+        stored = await cache.redis.client.lrange(cache._messages_key("conv-1"), 0, -1)
+        assert len(stored) == 4
+
+    @pytest.mark.asyncio
+    async def test_append_before_prime_is_ignored(self, cache):
+        """Unprimed conversations are left for the database fallback."""
+        await cache.append("conv-2", {"role": "user", "content": "hello"})
+
+        assert await cache.get_prompt("conv-2", "enhanced", 3) is None
+
+
+class TestBudgetedContext:
+    """Tests for the summary-plus-recent-turns formatter."""
+
+    def test_respects_token_budget(self):
+        """Older turns are dropped once the budget is spent."""
+        rows = [
+            {"role": "user", "content": "word " * 50, "created_at": f"2025-01-01T00:00:{i:02d}"}
+            for i in range(20)
+        ]
+
+        prompt = format_budgeted_context(rows, 120)
+
+        assert count_tokens(prompt) <= 130
+        assert prompt.count("User:") < len(rows)
+
+    def test_skips_turns_covered_by_summary(self):
+        """Turns at or before the summary watermark are not repeated."""
+        rows = [
+            {"role": "user", "content": "old question", "created_at": "2025-01-01T00:00:01"},
+            {"role": "user", "content": "new question", "created_at": "2025-01-01T00:00:02"},
+        ]
+        summary = {"text": "User asked about solar jobs.", "through": "2025-01-01T00:00:01"}
+
+        prompt = format_budgeted_context(rows, 200, summary)
+
+        assert prompt.startswith("Earlier conversation summary: User asked about solar")
+        assert "new question" in prompt
+        assert "old question" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_set_summary_rebuilds_cached_prompt(self, cache):
+        """A new summary is reflected in the cached budgeted string."""
+
+        async def loader(conversation_id, count):
+            return make_rows(2)
+
+        await cache.get_context("conv-1", "budgeted", 200, loader)
+        await cache.set_summary("conv-1", {"text": "Veteran exploring wind roles."})
+
+        prompt = await cache.get_prompt("conv-1", "budgeted", 200)
+        assert "Veteran exploring wind roles." in prompt
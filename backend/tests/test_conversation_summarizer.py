@@ -0,0 +1,121 @@
+"""
+Tests for incremental rolling conversation summarization.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from backend.services.conversation_context import ConversationContextCache
+from backend.services.conversation_summarizer import ConversationSummarizer
+from backend.utils.tokens import count_tokens
+
+
+class StubModel:
+    """Chat model stub that records the prompts it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        await asyncio.sleep(0.01)
+        return AIMessage(content=f"summary #{len(self.calls)}")
+
+
+class InMemorySummarizer(ConversationSummarizer):
+    """Summarizer reading messages from a list instead of Supabase."""
+
+    def __init__(self, messages, **kwargs):
+        super().__init__(**kwargs)
+        self.messages = messages
+        self.persisted = {}
+
+    async def _load_messages_after(self, conversation_id, through):
+        return [m for m in self.messages if not through or m["created_at"] > through]
+
+    async def _load_persisted_summary(self, conversation_id):
+        return self.persisted.get(conversation_id)
+
+    async def _persist_summary(self, conversation_id, summary):
+        self.persisted[conversation_id] = summary
+
+
+def make_messages(count):
+    """Alternate user and assistant messages with increasing timestamps."""
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"message {i} " + "detail " * 40,
+            "specialist_type": None if i % 2 == 0 else "marcus",
+            "created_at": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def summarizer(fake_redis):
+    """Summarizer backed by fakeredis and a stub model."""
+    model = StubModel()
+    return InMemorySummarizer(
+        make_messages(12),
+        redis=fake_redis,
+        model_factory=lambda: model,
+        trigger_tokens=200,
+        keep_recent=4,
+        context_cache=ConversationContextCache(redis=fake_redis),
+    )
+
+
+class TestConversationSummarizer:
+    """Tests for the background summary fold."""
+
+    @pytest.mark.asyncio
+    async def test_threshold_triggers_single_fold(self, summarizer):
+        """Crossing the token threshold folds older turns exactly once."""
+        for message in summarizer.messages:
+            await summarizer.record_message("conv-1", message)
+        await asyncio.gather(*summarizer._tasks)
+
+        summary = await summarizer.get_summary("conv-1")
+        assert summary["text"].startswith("summary #")
+        assert summary["through"] == summarizer.messages[-5]["created_at"]
+        assert summary["message_count"] == 8
+        assert summarizer.persisted["conv-1"] == summary
+        assert summarizer.stats["folds"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_fold_is_incremental(self, summarizer):
+        """A second fold only sends turns newer than the previous watermark."""
+        await summarizer.fold("conv-1")
+        model = summarizer._get_model()
+        summarizer.messages.extend(make_messages(20)[12:])
+
+        await summarizer.fold("conv-1")
+
+        second_prompt = model.calls[1][1].content
+        assert "summary #1" in second_prompt
+        assert "message 0 " not in second_prompt
+        assert "message 8 " in second_prompt
+
+    @pytest.mark.asyncio
+    async def test_locked_conversation_is_skipped(self, summarizer):
+        """Another worker holding the fold lock prevents a duplicate fold."""
+        await summarizer.redis.client.set(summarizer._lock_key("conv-1"), "1")
+
+        assert await summarizer.fold("conv-1") is None
+        assert summarizer.stats["skipped_locked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_fold_resyncs_pending_tokens(self, summarizer):
+        """With only recent turns to keep, the counter drops to their tokens."""
+        summarizer.messages[:] = summarizer.messages[:2]
+        await summarizer.redis.client.set(summarizer._pending_key("conv-1"), 5000)
+
+        assert await summarizer.fold("conv-1") is None
+
+        pending = int(await summarizer.redis.client.get(summarizer._pending_key("conv-1")))
+        assert pending == sum(count_tokens(m["content"]) for m in summarizer.messages)
+        assert pending < summarizer.trigger_tokens
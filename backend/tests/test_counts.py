@@ -0,0 +1,109 @@
+"""
+Tests for listing total counts.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.api import counts
+from backend.api.counts import Total, count_rows
+from backend.api.routes.jobs import get_job_listings
+from backend.database.local_seed import seed_job_listings
+
+
+@pytest.fixture
+def local_db(local_db):
+    seed_job_listings(local_db, 300, seed=4)
+    return local_db
+
+
+@pytest.fixture
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(counts, "redis_client", fake_redis)
+    return fake_redis
+
+
+def _rows(db, **eq):
+    query = db.table("job_listings").select("id")
+    for column, value in eq.items():
+        query = query.eq(column, value)
+    return len(query.execute().data)
+
+
+class TestCountRows:
+    """Tests for count_rows()"""
+
+    @pytest.mark.asyncio
+    async def test_small_sets_are_counted_exactly(self, local_db, redis):
+        total = await count_rows("job_listings", [("eq", "status", "closed")], exact_limit=100)
+
+        assert total == Total(_rows(local_db, status="closed"), True)
+
+    @pytest.mark.asyncio
+    async def test_large_filtered_sets_are_estimated(self, local_db, redis):
+        """Above the limit the planned count is used, never below the proven bound"""
+        total = await count_rows("job_listings", [("eq", "status", "active")], exact_limit=100)
+
+        assert not total.exact
+        assert total.value >= 101
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_totals_use_the_row_estimate(self, local_db, redis):
+        local_db.register_rpc("estimated_row_count", lambda store, table_name: 123456)
+
+        assert await count_rows("job_listings", exact_limit=100) == Total(123456, False)
+
+    @pytest.mark.asyncio
+    async def test_small_tables_ignore_a_stale_estimate(self, local_db, redis):
+        """A low or missing estimate falls back to an exact count"""
+        for estimate in (5, None):
+            local_db.register_rpc("estimated_row_count", lambda store, table_name: estimate)
+            total = await count_rows("job_listings", exact_limit=1000, ttl=0)
+
+            assert total == Total(300, True)
+
+    @pytest.mark.asyncio
+    async def test_totals_are_memoized_per_filter_signature(self, local_db, redis):
+        filters = [("eq", "status", "closed"), ("eq", "experience_level", "entry_level")]
+        first = await count_rows("job_listings", filters)
+        local_db.table("job_listings").insert(
+            {"id": "new", "status": "closed", "experience_level": "entry_level"}
+        ).execute()
+
+        assert await count_rows("job_listings", list(reversed(filters))) == first
+        assert (await count_rows("job_listings", filters[:1])).value == _rows(
+            local_db, status="closed"
+        )
+        assert len(await redis.client.keys("counts:job_listings:*")) == 2
+
+    @pytest.mark.asyncio
+    async def test_counts_without_redis(self, local_db):
+        class DownRedis:
+            @asynccontextmanager
+            async def get_connection(self):
+                raise ConnectionError("redis down")
+                yield
+
+        total = await count_rows("job_listings", [("eq", "status", "closed")], redis=DownRedis())
+
+        assert total == Total(_rows(local_db, status="closed"), True)
+
+
+class TestJobListingTotals:
+    """Tests for the total on /jobs/listings"""
+
+    @pytest.mark.asyncio
+    async def test_total_respects_filters(self, local_db, redis):
+        result = await get_job_listings(
+            limit=10,
+            offset=0,
+            cursor=None,
+            status="closed",
+            location=None,
+            remote_work_preference=None,
+            user_id="user-1",
+        )
+
+        assert result["pagination"]["total"] == _rows(local_db, status="closed")
+        assert result["pagination"]["total_is_exact"] is True
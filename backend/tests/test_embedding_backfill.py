@@ -0,0 +1,224 @@
+"""
+Tests for the batch embedding backfill.
+"""
+
+import pytest
+
+from backend.adapters.stub import StubEmbeddings
+from backend.config import supabase as config_supabase
+from backend.database import supabase_client
+from backend.database.local_supabase import LocalSupabase
+from backend.services.embedding_backfill import EmbeddingBackfill, main
+from backend.services.embeddings import embedding_model_id
+from backend.services.job_matching import content_hash, job_embedding_text
+from backend.tools.simple_resume_processor import SimpleResumeProcessor
+
+MODEL = "stub-embedding:2"
+
+
+class Interrupted(BaseException):
+    """Stops a run the way a signal would, past the per-batch error handling."""
+
+
+class FakeEmbeddingService:
+    """EmbeddingService interface over stub embeddings, recording batches."""
+
+    def __init__(self, fail_on=(), fail_after=None):
+        self.model = StubEmbeddings(dimensions=16, latency_ms=0)
+        self.fail_on = set(fail_on)
+        self.fail_after = fail_after
+        self.batches = []
+
+    async def embed_texts(self, texts):
+        if self.fail_after is not None and len(self.batches) >= self.fail_after:
+            raise Interrupted
+        if self.fail_on.intersection(texts):
+            raise ValueError("input rejected")
+        self.batches.append(list(texts))
+        return self.model.embed_documents(texts)
+
+
+@pytest.fixture
+def local_db(local_db):
+    local_db.table("job_listings").insert(
+        [
+            {"id": f"j{i:02d}", "title": f"Job {i}", "description": "Install heat pumps"}
+            for i in range(10)
+        ]
+    ).execute()
+    return local_db
+
+
+def _embedded(db, table="job_listing_embeddings"):
+    return {row["id"]: row for row in db.table(table).select("*").execute().data}
+
+
+def _backfill(target="job_listings", embeddings=None, **options):
+    options = {"page_size": 4, "batch_size": 3, "concurrency": 2, **options}
+    options.setdefault("model", MODEL)
+    return EmbeddingBackfill(target, embeddings=embeddings or FakeEmbeddingService(), **options)
+
+
+class TestEmbeddingBackfill:
+    """Tests for EmbeddingBackfill"""
+
+    @pytest.mark.asyncio
+    async def test_embeds_only_stale_rows(self, local_db):
+        """Rows of another model or with changed text are re-embedded; current ones are skipped"""
+        current = {"id": "j01", "title": "Job 1", "description": "Install heat pumps"}
+        local_db.table("job_listing_embeddings").insert(
+            [
+                {
+                    "id": "j00",
+                    "embedding": [0.0] * 16,
+                    "embedding_model": "old:1",
+                    "content_hash": content_hash(
+                        job_embedding_text({"title": "Job 0", "description": "Install heat pumps"})
+                    ),
+                },
+                {
+                    "id": "j01",
+                    "embedding": [0.0] * 16,
+                    "embedding_model": MODEL,
+                    "content_hash": content_hash(job_embedding_text(current)),
+                },
+                {
+                    "id": "j02",
+                    "embedding": [0.0] * 16,
+                    "embedding_model": MODEL,
+                    "content_hash": "edited",
+                },
+            ]
+        ).execute()
+        embeddings = FakeEmbeddingService()
+
+        report = await _backfill(embeddings=embeddings).run()
+
+        stored = _embedded(local_db)
+        assert report["rows_scanned"] == 10
+        assert report["rows_embedded"] == 9
+        assert stored["j01"]["embedding"] == [0.0] * 16
+        assert {row["embedding_model"] for row in stored.values()} == {MODEL}
+        assert all(len(batch) <= 3 for batch in embeddings.batches)
+        assert report["models"] == [{"embedding_model": MODEL, "row_count": 10}]
+        assert report["mixed_models"] is False
+
+    @pytest.mark.asyncio
+    async def test_batches_are_bounded_by_characters(self, local_db):
+        embeddings = FakeEmbeddingService()
+        text = len(job_embedding_text({"title": "Job 0", "description": "Install heat pumps"}))
+
+        await _backfill(embeddings=embeddings, batch_size=10, batch_chars=2 * text).run()
+
+        assert [len(batch) for batch in embeddings.batches] == [2, 2, 2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_writes_nothing(self, local_db):
+        embeddings = FakeEmbeddingService()
+
+        report = await _backfill(embeddings=embeddings, dry_run=True).run()
+
+        assert report["rows_stale"] == 10
+        assert report["rows_embedded"] == 0
+        assert embeddings.batches == []
+        assert _embedded(local_db) == {}
+        assert local_db.table("embedding_backfill_runs").select("*").execute().data == []
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes_after_last_page(self, local_db):
+        """Pages written before the interruption are neither re-read nor re-embedded"""
+        with pytest.raises(Interrupted):
+            await _backfill(embeddings=FakeEmbeddingService(fail_after=3), concurrency=1).run()
+
+        checkpoint = local_db.table("embedding_backfill_runs").select("*").execute().data[0]
+        assert checkpoint["status"] == "interrupted"
+        assert checkpoint["last_id"] == "j03"
+        assert set(_embedded(local_db)) == {"j00", "j01", "j02", "j03"}
+
+        embeddings = FakeEmbeddingService()
+        report = await _backfill(embeddings=embeddings).run()
+
+        assert report["resumed_after"] == "j03"
+        assert sum(len(batch) for batch in embeddings.batches) == 6
+        assert report["rows_scanned"] == 10
+        assert len(_embedded(local_db)) == 10
+        checkpoint = local_db.table("embedding_backfill_runs").select("*").execute().data[0]
+        assert checkpoint["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_failing_row_is_isolated(self, local_db):
+        """A rejected batch is split until only the bad row is left out"""
+        bad = job_embedding_text({"title": "Job 4", "description": "Install heat pumps"})
+
+        report = await _backfill(embeddings=FakeEmbeddingService(fail_on=[bad])).run()
+
+        assert report["rows_failed"] == 1
+        assert report["rows_embedded"] == 9
+        assert "j04" not in _embedded(local_db)
+
+    @pytest.mark.asyncio
+    async def test_embeddings_on_the_row_are_updated_in_place(self, local_db):
+        local_db.table("resume_chunks").insert(
+            [
+                {
+                    "id": "c1",
+                    "resume_id": "r1",
+                    "content": "Led a solar crew",
+                    "embedding": [0.0] * 16,
+                    "embedding_model": "old:1",
+                },
+                {
+                    "id": "c2",
+                    "resume_id": "r1",
+                    "content": "Wired substations",
+                    "embedding": [0.0] * 16,
+                    "embedding_model": MODEL,
+                },
+            ]
+        ).execute()
+
+        report = await _backfill("resume_chunks").run()
+
+        chunks = _embedded(local_db, "resume_chunks")
+        assert report["rows_embedded"] == 1
+        assert chunks["c1"]["embedding_model"] == MODEL
+        assert chunks["c1"]["content"] == "Led a solar crew"
+        assert chunks["c1"]["embedding"] != [0.0] * 16
+        assert chunks["c2"]["embedding"] == [0.0] * 16
+
+    @pytest.mark.asyncio
+    async def test_processed_resume_chunks_are_current(self, local_db):
+        """Chunks written at upload record their model, so a backfill leaves them alone"""
+        processor = SimpleResumeProcessor.__new__(SimpleResumeProcessor)
+        processor.embeddings = StubEmbeddings(dimensions=16, latency_ms=0)
+        processor.supabase = local_db
+
+        await processor.store_chunks("r1", [{"text": "Led a solar crew", "metadata": {}}])
+        report = await _backfill("resume_chunks", model=embedding_model_id(), dry_run=True).run()
+
+        assert report["rows_scanned"] == 1
+        assert report["rows_stale"] == 0
+        assert report["models"] == [{"embedding_model": embedding_model_id(), "row_count": 1}]
+
+    def test_cli_reports_mixed_models(self, tmp_path, capsys, monkeypatch):
+        # --database installs the stand-in process-wide; restore the clients afterwards
+        monkeypatch.setattr(
+            supabase_client.SupabaseClient, "_client", supabase_client.SupabaseClient._client
+        )
+        monkeypatch.setattr(supabase_client.supabase, "_client", supabase_client.supabase._client)
+        monkeypatch.setattr(config_supabase, "_supabase_client", config_supabase._supabase_client)
+        database = str(tmp_path / "local.db")
+        client = LocalSupabase(database)
+        client.table("knowledge_resources").insert(
+            [
+                {"id": "k1", "title": "Heat pumps", "embedding": [0.1], "embedding_model": "old:1"},
+                {"id": "k2", "title": "Solar", "embedding": [0.1], "embedding_model": "new:1"},
+            ]
+        ).execute()
+        client.close()
+
+        report = main(["knowledge_resources", "--dry-run", "--database", database])
+
+        assert report["rows_stale"] == 2
+        assert report["mixed_models"] is True
+        assert '"rows_per_s"' in capsys.readouterr().out
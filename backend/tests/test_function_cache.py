@@ -0,0 +1,157 @@
+"""
+Tests for the bounded async function cache.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.utils.cache import AsyncTTLCache, make_cache_key
+from backend.utils.optimization import OptimizationManager
+
+
+class TestAsyncTTLCache:
+    """Tests for LRU bounds, TTL and stampede protection."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        """Only one of many concurrent misses runs the computation."""
+        cache = AsyncTTLCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"programs": ["MassCEC"]}
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("popular", compute) for _ in range(50))
+        )
+
+        assert calls == 1
+        assert all(r == {"programs": ["MassCEC"]} for r in results)
+        assert cache.stats["coalesced"] == 49
+
+    def test_lru_eviction_by_count_and_memory(self):
+        """The least recently used entries are evicted past either bound."""
+        cache = AsyncTTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "b" not in cache and "a" in cache and "c" in cache
+
+        small = AsyncTTLCache(max_bytes=2000)
+        for i in range(10):
+            small.set(i, "x" * 500)
+
+        assert len(small) < 10
+        assert small.get_stats()["bytes"] <= 2000
+        assert 9 in small
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_recompute(self):
+        """Entries past their TTL are recomputed."""
+        cache = AsyncTTLCache()
+        values = iter([1, 2])
+
+        async def compute():
+            return next(values)
+
+        assert await cache.get_or_compute("k", compute, ttl=0.01) == 1
+        await asyncio.sleep(0.02)
+        assert await cache.get_or_compute("k", compute, ttl=0.01) == 2
+        assert cache.stats["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """A stale entry is served while one background refresh runs."""
+        cache = AsyncTTLCache()
+        values = iter([1, 2])
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return next(values)
+
+        await cache.get_or_compute("k", compute, ttl=0.05, stale_ttl=5)
+        await asyncio.sleep(0.06)
+
+        stale = await asyncio.gather(
+            *(cache.get_or_compute("k", compute, ttl=0.05, stale_ttl=5) for _ in range(5))
+        )
+        await asyncio.sleep(0.02)
+
+        assert stale == [1] * 5
+        assert cache.stats["refreshes"] == 1
+        assert cache.get("k") == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """A failed computation propagates and the next call retries."""
+        cache = AsyncTTLCache()
+
+        async def fail():
+            raise RuntimeError("database unavailable")
+
+        async def succeed():
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", fail)
+        assert await cache.get_or_compute("k", succeed) == "ok"
+
+
+class TestCacheFunction:
+    """Tests for the OptimizationManager.cache_function decorator."""
+
+    @pytest.mark.asyncio
+    async def test_decorated_function_with_unhashable_args(self):
+        """Dict arguments are keyed by content."""
+        manager = OptimizationManager()
+        calls = []
+
+        @manager.cache_function(ttl=60)
+        async def search(filters, limit=10):
+            calls.append(filters)
+            return [filters["location"]] * limit
+
+        await search({"location": "Boston"}, limit=2)
+        await search({"location": "Boston"}, limit=2)
+        await search({"location": "Worcester"}, limit=2)
+
+        assert len(calls) == 2
+        assert manager.get_cache_stats()["hits"] == 1
+
+    def test_hashable_keys_skip_serialization(self):
+        """Hashable arguments form the key directly."""
+        key = make_cache_key("f", (1, "a"), {"x": 2})
+        assert key == make_cache_key("f", (1, "a"), {"x": 2})
+        assert (tuple, (("int", 1), ("str", "a"))) in key
+        assert make_cache_key("f", ([1],)) == make_cache_key("f", ([1],))
+
+    @pytest.mark.asyncio
+    async def test_equal_values_of_different_types_are_cached_apart(self):
+        """1, True and 1.0 hash alike but are separate calls."""
+        manager = OptimizationManager()
+
+        @manager.cache_function(ttl=60)
+        async def describe(value, flag=0):
+            return repr(value), repr(flag)
+
+        results = [await describe(v) for v in (1, True, 1.0)]
+        results += [await describe(1, flag=f) for f in (1, True)]
+        results.append(await describe((1,)))
+        results.append(await describe((True,)))
+
+        assert results == [
+            ("1", "0"),
+            ("True", "0"),
+            ("1.0", "0"),
+            ("1", "1"),
+            ("1", "True"),
+            ("(1,)", "0"),
+            ("(True,)", "0"),
+        ]
+        assert len({make_cache_key("f", (v,)) for v in (1, True, 1.0)}) == 3
@@ -0,0 +1,144 @@
+"""
+Tests for hedged requests and failover between providers.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from backend.adapters.hedging import HedgedChatModel
+from backend.adapters.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    GuardedChatModel,
+    ProviderGuard,
+)
+
+
+class StubProvider:
+    """Chat model stub with fixed latency that records cancellations."""
+
+    def __init__(self, name, latency, fail=False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ConnectionError(f"{self.name} down")
+        return AIMessage(content=self.name)
+
+    async def astream(self, messages, config=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail:
+                raise ConnectionError(f"{self.name} down")
+            for word in (self.name, " done"):
+                yield AIMessageChunk(content=word)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def hedged(primary, secondary, **kwargs):
+    kwargs.setdefault("default_delay", 0.05)
+    kwargs.setdefault("min_delay", 0.01)
+    kwargs.setdefault("max_hedge_rate", 1.0)
+    return HedgedChatModel(primary, secondary, "deepseek", "openai", **kwargs)
+
+
+class TestHedgedChatModel:
+    """Tests for hedging, cancellation and the hedge budget."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_never_hedges(self):
+        """A primary answering within the delay is used alone."""
+        primary, secondary = StubProvider("deepseek", 0.01), StubProvider("openai", 0.01)
+        model = hedged(primary, secondary)
+
+        response = await model.ainvoke("hi")
+
+        assert response.content == "deepseek"
+        assert secondary.calls == 0
+        assert model.stats["hedges_issued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """The secondary wins a hedge and the slow primary is cancelled."""
+        primary, secondary = StubProvider("deepseek", 1.0), StubProvider("openai", 0.01)
+        model = hedged(primary, secondary)
+
+        response = await model.ainvoke("hi")
+
+        assert response.content == "openai"
+        assert primary.cancelled == 1
+        assert model.stats["hedges_issued"] == 1
+        assert model.stats["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_fails_over(self):
+        """A failing primary is replaced by the secondary immediately."""
+        primary = StubProvider("deepseek", 0.0, fail=True)
+        secondary = StubProvider("openai", 0.01)
+        model = hedged(primary, secondary)
+
+        response = await model.ainvoke("hi")
+
+        assert response.content == "openai"
+        assert model.stats["failovers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_rate_is_capped(self):
+        """Once the hedge budget is spent, slow calls wait for the primary."""
+        primary, secondary = StubProvider("deepseek", 0.08), StubProvider("openai", 0.0)
+        model = hedged(primary, secondary, max_hedge_rate=0.25)
+
+        for _ in range(8):
+            await model.ainvoke("hi")
+
+        assert model.stats["hedges_issued"] == 2
+        assert model.stats["hedges_suppressed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_hedges_on_time_to_first_token(self):
+        """Streams switch to whichever provider produces the first chunk."""
+        primary, secondary = StubProvider("deepseek", 1.0), StubProvider("openai", 0.01)
+        model = hedged(primary, secondary)
+
+        chunks = [chunk.content async for chunk in model.astream("hi")]
+
+        assert chunks == ["openai", " done"]
+        assert primary.cancelled == 1
+        assert model.stats["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_is_not_a_provider_failure(self):
+        """Losing hedges leave the primary's breaker closed and its limit unchanged."""
+        guard = ProviderGuard(
+            "deepseek",
+            limiter=AdaptiveConcurrencyLimiter("deepseek", initial_limit=4),
+            breaker=CircuitBreaker("deepseek", min_requests=4),
+        )
+        primary = GuardedChatModel(StubProvider("deepseek", 1.0), guard)
+        model = hedged(primary, StubProvider("openai", 0.01))
+
+        for _ in range(6):
+            assert (await model.ainvoke("hi")).content == "openai"
+        chunks = [chunk.content async for chunk in model.astream("hi")]
+
+        assert chunks == ["openai", " done"]
+        assert primary.model.cancelled == 7
+        assert guard.breaker.state == CircuitBreaker.CLOSED
+        assert guard.breaker.get_stats()["window_requests"] == 0
+        assert guard.limiter.limit == 4
+        assert guard.limiter.in_flight == 0
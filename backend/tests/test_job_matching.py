@@ -0,0 +1,275 @@
+"""
+Tests for resume-to-job matching.
+"""
+
+import numpy as np
+import pytest
+
+from backend.adapters.stub import StubEmbeddings
+from backend.api.routes import jobs
+from backend.services import job_matching
+from backend.services.job_matching import JobMatcher, job_embedding_text, parse_salary_range
+from backend.services.reference_data import ReferenceDataCache
+from backend.services.skills_engine import SkillsEngine
+
+DIMENSIONS = 64
+
+JOBS = [
+    {
+        "id": "j1",
+        "title": "Solar Installer",
+        "description": "Install rooftop solar arrays",
+        "skills_required": ["Solar PV Installation", "Electrical Wiring"],
+        "experience_level": "entry_level",
+        "location": "Boston, MA",
+        "remote_work_preference": "onsite",
+        "salary_range": "$50k-$70k",
+        "climate_focus": ["renewable_energy"],
+        "status": "active",
+    },
+    {
+        "id": "j2",
+        "title": "Grid Analyst",
+        "description": "Model distribution grid load",
+        "skills_required": ["Python", "Power Systems"],
+        "experience_level": "senior_level",
+        "location": "Denver, CO",
+        "remote_work_preference": "hybrid",
+        "salary_range": "$90k-$120k",
+        "status": "active",
+    },
+    {
+        "id": "j3",
+        "title": "Solar Installer",
+        "description": "Install rooftop solar arrays",
+        "skills_required": ["Solar PV Installation"],
+        "location": "Boston, MA",
+        "status": "closed",
+    },
+]
+
+
+class FakeEmbeddingService:
+    """EmbeddingService interface over stub embeddings, counting calls."""
+
+    def __init__(self, fail: bool = False):
+        self.model = StubEmbeddings(dimensions=DIMENSIONS, latency_ms=0)
+        self.fail = fail
+        self.calls = 0
+
+    async def embed_text(self, text):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("embedding provider down")
+        return self.model.embed_query(text)
+
+
+@pytest.fixture
+def local_db(local_db, monkeypatch):
+    local_db.table("skills_mapping").insert(
+        [{"id": "s1", "skill_name": "Solar PV Installation", "keywords": ["pv install"]}]
+    ).execute()
+    monkeypatch.setattr(
+        job_matching,
+        "skills_engine",
+        SkillsEngine(reference=ReferenceDataCache(refresh_interval=0)),
+    )
+    return local_db
+
+
+@pytest.fixture
+def embeddings():
+    return FakeEmbeddingService()
+
+
+@pytest.fixture
+def matcher(local_db, embeddings, monkeypatch):
+    matcher = JobMatcher(embeddings=embeddings)
+    monkeypatch.setattr(jobs, "job_matcher", matcher)
+    return matcher
+
+
+async def _seed_jobs(db, matcher):
+    db.table("job_listings").insert(JOBS).execute()
+    for job in JOBS:
+        await matcher.embed_job(job)
+
+
+def _add_resume(db, embedding=None, chunks=(), **fields):
+    row = {"id": "res-1", "user_id": "user-1", "created_at": "2025-01-01T00:00:00", **fields}
+    if embedding is not None:
+        row["embedding"] = list(embedding)
+    db.table("resumes").insert(row).execute()
+    for i, chunk in enumerate(chunks):
+        db.table("resume_chunks").insert(
+            {"resume_id": "res-1", "embedding": list(chunk), "content": f"c{i}"}
+        ).execute()
+
+
+async def _recommend(**params):
+    defaults = dict(
+        limit=10,
+        resume_id=None,
+        location=None,
+        experience_level=None,
+        remote_work_preference=None,
+        user_id="user-1",
+    )
+    return await jobs.get_job_recommendations(**{**defaults, **params})
+
+
+class TestJobEmbeddings:
+    """Tests for write-time listing embeddings"""
+
+    @pytest.mark.asyncio
+    async def test_listings_are_embedded_when_written(self, matcher, embeddings, local_db):
+        created = await jobs.create_job_listing(
+            {"title": "Wind Tech", "description": "Turbine upkeep", "organization_name": "Gusts"},
+            user_id="partner-1",
+        )
+        job_id = created["job"]["id"]
+        await jobs.update_job_listing(job_id, {"status": "active"}, user_id="partner-1")
+        assert embeddings.calls == 1
+
+        await jobs.update_job_listing(job_id, {"description": "Blade repair"}, user_id="partner-1")
+        stored = (
+            local_db.table("job_listing_embeddings").select("*").eq("id", job_id).execute().data
+        )
+
+        assert embeddings.calls == 2
+        assert len(stored[0]["embedding"]) == DIMENSIONS
+        assert "embedding" not in created["job"]
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_does_not_fail_the_write(self, local_db):
+        matcher = JobMatcher(embeddings=FakeEmbeddingService(fail=True))
+
+        assert await matcher.embed_job({"id": "j9", "title": "Wind Tech"}) is False
+        assert not local_db.table("job_listing_embeddings").select("id").execute().data
+
+
+class TestMatchJobListings:
+    """Tests for the match_job_listings function"""
+
+    def test_ranks_active_listings_by_cosine_similarity(self, local_db):
+        rng = np.random.default_rng(3)
+        vectors = rng.standard_normal((50, DIMENSIONS)).astype(np.float32)
+        local_db.table("job_listings").insert(
+            [{"id": f"j{i}", "status": "closed" if i % 5 == 0 else "active"} for i in range(50)]
+        ).execute()
+        local_db.table("job_listing_embeddings").insert(
+            [{"id": f"j{i}", "embedding": v.tolist()} for i, v in enumerate(vectors)]
+        ).execute()
+        query = rng.standard_normal(DIMENSIONS)
+
+        rows = (
+            local_db.rpc(
+                "match_job_listings", {"query_embedding": query.tolist(), "match_count": 5}
+            )
+            .execute()
+            .data
+        )
+
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        scores = unit @ (query / np.linalg.norm(query))
+        expected = [f"j{i}" for i in np.argsort(-scores) if i % 5][:5]
+        assert [row["id"] for row in rows] == expected
+        assert rows[0]["similarity"] == pytest.approx(scores[int(expected[0][1:])], abs=1e-5)
+
+    def test_selective_filters_reach_past_the_nearest_listings(self, local_db):
+        rng = np.random.default_rng(5)
+        vectors = rng.standard_normal((1500, 8)).astype(np.float32)
+        local_db.table("job_listings").insert(
+            [
+                {
+                    "id": f"j{i}",
+                    "status": "active",
+                    "location": "Denver, CO" if i % 300 == 7 else "Boston, MA",
+                }
+                for i in range(1500)
+            ]
+        ).execute()
+        local_db.table("job_listing_embeddings").insert(
+            [{"id": f"j{i}", "embedding": v.tolist()} for i, v in enumerate(vectors)]
+        ).execute()
+        query = vectors[0]
+
+        rows = (
+            local_db.rpc(
+                "match_job_listings",
+                {"query_embedding": query.tolist(), "match_count": 10, "location_filter": "denver"},
+            )
+            .execute()
+            .data
+        )
+
+        scores = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ query
+        expected = [f"j{i}" for i in np.argsort(-scores) if i % 300 == 7]
+        assert [row["id"] for row in rows] == expected
+
+
+class TestJobRecommendations:
+    """Tests for the /jobs/recommendations endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_matches_combine_similarity_and_features(self, matcher, embeddings, local_db):
+        await _seed_jobs(local_db, matcher)
+        _add_resume(
+            local_db,
+            embedding=embeddings.model.embed_query(job_embedding_text(JOBS[0])),
+            skills_extracted=["pv install", {"name": "Python"}],
+            experience_years=1,
+        )
+        local_db.table("job_seeker_profiles").insert(
+            {"user_id": "user-1", "preferred_locations": ["Boston"], "salary_range_min": 60000}
+        ).execute()
+
+        result = await _recommend()
+        best, other = result["matches"]
+
+        assert result["resume_id"] == "res-1"
+        assert best["job_id"] == "j1"
+        assert best["matching_skills"] == ["Solar PV Installation"]
+        assert best["missing_required_skills"] == ["Electrical Wiring"]
+        assert best["location_match_score"] == 1.0
+        assert "Missing: Electrical Wiring" in best["explanations"]
+        assert other["job_id"] == "j2"
+        assert other["experience_match_score"] == 0.0
+        assert best["match_score"] > other["match_score"]
+
+    @pytest.mark.asyncio
+    async def test_resume_chunks_stand_in_for_a_missing_embedding(
+        self, matcher, embeddings, local_db
+    ):
+        await _seed_jobs(local_db, matcher)
+        target = embeddings.model.embed_query(job_embedding_text(JOBS[1]))
+        _add_resume(local_db, chunks=[target, target])
+
+        result = await _recommend(limit=1)
+
+        assert result["matches"][0]["job_id"] == "j2"
+
+    @pytest.mark.asyncio
+    async def test_hard_filters_apply_before_ranking(self, matcher, embeddings, local_db):
+        await _seed_jobs(local_db, matcher)
+        _add_resume(local_db, embedding=embeddings.model.embed_query(job_embedding_text(JOBS[0])))
+
+        result = await _recommend(location="Denver")
+
+        assert [m["job_id"] for m in result["matches"]] == ["j2"]
+
+    @pytest.mark.asyncio
+    async def test_no_resume_is_not_found(self, matcher):
+        with pytest.raises(jobs.HTTPException) as exc:
+            await _recommend()
+
+        assert exc.value.status_code == 404
+
+
+class TestParseSalaryRange:
+    """Tests for parse_salary_range()"""
+
+    def test_ranges_parse_to_their_top(self):
+        assert parse_salary_range("$60k-$80k") == 80000
+        assert parse_salary_range("55,000 - 75,000 USD") == 75000
+        assert parse_salary_range("Competitive") is None
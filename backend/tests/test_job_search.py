@@ -0,0 +1,62 @@
+"""
+Tests for relevance-ranked job search.
+"""
+
+import pytest
+
+from backend.api.routes.jobs import search_jobs
+from backend.database.local_seed import seed_job_listings
+
+
+@pytest.fixture
+def local_db(local_db):
+    seed_job_listings(local_db, 300, seed=11)
+    return local_db
+
+
+async def _search(**params):
+    defaults = dict(
+        query=None,
+        location=None,
+        experience_level=None,
+        remote_work_preference=None,
+        climate_focus=None,
+        limit=10,
+        offset=0,
+        cursor=None,
+        user_id="user-1",
+    )
+    return await search_jobs(**{**defaults, **params})
+
+
+class TestJobSearch:
+    """Tests for the /jobs/search endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_query_results_are_ranked(self, local_db):
+        """Search terms go through the ranked RPC with the filters applied"""
+        result = await _search(query="heat pump technician", experience_level="mid_level")
+        jobs = result["jobs"]
+
+        assert jobs
+        assert all(job["status"] == "active" for job in jobs)
+        assert all(job["experience_level"] == "mid_level" for job in jobs)
+        assert all(job["title"] == "Heat Pump Technician" for job in jobs)
+        assert [job["rank"] for job in jobs] == sorted((job["rank"] for job in jobs), reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_query_with_commas_is_not_a_filter(self, local_db):
+        """Free text can no longer break or extend the PostgREST filter"""
+        result = await _search(query="solar,status.eq.closed")
+
+        assert all(job["status"] == "active" for job in result["jobs"])
+
+    @pytest.mark.asyncio
+    async def test_no_query_lists_newest_first(self, local_db):
+        """Without search terms the filtered listing is ordered by recency"""
+        result = await _search(climate_focus="wind", limit=5, offset=5)
+        created = [job["created_at"] for job in result["jobs"]]
+
+        assert len(created) == 5
+        assert created == sorted(created, reverse=True)
+        assert all("wind" in job["climate_focus"] for job in result["jobs"])
@@ -0,0 +1,146 @@
+"""
+Tests for the shared multi-pattern keyword matcher.
+"""
+
+import pytest
+
+from backend.utils.keywords import (
+    KeywordMatcher,
+    SubstringIndex,
+    register_keywords,
+    scan_keywords,
+)
+
+MESSAGES = [
+    "",
+    "I'm a Veteran leaving the ARMY and need help with my resume",
+    "Our community faces air pollution and flooding near the industrial port",
+    "I have a foreign degree from India and a master's from the UK",
+    "I feel hopeless and can't go on, please help me",
+    "Looking for solar and wind certification programs",
+    "What policy and government programs support green tech startups?",
+    "va benefits for disability compensation and the GI Bill",
+    "experienced manager looking for jobs in renewable energy",
+    "global visa immigration questions about international credentials",
+]
+
+
+class TestKeywordMatcher:
+    """Single-pass scan matches the per-keyword ``in`` checks it replaces"""
+
+    def test_parity_with_substring_checks(self):
+        tables = {
+            "a": ["veteran", "veterans", "vet", "army"],
+            "b": ["air pollution", "pollution", "air", "port"],
+            "c": ["can't go on", "go", "help me", "help"],
+            "d": ["degree", "master", "uk", "india"],
+        }
+        matcher = KeywordMatcher(tables)
+        for message in MESSAGES:
+            hits = matcher.scan(message)
+            lowered = message.lower()
+            for category, keywords in tables.items():
+                expected = [k for k in keywords if k in lowered]
+                assert hits.matched(category) == expected
+                assert hits.has(category) == bool(expected)
+
+    def test_overlapping_and_nested_keywords(self):
+        matcher = KeywordMatcher({"x": ["ab", "abc", "bcd", "c"]})
+        assert matcher.scan("ABCD").matched("x") == ["ab", "abc", "bcd", "c"]
+        assert matcher.scan("abx").matched("x") == ["ab"]
+
+    def test_weighted_scores(self):
+        matcher = KeywordMatcher({"solar": {"solar": 2.0, "panel": 0.5}, "wind": ["wind"]})
+        hits = matcher.scan("Solar panel and wind farm")
+        assert hits.score("solar") == 2.5
+        assert hits.score("wind") == 1.0
+        assert hits.score("missing") == 0.0
+
+    def test_scores_and_first_follow_registration_order(self):
+        matcher = KeywordMatcher({"late": ["zebra"], "early": ["apple"], "none": ["kiwi"]})
+        hits = matcher.scan("apple zebra")
+        assert list(hits.scores()) == ["late", "early"]
+        assert hits.first(["none", "early", "late"]) == "early"
+        assert hits.first(["none"]) is None
+
+    def test_registered_namespaces_share_one_scan(self):
+        first = register_keywords("test_first", {"hit": ["climate"]})
+        second = register_keywords("test_second", {"hit": ["justice"], "miss": ["nope"]})
+        message = "climate justice"
+
+        assert first.scan(message).matched("hit") == ["climate"]
+        assert second.scan(message).matched("hit") == ["justice"]
+        assert not second.scan(message).has("miss")
+        assert scan_keywords(message).has("test_first.hit")
+
+
+class TestSubstringIndex:
+    """Index lookups match ``query in value`` over all values"""
+
+    def test_containing(self):
+        values = ["Solar Installation", "solar finance", "wind"]
+        index = SubstringIndex(values)
+        for query in ["solar", "Wind", "in", "finance", "x", ""]:
+            expected = {v.lower() for v in values if query.lower() in v.lower()}
+            assert index.containing(query) == expected
+
+
+class TestRoutingParity:
+    """Routing and analysis outputs are unchanged by the shared matcher"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_semantic_routing(self):
+        from backend.agents.langgraph.framework import _fallback_semantic_routing
+
+        result = await _fallback_semantic_routing("I'm in crisis, help me find support")
+        assert result["team"] == "support_team"
+        assert result["agent"] == "michael"
+        assert result["crisis_indicators"] is True
+
+        result = await _fallback_semantic_routing("military discharge paperwork")
+        assert (result["team"], result["agent"]) == ("veterans_team", "marcus")
+        assert result["routing_reason"] == "Fallback routing - veteran keywords detected"
+
+        result = await _fallback_semantic_routing("Tell me something")
+        assert result["agent"] == "pendo"
+
+    def test_find_expert_agents_ranking(self):
+        from backend.agents.awareness import AgentAwarenessSystem
+
+        system = AgentAwarenessSystem()
+
+        def legacy(expertise_needed):
+            ranked = []
+            expertise_lower = expertise_needed.lower()
+            boost = {"specialist": 0.4, "expert": 0.3, "intermediate": 0.2, "novice": 0.1}
+            for agent_name, capability in system.agent_capabilities.items():
+                score = 0.0
+                for area in capability.expertise_areas:
+                    if expertise_lower in area.lower():
+                        score += 1.0
+                    elif any(word in area.lower() for word in expertise_lower.split()):
+                        score += 0.5
+                score += boost.get(capability.expertise_level.value, 0.1)
+                if score > 0.3:
+                    ranked.append((agent_name, score))
+            return sorted(ranked, key=lambda x: x[1], reverse=True)[:5]
+
+        for query in ["solar", "veteran benefits", "Policy Analysis", "mental health", "x"]:
+            assert system.find_expert_agents(query) == legacy(query)
+
+    @pytest.mark.asyncio
+    async def test_support_needs_analysis(self):
+        from backend.agents.implementations.david import DavidAgent, assess_crisis_risk
+
+        david = DavidAgent.__new__(DavidAgent)
+        context = await david._analyze_support_needs(
+            "I feel hopeless and my PTSD is bad; what about my GI Bill and a job?"
+        )
+        assert context["crisis_indicators"] is True
+        assert context["needs_crisis_support"] is True
+        assert context["urgency_level"] == "high"
+        assert context["benefit_type"] == "education"
+        assert context["needs_employment_help"] is True
+        assert context["needs_va_benefits"] is False
+
+        assert assess_crisis_risk.func("I'm overwhelmed").startswith("CRISIS LEVEL: MODERATE")
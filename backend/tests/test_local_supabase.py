@@ -0,0 +1,282 @@
+"""
+Tests for the SQLite-backed local Supabase stand-in.
+"""
+
+import pytest
+
+from backend.database.local_seed import (
+    conversation_rows,
+    insert_batches,
+    seed_job_listings,
+    seed_resume_chunks,
+)
+from backend.database.local_supabase import LocalSupabase, LocalSupabaseError
+
+
+@pytest.fixture
+def db():
+    client = LocalSupabase()
+    client.table("job_listings").insert(
+        [
+            {
+                "title": "Solar Installer",
+                "status": "active",
+                "location": "Boston, MA",
+                "climate_focus": ["solar", "buildings"],
+                "salary_min": 52000,
+                "created_at": "2025-03-01T00:00:00+00:00",
+            },
+            {
+                "title": "Wind Turbine Technician",
+                "status": "active",
+                "location": "New Bedford, MA",
+                "climate_focus": ["wind"],
+                "salary_min": 61000,
+                "created_at": "2025-04-01T00:00:00+00:00",
+            },
+            {
+                "title": "Energy Analyst",
+                "status": "closed",
+                "location": "Worcester, MA",
+                "climate_focus": ["energy_efficiency"],
+                "salary_min": None,
+                "created_at": "2025-05-01T00:00:00+00:00",
+            },
+        ]
+    ).execute()
+    yield client
+    client.close()
+
+
+class TestLocalQueryBuilder:
+    """Tests for the PostgREST-style builder subset."""
+
+    def test_filters_order_range_and_exact_count(self, db):
+        """Count ignores pagination; data honors order and range."""
+        result = (
+            db.table("job_listings")
+            .select("title", count="exact")
+            .eq("status", "active")
+            .order("created_at", desc=True)
+            .range(0, 0)
+            .execute()
+        )
+
+        assert result.count == 2
+        assert result.data == [{"title": "Wind Turbine Technician"}]
+
+    def test_text_and_array_filters(self, db):
+        """ilike, or_, contains, overlaps, in_ and is_ compile correctly."""
+        table = lambda: db.table("job_listings").select("title")
+
+        assert len(table().ilike("location", "%ma%").execute().data) == 3
+        assert len(table().or_("title.ilike.%wind%,location.ilike.%worcester%").execute().data) == 2
+        assert table().contains("climate_focus", ["solar"]).execute().data == [
+            {"title": "Solar Installer"}
+        ]
+        assert len(table().overlaps("climate_focus", ["wind", "solar"]).execute().data) == 2
+        assert len(table().in_("status", ["closed", "draft"]).execute().data) == 1
+        assert table().is_("salary_min", "null").execute().data == [{"title": "Energy Analyst"}]
+        assert len(table().gte("salary_min", 55000).execute().data) == 1
+
+    def test_update_upsert_delete(self, db):
+        """Writes return the affected rows."""
+        updated = (
+            db.table("job_listings")
+            .update({"status": "filled"})
+            .eq("title", "Energy Analyst")
+            .execute()
+        )
+        row = updated.data[0]
+        db.table("job_listings").upsert({"id": row["id"], "salary_min": 70000}).execute()
+        merged = db.table("job_listings").select("*").eq("id", row["id"]).single().execute()
+        deleted = db.table("job_listings").delete().eq("status", "filled").execute()
+
+        assert merged.data["status"] == "filled"
+        assert merged.data["salary_min"] == 70000
+        assert merged.data["created_at"] == row["created_at"]
+        assert len(deleted.data) == 1
+
+    def test_single_requires_exactly_one_row(self, db):
+        """single() raises like PostgREST when the row count is not one."""
+        with pytest.raises(LocalSupabaseError):
+            db.table("job_listings").select("*").eq("status", "active").single().execute()
+        assert (
+            db.table("job_listings").select("*").eq("status", "draft").maybe_single().execute().data
+            is None
+        )
+
+    def test_identifiers_are_validated(self, db):
+        """Column names cannot inject SQL."""
+        with pytest.raises(LocalSupabaseError):
+            db.table("job_listings").select("*").eq("status') OR 1=1 --", "x").execute()
+
+
+class TestLocalSchema:
+    """Tests for production defaults, indexes and vector functions."""
+
+    def test_inserts_apply_schema_defaults(self, db):
+        """Columns omitted on insert get the production defaults."""
+        row = db.table("job_listings").select("*").eq("title", "Solar Installer").single().execute()
+
+        assert row.data["is_active"] is True
+        assert row.data["skills_required"] == []
+        assert row.data["partner_id"] is None
+
+    def test_hot_path_query_uses_expression_index(self, db):
+        """The status/created_at index serves the job search query."""
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT doc FROM job_listings "
+            "WHERE json_extract(doc, '$.status') = ? "
+            "ORDER BY json_extract(doc, '$.status'), json_extract(doc, '$.created_at')",
+            ["active"],
+        ).fetchall()
+
+        assert any("idx_job_listings_status_created_at" in str(step) for step in plan)
+
+    def test_upsert_does_not_reset_columns_to_defaults(self, db):
+        """Conflicting upserts only change the columns provided."""
+        row = db.table("job_listings").select("*").eq("title", "Wind Turbine Technician").execute()
+        job_id = row.data[0]["id"]
+        db.table("job_listings").update({"is_active": False}).eq("id", job_id).execute()
+        db.table("job_listings").upsert({"id": job_id, "title": "Lead Technician"}).execute()
+        merged = db.table("job_listings").select("*").eq("id", job_id).single().execute()
+
+        assert merged.data["title"] == "Lead Technician"
+        assert merged.data["is_active"] is False
+
+    def test_match_rpc_ranks_by_cosine_similarity(self):
+        """match_<table> returns nearest rows above the threshold, honoring filters."""
+        client = LocalSupabase()
+        client.table("documents").insert(
+            [
+                {"content": "solar", "embedding": [1.0, 0.0], "metadata": {"kind": "a"}},
+                {"content": "wind", "embedding": [0.8, 0.6], "metadata": {"kind": "b"}},
+                {"content": "policy", "embedding": [0.0, 1.0], "metadata": {"kind": "a"}},
+            ]
+        ).execute()
+
+        ranked = client.rpc(
+            "match_documents", {"query_embedding": [2.0, 0.0], "match_threshold": 0.5}
+        ).execute()
+        filtered = client.rpc(
+            "match_documents",
+            {"query_embedding": [2.0, 0.0], "match_count": 5, "filter": {"kind": "a"}},
+        ).execute()
+
+        assert [r["content"] for r in ranked.data] == ["solar", "wind"]
+        assert ranked.data[0]["similarity"] == pytest.approx(1.0)
+        assert "embedding" not in ranked.data[0]
+        assert [r["content"] for r in filtered.data] == ["solar"]
+
+    def test_search_resume_chunks_sees_new_rows(self):
+        """The vector matrix is rebuilt after writes."""
+        client = LocalSupabase()
+        seed_resume_chunks(client, resumes=5, chunks_per_resume=4, dimensions=16, seed=1)
+        target = client.table("resume_chunks").select("*").limit(1).execute().data[0]
+
+        found = client.rpc(
+            "search_resume_chunks",
+            {"query_embedding": target["embedding"], "target_user_id": target["user_id"]},
+        ).execute()
+        client.table("resume_chunks").delete().eq("id", target["id"]).execute()
+        after_delete = client.rpc(
+            "search_resume_chunks", {"query_embedding": target["embedding"]}
+        ).execute()
+
+        assert found.data[0]["id"] == target["id"]
+        assert all(r["resume_id"] == target["resume_id"] for r in found.data)
+        assert target["id"] not in [r["id"] for r in after_delete.data]
+
+
+class TestLocalTextSearch:
+    """Tests for the FTS5 stand-in for generated tsvector columns."""
+
+    def test_search_job_listings_ranks_and_filters(self):
+        """Title hits outrank description hits; filters and status apply."""
+        client = LocalSupabase()
+        seed_job_listings(client, 200, seed=5)
+        client.table("job_listings").insert(
+            [
+                {
+                    "title": "Geothermal Driller",
+                    "description": "Drill wells for ground source heat pumps.",
+                    "requirements": "CDL",
+                    "status": "active",
+                    "location": "Boston, MA",
+                    "climate_focus": ["buildings"],
+                },
+                {
+                    "title": "Site Supervisor",
+                    "description": "Oversee geothermal drilling crews.",
+                    "requirements": "OSHA 30",
+                    "status": "active",
+                    "location": "Lowell, MA",
+                    "climate_focus": ["buildings"],
+                },
+                {
+                    "title": "Geothermal Intern",
+                    "description": "Summer role.",
+                    "requirements": "",
+                    "status": "closed",
+                },
+            ]
+        ).execute()
+        search = lambda **params: client.rpc("search_job_listings", params).execute().data
+
+        ranked = search(search_query="geothermal drilling")
+        assert [r["title"] for r in ranked] == ["Geothermal Driller", "Site Supervisor"]
+        assert ranked[0]["rank"] > ranked[1]["rank"] > 0
+        assert [
+            r["title"] for r in search(search_query="geothermal", location_filter="lowell")
+        ] == ["Site Supervisor"]
+        assert search(search_query="geothermal -supervisor", result_limit=5)[0]["title"] == (
+            "Geothermal Driller"
+        )
+        assert search(search_query="the of and") == []
+
+    def test_text_index_follows_writes(self, db):
+        """Inserts, updates, upserts and deletes keep the index in sync."""
+        search = lambda q: [
+            r["title"] for r in db.rpc("search_job_listings", {"search_query": q}).execute().data
+        ]
+        row = db.table("job_listings").select("id").eq("title", "Solar Installer").execute()
+        job_id = row.data[0]["id"]
+
+        assert search("solar") == ["Solar Installer"]
+        db.table("job_listings").update({"title": "Rooftop Installer"}).eq("id", job_id).execute()
+        assert search("solar") == []
+        db.table("job_listings").upsert({"id": job_id, "title": "Solar Lead"}).execute()
+        assert search("solar") == ["Solar Lead"]
+        db.table("job_listings").delete().eq("id", job_id).execute()
+        assert search("solar") == []
+        assert db.conn.execute("SELECT COUNT(*) FROM job_listings_fts").fetchone() == (2,)
+
+
+class TestLocalSeed:
+    """Tests for the synthetic data generators."""
+
+    def test_seeds_are_deterministic_and_batched(self):
+        """Same seed, same rows, across batch boundaries."""
+        first, second = LocalSupabase(), LocalSupabase()
+        counts = seed_job_listings(first, 250, seed=3, batch_size=100)
+        seed_job_listings(second, 250, seed=3)
+        query = lambda c: c.table("job_listings").select("id").order("id").execute().data
+
+        assert counts == {"job_listings": 250}
+        assert query(first) == query(second)
+
+    def test_conversations_route_messages_to_their_table(self):
+        """Conversation seeds fill both tables with linked rows."""
+        client = LocalSupabase()
+        counts = insert_batches(client, conversation_rows(10, messages_per_conversation=4))
+        conversation = client.table("conversations").select("id").limit(1).execute().data[0]
+        messages = (
+            client.table("conversation_messages")
+            .select("id", count="exact")
+            .eq("conversation_id", conversation["id"])
+            .execute()
+        )
+
+        assert counts == {"conversations": 10, "conversation_messages": 40}
+        assert messages.count == 4
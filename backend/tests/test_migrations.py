@@ -0,0 +1,75 @@
+"""
+Tests for the ordering of the Supabase migrations.
+"""
+
+import json
+import re
+import shutil
+
+import pytest
+
+from backend.database.local_supabase import MIGRATIONS_DIR, SCHEMA_DUMP, load_schema
+
+MIGRATIONS = sorted(MIGRATIONS_DIR.glob("*.sql"))
+
+# (migration, table, columns it needs): LANGUAGE sql function bodies and
+# indexes are checked when the migration runs, so the columns must be added
+# by an earlier migration or already be in the live schema
+DEPENDENCIES = [
+    ("job_listings_full_text_search", "job_listings", {"status", "remote_work_preference"}),
+    ("resource_view_daily_rollup", "knowledge_resources", {"visibility"}),
+    ("resource_view_counters", "knowledge_resources", {"view_count"}),
+    ("knowledge_resource_facets", "knowledge_resources", {"category", "status", "visibility"}),
+    ("keyset_pagination_indexes", "job_listings", {"status"}),
+    ("keyset_pagination_indexes", "knowledge_resources", {"status"}),
+]
+
+
+def column_type(table, column):
+    """Type of ``table.column`` in the live schema dump."""
+    current = None
+    for row in json.loads(SCHEMA_DUMP.read_text()):
+        line = row.get("output", "")
+        header = re.search(r"TABLE:\s*(\w+)", line)
+        if header:
+            current = header.group(1)
+            continue
+        match = re.search(rf"\b{column} \| TYPE: ([\w ]+?) \|", line)
+        if current == table and match:
+            return match.group(1)
+    raise KeyError(f"{table}.{column}")
+
+
+def _migration(name):
+    (path,) = [p for p in MIGRATIONS if p.stem.split("_", 1)[1] == name]
+    return path
+
+
+def columns_before(name, table, directory):
+    """Columns of ``table`` once every migration sorting before ``name`` has run."""
+    target = _migration(name)
+    for path in MIGRATIONS:
+        if path.name < target.name:
+            shutil.copy(path, directory)
+    defaults, _ = load_schema(str(SCHEMA_DUMP), str(directory))
+    return set(defaults.get(table, {}))
+
+
+class TestMigrations:
+    """Tests for migration ordering"""
+
+    def test_versions_are_unique(self):
+        versions = [path.name.split("_", 1)[0] for path in MIGRATIONS]
+
+        assert len(versions) == len(set(versions))
+
+    @pytest.mark.parametrize("name, table, columns", DEPENDENCIES)
+    def test_columns_exist_before_use(self, name, table, columns, tmp_path):
+        assert columns <= columns_before(name, table, tmp_path)
+
+    def test_conversation_token_keys_match_the_id_type(self):
+        """jsonb_each_text keys are text; any cast must match conversations.id"""
+        sql = _migration("conversation_token_counters").read_text()
+        (cast,) = re.findall(r"c\.id = deltas\.key(?:::(\w+))?", sql)
+
+        assert (cast or "text") == column_type("conversations", "id")
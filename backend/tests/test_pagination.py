@@ -0,0 +1,165 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.pagination import InvalidCursorError, decode_cursor, encode_cursor, paginate
+from backend.api.routes.jobs import get_job_listings
+from backend.database.local_seed import seed_job_listings
+
+
+async def _listings(**params):
+    defaults = dict(
+        limit=10,
+        offset=0,
+        cursor=None,
+        status=None,
+        location=None,
+        remote_work_preference=None,
+        user_id="user-1",
+    )
+    return await get_job_listings(**{**defaults, **params})
+
+
+def _walk(db, limit, column="created_at", desc=True):
+    """Every row of job_listings, one keyset page at a time."""
+    rows, cursor = [], None
+    while True:
+        page = paginate(
+            db.table("job_listings").select("*"), limit, cursor, column=column, desc=desc
+        )
+        rows.extend(page.rows)
+        if not page.has_more:
+            return rows
+        cursor = page.next_cursor
+
+
+@pytest.fixture
+def local_db(local_db):
+    seed_job_listings(local_db, 250, seed=3)
+    # Rows sharing a timestamp must neither repeat nor go missing across pages
+    local_db.table("job_listings").insert(
+        [
+            {"id": f"tied-{i:02d}", "title": "Tied", "created_at": "2025-01-01T00:00:00"}
+            for i in range(25)
+        ]
+    ).execute()
+    return local_db
+
+
+class TestCursor:
+    """Tests for cursor encoding"""
+
+    def test_round_trip(self):
+        """A cursor decodes to the sort value and id it was built from"""
+        cursor = encode_cursor("created_at", "2025-01-01T00:00:00", "job-1")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, "created_at") == ("2025-01-01T00:00:00", "job-1")
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-a-cursor", "e30", encode_cursor("created_at", "2025-01-01", None)]
+    )
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "created_at")
+
+    def test_cursor_is_bound_to_its_sort_column(self):
+        """A cursor from one listing cannot be replayed against another ordering"""
+        cursor = encode_cursor("updated_at", "2025-01-01T00:00:00", "job-1")
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "created_at")
+
+
+class TestPaginate:
+    """Tests for paginate()"""
+
+    @pytest.mark.parametrize("desc", [True, False])
+    def test_pages_cover_every_row_once(self, local_db, desc):
+        """Walking the cursors returns each row exactly once, in order"""
+        rows = _walk(local_db, 7, desc=desc)
+        keys = [(row["created_at"], row["id"]) for row in rows]
+
+        assert len(keys) == 275
+        assert len(set(keys)) == 275
+        assert keys == sorted(keys, reverse=desc)
+
+    @pytest.mark.parametrize("desc", [True, False])
+    def test_null_sort_values_come_last(self, local_db, desc):
+        """Rows without a sort value are paged after the others instead of ending the walk"""
+        local_db.table("job_listings").insert(
+            [{"id": f"undated-{i:02d}", "title": "Undated", "created_at": None} for i in range(9)]
+        ).execute()
+
+        rows = _walk(local_db, 7, desc=desc)
+        undated = [row["id"] for row in rows if row["created_at"] is None]
+
+        assert len(rows) == len({row["id"] for row in rows}) == 284
+        assert undated == sorted(undated, reverse=desc)
+        assert [row["created_at"] is None for row in rows[-9:]] == [True] * 9
+
+    def test_inserts_do_not_shift_later_pages(self, local_db):
+        """New rows at the head of the listing do not repeat rows on the next page"""
+        query = lambda: local_db.table("job_listings").select("*")  # noqa: E731
+        first = paginate(query(), 10)
+        local_db.table("job_listings").insert(
+            [{"id": f"new-{i}", "created_at": "2099-01-01T00:00:00"} for i in range(5)]
+        ).execute()
+
+        second = paginate(query(), 10, first.next_cursor)
+        by_offset = paginate(query(), 10, offset=10)
+
+        assert not {r["id"] for r in first.rows} & {r["id"] for r in second.rows}
+        assert second.rows[0]["created_at"] <= first.rows[-1]["created_at"]
+        # The deprecated offset fallback re-reads rows from the first page
+        assert {r["id"] for r in first.rows} & {r["id"] for r in by_offset.rows}
+
+    def test_last_page_has_no_cursor(self, local_db):
+        page = paginate(local_db.table("job_listings").select("*").eq("title", "Tied"), 25)
+
+        assert len(page.rows) == 25
+        assert page.next_cursor is None
+        assert page.pagination() == {
+            "limit": 25,
+            "offset": 0,
+            "next_cursor": None,
+            "has_more": False,
+        }
+
+    def test_cursor_values_are_quoted(self, local_db):
+        """Sort values containing PostgREST delimiters do not break the filter"""
+        local_db.table("job_listings").insert(
+            [{"id": f"odd-{i}", "title": "a,b.(c)", "created_at": "2098-01-01"} for i in range(3)]
+        ).execute()
+
+        first = paginate(local_db.table("job_listings").select("*"), 2, column="title")
+        rows = _walk(local_db, 2, column="title")
+
+        assert first.rows[0]["title"] == "a,b.(c)"
+        assert len(rows) == 278
+
+
+class TestListingEndpoints:
+    """Tests for cursor parameters on list endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_job_listings_follow_next_cursor(self, local_db):
+        first = await _listings(limit=20, status="active")
+        second = await _listings(
+            limit=20, status="active", cursor=first["pagination"]["next_cursor"]
+        )
+
+        assert first["pagination"]["has_more"]
+        assert first["jobs"][-1]["created_at"] >= second["jobs"][0]["created_at"]
+        assert not {j["id"] for j in first["jobs"]} & {j["id"] for j in second["jobs"]}
+        assert all(job["status"] == "active" for job in second["jobs"])
+
+    @pytest.mark.asyncio
+    async def test_bad_cursor_is_a_client_error(self, local_db):
+        with pytest.raises(HTTPException) as exc_info:
+            await _listings(cursor="garbage")
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,122 @@
+"""
+Tests for the resource view rollup and the popular resources endpoint.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.api.routes import resources
+from backend.api.routes.resources import get_popular_resources, popular_resources_cache
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _views(resource_id: str, count: int, days_ago: int = 0):
+    return [
+        {
+            "resource_id": resource_id,
+            "resource_type": "knowledge_resource",
+            "viewed_at": _days_ago(days_ago),
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def local_db(local_db):
+    local_db.table("knowledge_resources").insert(
+        [
+            {"id": "hot", "title": "Hot", "visibility": "public", "embedding": [0.1, 0.2]},
+            {"id": "warm", "title": "Warm", "visibility": "public"},
+            {"id": "secret", "title": "Secret", "visibility": "private"},
+            {"id": "old", "title": "Old", "visibility": "public"},
+        ]
+    ).execute()
+    local_db.table("resource_views").insert(
+        _views("hot", 5)
+        + _views("warm", 2, days_ago=3)
+        + _views("secret", 9)
+        + _views("old", 20, days_ago=60)
+    ).execute()
+    local_db.table("resource_views").insert(_views("warm", 1)).execute()
+    popular_resources_cache.clear()
+    yield local_db
+    popular_resources_cache.clear()
+
+
+class TestResourceViewRollup:
+    """Tests for the resource_view_daily rollup"""
+
+    def test_rollup_matches_raw_views(self, local_db):
+        """Every insert, single or batched, lands in its daily bucket"""
+        totals = {}
+        for row in local_db.table("resource_view_daily").select("*").execute().data:
+            totals[row["resource_id"]] = totals.get(row["resource_id"], 0) + row["view_count"]
+
+        assert totals == {"hot": 5, "warm": 3, "secret": 9, "old": 20}
+
+    def test_top_viewed_applies_window_and_visibility(self, local_db):
+        """The limit applies after the visibility filter, within the window"""
+        public = (
+            local_db.rpc("top_viewed_resources", {"days": 30, "result_limit": 2}).execute().data
+        )
+        everything = (
+            local_db.rpc(
+                "top_viewed_resources", {"days": 90, "result_limit": 10, "public_only": False}
+            )
+            .execute()
+            .data
+        )
+
+        assert [(r["id"], r["recent_views"]) for r in public] == [("hot", 5), ("warm", 3)]
+        assert "embedding" not in public[0]
+        assert [r["id"] for r in everything] == ["old", "secret", "hot", "warm"]
+
+
+class TestPopularResourcesEndpoint:
+    """Tests for the /analytics/popular endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_non_admin_sees_public_resources(self, local_db):
+        """Non-admins get the top public resources with their recent views"""
+        result = await get_popular_resources(limit=10, days=30, user_id="user-1")
+
+        assert result["success"] is True
+        assert result["time_period"] == "Last 30 days"
+        assert [(r["id"], r["recent_views"]) for r in result["popular_resources"]] == [
+            ("hot", 5),
+            ("warm", 3),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_admin_sees_all_resources(self, local_db):
+        """Admins also see private resources"""
+        local_db.table("admin_profiles").insert({"user_id": "admin-1"}).execute()
+
+        result = await get_popular_resources(limit=10, days=30, user_id="admin-1")
+
+        assert [r["id"] for r in result["popular_resources"]] == ["secret", "hot", "warm"]
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_visibility(self, local_db, monkeypatch):
+        """Repeat requests are served from the cache without querying again"""
+        calls = []
+        load = resources._load_popular_resources
+
+        async def counting_load(*args, **kwargs):
+            calls.append(args)
+            return await load(*args, **kwargs)
+
+        monkeypatch.setattr(resources, "_load_popular_resources", counting_load)
+
+        first = await get_popular_resources(limit=10, days=30, user_id="user-1")
+        local_db.table("resource_views").insert(_views("warm", 10)).execute()
+        second = await get_popular_resources(limit=10, days=30, user_id="user-2")
+        await get_popular_resources(limit=5, days=30, user_id="user-1")
+
+        assert second == first
+        assert len(calls) == 2
+        assert popular_resources_cache.get_stats()["hits"] == 1
@@ -0,0 +1,80 @@
+"""
+Tests for stable-prefix prompt assembly and prefix cache accounting.
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from backend.services.prompt_assembly import (
+    PrefixCacheStats,
+    StaticPromptRegistry,
+    assemble_messages,
+    extract_cached_tokens,
+)
+
+
+class TestPromptAssembly:
+    """Tests for interned system prompts and message layout."""
+
+    def test_static_prompt_built_once(self):
+        """The builder runs once and the same message is reused."""
+        registry = StaticPromptRegistry()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "You are Marcus."
+
+        first = registry.get(("enhanced", "marcus"), build)
+        second = registry.get(("enhanced", "marcus"), build)
+
+        assert first is second
+        assert calls == [1]
+
+    def test_context_goes_after_static_prefix(self):
+        """Volatile context never changes the leading system message."""
+        system = SystemMessage(content="You are Pendo.")
+
+        with_context = assemble_messages(system, "hello", "Recent conversation context: x")
+        without_context = assemble_messages(system, "hello")
+
+        assert with_context[0] is system and without_context[0] is system
+        assert with_context[1].content == "Recent conversation context: x"
+        assert isinstance(with_context[-1], HumanMessage)
+        assert len(without_context) == 2
+
+
+class TestPrefixCacheStats:
+    """Tests for cached-prefix token extraction."""
+
+    def test_reads_standard_usage_metadata(self):
+        """LangChain usage metadata reports cache reads."""
+        message = AIMessage(
+            content="hi",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 10,
+                "total_tokens": 1210,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+
+        assert extract_cached_tokens(message) == {
+            "prompt_tokens": 1200,
+            "cached_tokens": 1024,
+        }
+
+    def test_reads_deepseek_response_metadata(self):
+        """DeepSeek reports prompt cache hits in its raw token usage."""
+        message = AIMessage(
+            content="hi",
+            response_metadata={
+                "token_usage": {"prompt_tokens": 900, "prompt_cache_hit_tokens": 640}
+            },
+        )
+        stats = PrefixCacheStats()
+        stats.record("lauren", message, time_to_first_token_ms=120.0)
+
+        lauren = stats.get_stats()["lauren"]
+        assert lauren["cached_tokens"] == 640
+        assert round(lauren["cache_hit_ratio"], 2) == 0.71
+        assert lauren["avg_ttft_ms"] == 120.0
@@ -0,0 +1,102 @@
+"""
+Tests for the tiered quality evaluator.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.services.quality_evaluator import (
+    QualityRiskClassifier,
+    measure_agreement,
+)
+
+CORPUS_PATH = Path(__file__).parent / "fixtures" / "quality_corpus.json"
+
+
+class StubEmbeddingService:
+    """Maps texts onto fixed vectors so exemplar similarity is predictable."""
+
+    def __init__(self, vector):
+        self.vector = vector
+
+    async def embed_texts(self, texts):
+        return [[1.0, 0.0] for _ in texts]
+
+    async def embed_text(self, text):
+        return self.vector
+
+
+@pytest.fixture
+def corpus():
+    """Load the labelled quality fixture corpus."""
+    with open(CORPUS_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def classifier():
+    """Create a lexicon-only classifier."""
+    return QualityRiskClassifier(use_embeddings=False)
+
+
+class TestQualityRiskClassifier:
+    """Tests for the local risk tiers."""
+
+    @pytest.mark.asyncio
+    async def test_clear_pass_settled_locally(self, classifier):
+        """Responses with no risk signals never reach the LLM."""
+        assessment = await classifier.assess(
+            "What solar certifications exist?",
+            "NABCEP offers the PV Associate credential.",
+        )
+
+        assert assessment.decided
+        assert assessment.needs_review is False
+        assert assessment.tier == "lexicon"
+        assert assessment.quality_score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_crisis_settled_as_review(self, classifier):
+        """Crisis language goes straight to human review."""
+        assessment = await classifier.assess(
+            "I've been thinking about suicide", "Please call 988 right now."
+        )
+
+        assert assessment.decided
+        assert assessment.needs_review is True
+        assert "crisis" in assessment.matched_categories
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_is_escalated(self, classifier):
+        """A single weak signal is left to the LLM evaluator."""
+        assessment = await classifier.assess(
+            "Is the tax credit available?", "Yes, the 25C credit covers heat pumps."
+        )
+
+        assert not assessment.decided
+        assert assessment.tier == "escalate"
+
+    @pytest.mark.asyncio
+    async def test_exemplar_tier_settles_ambiguous(self):
+        """Exemplar similarity resolves cases the lexicon cannot."""
+        near = QualityRiskClassifier(embedding_service=StubEmbeddingService([1.0, 0.0]))
+        far = QualityRiskClassifier(embedding_service=StubEmbeddingService([0.0, 1.0]))
+
+        question, answer = "Is the tax credit available?", "It is, with conditions."
+        near_assessment = await near.assess(question, answer)
+        far_assessment = await far.assess(question, answer)
+
+        assert near_assessment.tier == "embedding" and near_assessment.needs_review
+        assert far_assessment.tier == "embedding" and not far_assessment.needs_review
+
+    @pytest.mark.asyncio
+    async def test_agreement_with_llm_labels(self, classifier, corpus):
+        """Local decisions agree with the recorded LLM labels on the fixture corpus."""
+        report = await measure_agreement(classifier, corpus)
+
+        assert report["precision"] >= 0.9
+        assert report["recall"] >= 0.9
+        assert report["escalation_rate"] < 0.6
+        assert report["avg_latency_ms"] < 1.0
@@ -0,0 +1,101 @@
+"""
+Tests for the asynchronous quality evaluation queue.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.quality_pipeline import QualityEvaluationQueue, QualityJob
+
+
+def make_job(index: int) -> QualityJob:
+    """Create a quality job for a fake conversation."""
+    return QualityJob(
+        conversation_id=f"conv-{index}",
+        question="Is the tax credit available?",
+        answer="Yes, with conditions.",
+        agent="lauren",
+    )
+
+
+class TestQualityEvaluationQueue:
+    """Tests for the background quality queue."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_evaluated_in_background(self):
+        """Published jobs are evaluated and recorded after the fact."""
+        recorded = []
+        active = 0
+        peak = 0
+
+        async def evaluate(job):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"score": 0.5, "reason": "test", "needs_review": True}
+
+        async def on_result(job, result):
+            recorded.append((job.conversation_id, result["score"]))
+
+        queue = QualityEvaluationQueue(evaluate, on_result, batch_size=4, max_concurrency=2)
+        for i in range(10):
+            assert queue.publish(make_job(i))
+
+        await queue.drain(timeout=5)
+        stats = queue.get_stats()
+        await queue.stop()
+
+        assert len(recorded) == 10
+        assert peak <= 2
+        assert stats["processed"] == 10
+        assert stats["depth"] == 0
+        assert stats["batches"] >= 3
+        assert stats["max_lag_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self):
+        """A full queue drops new jobs instead of blocking the response."""
+        gate = asyncio.Event()
+
+        async def evaluate(job):
+            await gate.wait()
+            return {"score": 0.9, "reason": "ok", "needs_review": False}
+
+        async def on_result(job, result):
+            pass
+
+        queue = QualityEvaluationQueue(
+            evaluate, on_result, maxsize=2, batch_size=1, max_concurrency=1
+        )
+        results = [queue.publish(make_job(i)) for i in range(5)]
+
+        assert results.count(False) == 3
+        assert queue.get_stats()["dropped"] == 3
+
+        gate.set()
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_evaluator_failure_is_counted(self):
+        """Evaluator errors are counted and do not stop the worker."""
+
+        async def evaluate(job):
+            if job.conversation_id == "conv-0":
+                raise RuntimeError("provider down")
+            return {"score": 0.9, "reason": "ok", "needs_review": False}
+
+        async def on_result(job, result):
+            pass
+
+        queue = QualityEvaluationQueue(evaluate, on_result)
+        queue.publish(make_job(0))
+        queue.publish(make_job(1))
+        await queue.drain(timeout=5)
+        stats = queue.get_stats()
+        await queue.stop()
+
+        assert stats["failed"] == 1
+        assert stats["processed"] == 1
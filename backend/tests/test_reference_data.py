@@ -0,0 +1,178 @@
+"""
+Tests for the reference data cache.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.api.routes import education
+from backend.database import supabase_client
+from backend.services import reference_data as reference_data_module
+from backend.services.reference_data import ReferenceDataCache
+
+
+class NoDatabase:
+    """Stands in for the database where a test expects no round trips."""
+
+    def table(self, name):
+        raise AssertionError(f"unexpected query on {name}")
+
+
+@pytest.fixture
+def local_db(local_db):
+    local_db.table("mos_translation").insert(
+        [
+            {"id": "m1", "mos_code": "12B", "civilian_equivalents": ["Site Engineer"]},
+            {"id": "m2", "mos_code": "25B", "civilian_equivalents": ["Grid Analyst", "IT Support"]},
+        ]
+    ).execute()
+    local_db.table("education_programs").insert(
+        [
+            {"id": "p1", "program_name": "Solar 101", "target_roles": ["Solar Installer"]},
+            {"id": "p2", "program_name": "Wind Tech", "target_roles": ["Wind Technician"]},
+            {
+                "id": "p3",
+                "program_name": "Clean Trades",
+                "target_roles": ["Solar Installer", "Electrician"],
+            },
+        ]
+    ).execute()
+    local_db.table("role_requirements").insert(
+        {"id": "r1", "role_name": "Solar Installer", "required_skills": ["wiring", "safety"]}
+    ).execute()
+    return local_db
+
+
+@pytest.fixture
+def cache(monkeypatch, fake_redis):
+    """Cache with background refresh disabled, installed for the education routes."""
+    cache = ReferenceDataCache(refresh_interval=0, redis=fake_redis)
+    monkeypatch.setattr(education, "reference_data", cache)
+    monkeypatch.setattr(reference_data_module, "reference_data", cache)
+    return cache
+
+
+class TestReferenceDataCache:
+    """Tests for ReferenceDataCache"""
+
+    @pytest.mark.asyncio
+    async def test_lookups_need_no_database_after_load(self, local_db, cache, monkeypatch):
+        await cache.snapshot("mos_translation")
+        await cache.snapshot("education_programs")
+        monkeypatch.setattr(supabase_client.supabase, "_client", NoDatabase())
+
+        translations = await cache.lookup("mos_translation", "mos_code", "25B")
+        program = await cache.get("education_programs", "p2")
+        solar = await cache.lookup("education_programs", "target_roles", "Solar Installer")
+
+        assert translations[0]["civilian_equivalents"] == ["Grid Analyst", "IT Support"]
+        assert program["program_name"] == "Wind Tech"
+        assert {p["id"] for p in solar} == {"p1", "p3"}
+
+    @pytest.mark.asyncio
+    async def test_returned_rows_do_not_alias_the_snapshot(self, local_db, cache):
+        program = await cache.get("education_programs", "p1")
+        program["user_enrollment"] = {"status": "active"}
+
+        assert "user_enrollment" not in await cache.get("education_programs", "p1")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_reads_share_one_load(self, local_db, cache):
+        await asyncio.gather(
+            *(cache.lookup("mos_translation", "mos_code", "12B") for _ in range(10))
+        )
+
+        assert cache.get_stats()["loads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tables_load_in_batches(self, local_db, cache, monkeypatch):
+        monkeypatch.setattr(reference_data_module, "REFERENCE_LOAD_BATCH", 2)
+        local_db.table("skills_mapping").insert(
+            [{"id": f"s{i}", "skill_name": f"skill-{i}"} for i in range(5)]
+        ).execute()
+
+        assert len(await cache.rows("skills_mapping")) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_ids_are_read_through(self, local_db, cache):
+        await cache.snapshot("education_programs")
+        local_db.table("education_programs").insert({"id": "p4", "program_name": "New"}).execute()
+
+        assert (await cache.get("education_programs", "p4"))["program_name"] == "New"
+        assert await cache.get("education_programs", "missing") is None
+        assert cache.get_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_reloads_only_changed_tables(self, local_db, cache):
+        """Writes bump the table's version stamp; the poll reloads that table alone"""
+        await cache.snapshot("mos_translation")
+        await cache.snapshot("education_programs")
+        version = (await cache.snapshot("mos_translation")).version
+
+        local_db.table("mos_translation").insert({"id": "m3", "mos_code": "88M"}).execute()
+
+        assert await cache.refresh() == ["mos_translation"]
+        assert (await cache.snapshot("mos_translation")).version == version + 1
+        assert await cache.lookup("mos_translation", "mos_code", "88M")
+        assert await cache.refresh() == []
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers(self, local_db, make_fake_redis):
+        """invalidate() drops the snapshot in every worker through Redis pub/sub"""
+        writer, reader = (
+            ReferenceDataCache(refresh_interval=3600, redis=make_fake_redis()) for _ in range(2)
+        )
+        await reader.snapshot("education_programs")
+        await asyncio.sleep(0.05)
+        local_db.table("education_programs").insert(
+            {"id": "p5", "program_name": "Heat Pumps"}
+        ).execute()
+
+        await writer.invalidate("education_programs")
+        for _ in range(100):
+            if "education_programs" not in reader.get_stats()["tables"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(await reader.rows("education_programs")) == 4
+        await writer.stop()
+        await reader.stop()
+
+
+class TestEducationRoutes:
+    """Tests for education endpoints served from reference data"""
+
+    @pytest.mark.asyncio
+    async def test_created_program_is_readable_immediately(self, local_db, cache):
+        await cache.snapshot("education_programs")
+        created = await education.create_education_program(
+            {"program_name": "Retrofit Lab", "provider": "CC", "description": "Hands on"},
+            user_id="admin-1",
+        )
+
+        result = await education.get_education_program(created["program"]["id"], user_id="user-1")
+
+        assert result["program"]["program_name"] == "Retrofit Lab"
+        assert cache.get_stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_role_requirement_lists_related_programs(self, local_db, cache):
+        result = await education.get_role_requirement("r1", user_id="user-1")
+
+        assert {p["id"] for p in result["role"]["related_programs"]} == {"p1", "p3"}
+        assert set(result["role"]["related_programs"][0]) == {
+            "id",
+            "program_name",
+            "provider",
+            "description",
+        }
+
+    @pytest.mark.asyncio
+    async def test_skills_mapping_compares_against_cached_role(self, local_db, cache):
+        result = await education.create_skills_mapping(
+            {"current_skills": ["wiring"], "target_role": "Solar Installer"}, user_id="user-1"
+        )
+
+        assert result["mapping"]["skill_gaps"] == ["safety"]
+        assert result["mapping"]["match_percentage"] == 50
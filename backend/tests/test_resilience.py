@@ -0,0 +1,170 @@
+"""
+Tests for per-provider concurrency limiting, load shedding and circuit breaking.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from backend.adapters.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    GuardedChatModel,
+    LoadShedError,
+    ProviderGuard,
+)
+
+
+class FaultInjectingModel:
+    """Chat model stub with configurable latency and failures."""
+
+    def __init__(self, latency=0.02, fail=False):
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail:
+                raise ConnectionError("injected provider failure")
+            return AIMessage(content="ok")
+        finally:
+            self.active -= 1
+
+
+def make_guard(initial_limit=4, **breaker_kwargs):
+    """Guard with small limits suitable for tests."""
+    breaker_kwargs.setdefault("min_requests", 4)
+    breaker_kwargs.setdefault("open_seconds", 0.2)
+    return ProviderGuard(
+        "stub",
+        limiter=AdaptiveConcurrencyLimiter("stub", initial_limit=initial_limit, max_limit=8),
+        breaker=CircuitBreaker("stub", **breaker_kwargs),
+        timeout=5,
+    )
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the AIMD limiter and its wait queue."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_bounded(self):
+        """Excess calls queue instead of all reaching the provider at once."""
+        stub = FaultInjectingModel()
+        model = GuardedChatModel(stub, make_guard(initial_limit=3))
+
+        await asyncio.gather(*(model.ainvoke("hi") for _ in range(20)))
+
+        assert stub.calls == 20
+        assert stub.peak <= model.guard.limiter.max_limit
+        assert model.guard.limiter.stats["queued"] > 0
+
+    @pytest.mark.asyncio
+    async def test_limit_backs_off_on_latency_and_recovers(self):
+        """Slow responses cut the limit; healthy ones grow it back."""
+        limiter = AdaptiveConcurrencyLimiter("stub", initial_limit=8)
+        limiter.on_result(0.1, True)
+        limiter.on_result(1.0, True)
+        reduced = limiter.limit
+
+        for _ in range(50):
+            limiter.on_result(0.1, True)
+
+        assert reduced < 8
+        assert limiter.limit > reduced
+
+    @pytest.mark.asyncio
+    async def test_requests_that_cannot_meet_deadline_are_shed(self):
+        """Queued requests are rejected instead of waiting past their deadline."""
+        stub = FaultInjectingModel(latency=0.2)
+        guard = make_guard(initial_limit=1)
+
+        results = await asyncio.gather(
+            *(
+                guard.call(lambda: stub.ainvoke("hi"), deadline=time.monotonic() + 0.1)
+                for _ in range(5)
+            ),
+            return_exceptions=True,
+        )
+
+        shed = [r for r in results if isinstance(r, LoadShedError)]
+        assert len(shed) == 4
+        assert guard.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_by_default(self):
+        """Without a timeout or caller deadline, slow calls run to completion."""
+        stub = FaultInjectingModel(latency=0.05)
+        guard = ProviderGuard("stub")
+
+        response = await guard.call(lambda: stub.ainvoke("hi"))
+
+        assert guard.timeout is None
+        assert response.content == "ok"
+
+
+class TestCircuitBreaker:
+    """Tests for failing fast when a provider is unhealthy."""
+
+    @pytest.mark.asyncio
+    async def test_opens_on_errors_and_fails_fast(self):
+        """After enough failures calls are rejected without reaching the provider."""
+        stub = FaultInjectingModel(fail=True)
+        model = GuardedChatModel(stub, make_guard())
+
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                await model.ainvoke("hi")
+
+        with pytest.raises(CircuitOpenError):
+            await model.ainvoke("hi")
+        assert stub.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_circuit(self):
+        """A successful probe after the cool-down closes the circuit again."""
+        stub = FaultInjectingModel(fail=True)
+        model = GuardedChatModel(stub, make_guard())
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                await model.ainvoke("hi")
+
+        stub.fail = False
+        await asyncio.sleep(0.25)
+        response = await model.ainvoke("hi")
+
+        assert response.content == "ok"
+        assert model.guard.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_probe_cancelled_while_queued_is_released(self):
+        """Cancelling a half-open probe before it gets a slot lets the next call probe."""
+        stub = FaultInjectingModel(fail=True)
+        guard = make_guard(initial_limit=1)
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                await guard.call(lambda: stub.ainvoke("hi"))
+        stub.fail = False
+        await asyncio.sleep(0.25)
+
+        await guard.limiter.acquire(None)
+        probe = asyncio.create_task(guard.call(lambda: stub.ainvoke("hi")))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        guard.limiter.release()
+
+        response = await guard.call(lambda: stub.ainvoke("hi"))
+
+        assert response.content == "ok"
+        assert guard.breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,138 @@
+"""
+Tests for knowledge resource facet counts.
+"""
+
+import pytest
+
+from backend.api.routes import resources
+from backend.api.routes.resources import (
+    get_resource_categories,
+    get_resource_facets,
+    get_resource_tags,
+    resource_facets_cache,
+)
+from backend.database.local_seed import seed_knowledge_resources
+
+
+async def _facets(**params):
+    defaults = dict(
+        content_type=None,
+        category=None,
+        tags=None,
+        status="published",
+        visibility=None,
+        tag_limit=50,
+        user_id="user-1",
+    )
+    return await get_resource_facets(**{**defaults, **params})
+
+
+def _python_counts(rows, column):
+    """What the endpoints used to compute from every row."""
+    counts = {}
+    for row in rows:
+        values = row.get(column)
+        for value in values if isinstance(values, list) else [values]:
+            if value:
+                counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+@pytest.fixture
+def local_db(local_db):
+    seed_knowledge_resources(local_db, 400, seed=5)
+    resource_facets_cache.clear()
+    yield local_db
+    resource_facets_cache.clear()
+
+
+class TestResourceFacets:
+    """Tests for the /facets, /categories and /tags endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_facets_match_row_counts(self, local_db):
+        """Database-side counts equal counting the matching rows"""
+        rows = (
+            local_db.table("knowledge_resources")
+            .select("*")
+            .eq("status", "published")
+            .eq("visibility", "public")
+            .execute()
+            .data
+        )
+        result = await _facets(tag_limit=200)
+        facets = result["facets"]
+
+        assert result["total"] == len(rows)
+        for facet, column in (
+            ("categories", "category"),
+            ("tags", "tags"),
+            ("content_types", "content_type"),
+            ("climate_sectors", "climate_sectors"),
+        ):
+            assert {f["name"]: f["count"] for f in facets[facet]} == _python_counts(rows, column)
+            counts = [f["count"] for f in facets[facet]]
+            assert counts == sorted(counts, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_filters_narrow_every_facet(self, local_db):
+        """Facets are computed over the filtered resources only"""
+        result = await _facets(content_type="guide", tags="solar")
+
+        assert result["facets"]["content_types"] == [{"name": "guide", "count": result["total"]}]
+        assert {"name": "solar", "count": result["total"]} in result["facets"]["tags"]
+
+    @pytest.mark.asyncio
+    async def test_non_admins_only_count_public_resources(self, local_db):
+        """Visibility is forced to public for non-admins"""
+        local_db.table("admin_profiles").insert({"user_id": "admin-1"}).execute()
+
+        public = await _facets(visibility="private")
+        everything = await _facets(user_id="admin-1")
+
+        assert public["filters_applied"]["visibility"] == "public"
+        assert everything["total"] > public["total"]
+
+    @pytest.mark.asyncio
+    async def test_categories_and_tags_share_the_cache(self, local_db, monkeypatch):
+        """The legacy endpoints read the same cached counts"""
+        calls = []
+        load = resources._load_resource_facets
+
+        async def counting_load(filters):
+            calls.append(filters)
+            return await load(filters)
+
+        monkeypatch.setattr(resources, "_load_resource_facets", counting_load)
+
+        categories = await get_resource_categories(user_id="user-1")
+        tags = await get_resource_tags(limit=5, user_id="user-1")
+        await _facets(visibility="public")
+
+        assert len(calls) == 1
+        names = [c["name"] for c in categories["categories"]]
+        assert names == sorted(names)
+        assert len(tags["tags"]) == 5
+        assert tags["total_unique_tags"] >= 5
+
+    @pytest.mark.asyncio
+    async def test_resource_writes_invalidate_facets(self, local_db):
+        """Creating a resource is reflected in the next facet request"""
+        before = await _facets()
+
+        await resources.create_knowledge_resource(
+            {
+                "title": "Offshore wind primer",
+                "content_type": "guide",
+                "description": "Getting started",
+                "category": "offshore",
+                "tags": ["offshore"],
+                "status": "published",
+                "visibility": "public",
+            },
+            user_id="author-1",
+        )
+        after = await _facets()
+
+        assert after["total"] == before["total"] + 1
+        assert {"name": "offshore", "count": 1} in after["facets"]["categories"]
@@ -0,0 +1,124 @@
+"""
+Tests for singleflight coalescing of LLM and embedding calls.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from backend.adapters.singleflight import (
+    CoalescingChatModel,
+    CoalescingEmbeddings,
+    SingleFlight,
+)
+
+
+class SlowStubModel:
+    """Chat model stub that counts upstream calls."""
+
+    model_name = "stub-chat"
+    temperature = 0.2
+
+    def __init__(self, delay=0.05, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return AIMessage(content=f"answer to {messages[-1].content}")
+
+
+class SlowStubEmbeddings:
+    """Embeddings stub that counts upstream calls."""
+
+    model = "stub-embed"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return [float(len(text)), 1.0]
+
+
+def prompt(text):
+    return [SystemMessage(content="You are Pendo."), HumanMessage(content=text)]
+
+
+class TestSingleFlight:
+    """Tests for in-process and cross-worker coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        """N identical concurrent calls produce a single upstream call."""
+        stub = SlowStubModel()
+        model = CoalescingChatModel(stub, SingleFlight())
+
+        results = await asyncio.gather(*(model.ainvoke(prompt("solar jobs?")) for _ in range(25)))
+
+        assert stub.calls == 1
+        assert {r.content for r in results} == {"answer to solar jobs?"}
+        assert model.singleflight.stats["coalesced"] == 24
+
+    @pytest.mark.asyncio
+    async def test_distinct_and_sequential_requests_are_not_coalesced(self):
+        """Different prompts and calls after completion go upstream."""
+        stub = SlowStubModel(delay=0.01)
+        model = CoalescingChatModel(stub, SingleFlight())
+
+        await asyncio.gather(model.ainvoke(prompt("a")), model.ainvoke(prompt("b")))
+        await model.ainvoke(prompt("a"))
+
+        assert stub.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_waiters(self):
+        """Every coalesced caller sees the upstream error."""
+        stub = SlowStubModel(fail=True)
+        model = CoalescingChatModel(stub, SingleFlight())
+
+        results = await asyncio.gather(
+            *(model.ainvoke(prompt("x")) for _ in range(5)), return_exceptions=True
+        )
+
+        assert stub.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_embeddings_coalesced(self):
+        """Identical embedding requests share one call."""
+        stub = SlowStubEmbeddings()
+        embeddings = CoalescingEmbeddings(stub, SingleFlight())
+
+        vectors = await asyncio.gather(
+            *(embeddings.aembed_query("wind technician") for _ in range(10))
+        )
+
+        assert stub.calls == 1
+        assert all(v == [15.0, 1.0] for v in vectors)
+
+    @pytest.mark.asyncio
+    async def test_workers_coalesce_through_redis(self, make_fake_redis):
+        """A second worker waits for the lock holder's published result."""
+        stub = SlowStubModel()
+        worker_a = CoalescingChatModel(
+            stub, SingleFlight(redis=make_fake_redis(), poll_interval=0.01)
+        )
+        worker_b = CoalescingChatModel(
+            stub, SingleFlight(redis=make_fake_redis(), poll_interval=0.01)
+        )
+
+        first, second = await asyncio.gather(
+            worker_a.ainvoke(prompt("heat pumps?")),
+            worker_b.ainvoke(prompt("heat pumps?")),
+        )
+
+        assert stub.calls == 1
+        assert first.content == second.content == "answer to heat pumps?"
+        assert worker_b.singleflight.stats["remote_coalesced"] == 1
@@ -0,0 +1,213 @@
+"""
+Tests for the set-based skills engine.
+"""
+
+import random
+
+import pytest
+
+from backend.api.routes import education
+from backend.services.reference_data import ReferenceDataCache
+from backend.services.skills_engine import (
+    PREFERRED_SKILL_WEIGHT,
+    RoleSkillMatrix,
+    SkillsEngine,
+    SkillVocabulary,
+    batch_coverage,
+    compare_skills,
+    normalize_skill,
+)
+
+SKILLS = [
+    {
+        "id": "s1",
+        "skill_name": "Solar PV Installation",
+        "category": "energy",
+        "keywords": ["solar install", "PV install"],
+    },
+    {"id": "s2", "skill_name": "Electrical Wiring", "category": "trades", "keywords": ["wiring"]},
+    {
+        "id": "s3",
+        "skill_name": "OSHA Safety",
+        "category": "safety",
+        "keywords": ["safety", "osha 30"],
+    },
+    {"id": "s4", "skill_name": "Project Management", "category": "business", "keywords": ["PMP"]},
+]
+
+ROLES = [
+    {
+        "id": "r1",
+        "role_title": "Solar Installer",
+        "required_skills": ["Solar PV Installation", "wiring"],
+        "preferred_skills": ["OSHA Safety"],
+    },
+    {
+        "id": "r2",
+        "role_title": "Site Manager",
+        "required_skills": ["Project Management", "Safety"],
+        "preferred_skills": ["Budgeting"],
+    },
+    {
+        "id": "r3",
+        "role_title": "Electrician",
+        "required_skills": ["Electrical Wiring"],
+        "preferred_skills": [],
+    },
+]
+
+
+@pytest.fixture
+def vocabulary():
+    return SkillVocabulary.from_skills_mapping(SKILLS)
+
+
+@pytest.fixture
+def local_db(local_db):
+    local_db.table("skills_mapping").insert(SKILLS).execute()
+    local_db.table("role_requirements").insert(ROLES).execute()
+    return local_db
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    cache = ReferenceDataCache(refresh_interval=0)
+    engine = SkillsEngine(reference=cache)
+    monkeypatch.setattr(education, "skills_engine", engine)
+    return engine
+
+
+class TestSkillVocabulary:
+    """Tests for SkillVocabulary"""
+
+    def test_normalization_ignores_case_and_punctuation(self):
+        assert normalize_skill("  Health & Safety ") == normalize_skill("health and safety")
+        assert normalize_skill("Solar-PV") == "solar pv"
+        assert normalize_skill("C++") != normalize_skill("C#")
+
+    def test_synonyms_resolve_to_the_canonical_skill(self, vocabulary):
+        assert vocabulary.resolve("pv install") == vocabulary.resolve("SOLAR PV installation")
+        assert vocabulary.decode([vocabulary.resolve("osha 30")]) == ["OSHA Safety"]
+        assert vocabulary.resolve("welding") is None
+
+    def test_synonyms_never_capture_a_canonical_name(self):
+        vocabulary = SkillVocabulary.from_skills_mapping(
+            [{"skill_name": "Electrical", "keywords": ["Wiring"]}, {"skill_name": "Wiring"}]
+        )
+
+        assert vocabulary.decode([vocabulary.resolve("wiring")]) == ["Wiring"]
+
+    def test_encode_is_sorted_and_unique(self, vocabulary):
+        ids = vocabulary.encode(["PMP", "wiring", "Electrical Wiring", "unknown", ""])
+
+        assert list(ids) == sorted({vocabulary.resolve("PMP"), vocabulary.resolve("wiring")})
+
+
+class TestCompareSkills:
+    """Tests for compare_skills()"""
+
+    def test_gaps_and_overlap_use_the_listed_names(self, vocabulary):
+        result = compare_skills(
+            vocabulary,
+            ["solar install", "OSHA 30"],
+            ["Solar PV Installation", "wiring"],
+            ["Safety", "Budgeting"],
+        )
+
+        assert result.matching == ["Solar PV Installation", "Safety"]
+        assert result.missing_required == ["wiring"]
+        assert result.missing_preferred == ["Budgeting"]
+        assert result.match_percentage == 50
+        assert result.coverage == pytest.approx(
+            (1 + PREFERRED_SKILL_WEIGHT) / (2 + 2 * PREFERRED_SKILL_WEIGHT)
+        )
+
+    def test_unknown_skills_match_by_normalized_name(self, vocabulary):
+        result = compare_skills(vocabulary, ["Heat-Pump Repair"], ["heat pump repair", "Welding"])
+
+        assert result.matching == ["heat pump repair"]
+        assert result.missing_required == ["Welding"]
+
+    def test_batch_coverage_matches_pairwise(self, vocabulary):
+        have = ["PV install", "Heat Pumps"]
+        requirements = [
+            (["Solar PV Installation", "wiring"], ["heat pumps"]),
+            ([], []),
+            (["Welding"], ["OSHA Safety", "welding"]),
+        ]
+
+        coverage = batch_coverage(vocabulary, have, requirements)
+
+        assert list(coverage) == pytest.approx(
+            [compare_skills(vocabulary, have, r, p).coverage for r, p in requirements]
+        )
+
+
+class TestRoleSkillMatrix:
+    """Tests for batch evaluation over RoleSkillMatrix"""
+
+    def test_roles_rank_by_weighted_coverage(self, vocabulary):
+        matrix = RoleSkillMatrix(vocabulary, ROLES)
+
+        fits = matrix.evaluate(["wiring", "PV install"], limit=2)
+
+        assert [fit.role["id"] for fit in fits] == ["r3", "r1"]
+        assert fits[1].comparison.missing_preferred == ["OSHA Safety"]
+        assert fits[1].comparison.match_percentage == 100
+
+    def test_batch_scores_agree_with_pairwise_comparison(self):
+        """Every role's coverage matches compare_skills on the same lists"""
+        rng = random.Random(7)
+        names = [f"skill {i}" for i in range(200)]
+        vocabulary = SkillVocabulary.from_skills_mapping([{"skill_name": n} for n in names])
+        roles = [
+            {
+                "id": str(i),
+                "required_skills": rng.sample(names, 6),
+                "preferred_skills": rng.sample(names, 3),
+            }
+            for i in range(500)
+        ]
+        profile = rng.sample(names, 40)
+        matrix = RoleSkillMatrix(vocabulary, roles)
+
+        coverage, required_share = matrix.score(vocabulary.encode(profile))
+        fits = matrix.evaluate(profile, limit=20)
+
+        for i, role in enumerate(roles):
+            expected = compare_skills(
+                vocabulary, profile, role["required_skills"], role["preferred_skills"]
+            )
+            assert coverage[i] == pytest.approx(expected.coverage)
+            assert required_share[i] * 100 == pytest.approx(expected.match_percentage)
+        assert [fit.comparison.coverage for fit in fits] == sorted(coverage, reverse=True)[:20]
+
+
+class TestSkillsEngine:
+    """Tests for SkillsEngine and the education routes using it"""
+
+    @pytest.mark.asyncio
+    async def test_index_is_rebuilt_only_when_a_snapshot_changes(self, local_db, engine):
+        first = await engine.index()
+        assert await engine.index() is first
+
+        await engine.reference.invalidate("role_requirements")
+        assert await engine.index() is not first
+
+    @pytest.mark.asyncio
+    async def test_evaluate_endpoint_ranks_roles(self, local_db, engine):
+        result = await education.evaluate_skills(
+            {"skills": ["electrical wiring", "Forklift"]}, limit=2, user_id="user-1"
+        )
+
+        assert result["roles"][0]["role_title"] == "Electrician"
+        assert result["roles"][0]["coverage"] == 1.0
+        assert result["unrecognized_skills"] == ["Forklift"]
+        assert result["roles_evaluated"] == 3
+
+    @pytest.mark.asyncio
+    async def test_evaluate_endpoint_requires_skills(self, local_db, engine):
+        with pytest.raises(education.HTTPException) as exc:
+            await education.evaluate_skills({"skills": []}, limit=10, user_id="user-1")
+
+        assert exc.value.status_code == 400
@@ -0,0 +1,107 @@
+"""
+Tests for the deterministic offline stub providers.
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from backend.adapters import models
+from backend.adapters.stub import StubChatModel, StubEmbeddings
+
+
+class TestStubChatModel:
+    """Tests for StubChatModel responses and timing."""
+
+    @pytest.mark.asyncio
+    async def test_responses_are_deterministic(self):
+        """The same prompt always produces the same response and usage."""
+        model = StubChatModel(latency_ms=0, tokens_per_second=0, response_tokens=30)
+
+        first = await model.ainvoke("What solar apprenticeships exist?")
+        second = await model.ainvoke("What solar apprenticeships exist?")
+        other = await model.ainvoke("How do I translate my MOS?")
+
+        assert first.content == second.content != other.content
+        assert first.usage_metadata["output_tokens"] == 30
+
+    @pytest.mark.asyncio
+    async def test_json_prompts_get_the_template_fields(self):
+        """Prompts asking for JSON get parseable JSON with the requested keys."""
+        model = StubChatModel(latency_ms=0, tokens_per_second=0)
+        prompt = 'Respond in JSON format:\n{"team": "team_name", "agent": "agent_name", "confidence": 0.0-1.0}'
+
+        response = await model.ainvoke(
+            [SystemMessage(content=prompt), HumanMessage(content="solar jobs")]
+        )
+        data = json.loads(response.content)
+
+        assert set(data) == {"team", "agent", "confidence"}
+        assert 0.0 <= data["confidence"] <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_stream_chunking_and_latency(self):
+        """Streams honor the first-token delay and chunk size."""
+        model = StubChatModel(
+            latency_ms=50, tokens_per_second=0, chunk_tokens=5, response_tokens=20
+        )
+
+        started = time.perf_counter()
+        chunks = []
+        first_token = None
+        async for chunk in model.astream("wind technician training"):
+            if first_token is None:
+                first_token = time.perf_counter() - started
+            chunks.append(chunk)
+
+        text = "".join(c.content for c in chunks)
+        assert first_token >= 0.05
+        assert len(text.split()) == 20
+        assert len([c for c in chunks if c.content]) == 4
+        assert chunks[-1].usage_metadata["output_tokens"] == 20
+
+
+class TestStubEmbeddings:
+    """Tests for hash-based embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_vectors_are_stable_unit_vectors_of_the_right_size(self):
+        """Embeddings have the configured dimension and are reproducible."""
+        embeddings = StubEmbeddings(dimensions=384, latency_ms=0)
+
+        vector = await embeddings.aembed_query("heat pump installer")
+        batch = embeddings.encode(["heat pump installer", "grant writer"])
+
+        assert len(vector) == 384
+        assert batch.shape == (2, 384)
+        assert np.allclose(batch[0], vector)
+        assert np.isclose(np.linalg.norm(vector), 1.0)
+
+
+class TestProviderSelection:
+    """Tests for LLM_PROVIDER=stub in the model factories."""
+
+    def test_factories_return_stubs_without_api_keys(self, monkeypatch):
+        """Primary, secondary, ad-hoc and embedding models are stubs."""
+        monkeypatch.setenv("LLM_PROVIDER", "stub")
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("DEEPSEEK_API_KEY", raising=False)
+
+        assert isinstance(models.get_primary_model(), StubChatModel)
+        assert isinstance(models.get_secondary_model(), StubChatModel)
+        assert isinstance(models.get_chat_model("gpt-4o-mini"), StubChatModel)
+        assert models.get_embeddings_model().dimensions == 1536
+        assert models.create_langchain_llm(latency_critical=True) is not None
+
+    def test_ad_hoc_models_are_accounted(self, monkeypatch):
+        """get_chat_model attaches usage accounting for the real provider too."""
+        monkeypatch.delenv("LLM_PROVIDER", raising=False)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        model = models.get_chat_model("gpt-4o-mini")
+
+        assert models.usage_callback in model.callbacks
+        assert model.stream_usage is True
@@ -0,0 +1,162 @@
+"""
+Tests for callback-based LLM token and cost accounting.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.adapters.usage import (
+    UsageAccountant,
+    UsageCallbackHandler,
+    estimate_cost,
+    usage_context,
+    usage_metadata,
+)
+
+
+@pytest.fixture
+def accountant(fake_redis):
+    """Accountant with the periodic flusher disabled."""
+    return UsageAccountant(flush_interval=0, redis=fake_redis)
+
+
+class TestUsageAccounting:
+    """Tests for per-call usage capture and aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_provider_usage_is_recorded_with_tags(self, accountant):
+        """Reported prompt, completion and cached tokens are tagged by agent and node."""
+        reply = AIMessage(
+            content="Look at the MassCEC internship program.",
+            usage_metadata={
+                "input_tokens": 1500,
+                "output_tokens": 40,
+                "total_tokens": 1540,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+        model = GenericFakeChatModel(
+            messages=iter([reply]), callbacks=[UsageCallbackHandler(accountant)]
+        )
+
+        with usage_context(agent="jasmine", node="jasmine_agent", conversation_id="c1"):
+            await model.ainvoke([HumanMessage(content="internships?")])
+
+        (row,) = accountant.get_stats()["breakdown"]
+        assert (row["agent"], row["node"]) == ("jasmine", "jasmine_agent")
+        assert (row["prompt"], row["cached"], row["completion"]) == (1500, 1024, 40)
+        assert accountant.stats["estimated_calls"] == 0
+        assert accountant._pending_conversations == {"c1": 1540}
+
+    @pytest.mark.asyncio
+    async def test_stream_without_usage_falls_back_to_tokenizer(self, accountant):
+        """Streams that report no usage are counted locally."""
+        model = FakeListChatModel(
+            responses=["Solar installers are in demand across Massachusetts."],
+            callbacks=[UsageCallbackHandler(accountant)],
+        )
+        config = {"metadata": usage_metadata(agent="alex", node="stream_response")}
+
+        chunks = [c async for c in model.astream("solar jobs?", config)]
+
+        (row,) = accountant.get_stats()["breakdown"]
+        assert chunks
+        assert row["node"] == "stream_response"
+        assert row["prompt"] > 0 and row["completion"] > 0
+        assert accountant.stats["estimated_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_daily_aggregates(self, accountant):
+        """Pending totals are flushed to Redis and cleared."""
+        accountant.record("deepseek-chat", 1000, 200, 500, tags={"node": "semantic_routing"})
+        accountant.record("deepseek-chat", 1000, 200, 500, tags={"node": "semantic_routing"})
+
+        await accountant.flush()
+
+        client = accountant.redis.client
+        (key,) = await client.keys("ai_usage:*")
+        fields = await client.hgetall(key)
+        assert fields["deepseek-chat|-|semantic_routing|calls"] == "2"
+        assert fields["deepseek-chat|-|semantic_routing|cached"] == "1000"
+        assert accountant._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_flushes_add_conversation_tokens(self, local_db, make_fake_redis):
+        """Workers flushing the same conversation both count; neither overwrites the other."""
+        local_db.table("conversations").insert(
+            {"id": "c1", "user_id": "u1", "total_tokens_used": 100}
+        ).execute()
+        workers = [UsageAccountant(flush_interval=0, redis=make_fake_redis()) for _ in range(2)]
+        for tokens, worker in zip((1540, 260), workers):
+            worker.record("deepseek-chat", tokens, 0, tags={"conversation_id": "c1"})
+
+        await asyncio.gather(*(worker.flush() for worker in workers))
+
+        (row,) = (
+            local_db.table("conversations")
+            .select("total_tokens_used")
+            .eq("id", "c1")
+            .execute()
+            .data
+        )
+        assert row["total_tokens_used"] == 1900
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, accountant, local_db, monkeypatch):
+        """Usage from a failed flush is kept and written, summed, by the next one."""
+        local_db.table("conversations").insert(
+            {"id": "c1", "user_id": "u1", "total_tokens_used": 100}
+        ).execute()
+        accountant.record(
+            "deepseek-chat", 1500, 40, tags={"agent": "pendo", "conversation_id": "c1"}
+        )
+
+        class DownRedis:
+            @asynccontextmanager
+            async def get_connection(self):
+                raise ConnectionError("redis unavailable")
+                yield
+
+        def failing_rpc(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(local_db, "rpc", failing_rpc)
+            patch.setattr(accountant, "_redis", DownRedis())
+            await accountant.flush()
+        assert accountant.stats["flush_errors"] == 2
+
+        accountant.record(
+            "deepseek-chat", 200, 10, tags={"agent": "pendo", "conversation_id": "c1"}
+        )
+        await accountant.flush()
+
+        (row,) = (
+            local_db.table("conversations")
+            .select("total_tokens_used")
+            .eq("id", "c1")
+            .execute()
+            .data
+        )
+        assert row["total_tokens_used"] == 1850
+        client = accountant.redis.client
+        (key,) = await client.keys("ai_usage:*")
+        fields = await client.hgetall(key)
+        assert fields["deepseek-chat|pendo|-|calls"] == "2"
+        assert fields["deepseek-chat|pendo|-|prompt"] == "1700"
+        assert accountant._pending == {} and accountant._pending_conversations == {}
+
+    def test_cached_tokens_are_discounted(self):
+        """Cached prompt tokens are priced at the cache-hit rate."""
+        full = estimate_cost("deepseek-chat", 1_000_000, 0, 0)
+        cached = estimate_cost("deepseek-chat", 1_000_000, 1_000_000, 0)
+
+        assert cached < full
+        assert estimate_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0, 0) == 0.15
@@ -0,0 +1,164 @@
+"""
+Tests for buffered resource view counting.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.database import supabase_client
+from backend.services.view_counter import ViewCounter
+
+
+@pytest.fixture
+def local_db(local_db):
+    local_db.table("knowledge_resources").insert(
+        [{"id": "r1", "title": "Heat pumps", "view_count": 7}, {"id": "r2", "title": "Solar"}]
+    ).execute()
+    return local_db
+
+
+@pytest.fixture
+def counter(fake_redis):
+    """Counter with the periodic flusher disabled."""
+    return ViewCounter(flush_interval=0, redis=fake_redis)
+
+
+def _view_count(db, resource_id):
+    return (
+        db.table("knowledge_resources")
+        .select("view_count")
+        .eq("id", resource_id)
+        .execute()
+        .data[0]["view_count"]
+    )
+
+
+def _events(db):
+    return db.table("resource_views").select("*").execute().data
+
+
+class TestViewCounter:
+    """Tests for ViewCounter"""
+
+    @pytest.mark.asyncio
+    async def test_views_are_buffered_until_flush(self, counter, local_db):
+        """Recording touches Redis only; a flush writes counts and events"""
+        assert await counter.record("r1", user_id="u1")
+        assert await counter.record("r2", user_id="u1")
+
+        assert _view_count(local_db, "r1") == 7
+        assert _events(local_db) == []
+
+        assert await counter.flush() == {"views": 2, "events": 2}
+        assert _view_count(local_db, "r1") == 8
+        assert _view_count(local_db, "r2") == 1
+        assert {e["resource_id"] for e in _events(local_db)} == {"r1", "r2"}
+        assert await counter.flush() == {"views": 0, "events": 0}
+
+    @pytest.mark.asyncio
+    async def test_repeat_views_within_window_count_once(self, counter, local_db):
+        """The same user re-reading a resource inside the dedupe window is dropped"""
+        results = [await counter.record("r1", user_id="u1") for _ in range(3)]
+        await counter.record("r1", user_id="u2")
+        await counter.flush()
+
+        assert results == [True, False, False]
+        assert _view_count(local_db, "r1") == 9
+        assert counter.get_stats()["deduplicated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_no_lost_increments_under_concurrency(self, local_db, make_fake_redis):
+        """Concurrent views and flushes from several workers add up exactly"""
+        workers = [ViewCounter(flush_interval=0, redis=make_fake_redis()) for _ in range(3)]
+
+        async def view(i):
+            await workers[i % 3].record("r1", user_id=f"user-{i}")
+
+        async def flush_repeatedly(worker):
+            for _ in range(20):
+                await worker.flush()
+                await asyncio.sleep(0)
+
+        await asyncio.gather(
+            *(view(i) for i in range(300)), *(flush_repeatedly(w) for w in workers)
+        )
+        await workers[0].flush()
+
+        assert _view_count(local_db, "r1") == 7 + 300
+        assert len(_events(local_db)) == 300
+        rollup = local_db.table("resource_view_daily").select("view_count").execute().data
+        assert sum(row["view_count"] for row in rollup) == 300
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, counter, local_db, monkeypatch):
+        """Buffered views survive a database failure and land on the next flush"""
+        for i in range(5):
+            await counter.record("r1", user_id=f"user-{i}")
+
+        def failing_rpc(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(local_db, "rpc", failing_rpc)
+        first = await counter.flush()
+        await counter.record("r1", user_id="user-5")
+        monkeypatch.undo()
+        monkeypatch.setattr(supabase_client.supabase, "_client", local_db)
+        second = await counter.flush()
+        third = await counter.flush()
+
+        assert first == {"views": 0, "events": 5}
+        assert counter.get_stats()["flush_errors"] == 1
+        # The claimed batch is retried before newer views are claimed
+        assert second == {"views": 5, "events": 1}
+        assert third == {"views": 1, "events": 0}
+        assert _view_count(local_db, "r1") == 13
+        assert len(_events(local_db)) == 6
+
+    @pytest.mark.asyncio
+    async def test_replayed_events_are_ignored(self, counter, local_db):
+        """Events already written are skipped when a claimed batch is replayed"""
+        await counter.record("r1", user_id="u1")
+        client = counter.redis.client
+        events = await client.lrange("resource_views:events", 0, -1)
+        await counter.flush()
+        await client.rpush("resource_views:events:claimed", *events)
+
+        assert (await counter.flush())["events"] == 1
+        assert len(_events(local_db)) == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_directly_without_redis(self, local_db):
+        """Views are not lost when Redis is down"""
+
+        class DownRedis:
+            @asynccontextmanager
+            async def get_connection(self):
+                raise ConnectionError("redis down")
+                yield
+
+        counter = ViewCounter(flush_interval=0, redis=DownRedis())
+
+        assert await counter.record("r1", user_id="u1")
+        assert _view_count(local_db, "r1") == 8
+        assert len(_events(local_db)) == 1
+        assert counter.get_stats()["direct_writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_resource_read_buffers_its_view(self, counter, local_db, monkeypatch):
+        """Fetching a resource no longer writes to the database"""
+        from backend.api.routes import resources
+
+        local_db.table("knowledge_resources").insert(
+            {"id": "r3", "created_by": "author", "visibility": "public", "view_count": 2}
+        ).execute()
+        monkeypatch.setattr(resources, "view_counter", counter)
+
+        result = await resources.get_knowledge_resource("r3", user_id="reader")
+
+        assert result["resource"]["view_count"] == 3
+        assert _view_count(local_db, "r3") == 2
+        await counter.flush()
+        assert _view_count(local_db, "r3") == 3
+        assert _events(local_db)[0]["interaction_metadata"] == {"access_method": "direct"}
@@ -28,10 +28,13 @@ except ImportError:
     pass
 
 # Fallback imports
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import ChatOpenAI
 
+from backend.adapters.models import get_embeddings_model, use_stub_provider
+from backend.adapters.stub import SENTENCE_TRANSFORMER_DIMENSIONS, StubEmbeddings
 from backend.config.environment import get_settings
 from backend.config.supabase import get_supabase_client
+from backend.services.embeddings import embedding_model_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -46,6 +49,8 @@ class ProductionResumeProcessor:
         # Initialize with DeepSeek for cost optimization
         self.llm = None
         self.embeddings_model = None
+        # Recorded with each chunk so the backfill job spots other models
+        self.embedding_model = embedding_model_id()
         
         try:
             from backend.adapters.models import create_langchain_llm
@@ -56,15 +61,23 @@ class ProductionResumeProcessor:
             )
             logger.info("💰 Using DeepSeek LLM")
 
-            # Try free embeddings first
-            try:
-                from sentence_transformers import SentenceTransformer
-                self.embeddings_model = SentenceTransformer("all-MiniLM-L6-v2")
-                logger.info("✅ Using FREE sentence-transformers embeddings")
-            except ImportError:
-                # Fallback to OpenAI embeddings if needed
-                self.embeddings = OpenAIEmbeddings(api_key=settings.OPENAI_API_KEY)
-                logger.warning("💸 Using OpenAI embeddings as fallback")
+            if use_stub_provider():
+                # Same vector size as all-MiniLM-L6-v2, without the model download
+                self.embeddings_model = StubEmbeddings(
+                    dimensions=SENTENCE_TRANSFORMER_DIMENSIONS
+                )
+                logger.info("🧪 Using offline stub embeddings")
+            else:
+                # Try free embeddings first
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    self.embeddings_model = SentenceTransformer("all-MiniLM-L6-v2")
+                    self.embedding_model = embedding_model_id("all-MiniLM-L6-v2")
+                    logger.info("✅ Using FREE sentence-transformers embeddings")
+                except ImportError:
+                    # Fallback to OpenAI embeddings if needed
+                    self.embeddings = get_embeddings_model(api_key=settings.OPENAI_API_KEY)
+                    logger.warning("💸 Using OpenAI embeddings as fallback")
 
         except Exception as e:
             logger.error(f"❌ Resume processor initialization failed: {e}")
@@ -513,6 +526,7 @@ class ProductionResumeProcessor:
                     "importance_score": chunk["metadata"].get("importance", 0.5),
                     "metadata": chunk["metadata"],
                     "embedding": embedding,
+                    "embedding_model": self.embedding_model,
                     "created_at": datetime.utcnow().isoformat(),
                 }
                 chunk_records.append(chunk_record)
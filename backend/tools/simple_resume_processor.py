@@ -7,9 +7,10 @@ from typing import Dict, Any, List
 from datetime import datetime
 import json
 
-from langchain_openai import OpenAIEmbeddings
+from backend.adapters.models import get_embeddings_model
 from backend.config.environment import get_settings
 from backend.config.supabase import get_supabase_client
+from backend.services.embeddings import embedding_model_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -30,7 +31,7 @@ class SimpleResumeProcessor:
             )
             
             # Use OpenAI embeddings as fallback (since sentence-transformers causing issues)
-            self.embeddings = OpenAIEmbeddings(api_key=settings.OPENAI_API_KEY)
+            self.embeddings = get_embeddings_model(api_key=settings.OPENAI_API_KEY)
             
             logger.info("✅ Using DeepSeek LLM + OpenAI embeddings")
 
@@ -176,6 +177,7 @@ class SimpleResumeProcessor:
                 "chunk_index": i,
                 "metadata": chunk["metadata"],
                 "embedding": embedding,
+                "embedding_model": embedding_model_id(),
                 "created_at": datetime.utcnow().isoformat(),
             }
             chunk_records.append(chunk_record)
@@ -0,0 +1,231 @@
+"""
+Bounded in-process cache for async function results.
+
+Entries live in an LRU bounded by entry count and by approximate memory use,
+each with its own TTL. Concurrent misses for the same key share one
+computation. With a stale window, an expired entry keeps being served while
+a single background task refreshes it (stale-while-revalidate).
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+def _typed(value: Any) -> Any:
+    # 1, 1.0 and True compare and hash equal; tag each value with its type so
+    # they do not share an entry
+    if isinstance(value, tuple):
+        return (tuple, tuple(_typed(item) for item in value))
+    return (type(value).__name__, value)
+
+
+def make_cache_key(namespace: str, args: Tuple = (), kwargs: Optional[Dict] = None) -> Hashable:
+    """
+    Key for a call signature.
+
+    Hashable arguments are used as-is, tagged with their types (a tuple hash,
+    no serialization); anything else is serialized once and digested.
+    """
+    items = tuple(sorted(kwargs.items())) if kwargs else ()
+    key = (namespace, _typed(args), _typed(items))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        raw = json.dumps([args, items], sort_keys=True, default=repr)
+        return (namespace, hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest())
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate memory footprint in bytes of plain containers and scalars."""
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in value)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "size")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.size = size
+
+
+class AsyncTTLCache:
+    """
+    Size- and memory-bounded LRU cache with per-entry TTL.
+
+    ``get_or_compute`` is the main entry point: hits return immediately,
+    concurrent misses for a key await a single computation, and entries
+    within their stale window are served while one refresh runs in the
+    background. Failed computations are never cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 60.0,
+        stale_ttl: float = 0.0,
+        name: str = "cache",
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._bytes = 0
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "errors": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry.expires_at
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Fresh value for ``key``, or ``default``."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.expires_at:
+            return default
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """Store ``value``, evicting least recently used entries past the bounds."""
+        ttl = self.default_ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        now = time.monotonic()
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug("Value larger than cache budget, not cached", cache=self.name)
+            return
+
+        self._drop(key)
+        self._entries[key] = _Entry(value, now + ttl, now + ttl + stale_ttl, size)
+        self._bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats["evictions"] += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        return self._drop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _drop(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> Any:
+        """Cached value for ``key``, computing it at most once concurrently."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self.stats["stale_hits"] += 1
+                if key not in self._inflight:
+                    self.stats["refreshes"] += 1
+                    self._start(key, compute, ttl, stale_ttl)
+                return entry.value
+            self._drop(key)
+            self.stats["expirations"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["misses"] += 1
+            task = self._start(key, compute, ttl, stale_ttl)
+        else:
+            self.stats["coalesced"] += 1
+        # Shielded so a cancelled caller does not cancel the shared computation
+        return await asyncio.shield(task)
+
+    def _start(self, key, compute, ttl, stale_ttl) -> asyncio.Task:
+        task = asyncio.ensure_future(self._compute(key, compute, ttl, stale_ttl))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+
+    async def _compute(self, key, compute, ttl, stale_ttl) -> Any:
+        value = await compute()
+        self.set(key, value, ttl, stale_ttl)
+        return value
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+            logger.debug("Cached computation failed", cache=self.name, error=str(task.exception()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "in_flight": len(self._inflight),
+            "hit_rate": (
+                (self.stats["hits"] + self.stats["stale_hits"] + self.stats["coalesced"])
+                / (lookups + self.stats["coalesced"])
+                if lookups
+                else 0.0
+            ),
+        }
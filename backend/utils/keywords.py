@@ -0,0 +1,225 @@
+"""
+Shared multi-pattern keyword matching.
+
+Keyword tables from across the backend (routing fallbacks, agent analysis
+helpers, resume analysis) register under a namespace and are compiled
+together into one matcher. A scan lowercases the text once and finds every
+keyword of every table in a single regex pass, returning weighted hits per
+category, instead of rescanning the text once per keyword.
+
+Matching keeps the substring semantics of the ``keyword in text`` checks it
+replaces (``"veteran"`` matches ``"veterans"``), including overlapping and
+nested keywords.
+"""
+
+import functools
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
+
+KeywordTable = Union[Iterable[str], Mapping[str, float]]
+
+# Texts longer than this are scanned without being cached
+MAX_CACHED_TEXT = 2000
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex alternation shaped like a trie of ``keywords``.
+
+    Shared prefixes are factored out and optional tails are greedy, so at
+    each position the longest keyword starting there is captured.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _weighted(table: KeywordTable) -> Dict[str, float]:
+    if isinstance(table, Mapping):
+        return {k.lower(): float(w) for k, w in table.items()}
+    return {k.lower(): 1.0 for k in table}
+
+
+class KeywordHits:
+    """Keywords found in one text, grouped by category."""
+
+    __slots__ = ("keywords", "_matches", "_scores", "_scopes")
+
+    def __init__(
+        self,
+        keywords: FrozenSet[str],
+        matches: Dict[str, Tuple[str, ...]],
+        scores: Dict[str, float],
+    ):
+        self.keywords = keywords
+        self._matches = matches
+        self._scores = scores
+        self._scopes: Dict[str, "KeywordHits"] = {}
+
+    def has(self, category: str) -> bool:
+        return category in self._matches
+
+    def matched(self, category: str) -> List[str]:
+        """Matched keywords of ``category``, in table order."""
+        return list(self._matches.get(category, ()))
+
+    def score(self, category: str) -> float:
+        """Sum of the weights of the matched keywords of ``category``."""
+        return self._scores.get(category, 0.0)
+
+    def scores(self) -> Dict[str, float]:
+        """Scores of the categories with hits, in registration order."""
+        return dict(self._scores)
+
+    def first(self, categories: Iterable[str]) -> Optional[str]:
+        """First of ``categories`` with a hit."""
+        return next((c for c in categories if c in self._matches), None)
+
+    def scoped(self, namespace: str) -> "KeywordHits":
+        """View of the categories under ``namespace``, without the prefix."""
+        # Hits for short texts are cached and shared, so keep their views too
+        view = self._scopes.get(namespace)
+        if view is None:
+            prefix = namespace + "."
+            size = len(prefix)
+            view = self._scopes[namespace] = KeywordHits(
+                self.keywords,
+                {c[size:]: m for c, m in self._matches.items() if c.startswith(prefix)},
+                {c[size:]: s for c, s in self._scores.items() if c.startswith(prefix)},
+            )
+        return view
+
+    def __repr__(self) -> str:
+        return f"KeywordHits({self._scores!r})"
+
+
+class KeywordMatcher:
+    """Compiled matcher over weighted keyword tables, one per category."""
+
+    def __init__(self, tables: Mapping[str, KeywordTable]):
+        self.categories: List[str] = list(tables)
+        # keyword -> (category, weight, position in its table)
+        self._owners: Dict[str, List[Tuple[str, float, int]]] = {}
+        for category, table in tables.items():
+            for position, (keyword, weight) in enumerate(_weighted(table).items()):
+                self._owners.setdefault(keyword, []).append((category, weight, position))
+
+        keywords = [k for k in self._owners if k]
+        # The regex reports the longest keyword at each position; shorter
+        # keywords starting at the same position are its prefixes
+        self._implied = {
+            keyword: tuple(k for k in keywords if keyword.startswith(k)) for keyword in keywords
+        }
+        self._order = {c: i for i, c in enumerate(self.categories)}
+        self._regex = re.compile(f"(?=({_trie_pattern(keywords)}))") if keywords else None
+
+    def scan(self, text: str) -> KeywordHits:
+        found = set()
+        if self._regex is not None and text:
+            implied = self._implied
+            for match in self._regex.finditer(text.lower()):
+                found.update(implied[match.group(1)])
+
+        grouped: Dict[str, List[Tuple[int, str]]] = {}
+        scores: Dict[str, float] = {}
+        for keyword in found:
+            for category, weight, position in self._owners[keyword]:
+                grouped.setdefault(category, []).append((position, keyword))
+                scores[category] = scores.get(category, 0.0) + weight
+
+        ordered = sorted(grouped, key=self._order.__getitem__)
+        return KeywordHits(
+            frozenset(found),
+            {c: tuple(k for _, k in sorted(grouped[c])) for c in ordered},
+            {c: scores[c] for c in ordered},
+        )
+
+
+class KeywordNamespace:
+    """Handle returned by ``register_keywords`` for one module's tables."""
+
+    def __init__(self, namespace: str, categories: List[str]):
+        self.namespace = namespace
+        self.categories = categories
+
+    def scan(self, text: str) -> KeywordHits:
+        """This namespace's hits from the shared single-pass scan."""
+        return scan_keywords(text).scoped(self.namespace)
+
+
+_tables: Dict[str, Dict[str, float]] = {}
+_shared: Optional[KeywordMatcher] = None
+
+
+def register_keywords(namespace: str, tables: Mapping[str, KeywordTable]) -> KeywordNamespace:
+    """
+    Add keyword tables to the shared matcher as ``namespace.category``.
+
+    Call at import time; the shared matcher is recompiled on next use.
+    """
+    global _shared
+    for category, table in tables.items():
+        _tables[f"{namespace}.{category}"] = _weighted(table)
+    _shared = None
+    _scan_cached.cache_clear()
+    return KeywordNamespace(namespace, list(tables))
+
+
+def shared_matcher() -> KeywordMatcher:
+    global _shared
+    if _shared is None:
+        _shared = KeywordMatcher(_tables)
+    return _shared
+
+
+@functools.lru_cache(maxsize=512)
+def _scan_cached(text: str) -> KeywordHits:
+    return shared_matcher().scan(text)
+
+
+def scan_keywords(text: str) -> KeywordHits:
+    """
+    Hits for every registered table in one pass over ``text``.
+
+    Results for short texts are cached, so the several analyzers that look
+    at the same user message share one scan.
+    """
+    if len(text) <= MAX_CACHED_TEXT:
+        return _scan_cached(text)
+    return shared_matcher().scan(text)
+
+
+class SubstringIndex:
+    """
+    Which of a fixed set of short strings contain a query.
+
+    The inverse of ``KeywordMatcher``: every substring of every value is
+    indexed up front, so ``query in value`` for all values is one lookup.
+    """
+
+    def __init__(self, values: Iterable[str]):
+        self.values = frozenset(v.lower() for v in values)
+        index: Dict[str, set] = {}
+        for value in self.values:
+            for start in range(len(value)):
+                for end in range(start + 1, len(value) + 1):
+                    index.setdefault(value[start:end], set()).add(value)
+        self._index = {k: frozenset(v) for k, v in index.items()}
+
+    def containing(self, query: str) -> FrozenSet[str]:
+        query = query.lower()
+        if not query:
+            return self.values
+        return self._index.get(query, frozenset())
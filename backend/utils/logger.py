@@ -32,6 +32,7 @@ class StructuredLogger:
         """Initialize a structured logger with the given name and level."""
         self.logger = logging.getLogger(name)
         self.logger.setLevel(LEVELS.get(level.upper(), logging.INFO))
+        self.context: Dict[str, Any] = {}
 
         # Add console handler if none exists
         if not self.logger.handlers:
@@ -43,8 +44,18 @@ class StructuredLogger:
         """Get a JSON formatter for structured logging."""
         return logging.Formatter(DEFAULT_FORMAT)
 
+    def bind(self, **context) -> "StructuredLogger":
+        """Return a logger that adds the given context to every message."""
+        bound = StructuredLogger.__new__(StructuredLogger)
+        bound.logger = self.logger
+        bound.context = {**self.context, **context}
+        return bound
+
     def _log(self, level: int, message: str, **kwargs):
         """Log a message with structured data."""
+        if self.context:
+            kwargs = {**self.context, **kwargs}
+
         # Add timestamp if not present
         if "timestamp" not in kwargs:
             kwargs["timestamp"] = datetime.utcnow().isoformat()
@@ -4,15 +4,20 @@ Implements strategies for improving speed, efficiency, and cost-effectiveness.
 """
 
 import asyncio
-import time
+import os
+import random
 import functools
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
-import json
 
+from backend.adapters.resilience import ProviderUnavailableError
+from backend.utils.cache import AsyncTTLCache, make_cache_key
 from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+FUNCTION_CACHE_MAX_ENTRIES = int(os.getenv("FUNCTION_CACHE_MAX_ENTRIES", "10000"))
+FUNCTION_CACHE_MAX_MB = int(os.getenv("FUNCTION_CACHE_MAX_MB", "64"))
+
 T = TypeVar("T")
 
 
@@ -24,16 +29,25 @@ class OptimizationManager:
 
     def __init__(self):
         """Initialize the optimization manager."""
-        self.cache = {}
+        self.cache = AsyncTTLCache(
+            max_entries=FUNCTION_CACHE_MAX_ENTRIES,
+            max_bytes=FUNCTION_CACHE_MAX_MB * 1024 * 1024,
+            name="function_cache",
+        )
         self.ai_usage_stats = {
-            "tokens": {"prompt": 0, "completion": 0, "total": 0},
+            "tokens": {"prompt": 0, "completion": 0, "cached": 0, "total": 0},
             "cost": 0.0,
             "requests": 0,
             "models": {},
         }
 
     def track_ai_usage(
-        self, model: str, prompt_tokens: int, completion_tokens: int, cost: float
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: float,
+        cached_tokens: int = 0,
     ) -> None:
         """
         Track AI usage statistics.
@@ -43,9 +57,11 @@ class OptimizationManager:
             prompt_tokens: Number of prompt tokens
             completion_tokens: Number of completion tokens
             cost: Estimated cost
+            cached_tokens: Prompt tokens served from the provider's prefix cache
         """
         # Update global counters
         self.ai_usage_stats["tokens"]["prompt"] += prompt_tokens
+        self.ai_usage_stats["tokens"]["cached"] += cached_tokens
         self.ai_usage_stats["tokens"]["completion"] += completion_tokens
         self.ai_usage_stats["tokens"]["total"] += prompt_tokens + completion_tokens
         self.ai_usage_stats["cost"] += cost
@@ -54,12 +70,13 @@ class OptimizationManager:
         # Update model-specific counters
         if model not in self.ai_usage_stats["models"]:
             self.ai_usage_stats["models"][model] = {
-                "tokens": {"prompt": 0, "completion": 0, "total": 0},
+                "tokens": {"prompt": 0, "completion": 0, "cached": 0, "total": 0},
                 "cost": 0.0,
                 "requests": 0,
             }
 
         self.ai_usage_stats["models"][model]["tokens"]["prompt"] += prompt_tokens
+        self.ai_usage_stats["models"][model]["tokens"]["cached"] += cached_tokens
         self.ai_usage_stats["models"][model]["tokens"][
             "completion"
         ] += completion_tokens
@@ -81,51 +98,48 @@ class OptimizationManager:
     def reset_ai_usage_stats(self) -> None:
         """Reset AI usage statistics."""
         self.ai_usage_stats = {
-            "tokens": {"prompt": 0, "completion": 0, "total": 0},
+            "tokens": {"prompt": 0, "completion": 0, "cached": 0, "total": 0},
             "cost": 0.0,
             "requests": 0,
             "models": {},
         }
 
-    def cache_function(self, ttl: int = 60):
+    def cache_function(self, ttl: int = 60, stale_ttl: int = 0):
         """
         Decorator for caching function results.
 
+        Concurrent calls with the same arguments share one execution. Within
+        ``stale_ttl`` seconds after expiry the previous result is still
+        returned while a single background call refreshes it.
+
         Args:
             ttl: Time to live in seconds
+            stale_ttl: Seconds an expired result may be served while refreshing
         """
 
         def decorator(func):
-            cache_key = func.__name__
+            cache_key = f"{func.__module__}.{func.__qualname__}"
 
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
-                # Generate cache key
-                arg_key = json.dumps(args) + json.dumps(sorted(kwargs.items()))
-                full_key = f"{cache_key}:{arg_key}"
-
-                # Check cache
-                if full_key in self.cache:
-                    entry = self.cache[full_key]
-
-                    # Check if entry is still valid
-                    if time.time() < entry["expires"]:
-                        logger.debug(f"Cache hit: {full_key}")
-                        return entry["value"]
-
-                # Call the function
-                result = await func(*args, **kwargs)
-
-                # Store in cache
-                self.cache[full_key] = {"value": result, "expires": time.time() + ttl}
-
-                logger.debug(f"Cache miss: {full_key}")
-                return result
+                key = make_cache_key(cache_key, args, kwargs)
+                return await self.cache.get_or_compute(
+                    key, lambda: func(*args, **kwargs), ttl=ttl, stale_ttl=stale_ttl
+                )
 
             return wrapper
 
         return decorator
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get function cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit, miss, eviction and size counters
+        """
+        return self.cache.get_stats()
+
     async def execute_with_timeout(
         self, func: Callable, timeout: float, *args, **kwargs
     ) -> Any:
@@ -164,6 +178,10 @@ class OptimizationManager:
         """
         Execute a function with retry logic.
 
+        Delays use exponential backoff with full jitter so concurrent callers
+        do not retry in lockstep. Provider rejections from the circuit
+        breaker or load shedder are raised immediately rather than retried.
+
         Args:
             func: Function to execute
             max_retries: Maximum number of retries
@@ -189,12 +207,15 @@ class OptimizationManager:
 
                 return await func(*args, **kwargs)
 
+            except ProviderUnavailableError:
+                raise
+
             except Exception as e:
                 last_error = e
 
                 if retry < max_retries:
                     # Calculate delay with exponential backoff
-                    delay = retry_delay * (backoff_factor**retry)
+                    delay = random.uniform(0, retry_delay * (backoff_factor**retry))
 
                     logger.warning(
                         f"Execution failed, retrying in {delay:.2f}s",
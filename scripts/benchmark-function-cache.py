@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Function cache benchmark: bounded TTL/LRU cache vs the previous plain dict.
+
+Runs the same concurrent workload through both decorators and reports
+upstream calls (stampedes), wall time, hit-path throughput and entries held.
+
+Usage:
+    python scripts/benchmark-function-cache.py [--requests 20000] [--keys 500]
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.utils.optimization import OptimizationManager  # noqa: E402
+
+
+def legacy_cache_function(store: Dict[str, Any], ttl: int = 60):
+    """The original dict-based decorator, kept here as the baseline."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            arg_key = json.dumps(args) + json.dumps(sorted(kwargs.items()))
+            full_key = f"{func.__name__}:{arg_key}"
+            if full_key in store:
+                entry = store[full_key]
+                if time.time() < entry["expires"]:
+                    return entry["value"]
+            result = await func(*args, **kwargs)
+            store[full_key] = {"value": result, "expires": time.time() + ttl}
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def run_workload(cached_fn, requests: int, keys: int, concurrency: int) -> float:
+    """Zipf-ish key mix issued in waves of ``concurrency`` concurrent calls."""
+    rng = random.Random(42)
+    weights = [1 / (i + 1) for i in range(keys)]
+    key_stream = rng.choices(range(keys), weights=weights, k=requests)
+
+    started = time.perf_counter()
+    for i in range(0, requests, concurrency):
+        await asyncio.gather(
+            *(cached_fn("resources", key, limit=20) for key in key_stream[i : i + concurrency])
+        )
+    return time.perf_counter() - started
+
+
+async def hit_path_ops(cached_fn, iterations: int) -> float:
+    await cached_fn("resources", 0, limit=20)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await cached_fn("resources", 0, limit=20)
+    return iterations / (time.perf_counter() - started)
+
+
+def make_upstream(counter: Dict[str, int], latency: float):
+    async def fetch(kind: str, key: int, limit: int = 20):
+        counter["calls"] += 1
+        await asyncio.sleep(latency)
+        return [{"id": f"{kind}-{key}-{i}", "title": "Solar installer"} for i in range(limit)]
+
+    return fetch
+
+
+async def main(args) -> Dict[str, Any]:
+    report = {}
+
+    legacy_store: Dict[str, Any] = {}
+    legacy_calls = {"calls": 0}
+    legacy_fn = legacy_cache_function(legacy_store, ttl=60)(
+        make_upstream(legacy_calls, args.latency)
+    )
+    wall = await run_workload(legacy_fn, args.requests, args.keys, args.concurrency)
+    report["dict"] = {
+        "upstream_calls": legacy_calls["calls"],
+        "wall_s": round(wall, 3),
+        "hit_ops_per_s": round(await hit_path_ops(legacy_fn, args.hit_iterations)),
+        "entries": len(legacy_store),
+    }
+
+    manager = OptimizationManager()
+    manager.cache.max_entries = args.max_entries
+    bounded_calls = {"calls": 0}
+    bounded_fn = manager.cache_function(ttl=60)(make_upstream(bounded_calls, args.latency))
+    wall = await run_workload(bounded_fn, args.requests, args.keys, args.concurrency)
+    stats = manager.get_cache_stats()
+    report["bounded"] = {
+        "upstream_calls": bounded_calls["calls"],
+        "wall_s": round(wall, 3),
+        "hit_ops_per_s": round(await hit_path_ops(bounded_fn, args.hit_iterations)),
+        "entries": stats["entries"],
+        "evictions": stats["evictions"],
+        "coalesced": stats["coalesced"],
+    }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the function cache")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005, help="Upstream latency (s)")
+    parser.add_argument("--max-entries", type=int, default=10000)
+    parser.add_argument("--hit-iterations", type=int, default=50000)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
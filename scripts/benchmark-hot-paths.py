@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the hot pure-Python paths, with a stored baseline.
+
+Each case runs a fixed, seeded input set through one code path (keyword
+routing, expert lookup, resume sectioning and chunking, shared keyword
+scans, Redis JSON round-trips, structured log formatting). Timings are the
+median per-call time over several repeats, each long enough to swamp timer
+resolution.
+
+``compare`` exits non-zero when any case's median regresses past the
+threshold relative to the baseline, so it can gate CI or a pre-push hook.
+Baselines are machine-specific: refresh with ``--save-baseline`` after
+intentional changes or when moving to new hardware.
+
+Usage:
+    python scripts/benchmark-hot-paths.py run [--filter routing] [--output results.json]
+    python scripts/benchmark-hot-paths.py run --save-baseline
+    python scripts/benchmark-hot-paths.py compare [--threshold 0.25] [results.json]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+BASELINE_PATH = os.path.join(ROOT, "scripts", "benchmarks", "hot-paths-baseline.json")
+SEED = 1234
+
+MESSAGE_PARTS = [
+    "I'm a veteran",
+    "looking for solar jobs",
+    "in environmental justice communities",
+    "with an engineering degree from Brazil",
+    "and I need help with my resume",
+    "is there any government program",
+    "for green tech startups",
+    "near Worcester",
+    "I feel a lot of stress about this",
+    "what certification do I need for wind turbines",
+    "my military logistics experience",
+    "how does immigration affect my visa",
+    "renewable energy internships",
+    "community solar policy",
+]
+EXPERTISE_QUERIES = [
+    "military transition",
+    "renewable energy",
+    "environmental justice",
+    "credential evaluation",
+    "mental health",
+    "job placement",
+    "policy analysis",
+    "solar installation training",
+    "international",
+    "data analysis",
+]
+RESUME_TEMPLATE = """Jordan Rivera
+Boston, MA | jordan@example.com
+
+SUMMARY
+{summary}
+
+EXPERIENCE
+{experience}
+
+EDUCATION
+B.S. Mechanical Engineering, UMass Lowell
+
+SKILLS
+Project management, AutoCAD, Excel, team leadership, OSHA 10, energy modeling
+
+PROJECTS
+{projects}
+
+CERTIFICATIONS
+NABCEP PV Associate, OSHA 30
+"""
+JOB_TITLES = ["Project Manager", "Senior Engineer", "Energy Analyst", "Operations Coordinator"]
+
+
+Case = Callable[[int], None]
+CASES: Dict[str, Callable[[], Case]] = {}
+
+
+def case(name: str):
+    """Register a factory that builds inputs and returns ``run(loops)``."""
+
+    def register(factory):
+        CASES[name] = factory
+        return factory
+
+    return register
+
+
+def configure_environment() -> None:
+    """Offline providers and quiet loggers, set before backend imports."""
+    os.environ["LLM_PROVIDER"] = "stub"
+    os.environ.setdefault("ENVIRONMENT", "development")
+    os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+    os.environ.setdefault("SUPABASE_SERVICE_KEY", "local.service.key")
+    os.environ.setdefault("SUPABASE_ANON_KEY", "local.anon.key")
+    os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+
+def messages(count: int = 256) -> List[str]:
+    rng = random.Random(SEED)
+    return [" ".join(rng.sample(MESSAGE_PARTS, rng.randint(1, 4))) for _ in range(count)]
+
+
+def resumes(count: int = 8) -> List[str]:
+    rng = random.Random(SEED)
+    docs = []
+    for i in range(count):
+        jobs = "\n\n".join(
+            f"{rng.choice(JOB_TITLES)}, Company {j}\n"
+            + "\n".join(f"- Delivered outcome {k} for program {j}" for k in range(3 + i % 4))
+            for j in range(2 + i % 5)
+        )
+        docs.append(
+            RESUME_TEMPLATE.format(
+                summary=" ".join(rng.sample(MESSAGE_PARTS, 5)),
+                experience=jobs,
+                projects="\n\n".join(
+                    " ".join(rng.sample(MESSAGE_PARTS, 6)) for _ in range(2 + i % 3)
+                ),
+            )
+        )
+    return docs
+
+
+def run_async(batch: Callable[[int], Any]) -> Case:
+    """Run ``loops`` awaited calls inside one event loop turn."""
+    loop = asyncio.new_event_loop()
+
+    def run(loops: int) -> None:
+        loop.run_until_complete(batch(loops))
+
+    return run
+
+
+class MemoryRedis:
+    """In-process stand-in for the pooled client, so only our code is timed."""
+
+    def __init__(self, retain: bool = True):
+        self.retain = retain
+        self.data: Dict[str, Any] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.retain:
+            self.data[key] = value
+        return True
+
+
+# Cases
+
+
+@case("routing.fallback_semantic_routing")
+def bench_fallback_routing() -> Case:
+    from backend.agents.langgraph.framework import _fallback_semantic_routing
+
+    inputs = messages()
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await _fallback_semantic_routing(inputs[i % len(inputs)])
+
+    return run_async(batch)
+
+
+@case("routing.coordinator_fallback")
+def bench_coordinator_fallback() -> Case:
+    from backend.agents.agent_coordinator import AgentCoordinator
+
+    # Uses no instance state; called unbound to skip model construction
+    route = AgentCoordinator._fallback_semantic_routing
+    inputs = messages()
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await route(None, inputs[i % len(inputs)])
+
+    return run_async(batch)
+
+
+@case("routing.fast_route_miss")
+def bench_fast_route() -> Case:
+    from backend.agents.langgraph.functional_framework import FastSemanticRouter
+    from backend.database.redis_client import redis_client
+
+    redis_client._client = MemoryRedis(retain=False)
+    router = FastSemanticRouter()
+    inputs = messages()
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await router.fast_route(inputs[i % len(inputs)])
+
+    return run_async(batch)
+
+
+@case("awareness.find_expert_agents")
+def bench_find_expert_agents() -> Case:
+    from backend.agents.awareness import agent_awareness
+
+    def run(loops: int) -> None:
+        for i in range(loops):
+            agent_awareness.find_expert_agents(EXPERTISE_QUERIES[i % len(EXPERTISE_QUERIES)])
+
+    return run
+
+
+def _resume_processor():
+    from backend.tools.resume_processor import ProductionResumeProcessor
+
+    # Section detection and chunking are pure; skip model and client setup
+    return ProductionResumeProcessor.__new__(ProductionResumeProcessor)
+
+
+@case("resume.identify_sections")
+def bench_identify_sections() -> Case:
+    processor = _resume_processor()
+    docs = resumes()
+
+    def run(loops: int) -> None:
+        for i in range(loops):
+            processor.identify_resume_sections(docs[i % len(docs)])
+
+    return run
+
+
+@case("resume.create_semantic_chunks")
+def bench_semantic_chunks() -> Case:
+    processor = _resume_processor()
+    docs = resumes()
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await processor.create_semantic_chunks(docs[i % len(docs)], "resume.pdf")
+
+    return run_async(batch)
+
+
+@case("keywords.scan_resume")
+def bench_keyword_scan() -> Case:
+    # Importing the routing modules and agents registers their tables
+    import backend.agents.agent_coordinator  # noqa: F401
+    import backend.api.routes.resume_chunks  # noqa: F401
+    from backend.utils.keywords import shared_matcher
+
+    matcher = shared_matcher()
+    docs = resumes()
+
+    def run(loops: int) -> None:
+        for i in range(loops):
+            matcher.scan(docs[i % len(docs)])
+
+    return run
+
+
+def _redis_payload() -> Dict[str, Any]:
+    rng = random.Random(SEED)
+    return {
+        "agent": "marcus",
+        "team": "veterans_team",
+        "confidence": 0.82,
+        "messages": [
+            {
+                "role": rng.choice(["user", "assistant"]),
+                "content": " ".join(rng.sample(MESSAGE_PARTS, 4)),
+            }
+            for _ in range(20)
+        ],
+        "metadata": {"tokens": 1843, "cached": False, "tags": MESSAGE_PARTS[:6]},
+    }
+
+
+@case("redis.set_json")
+def bench_redis_set() -> Case:
+    from backend.database.redis_client import redis_client
+
+    redis_client._client = MemoryRedis()
+    payload = _redis_payload()
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await redis_client.set(f"bench:{i % 64}", payload, ttl=60)
+
+    return run_async(batch)
+
+
+@case("redis.get_json")
+def bench_redis_get() -> Case:
+    from backend.database.redis_client import redis_client
+
+    store = MemoryRedis()
+    store.data = {f"bench:{i}": json.dumps(_redis_payload()) for i in range(64)}
+    redis_client._client = store
+
+    async def batch(loops: int) -> None:
+        for i in range(loops):
+            await redis_client.get(f"bench:{i % 64}")
+
+    return run_async(batch)
+
+
+@case("logger.structured_info")
+def bench_structured_logger() -> Case:
+    from backend.utils.logger import StructuredLogger
+
+    log = StructuredLogger("benchmark.structured", "INFO")
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(log._get_formatter())
+    log.logger.handlers = [handler]
+    log.logger.propagate = False
+    bound = log.bind(request_id="req-123", user_id="user-456")
+
+    def run(loops: int) -> None:
+        for i in range(loops):
+            bound.info("Routed message", agent="marcus", confidence=0.82, attempt=i)
+
+    return run
+
+
+# Measurement
+
+
+def calibrate(run: Case, min_time: float) -> int:
+    """Smallest power-of-two loop count whose run takes at least ``min_time``."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        run(loops)
+        if time.perf_counter() - started >= min_time or loops >= 1 << 24:
+            return loops
+        loops *= 2
+
+
+def measure(name: str, run: Case, repeats: int, min_time: float) -> Dict[str, Any]:
+    run(max(1, calibrate(run, min_time / 4)))  # warm caches and lazy imports
+    loops = calibrate(run, min_time)
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()  # as timeit does: collections land in arbitrary samples
+    try:
+        for _ in range(repeats):
+            started = time.perf_counter()
+            run(loops)
+            samples.append((time.perf_counter() - started) / loops)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    samples_us = sorted(s * 1e6 for s in samples)
+    quartiles = statistics.quantiles(samples_us, n=4) if len(samples_us) > 1 else samples_us * 3
+    return {
+        "median_us": round(statistics.median(samples_us), 4),
+        "mean_us": round(statistics.fmean(samples_us), 4),
+        "min_us": round(samples_us[0], 4),
+        "iqr_us": round(quartiles[2] - quartiles[0], 4),
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": f"{platform.system()}-{platform.machine()}",
+    }
+
+
+def run_suite(args) -> Dict[str, Any]:
+    configure_environment()
+    logging.disable(logging.INFO)
+    results = {}
+    for name, factory in CASES.items():
+        if args.filter and args.filter not in name:
+            continue
+        # Structured logging is the one case that must actually emit INFO
+        logging.disable(logging.NOTSET if name.startswith("logger.") else logging.INFO)
+        results[name] = measure(name, factory(), args.repeats, args.min_time)
+        print(f"{name:40s} {results[name]['median_us']:>12.3f} us", file=sys.stderr)
+    logging.disable(logging.NOTSET)
+    return {**environment(), "results": results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    """Per-case median ratios; cases slower than ``1 + threshold`` regress."""
+    rows = {}
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows[name] = {"status": "new", "median_us": result["median_us"]}
+            continue
+        ratio = result["median_us"] / base["median_us"] if base["median_us"] else 1.0
+        status = (
+            "regressed"
+            if ratio > 1 + threshold
+            else ("improved" if ratio < 1 - threshold else "ok")
+        )
+        if status == "regressed":
+            regressions.append(name)
+        rows[name] = {
+            "status": status,
+            "baseline_us": base["median_us"],
+            "median_us": result["median_us"],
+            "ratio": round(ratio, 3),
+        }
+    warnings = [
+        f"baseline {key} {baseline.get(key)} differs from current {current.get(key)}"
+        for key in ("python", "machine")
+        if baseline.get(key) != current.get(key)
+    ]
+    return {
+        "threshold": threshold,
+        "baseline_commit": baseline.get("commit"),
+        "commit": current.get("commit"),
+        "warnings": warnings,
+        "regressions": regressions,
+        "cases": rows,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hot-path micro-benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the suite")
+    run_parser.add_argument("--output", help="Write results JSON here")
+    run_parser.add_argument("--save-baseline", action="store_true")
+
+    compare_parser = sub.add_parser("compare", help="Fail when medians regress vs the baseline")
+    compare_parser.add_argument(
+        "results", nargs="?", help="Results JSON (runs the suite if omitted)"
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+
+    for p in (run_parser, compare_parser):
+        p.add_argument("--filter", help="Only cases whose name contains this")
+        p.add_argument("--repeats", type=int, default=15)
+        p.add_argument("--min-time", type=float, default=0.1, help="Seconds per repeat")
+        p.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run_suite(args)
+        rendered = json.dumps(report, indent=2)
+        targets = [args.output] if args.output else []
+        if args.save_baseline:
+            os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+            targets.append(args.baseline)
+        for target in targets:
+            with open(target, "w") as f:
+                f.write(rendered + "\n")
+        print(rendered)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.results:
+        with open(args.results) as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args)
+    outcome = compare(baseline, current, args.threshold)
+    print(json.dumps(outcome, indent=2))
+    return 1 if outcome["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Job matching benchmark: top-k listings for a resume.
+
+Seeds the local Supabase stand-in with job listings and their embeddings
+and times ``JobMatcher.match`` for random resume embeddings: one matrix
+product over every listing embedding (``match_job_listings``), then the
+re-ranking of the candidate pool on skill, experience, location and salary
+features. Reports median and p95 latency of the vector query alone and of
+the full match against a latency budget.
+
+Usage:
+    python scripts/benchmark-job-matching.py [--jobs 100000] [--dimensions 1536] [--budget-ms 250]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.database.local_seed import SKILLS, seed_job_embeddings, seed_job_listings  # noqa: E402
+from backend.database.local_supabase import LocalSupabase, install_local_supabase  # noqa: E402
+from backend.services import job_matching  # noqa: E402
+from backend.services.job_matching import CandidateProfile, JobMatcher  # noqa: E402
+from backend.services.reference_data import ReferenceDataCache  # noqa: E402
+from backend.services.skills_engine import SkillsEngine  # noqa: E402
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+    }
+
+
+async def run(args) -> Dict[str, Any]:
+    db = install_local_supabase(LocalSupabase(args.database))
+    started = time.perf_counter()
+    seed_job_listings(db, args.jobs, args.seed)
+    seed_job_embeddings(db, args.dimensions, args.seed)
+    seed_seconds = round(time.perf_counter() - started, 1)
+
+    job_matching.skills_engine = SkillsEngine(reference=ReferenceDataCache(refresh_interval=0))
+    matcher = JobMatcher(candidates=args.candidates)
+    rng = np.random.default_rng(args.seed)
+    profiles = [
+        CandidateProfile(
+            embedding=rng.standard_normal(args.dimensions).astype(np.float32),
+            skills=list(rng.choice(SKILLS, 5, replace=False)),
+            experience_rank=int(rng.integers(0, 4)),
+            locations=["Boston"],
+            salary_min=60000,
+        )
+        for _ in range(args.rounds)
+    ]
+    # Warm the vector matrix and the skill index
+    await matcher.match("bench", profiles[0], args.limit)
+
+    vector, full = [], []
+    for profile in profiles:
+        t0 = time.perf_counter()
+        matcher._nearest(profile, {})
+        t1 = time.perf_counter()
+        await matcher.match("bench", profile, args.limit)
+        t2 = time.perf_counter()
+        vector.append((t1 - t0) * 1000)
+        full.append((t2 - t1) * 1000)
+    db.close()
+
+    report = percentiles(full)
+    return {
+        "jobs": args.jobs,
+        "dimensions": args.dimensions,
+        "candidates": args.candidates,
+        "limit": args.limit,
+        "seed_seconds": seed_seconds,
+        "vector_query": percentiles(vector),
+        "match": report,
+        "budget_ms": args.budget_ms,
+        "within_budget": report["p95_ms"] <= args.budget_ms,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark resume-to-job matching")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--candidates", type=int, default=200, help="Listings re-ranked per match")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=250)
+    parser.add_argument("--database", default=":memory:")
+    parser.add_argument("--seed", type=int, default=0)
+    print(json.dumps(asyncio.run(run(parser.parse_args())), indent=2))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Job search benchmark: ILIKE scan vs the ranked full-text RPC.
+
+Seeds the local Supabase stand-in with synthetic job listings and runs the
+same search mix two ways: the previous ``or_(title.ilike...)`` query ordered
+by ``created_at``, and ``rpc("search_job_listings")`` over the text index
+that stands in for the GIN-indexed ``search_vector`` column.
+
+The seeded corpus has a tiny vocabulary, so most of its terms match a large
+share of the listings. A few niche listings are added so the mix also covers
+selective terms, which is what most real searches look like. Latency is
+reported per search with its match count, and as percentiles per mode.
+
+Usage:
+    python scripts/benchmark-job-search.py [--jobs 100000] [--database /tmp/jobs.db]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.database.local_seed import seed_job_listings  # noqa: E402
+from backend.database.local_supabase import LocalSupabase, _fts_query  # noqa: E402
+
+# (title, description, listings) for selective terms
+NICHE_LISTINGS = [
+    ("Geothermal Driller", "Drill boreholes for ground source heat pump loops.", 25),
+    ("Offshore Wind Electrician", "Terminate array cables on offshore substations.", 250),
+    ("Tidal Energy Engineer", "Model tidal stream turbine arrays.", 5),
+    ("Wetland Restoration Ecologist", "Restore salt marsh and monitor wetland carbon.", 60),
+]
+SEARCHES = [
+    # Broad: each matches 10-80% of the seeded listings
+    {"query": "solar"},
+    {"query": "heat pump"},
+    {"query": "technician", "location": "Boston"},
+    {"query": "apprenticeship", "experience_level": "entry_level"},
+    {"query": "energy", "climate_focus": "wind"},
+    {"query": "python", "remote_work_preference": "remote"},
+    # Selective
+    {"query": "geothermal"},
+    {"query": "offshore electrician"},
+    {"query": "tidal turbine"},
+    {"query": "wetland restoration", "location": "MA"},
+    {"query": "veterans logistics"},
+]
+
+
+def ilike_search(db: LocalSupabase, search: Dict[str, str], limit: int) -> List[Dict[str, Any]]:
+    """The query the endpoint ran before the full-text RPC."""
+    query = search["query"]
+    db_query = db.table("job_listings").select("*").eq("status", "active")
+    db_query = db_query.or_(
+        f"title.ilike.%{query}%,description.ilike.%{query}%,requirements.ilike.%{query}%"
+    )
+    if search.get("location"):
+        db_query = db_query.ilike("location", f"%{search['location']}%")
+    if search.get("experience_level"):
+        db_query = db_query.eq("experience_level", search["experience_level"])
+    if search.get("remote_work_preference"):
+        db_query = db_query.eq("remote_work_preference", search["remote_work_preference"])
+    if search.get("climate_focus"):
+        db_query = db_query.contains("climate_focus", [search["climate_focus"]])
+    return db_query.order("created_at", desc=True).range(0, limit - 1).execute().data
+
+
+def rpc_search(db: LocalSupabase, search: Dict[str, str], limit: int) -> List[Dict[str, Any]]:
+    return (
+        db.rpc(
+            "search_job_listings",
+            {
+                "search_query": search["query"],
+                "location_filter": search.get("location"),
+                "experience_level_filter": search.get("experience_level"),
+                "remote_work_filter": search.get("remote_work_preference"),
+                "climate_focus_filter": search.get("climate_focus"),
+                "result_limit": limit,
+            },
+        )
+        .execute()
+        .data
+    )
+
+
+def seed(db: LocalSupabase, args) -> float:
+    existing = db.table("job_listings").select("id", count="exact").limit(1).execute().count
+    started = time.perf_counter()
+    if existing < args.jobs:
+        seed_job_listings(db, args.jobs - existing, seed=args.seed + existing)
+    if not db.table("job_listings").select("id").eq("title", NICHE_LISTINGS[0][0]).execute().data:
+        db.table("job_listings").insert(
+            [
+                {
+                    "title": title,
+                    "description": description,
+                    "requirements": "OSHA 10",
+                    "location": "New Bedford, MA",
+                    "status": "active",
+                    "created_at": f"2024-06-{1 + i % 28:02d}T00:00:00+00:00",
+                }
+                for title, description, count in NICHE_LISTINGS
+                for i in range(count)
+            ]
+        ).execute()
+    return time.perf_counter() - started
+
+
+def timed(fn: Callable, db: LocalSupabase, search: Dict[str, str], args) -> List[float]:
+    latencies = []
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        fn(db, search, args.limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[max(0, int(len(latencies) * 0.95) - 1)], 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def main(args) -> Dict[str, Any]:
+    db = LocalSupabase(args.database)
+    seed_s = seed(db, args)
+    report: Dict[str, Any] = {
+        "job_listings": db.table("job_listings")
+        .select("id", count="exact")
+        .limit(1)
+        .execute()
+        .count,
+        "seed_s": round(seed_s, 1),
+        "searches": [],
+    }
+    # Warm the page cache so both modes start from the same state
+    ilike_search(db, SEARCHES[0], args.limit)
+
+    modes = {"ilike_scan": ilike_search, "full_text_rpc": rpc_search}
+    samples: Dict[str, List[float]] = {mode: [] for mode in modes}
+    for search in SEARCHES:
+        (matches,) = db.conn.execute(
+            "SELECT COUNT(*) FROM job_listings_fts WHERE job_listings_fts MATCH ?",
+            [_fts_query(search["query"])],
+        ).fetchone()
+        entry: Dict[str, Any] = {**search, "text_matches": matches}
+        for mode, fn in modes.items():
+            latencies = timed(fn, db, search, args)
+            samples[mode].extend(latencies)
+            entry[f"{mode}_ms"] = round(statistics.median(latencies), 2)
+            entry[f"{mode}_results"] = len(fn(db, search, args.limit))
+        report["searches"].append(entry)
+
+    for mode in modes:
+        report[mode] = percentiles(samples[mode])
+    db.close()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark job search access paths")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--database", default=":memory:", help="SQLite file to reuse seeds")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    print(json.dumps(main(parser.parse_args()), indent=2))
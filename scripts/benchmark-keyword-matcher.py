@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Keyword matcher benchmark: one shared scan vs the per-table ``in`` loops.
+
+Loads every registered keyword table (routing fallbacks, agent analysis
+helpers, resume analysis) and checks each input both ways: the legacy
+``[k for k in table if k in text]`` loop over every table, and a single
+``shared_matcher().scan``. Inputs are short chat messages and full resumes,
+where the number of keywords times the text length dominates.
+
+Usage:
+    python scripts/benchmark-keyword-matcher.py [--resume-sections 40] [--iterations 200]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+os.environ.setdefault("LLM_PROVIDER", "stub")
+
+import backend.agents.agent_coordinator  # noqa: E402,F401
+import backend.api.routes.resume_chunks  # noqa: E402,F401
+from backend.utils import keywords  # noqa: E402
+
+WORDS = (
+    "managed solar installation crews across community projects with a focus on "
+    "environmental justice and led logistics for military training while coordinating "
+    "renewable energy policy analysis for government programs and reduced carbon "
+    "emissions by improving maintenance schedules for wind turbines and technical teams"
+).split()
+
+
+def make_messages(count: int, rng: random.Random) -> List[str]:
+    return [" ".join(rng.choices(WORDS, k=rng.randint(6, 20))) for _ in range(count)]
+
+
+def make_resumes(count: int, sections: int, rng: random.Random) -> List[str]:
+    return [
+        "\n\n".join(" ".join(rng.choices(WORDS, k=rng.randint(40, 80))) for _ in range(sections))
+        for _ in range(count)
+    ]
+
+
+def legacy_scan(tables: Dict[str, Dict[str, float]], text: str) -> Dict[str, List[str]]:
+    lowered = text.lower()
+    found = {}
+    for category, table in tables.items():
+        matched = [k for k in table if k in lowered]
+        if matched:
+            found[category] = matched
+    return found
+
+
+def time_per_call(fn: Callable[[str], Any], inputs: List[str], iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        fn(inputs[i % len(inputs)])
+    return (time.perf_counter() - started) / iterations
+
+
+def main(args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    tables = keywords._tables
+    matcher = keywords.shared_matcher()
+    corpora = {
+        "message": make_messages(64, rng),
+        "resume": make_resumes(8, args.resume_sections, rng),
+    }
+
+    report: Dict[str, Any] = {
+        "tables": len(tables),
+        "keywords": sum(len(t) for t in tables.values()),
+    }
+    for name, inputs in corpora.items():
+        # Same categories and keywords either way
+        for text in inputs:
+            hits = matcher.scan(text)
+            expected = legacy_scan(tables, text)
+            assert {c: hits.matched(c) for c in expected} == expected
+            assert set(hits.scores()) == set(expected)
+
+        legacy = time_per_call(lambda t: legacy_scan(tables, t), inputs, args.iterations)
+        shared = time_per_call(matcher.scan, inputs, args.iterations)
+        report[name] = {
+            "avg_chars": round(sum(map(len, inputs)) / len(inputs)),
+            "legacy_us": round(legacy * 1e6, 1),
+            "shared_us": round(shared * 1e6, 1),
+            "speedup": round(legacy / shared, 2),
+        }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the shared keyword matcher")
+    parser.add_argument("--resume-sections", type=int, default=40)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    print(json.dumps(main(parser.parse_args()), indent=2))
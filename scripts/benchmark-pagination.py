@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Pagination benchmark: offset vs keyset (cursor) pages.
+
+Seeds the local Supabase stand-in with job listings and fetches the same
+pages of the newest-first listing two ways: ``.range(offset, ...)`` as the
+endpoints used to, and ``paginate()`` continuing from the cursor of the
+previous page. Offset pages read and discard every row before them, so
+their latency grows with the page number; cursor pages start from the
+(created_at, id) index and stay flat.
+
+Usage:
+    python scripts/benchmark-pagination.py [--jobs 100000] [--pages 1,10,100,1000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.api.pagination import paginate  # noqa: E402
+from backend.database.local_seed import seed_job_listings  # noqa: E402
+from backend.database.local_supabase import LocalSupabase  # noqa: E402
+
+
+def offset_page(db: LocalSupabase, page: int, limit: int) -> Any:
+    """The query the endpoints ran before keyset pagination."""
+    offset = (page - 1) * limit
+    return (
+        db.table("job_listings")
+        .select("*")
+        .eq("status", "active")
+        .order("created_at", desc=True)
+        .range(offset, offset + limit - 1)
+        .execute()
+        .data
+    )
+
+
+def median_ms(fn: Callable[[], Any], rounds: int) -> float:
+    latencies = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(latencies), 2)
+
+
+def main(args) -> Dict[str, Any]:
+    db = LocalSupabase(args.database)
+    seed_job_listings(db, args.jobs, args.seed)
+    query = lambda: db.table("job_listings").select("*").eq("status", "active")  # noqa: E731
+    targets = sorted(int(p) for p in args.pages.split(","))
+
+    # Walk the cursors once to learn the cursor that starts each target page
+    cursors, cursor = {}, None
+    for page in range(1, targets[-1] + 1):
+        if page in targets:
+            cursors[page] = cursor
+        result = paginate(query(), args.limit, cursor)
+        if not result.has_more:
+            break
+        cursor = result.next_cursor
+
+    report: Dict[str, Any] = {"jobs": args.jobs, "limit": args.limit, "pages": []}
+    for page in targets:
+        if page not in cursors:
+            continue
+        same = [r["id"] for r in offset_page(db, page, args.limit)] == [
+            r["id"] for r in paginate(query(), args.limit, cursors[page]).rows
+        ]
+        report["pages"].append(
+            {
+                "page": page,
+                "offset_ms": median_ms(lambda: offset_page(db, page, args.limit), args.rounds),
+                "cursor_ms": median_ms(
+                    lambda: paginate(query(), args.limit, cursors[page]), args.rounds
+                ),
+                "same_rows": same,
+            }
+        )
+    db.close()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark offset vs cursor pagination")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--pages", default="1,10,100,1000", help="Page numbers to time")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--database", default=":memory:")
+    parser.add_argument("--seed", type=int, default=0)
+    print(json.dumps(main(parser.parse_args()), indent=2))
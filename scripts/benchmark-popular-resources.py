@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Popular resources benchmark: raw view scan vs the daily rollup RPC.
+
+Seeds the local Supabase stand-in with knowledge resources, then grows
+``resource_views`` step by step. At each size the top-N query runs two
+ways: the previous endpoint logic (fetch every view in the window, count
+in Python, then look up the top ids) and ``rpc("top_viewed_resources")``
+over ``resource_view_daily``. The raw scan grows with the number of
+views; the rollup grows with resources times days.
+
+Usage:
+    python scripts/benchmark-popular-resources.py [--resources 5000] [--views 10000,100000,1000000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.database.local_seed import (  # noqa: E402
+    insert_batches,
+    resource_view_rows,
+    seed_knowledge_resources,
+)
+from backend.database.local_supabase import LocalSupabase  # noqa: E402
+
+
+def raw_scan(db: LocalSupabase, days: int, limit: int) -> List[Dict[str, Any]]:
+    """The query the endpoint ran before the rollup."""
+    date_from = (datetime.utcnow() - timedelta(days=days)).isoformat()
+    views = db.table("resource_views").select("resource_id").gte("viewed_at", date_from).execute()
+    view_counts: Dict[str, int] = {}
+    for view in views.data:
+        view_counts[view["resource_id"]] = view_counts.get(view["resource_id"], 0) + 1
+    top_ids = [r for r, _ in sorted(view_counts.items(), key=lambda x: x[1], reverse=True)[:limit]]
+    resources = (
+        db.table("knowledge_resources")
+        .select("*")
+        .in_("id", top_ids)
+        .eq("visibility", "public")
+        .execute()
+    )
+    for resource in resources.data:
+        resource["recent_views"] = view_counts[resource["id"]]
+    return sorted(resources.data, key=lambda x: x["recent_views"], reverse=True)
+
+
+def rollup_rpc(db: LocalSupabase, days: int, limit: int) -> List[Dict[str, Any]]:
+    return (
+        db.rpc("top_viewed_resources", {"days": days, "result_limit": limit, "public_only": True})
+        .execute()
+        .data
+    )
+
+
+def median_ms(fn: Callable, db: LocalSupabase, args) -> float:
+    latencies = []
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        fn(db, args.days, args.limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(latencies), 2)
+
+
+def main(args) -> Dict[str, Any]:
+    db = LocalSupabase(args.database)
+    seed_knowledge_resources(db, args.resources, args.seed)
+    resource_ids = [
+        row["id"] for row in db.table("knowledge_resources").select("id").order("id").execute().data
+    ]
+    report: Dict[str, Any] = {"resources": len(resource_ids), "days": args.days, "steps": []}
+
+    total = 0
+    for step, target in enumerate(int(v) for v in args.views.split(",")):
+        added = target - total
+        started = time.perf_counter()
+        insert_batches(
+            db, resource_view_rows(added, resource_ids, 90, args.seed + step), "resource_views"
+        )
+        insert_s = time.perf_counter() - started
+        total = target
+        (buckets,) = db.conn.execute("SELECT COUNT(*) FROM resource_view_daily").fetchone()
+        report["steps"].append(
+            {
+                "views": total,
+                "rollup_rows": buckets,
+                "insert_views_per_s": round(added / insert_s) if insert_s else None,
+                "raw_scan_ms": median_ms(raw_scan, db, args),
+                "rollup_rpc_ms": median_ms(rollup_rpc, db, args),
+            }
+        )
+    db.close()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark popular resource queries")
+    parser.add_argument("--resources", type=int, default=5000)
+    parser.add_argument("--views", default="10000,100000,1000000", help="Cumulative view counts")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--database", default=":memory:")
+    parser.add_argument("--seed", type=int, default=0)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Skills engine benchmark: list membership vs skill-id set operations.
+
+Builds a synthetic vocabulary and role catalogue and scores one profile
+against every role two ways: the nested ``skill in current_skills`` loops
+the education routes used to run per role, and ``RoleSkillMatrix.score``
+over the sparse role x skill matrix. Both must agree on every role's
+required-skill match percentage.
+
+Usage:
+    python scripts/benchmark-skills-engine.py [--roles 5000] [--skills 2000] [--profile 60]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.services.skills_engine import RoleSkillMatrix, SkillVocabulary  # noqa: E402
+
+
+def list_membership(roles: List[Dict[str, Any]], current_skills: List[str]) -> List[float]:
+    """The per-role comparison the education routes ran before."""
+    percentages = []
+    for role in roles:
+        required_skills = role["required_skills"]
+        matching_skills = [skill for skill in required_skills if skill in current_skills]
+        percentages.append(
+            len(matching_skills) / len(required_skills) * 100 if required_skills else 0
+        )
+    return percentages
+
+
+def median_ms(fn: Callable[[], Any], rounds: int) -> float:
+    latencies = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(latencies), 3)
+
+
+def main(args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    names = [f"skill {i}" for i in range(args.skills)]
+    roles = [
+        {
+            "id": str(i),
+            "required_skills": rng.sample(names, args.required),
+            "preferred_skills": rng.sample(names, args.preferred),
+        }
+        for i in range(args.roles)
+    ]
+    profile = rng.sample(names, args.profile)
+
+    started = time.perf_counter()
+    vocabulary = SkillVocabulary.from_skills_mapping([{"skill_name": n} for n in names])
+    matrix = RoleSkillMatrix(vocabulary, roles)
+    build_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    def vectorized():
+        return matrix.score(vocabulary.encode(profile))
+
+    _, required_share = vectorized()
+    agree = all(
+        abs(a - b * 100) < 1e-9 for a, b in zip(list_membership(roles, profile), required_share)
+    )
+    return {
+        "roles": args.roles,
+        "skills": args.skills,
+        "profile_skills": args.profile,
+        "index_build_ms": build_ms,
+        "list_membership_ms": median_ms(lambda: list_membership(roles, profile), args.rounds),
+        "set_based_ms": median_ms(vectorized, args.rounds),
+        "top_10_ms": median_ms(lambda: matrix.evaluate(profile, limit=10), args.rounds),
+        "same_scores": agree,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark skill gap evaluation")
+    parser.add_argument("--roles", type=int, default=5000)
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--profile", type=int, default=60, help="Skills in the profile")
+    parser.add_argument("--required", type=int, default=8)
+    parser.add_argument("--preferred", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Offline in-process load test for the Climate Economy Assistant API.
+
+Drives the FastAPI app directly over ASGI with stub LLMs (LLM_PROVIDER=stub),
+fakeredis and the local SQLite Supabase stand-in, so it needs no network or
+API keys. A scripted, seeded mix of chat, streaming chat, resume processing
+and job search requests is replayed at a target concurrency.
+
+The JSON report has per-scenario p50/p95/p99 latency, throughput, time to
+first token for streams and event-loop lag, for comparison across commits.
+
+Usage:
+    python scripts/load-test.py --requests 500 --concurrency 50 --output report.json
+    python scripts/load-test.py --mix chat=1,stream=1 --llm-latency-ms 800
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+CHAT_MESSAGES = [
+    "I'm a veteran looking for clean energy jobs",
+    "What solar programs are available in disadvantaged communities?",
+    "How do I transition from military logistics to offshore wind?",
+    "Are there apprenticeships for solar installation near Worcester?",
+    "What training programs exist for environmental justice work?",
+    "My engineering degree is from Nigeria, can I work in Massachusetts?",
+    "I want to become a wind turbine technician",
+    "What grants exist for community energy projects?",
+]
+
+SEARCH_QUERIES = ["solar", "wind", "heat pump", "energy efficiency", "analyst", "technician"]
+
+RESUME_TEXT = """Jordan Rivera
+Boston, MA | jordan@example.com
+
+EXPERIENCE
+Logistics Coordinator, US Army (2016-2022)
+- Managed supply chain for 300-person unit
+- Led maintenance scheduling for vehicle fleet
+
+EDUCATION
+B.S. Mechanical Engineering, UMass Lowell
+
+SKILLS
+Project management, AutoCAD, Excel, team leadership, OSHA 10
+"""
+
+DEFAULT_MIX = "chat=0.35,stream=0.3,resume=0.1,search=0.25"
+
+
+def configure_environment(args) -> None:
+    """Select offline providers before any backend module is imported."""
+    os.environ["LLM_PROVIDER"] = "stub"
+    os.environ["ENVIRONMENT"] = "development"
+    os.environ["STUB_LLM_LATENCY_MS"] = str(args.llm_latency_ms)
+    os.environ["STUB_LLM_TOKENS_PER_SEC"] = str(args.llm_tokens_per_sec)
+    os.environ["STUB_LLM_CHUNK_TOKENS"] = str(args.llm_chunk_tokens)
+    # Clients are constructed at import time; they are never used for I/O
+    os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+    os.environ.setdefault("SUPABASE_SERVICE_KEY", "local.service.key")
+    os.environ.setdefault("SUPABASE_ANON_KEY", "local.anon.key")
+    os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pick(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))], 2)
+
+    return {"p50": pick(50), "p95": pick(95), "p99": pick(99), "max": round(ordered[-1], 2)}
+
+
+class AsgiClient:
+    """
+    Minimal in-process ASGI client that timestamps each response body chunk.
+
+    httpx's ASGI transport buffers the whole response, which hides time to
+    first token for streamed responses.
+    """
+
+    def __init__(self, app, headers: Optional[Dict[str, str]] = None):
+        self.app = app
+        self.headers = headers or {}
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        form: Optional[Dict[str, str]] = None,
+        on_chunk=None,
+    ) -> Tuple[int, bytes]:
+        path, _, query = path.partition("?")
+        headers = dict(self.headers)
+        body = b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            headers["content-type"] = "application/json"
+        elif form is not None:
+            body = urlencode(form).encode()
+            headers["content-type"] = "application/x-www-form-urlencoded"
+        headers["content-length"] = str(len(body))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+
+        sent = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        status = 0
+        chunks: List[bytes] = []
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                if chunk:
+                    chunks.append(chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk)
+                if not message.get("more_body", False):
+                    finished.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            finished.set()
+        return status, b"".join(chunks)
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic timer fires, i.e. event-loop blocking."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected) * 1000)
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class LoadTest:
+    """Replays a seeded request mix against the app and records timings."""
+
+    def __init__(self, app, args):
+        self.client = AsgiClient(app, headers={"authorization": "Bearer load-test"})
+        self.args = args
+        self.results: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def chat(self, rng: random.Random, i: int) -> Dict[str, Any]:
+        status, _ = await self.client.request(
+            "POST",
+            "/api/v1/agents/pendo/chat",
+            json_body={
+                "message": rng.choice(CHAT_MESSAGES),
+                "user_id": f"load-user-{i % 50}",
+                "conversation_id": f"load-conv-{i % 100}",
+                "stream": False,
+            },
+        )
+        return {"status": status}
+
+    async def stream(self, rng: random.Random, i: int) -> Dict[str, Any]:
+        started = time.perf_counter()
+        first_token: List[float] = []
+
+        def on_chunk(chunk: bytes) -> None:
+            if not first_token and b'"type": "content"' in chunk:
+                first_token.append((time.perf_counter() - started) * 1000)
+
+        status, body = await self.client.request(
+            "POST",
+            "/api/agents/pendo/chat",
+            json_body={
+                "message": rng.choice(CHAT_MESSAGES),
+                "user_id": f"load-user-{i % 50}",
+                "conversation_id": f"load-stream-{i % 100}",
+                "stream": True,
+            },
+            on_chunk=on_chunk,
+        )
+        ok = status == 200 and b'"type": "error"' not in body
+        return {"status": status if ok else 599, "ttft_ms": first_token[0] if first_token else None}
+
+    async def resume(self, rng: random.Random, i: int) -> Dict[str, Any]:
+        status, _ = await self.client.request(
+            "POST",
+            "/api/resumes/process",
+            form={
+                "text": RESUME_TEXT,
+                "filename": f"resume-{i}.pdf",
+                "user_id": f"load-user-{i % 50}",
+            },
+        )
+        return {"status": status}
+
+    async def search(self, rng: random.Random, i: int) -> Dict[str, Any]:
+        query = urlencode({"query": rng.choice(SEARCH_QUERIES), "limit": 20})
+        status, _ = await self.client.request("GET", f"/api/v1/jobs/search?{query}")
+        return {"status": status}
+
+    def schedule(self) -> List[str]:
+        mix = {}
+        for part in self.args.mix.split(","):
+            name, _, weight = part.partition("=")
+            mix[name.strip()] = float(weight or 1)
+        rng = random.Random(self.args.seed)
+        return rng.choices(list(mix), weights=list(mix.values()), k=self.args.requests)
+
+    async def run(self) -> Dict[str, Any]:
+        plan = self.schedule()
+        queue: asyncio.Queue = asyncio.Queue()
+        for i, scenario in enumerate(plan):
+            queue.put_nowait((i, scenario))
+
+        async def worker(worker_id: int) -> None:
+            rng = random.Random(self.args.seed + worker_id)
+            while True:
+                try:
+                    i, scenario = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.perf_counter()
+                try:
+                    outcome = await getattr(self, scenario)(rng, i)
+                except Exception as e:
+                    outcome = {"status": 0, "error": type(e).__name__}
+                outcome["latency_ms"] = (time.perf_counter() - started) * 1000
+                self.results.setdefault(scenario, []).append(outcome)
+
+        lag = LoopLagMonitor()
+        lag.start()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(self.args.concurrency)))
+        elapsed = time.perf_counter() - started
+        await lag.stop()
+        return self.report(elapsed, lag.samples)
+
+    def report(self, elapsed: float, lag_samples: List[float]) -> Dict[str, Any]:
+        scenarios = {}
+        total = errors = 0
+        for name, outcomes in sorted(self.results.items()):
+            failed = [o for o in outcomes if not 200 <= o["status"] < 300]
+            total += len(outcomes)
+            errors += len(failed)
+            entry = {
+                "requests": len(outcomes),
+                "errors": len(failed),
+                "throughput_rps": round(len(outcomes) / elapsed, 2),
+                "latency_ms": percentiles([o["latency_ms"] for o in outcomes]),
+            }
+            ttfts = [o["ttft_ms"] for o in outcomes if o.get("ttft_ms") is not None]
+            if name == "stream":
+                entry["ttft_ms"] = percentiles(ttfts)
+            scenarios[name] = entry
+
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "config": {
+                "requests": self.args.requests,
+                "concurrency": self.args.concurrency,
+                "mix": self.args.mix,
+                "seed": self.args.seed,
+                "llm_latency_ms": self.args.llm_latency_ms,
+                "llm_tokens_per_sec": self.args.llm_tokens_per_sec,
+                "seed_jobs": self.args.seed_jobs,
+            },
+            "summary": {
+                "requests": total,
+                "errors": errors,
+                "duration_s": round(elapsed, 3),
+                "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+                "latency_ms": percentiles(
+                    [o["latency_ms"] for outcomes in self.results.values() for o in outcomes]
+                ),
+            },
+            "scenarios": scenarios,
+            "event_loop_lag_ms": {
+                **percentiles(lag_samples),
+                "mean": round(statistics.fmean(lag_samples), 2) if lag_samples else None,
+            },
+        }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+async def main(args) -> Dict[str, Any]:
+    configure_environment(args)
+
+    import fakeredis.aioredis
+
+    from backend.adapters.usage import usage_accountant
+    from backend.api.middleware.auth import verify_token
+    from backend.database.local_seed import seed_job_listings
+    from backend.database.local_supabase import LocalSupabase, install_local_supabase
+    from backend.database.redis_client import redis_client
+    from backend.main import app
+
+    redis_client._client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    db = install_local_supabase(LocalSupabase(args.database))
+    seed_job_listings(db, args.seed_jobs, args.seed)
+    app.dependency_overrides[verify_token] = lambda: "load-test-user"
+
+    try:
+        return await LoadTest(app, args).run()
+    finally:
+        await usage_accountant.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline in-process API load test")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help="scenario=weight,... (chat, stream, resume, search)"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--seed-jobs", type=int, default=2000)
+    parser.add_argument(
+        "--database", default=":memory:", help="SQLite path for the Supabase stand-in"
+    )
+    parser.add_argument("--llm-latency-ms", type=float, default=300)
+    parser.add_argument("--llm-tokens-per-sec", type=float, default=80)
+    parser.add_argument("--llm-chunk-tokens", type=int, default=4)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    cli_args = parser.parse_args()
+
+    report = asyncio.run(main(cli_args))
+    rendered = json.dumps(report, indent=2)
+    if cli_args.output:
+        with open(cli_args.output, "w") as f:
+            f.write(rendered + "\n")
+    print(rendered)
@@ -0,0 +1,13 @@
+-- Job Listings API Columns Migration
+-- Purpose: Add the columns the jobs API filters on
+-- Date: 2025-01-27
+
+-- /api/v1/jobs lists and searches active listings by these
+ALTER TABLE job_listings
+    ADD COLUMN IF NOT EXISTS status TEXT DEFAULT 'active',
+    ADD COLUMN IF NOT EXISTS remote_work_preference TEXT;
+
+-- Existing rows keep their active state
+UPDATE job_listings
+SET status = CASE WHEN is_active THEN 'active' ELSE 'closed' END
+WHERE status IS NULL OR (status = 'active' AND is_active = false);
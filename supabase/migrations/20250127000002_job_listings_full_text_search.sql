@@ -0,0 +1,51 @@
+-- Job Listings Full-Text Search Migration
+-- Purpose: Relevance-ranked job search backed by a GIN-indexed tsvector
+-- Date: 2025-01-27
+
+-- Weighted search document: title (A) outranks description (B), which
+-- outranks requirements (C). Generated, so it never drifts from the row.
+ALTER TABLE job_listings
+    ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(requirements, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_job_listings_search_vector
+    ON job_listings USING GIN (search_vector);
+
+-- Active listings matching a web-search style query ("solar -intern",
+-- "\"heat pump\" or hvac"), best ts_rank first, with the filters of the
+-- /jobs/search endpoint. Rows are returned as JSON so the function does not
+-- need updating when job_listings gains columns.
+CREATE OR REPLACE FUNCTION search_job_listings(
+    search_query text,
+    location_filter text DEFAULT NULL,
+    experience_level_filter text DEFAULT NULL,
+    remote_work_filter text DEFAULT NULL,
+    climate_focus_filter text DEFAULT NULL,
+    result_limit int DEFAULT 10,
+    result_offset int DEFAULT 0
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT (to_jsonb(jl) - 'search_vector') || jsonb_build_object('rank', ranked.rank)
+    FROM job_listings jl
+    CROSS JOIN LATERAL (
+        SELECT ts_rank(jl.search_vector, websearch_to_tsquery('english', search_query)) AS rank
+    ) ranked
+    WHERE jl.search_vector @@ websearch_to_tsquery('english', search_query)
+        AND jl.status = 'active'
+        AND (location_filter IS NULL OR jl.location ILIKE '%' || location_filter || '%')
+        AND (experience_level_filter IS NULL OR jl.experience_level = experience_level_filter)
+        AND (remote_work_filter IS NULL OR jl.remote_work_preference = remote_work_filter)
+        AND (climate_focus_filter IS NULL OR jl.climate_focus @> ARRAY[climate_focus_filter])
+    ORDER BY ranked.rank DESC, jl.created_at DESC
+    LIMIT result_limit
+    OFFSET result_offset;
+$$;
+
+GRANT EXECUTE ON FUNCTION search_job_listings(text, text, text, text, text, int, int)
+    TO anon, authenticated, service_role;
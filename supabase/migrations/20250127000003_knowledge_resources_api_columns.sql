@@ -0,0 +1,18 @@
+-- Knowledge Resources API Columns Migration
+-- Purpose: Add the columns the resources API reads and writes
+-- Date: 2025-01-27
+
+-- /api/v1/resources creates, filters and counts resources by these
+ALTER TABLE knowledge_resources
+    ADD COLUMN IF NOT EXISTS category TEXT,
+    ADD COLUMN IF NOT EXISTS status TEXT DEFAULT 'published',
+    ADD COLUMN IF NOT EXISTS visibility TEXT DEFAULT 'public',
+    ADD COLUMN IF NOT EXISTS created_by UUID,
+    ADD COLUMN IF NOT EXISTS last_modified_by UUID,
+    ADD COLUMN IF NOT EXISTS view_count INTEGER NOT NULL DEFAULT 0;
+
+-- Existing rows keep their published state and first category
+UPDATE knowledge_resources
+SET status = CASE WHEN is_published THEN 'published' ELSE 'draft' END,
+    category = COALESCE(category, categories[1])
+WHERE status IS NULL OR category IS NULL;
@@ -0,0 +1,87 @@
+-- Resource View Daily Rollup Migration
+-- Purpose: Popularity queries read per-day view counts instead of raw views
+-- Date: 2025-01-27
+
+-- One row per resource per UTC day
+CREATE TABLE IF NOT EXISTS resource_view_daily (
+    resource_id UUID NOT NULL,
+    view_date DATE NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (resource_id, view_date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_resource_view_daily_view_date ON resource_view_daily(view_date);
+
+ALTER TABLE resource_view_daily ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role can manage resource view rollups" ON resource_view_daily
+    FOR ALL USING (auth.role() = 'service_role');
+
+-- Fold each insert statement on resource_views into the daily buckets. A
+-- statement-level trigger sees a batch insert as one grouped upsert.
+CREATE OR REPLACE FUNCTION rollup_resource_views()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    INSERT INTO resource_view_daily (resource_id, view_date, view_count)
+    SELECT
+        resource_id,
+        (COALESCE(viewed_at, NOW()) AT TIME ZONE 'UTC')::date,
+        COUNT(*)
+    FROM new_views
+    GROUP BY 1, 2
+    ON CONFLICT (resource_id, view_date) DO UPDATE
+        SET view_count = resource_view_daily.view_count + EXCLUDED.view_count,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS resource_views_rollup ON resource_views;
+CREATE TRIGGER resource_views_rollup
+    AFTER INSERT ON resource_views
+    REFERENCING NEW TABLE AS new_views
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_resource_views();
+
+-- Backfill from existing views
+INSERT INTO resource_view_daily (resource_id, view_date, view_count)
+SELECT
+    resource_id,
+    (COALESCE(viewed_at, NOW()) AT TIME ZONE 'UTC')::date,
+    COUNT(*)
+FROM resource_views
+GROUP BY 1, 2
+ON CONFLICT (resource_id, view_date) DO NOTHING;
+
+-- Most viewed knowledge resources over the last ``days`` whole UTC days
+-- (today included), summed from the daily buckets. Cost depends on the
+-- number of resources viewed in the window, not on the number of views.
+CREATE OR REPLACE FUNCTION top_viewed_resources(
+    days int DEFAULT 30,
+    result_limit int DEFAULT 10,
+    public_only boolean DEFAULT true
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    WITH totals AS (
+        SELECT resource_id, SUM(view_count)::bigint AS recent_views
+        FROM resource_view_daily
+        WHERE view_date >= (NOW() AT TIME ZONE 'UTC')::date - days
+        GROUP BY resource_id
+    )
+    SELECT (to_jsonb(kr) - 'embedding') || jsonb_build_object('recent_views', totals.recent_views)
+    FROM totals
+    JOIN knowledge_resources kr ON kr.id = totals.resource_id
+    WHERE NOT public_only OR kr.visibility = 'public'
+    ORDER BY totals.recent_views DESC, kr.id
+    LIMIT result_limit;
+$$;
+
+GRANT EXECUTE ON FUNCTION top_viewed_resources(int, int, boolean)
+    TO authenticated, service_role;
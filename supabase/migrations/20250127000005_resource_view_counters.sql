@@ -0,0 +1,29 @@
+-- Resource View Counters Migration
+-- Purpose: Apply buffered view counts in batches without lost updates
+-- Date: 2025-01-27
+
+-- Client-generated id per view event, so a replayed flush is a no-op
+ALTER TABLE resource_views ADD COLUMN IF NOT EXISTS event_id UUID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resource_views_event_id ON resource_views(event_id);
+
+-- Add a batch of view counts, {"<resource id>": <views>, ...}, to
+-- knowledge_resources.view_count. The increment happens in the UPDATE
+-- itself, so concurrent flushes and other writers never overwrite each
+-- other. Returns the number of resources updated.
+CREATE OR REPLACE FUNCTION increment_resource_view_counts(increments jsonb)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    WITH updated AS (
+        UPDATE knowledge_resources kr
+        SET view_count = COALESCE(kr.view_count, 0) + deltas.value::int
+        FROM jsonb_each_text(increments) AS deltas
+        WHERE kr.id = deltas.key::uuid
+        RETURNING 1
+    )
+    SELECT COUNT(*)::int FROM updated;
+$$;
+
+GRANT EXECUTE ON FUNCTION increment_resource_view_counts(jsonb) TO service_role;
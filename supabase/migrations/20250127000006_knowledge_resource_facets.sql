@@ -0,0 +1,73 @@
+-- Knowledge Resource Facets Migration
+-- Purpose: Category, tag, content type and climate sector counts in one query
+-- Date: 2025-01-27
+
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_status_visibility
+    ON knowledge_resources(status, visibility);
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_tags
+    ON knowledge_resources USING GIN (tags);
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_climate_sectors
+    ON knowledge_resources USING GIN (climate_sectors);
+
+-- Facet counts over the resources matching the filters (NULL = any).
+-- Array facets are unnested and grouped in the database; each facet is a
+-- list of {name, count}, most used first. Tags are capped at tag_limit,
+-- with the number of distinct tags in tag_total.
+CREATE OR REPLACE FUNCTION knowledge_resource_facets(
+    status_filter text DEFAULT 'published',
+    visibility_filter text DEFAULT 'public',
+    content_type_filter text DEFAULT NULL,
+    category_filter text DEFAULT NULL,
+    tags_filter text[] DEFAULT NULL,
+    tag_limit int DEFAULT 200
+)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    WITH filtered AS (
+        SELECT category, content_type, tags, climate_sectors
+        FROM knowledge_resources
+        WHERE (status_filter IS NULL OR status = status_filter)
+            AND (visibility_filter IS NULL OR visibility = visibility_filter)
+            AND (content_type_filter IS NULL OR content_type = content_type_filter)
+            AND (category_filter IS NULL OR category = category_filter)
+            AND (tags_filter IS NULL OR tags @> tags_filter)
+    ),
+    facet_values AS (
+        SELECT 'categories' AS facet, category AS name FROM filtered
+        UNION ALL
+        SELECT 'content_types', content_type FROM filtered
+        UNION ALL
+        SELECT 'tags', tag FROM filtered, unnest(tags) AS tag
+        UNION ALL
+        SELECT 'climate_sectors', sector FROM filtered, unnest(climate_sectors) AS sector
+    ),
+    counts AS (
+        SELECT facet, name, COUNT(*) AS count,
+            ROW_NUMBER() OVER (PARTITION BY facet ORDER BY COUNT(*) DESC, name) AS position
+        FROM facet_values
+        WHERE name IS NOT NULL AND name <> ''
+        GROUP BY facet, name
+    )
+    SELECT jsonb_build_object(
+        'total', (SELECT COUNT(*) FROM filtered),
+        'tag_total', (SELECT COUNT(*) FROM counts WHERE facet = 'tags')
+    ) || COALESCE(
+        (
+            SELECT jsonb_object_agg(facet, items)
+            FROM (
+                SELECT facet, jsonb_agg(
+                    jsonb_build_object('name', name, 'count', count) ORDER BY position
+                ) AS items
+                FROM counts
+                WHERE facet <> 'tags' OR position <= tag_limit
+                GROUP BY facet
+            ) grouped
+        ),
+        '{}'::jsonb
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION knowledge_resource_facets(text, text, text, text, text[], int)
+    TO anon, authenticated, service_role;
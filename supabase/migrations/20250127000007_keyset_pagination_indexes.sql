@@ -0,0 +1,40 @@
+-- Keyset Pagination Indexes Migration
+-- Purpose: Composite (sort column, id) indexes for cursor pagination
+-- Date: 2025-01-27
+
+-- List endpoints page with "sort < last OR (sort = last AND id < last_id)
+-- OR sort IS NULL" ordered by (sort DESC NULLS LAST, id DESC). Each index
+-- matches one listing's order, after its always-applied equality filter.
+
+CREATE INDEX IF NOT EXISTS idx_job_listings_created_at_id
+    ON job_listings(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_job_listings_status_created_at_id
+    ON job_listings(status, created_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_created_at_id
+    ON knowledge_resources(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_status_created_at_id
+    ON knowledge_resources(status, created_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_content_flags_created_at_id
+    ON content_flags(created_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_education_programs_created_at_id
+    ON education_programs(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_skills_mapping_created_at_id
+    ON skills_mapping(created_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_security_audit_logs_timestamp_id
+    ON security_audit_logs(timestamp DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_analytics_created_at_id
+    ON conversation_analytics(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_message_feedback_created_at_id
+    ON message_feedback(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_conversation_feedback_created_at_id
+    ON conversation_feedback(created_at DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS idx_conversation_interrupts_created_at_id
+    ON conversation_interrupts(created_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_conversations_user_id_updated_at_id
+    ON conversations(user_id, updated_at DESC NULLS LAST, id DESC);
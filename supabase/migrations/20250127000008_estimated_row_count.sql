@@ -0,0 +1,23 @@
+-- Planner row estimates for listing totals
+--
+-- Listings used to request count=exact, which makes Postgres count the
+-- whole filtered set on every page view. Totals of large sets are now
+-- reported as estimates: pg_class.reltuples, kept current by autovacuum
+-- and ANALYZE, for unfiltered tables and the PostgREST planned count for
+-- filtered ones. Exact counts are only taken for small result sets.
+
+CREATE OR REPLACE FUNCTION estimated_row_count(table_name text)
+RETURNS bigint
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    -- reltuples is -1 until the table has been vacuumed or analyzed
+    SELECT CASE WHEN c.reltuples < 0 THEN NULL ELSE c.reltuples::bigint END
+    FROM pg_class c
+    WHERE c.oid = to_regclass(format('public.%I', table_name));
+$$;
+
+GRANT EXECUTE ON FUNCTION estimated_row_count(text)
+    TO authenticated, service_role;
@@ -0,0 +1,51 @@
+-- Version stamps for cached reference tables
+--
+-- The API keeps in-process snapshots of these tables and polls this table
+-- to learn which ones changed. A statement-level trigger bumps a table's
+-- version once per write statement, whatever wrote it.
+
+CREATE TABLE IF NOT EXISTS reference_data_versions (
+    table_name text PRIMARY KEY,
+    version bigint NOT NULL DEFAULT 1,
+    updated_at timestamptz NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION bump_reference_data_version()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO reference_data_versions (table_name)
+    VALUES (TG_TABLE_NAME)
+    ON CONFLICT (table_name) DO UPDATE
+        SET version = reference_data_versions.version + 1,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    reference_table text;
+BEGIN
+    FOREACH reference_table IN ARRAY ARRAY[
+        'education_programs', 'mos_translation', 'skills_mapping', 'role_requirements'
+    ]
+    LOOP
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS %I ON %I',
+            reference_table || '_version_stamp', reference_table
+        );
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_data_version()',
+            reference_table || '_version_stamp', reference_table
+        );
+        INSERT INTO reference_data_versions (table_name)
+        VALUES (reference_table)
+        ON CONFLICT (table_name) DO NOTHING;
+    END LOOP;
+END;
+$$;
+
+GRANT SELECT ON reference_data_versions TO authenticated, service_role;
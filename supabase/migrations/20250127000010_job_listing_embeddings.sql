@@ -0,0 +1,57 @@
+-- Job Listing Embeddings Migration
+-- Purpose: Resume-to-job matching over job embeddings stored at write time
+-- Date: 2025-01-27
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- One embedding per listing, sharing the listing's id. Kept out of
+-- job_listings so listing queries selecting * do not ship 1536 floats a row.
+-- content_hash is the hash of the embedded text; an unchanged listing is
+-- not re-embedded on update.
+CREATE TABLE IF NOT EXISTS job_listing_embeddings (
+    id UUID PRIMARY KEY REFERENCES job_listings(id) ON DELETE CASCADE,
+    embedding vector(1536) NOT NULL,
+    content_hash TEXT NOT NULL,
+    embedded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_listing_embeddings_embedding
+    ON job_listing_embeddings USING hnsw (embedding vector_cosine_ops);
+
+ALTER TABLE job_listing_embeddings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role manages job listing embeddings" ON job_listing_embeddings
+    FOR ALL USING (auth.role() = 'service_role');
+
+-- Active listings nearest to a resume embedding, with the hard filters of
+-- the recommendations endpoint. The HNSW index is walked in distance order
+-- and filtered rows are skipped, so ef_search must exceed match_count for
+-- selective filters to fill the page.
+CREATE OR REPLACE FUNCTION match_job_listings(
+    query_embedding vector(1536),
+    match_count int DEFAULT 200,
+    location_filter text DEFAULT NULL,
+    experience_level_filter text DEFAULT NULL,
+    remote_work_filter text DEFAULT NULL
+)
+RETURNS SETOF jsonb
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', greatest(match_count * 2, 100)::text, true);
+    RETURN QUERY
+    SELECT (to_jsonb(jl) - 'search_vector')
+        || jsonb_build_object('similarity', 1 - (e.embedding <=> query_embedding))
+    FROM job_listing_embeddings e
+    JOIN job_listings jl ON jl.id = e.id
+    WHERE jl.status = 'active'
+        AND (location_filter IS NULL OR jl.location ILIKE '%' || location_filter || '%')
+        AND (experience_level_filter IS NULL OR jl.experience_level = experience_level_filter)
+        AND (remote_work_filter IS NULL OR jl.remote_work_preference = remote_work_filter)
+    ORDER BY e.embedding <=> query_embedding
+    LIMIT match_count;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION match_job_listings(vector, int, text, text, text)
+    TO authenticated, service_role;
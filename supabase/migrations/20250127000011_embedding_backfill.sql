@@ -0,0 +1,84 @@
+-- Embedding Backfill Migration
+-- Purpose: Record the model behind every stored embedding and let a
+-- resumable batch job re-embed stale rows
+-- Date: 2025-01-27
+
+-- "<model>:<version>" of the embedding in the row; NULL for rows embedded
+-- before this column existed. Rows whose model differs from the current
+-- one are stale and picked up by the backfill job.
+ALTER TABLE job_listing_embeddings ADD COLUMN IF NOT EXISTS embedding_model TEXT;
+ALTER TABLE knowledge_resources ADD COLUMN IF NOT EXISTS embedding_model TEXT;
+ALTER TABLE resume_chunks ADD COLUMN IF NOT EXISTS embedding_model TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_job_listing_embeddings_embedding_model
+    ON job_listing_embeddings (embedding_model);
+CREATE INDEX IF NOT EXISTS idx_knowledge_resources_embedding_model
+    ON knowledge_resources (embedding_model);
+CREATE INDEX IF NOT EXISTS idx_resume_chunks_embedding_model
+    ON resume_chunks (embedding_model);
+
+-- One checkpoint per (table, model) backfill. last_id is the keyset cursor
+-- of the last page written, so an interrupted run resumes after it.
+CREATE TABLE IF NOT EXISTS embedding_backfill_runs (
+    id TEXT PRIMARY KEY,
+    target_table TEXT NOT NULL,
+    embedding_model TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'running',
+    last_id TEXT,
+    rows_scanned BIGINT NOT NULL DEFAULT 0,
+    rows_embedded BIGINT NOT NULL DEFAULT 0,
+    rows_failed BIGINT NOT NULL DEFAULT 0,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+ALTER TABLE embedding_backfill_runs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role manages embedding backfill runs" ON embedding_backfill_runs
+    FOR ALL USING (auth.role() = 'service_role');
+
+-- Sets embedding and embedding_model of many rows in one statement.
+-- updates: [{"id": ..., "embedding": [...], "embedding_model": ...}, ...]
+CREATE OR REPLACE FUNCTION update_embeddings(target_table text, updates jsonb)
+RETURNS int
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated int;
+BEGIN
+    IF target_table NOT IN ('knowledge_resources', 'resume_chunks') THEN
+        RAISE EXCEPTION 'update_embeddings: unsupported table %', target_table;
+    END IF;
+    EXECUTE format(
+        'UPDATE %I t
+         SET embedding = (u.value->>''embedding'')::vector,
+             embedding_model = u.value->>''embedding_model''
+         FROM jsonb_array_elements($1) u
+         WHERE t.id = (u.value->>''id'')::uuid',
+        target_table
+    ) USING updates;
+    GET DIAGNOSTICS updated = ROW_COUNT;
+    RETURN updated;
+END;
+$$;
+
+-- Rows per embedding model, to spot tables holding mixed-model embeddings
+CREATE OR REPLACE FUNCTION embedding_model_counts(target_table text)
+RETURNS TABLE (embedding_model text, row_count bigint)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    IF target_table NOT IN ('job_listing_embeddings', 'knowledge_resources', 'resume_chunks') THEN
+        RAISE EXCEPTION 'embedding_model_counts: unsupported table %', target_table;
+    END IF;
+    RETURN QUERY EXECUTE format(
+        'SELECT embedding_model, count(*) FROM %I WHERE embedding IS NOT NULL GROUP BY 1 ORDER BY 2 DESC',
+        target_table
+    );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION update_embeddings(text, jsonb) TO service_role;
+GRANT EXECUTE ON FUNCTION embedding_model_counts(text) TO service_role;
@@ -0,0 +1,25 @@
+-- Conversation Token Counters Migration
+-- Purpose: Add flushed LLM token counts to conversations without lost updates
+-- Date: 2025-01-27
+
+-- Add a batch of token counts, {"<conversation id>": <tokens>, ...}, to
+-- conversations.total_tokens_used. conversations.id is TEXT, so keys are
+-- compared as text; some ids (conv_<user>_<time>) are not UUIDs. The increment happens in the UPDATE
+-- itself, so workers flushing the same conversation never overwrite each
+-- other. Returns the number of conversations updated.
+CREATE OR REPLACE FUNCTION increment_conversation_tokens(increments jsonb)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    WITH updated AS (
+        UPDATE conversations c
+        SET total_tokens_used = COALESCE(c.total_tokens_used, 0) + deltas.value::int
+        FROM jsonb_each_text(increments) AS deltas
+        WHERE c.id = deltas.key
+        RETURNING 1
+    )
+    SELECT COUNT(*)::int FROM updated;
+$$;
+
+GRANT EXECUTE ON FUNCTION increment_conversation_tokens(jsonb) TO service_role;